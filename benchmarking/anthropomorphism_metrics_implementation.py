@@ -6,7 +6,7 @@ Based on IAAC article concepts, implemented using existing log data structure
 import pandas as pd
 import numpy as np
 import re
-from typing import Dict, List, Any, Tuple
+from typing import Dict, List, Any, Optional, Tuple
 from pathlib import Path
 import json
 from datetime import datetime
@@ -17,6 +17,12 @@ class AnthropomorphismMetricsEvaluator:
     """
     Evaluates anthropomorphism and cognitive dependency metrics based on the IAAC article
     "Anthropomorphism and the Simulation of Life: A Critical Examination"
+
+    Student inputs are scanned once by featurize(), which turns every marker
+    list below into a column of a per-interaction feature frame; each metric is
+    then a reduction over those columns (and over row slices of them for
+    halves, quarters or sessions). Several sessions can be evaluated in one
+    call with evaluate_cohort().
     """
     
     def __init__(self):
@@ -79,6 +85,104 @@ class AnthropomorphismMetricsEvaluator:
             ]
         }
         
+        # Plain phrases; an input has a marker when it contains any of them
+        self.keyword_markers = {
+            'professional_terms': ['design', 'architecture', 'spatial', 'proportion', 'concept',
+                                   'circulation', 'structure', 'material'],
+            'personal_terms': ['feel', 'personal', 'life', 'friend', 'help me with my life'],
+            'architectural_terms': ['design', 'space', 'architecture', 'building', 'structure',
+                                    'material', 'form', 'function', 'circulation', 'proportion'],
+            'alternative_keywords': ['alternative', 'another', 'different', 'instead',
+                                     'other option', 'what if', 'could also'],
+            'cross_domain_references': ['physics', 'biology', 'psychology', 'philosophy', 'art', 'music'],
+            'divergent_indicators': ['alternative', 'another way', 'different approach', 'what if',
+                                     'could also', 'might consider', 'option', 'possibility'],
+            'explanation_indicators': ['because', 'therefore', 'this means', 'the reason',
+                                       'this works by', 'the principle', 'based on'],
+            'original_indicators': ['my idea', 'i created', 'i designed', 'i came up with',
+                                    'my concept', 'i developed', 'my approach'],
+            'ai_following_indicators': ['as you suggested', 'following your', 'based on your',
+                                        'like you said', 'using your method'],
+            'trust_statements': ['trust you', 'believe you', 'rely on you'],
+            'personal_sharing': ['my life', 'feel', 'personal', 'problem'],
+            'solution_words': ['solution', 'approach', 'method', 'way', 'idea'],
+            'mastery_indicators': [
+                'this works because', 'the principle is', 'it means that',  # Teaching others
+                'combining', 'integrating', 'brings together',  # Synthesis
+                'better because', 'more effective', 'advantage is',  # Evaluation
+            ],
+        }
+        
+        # Architectural vocabulary tracked term by term (diversity and expansion)
+        self.technical_vocabulary = [
+            'spatial', 'proportion', 'circulation', 'hierarchy', 'adjacency',
+            'threshold', 'transparency', 'permeability', 'articulation', 'datum',
+            'axis', 'symmetry', 'rhythm', 'repetition', 'transformation'
+        ]
+        
+        self.professional_input_types = ['exploration', 'technical_question', 'design_question',
+                                         'feedback_request', 'improvement_seeking']
+        self.exploratory_input_types = ['exploration', 'hypothesis']
+        self.question_input_types = ['technical_question', 'design_question']
+        
+        self._compile_markers()
+    
+    def _compile_markers(self):
+        """One compiled regex per feature column"""
+        # Anthropomorphism counts every pattern separately
+        self._pattern_regexes = {
+            f'{category}_{i}': re.compile(pattern, re.IGNORECASE)
+            for category, patterns in self.anthropomorphic_patterns.items()
+            for i, pattern in enumerate(patterns)
+        }
+        # Other indicator groups only need "any pattern matched": one alternation each
+        groups = {**self.autonomy_indicators, **self.bias_indicators,
+                  'emotional_language': self.anthropomorphic_patterns['emotional_language']}
+        self._marker_regexes = {
+            name: re.compile('|'.join(f'(?:{pattern})' for pattern in patterns))
+            for name, patterns in groups.items()
+        }
+        self._marker_regexes.update({
+            name: re.compile('|'.join(re.escape(keyword) for keyword in keywords))
+            for name, keywords in self.keyword_markers.items()
+        })
+    
+    def featurize(self, data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Per-interaction feature frame (same row order as data): one boolean
+        column per anthropomorphic pattern, marker group and technical term,
+        input type flags, numeric lengths and the lowercased input text.
+        """
+        
+        if 'student_input' in data.columns:
+            text = data['student_input'].fillna('').astype(str).str.lower().astype(object)
+        else:
+            text = pd.Series('', index=data.index, dtype=object)
+        
+        texts = text.tolist()
+        columns = {'text': text}
+        for name, regex in {**self._pattern_regexes, **self._marker_regexes}.items():
+            search = regex.search
+            columns[name] = np.fromiter((search(t) is not None for t in texts), dtype=bool, count=len(texts))
+        for term in self.technical_vocabulary:
+            columns[f'term_{term}'] = np.fromiter((term in t for t in texts), dtype=bool, count=len(texts))
+        
+        input_type = data['input_type'] if 'input_type' in data.columns else pd.Series('', index=data.index)
+        columns['professional_type'] = input_type.isin(self.professional_input_types)
+        columns['exploratory_type'] = input_type.isin(self.exploratory_input_types)
+        columns['question_type'] = input_type.isin(self.question_input_types)
+        
+        for name in ('input_length', 'response_length'):
+            if name in data.columns:
+                columns[name] = pd.to_numeric(data[name], errors='coerce')
+            else:
+                columns[name] = pd.Series(0, index=data.index)
+        
+        return pd.DataFrame(columns, index=data.index)
+    
+    def _features(self, data: pd.DataFrame, features: Optional[pd.DataFrame]) -> pd.DataFrame:
+        return self.featurize(data) if features is None else features
+    
     def evaluate_anthropomorphism_metrics(self, session_data: pd.DataFrame) -> Dict[str, Any]:
         """
         Evaluate all anthropomorphism and cognitive dependency metrics for a session
@@ -95,31 +199,34 @@ class AnthropomorphismMetricsEvaluator:
         # Get base metrics first
         base_metrics = self.base_evaluator.evaluate_session(session_data)
         
+        # Scan the session's text once for every metric below
+        features = self.featurize(session_data)
+        
         # Calculate new metrics
         anthropomorphism_metrics = {
             'session_id': session_data['session_id'].iloc[0],
             'timestamp': datetime.now().isoformat(),
             
             # Core anthropomorphism metrics
-            'anthropomorphism_detection_score': self._calculate_ads(session_data),
-            'cognitive_autonomy_index': self._calculate_cai(session_data),
-            'professional_boundary_index': self._calculate_pbi(session_data),
-            'bias_resistance_score': self._calculate_brs(session_data),
+            'anthropomorphism_detection_score': self._calculate_ads(session_data, features),
+            'cognitive_autonomy_index': self._calculate_cai(session_data, features),
+            'professional_boundary_index': self._calculate_pbi(session_data, features),
+            'bias_resistance_score': self._calculate_brs(session_data, features),
             
             # Skill and creativity metrics
-            'neural_engagement_score': self._calculate_nes(session_data),
-            'divergent_thinking_index': self._calculate_dti(session_data),
-            'skill_retention_indicators': self._calculate_sri(session_data),
-            'creative_independence_ratio': self._calculate_cir(session_data),
+            'neural_engagement_score': self._calculate_nes(session_data, features),
+            'divergent_thinking_index': self._calculate_dti(session_data, features),
+            'skill_retention_indicators': self._calculate_sri(session_data, features),
+            'creative_independence_ratio': self._calculate_cir(session_data, features),
             
             # Dependency analysis
-            'dependency_progression': self._analyze_dependency_progression(session_data),
-            'emotional_attachment_level': self._calculate_emotional_attachment(session_data),
-            'cognitive_load_distribution': self._analyze_cognitive_load_distribution(session_data),
+            'dependency_progression': self._analyze_dependency_progression(session_data, features),
+            'emotional_attachment_level': self._calculate_emotional_attachment(session_data, features),
+            'cognitive_load_distribution': self._analyze_cognitive_load_distribution(session_data, features),
             
             # Combined analysis
-            'overall_cognitive_dependency': self._calculate_overall_dependency(session_data),
-            'risk_indicators': self._identify_risk_indicators(session_data),
+            'overall_cognitive_dependency': self._calculate_overall_dependency(session_data, features),
+            'risk_indicators': self._identify_risk_indicators(session_data, features),
             
             # Include relevant base metrics
             'base_metrics': {
@@ -131,37 +238,63 @@ class AnthropomorphismMetricsEvaluator:
         
         return anthropomorphism_metrics
     
-    def _calculate_ads(self, data: pd.DataFrame) -> Dict[str, float]:
+    def evaluate_cohort(self, data: pd.DataFrame, session_column: str = 'session_id') -> pd.DataFrame:
+        """
+        Headline anthropomorphism metrics of many sessions at once.
+        
+        data holds the interactions of several sessions concatenated (each
+        session's rows in order); the text is featurized in one pass and every
+        session's scores are reductions over its rows. Returns one row per
+        session, in order of first appearance. Base metrics are not included.
+        """
+        
+        features = self.featurize(data)
+        rows = []
+        
+        for session_id, positions in data.groupby(session_column, sort=False).indices.items():
+            session_data, session_features = data.iloc[positions], features.iloc[positions]
+            rows.append({
+                session_column: session_id,
+                'interactions': len(positions),
+                'anthropomorphism_detection_score': self._calculate_ads(session_data, session_features)['overall_score'],
+                'cognitive_autonomy_index': self._calculate_cai(session_data, session_features)['overall_score'],
+                'professional_boundary_index': self._calculate_pbi(session_data, session_features)['overall_score'],
+                'bias_resistance_score': self._calculate_brs(session_data, session_features)['overall_score'],
+                'neural_engagement_score': self._calculate_nes(session_data, session_features)['overall_score'],
+                'divergent_thinking_index': self._calculate_dti(session_data, session_features)['overall_score'],
+                'skill_retention_likelihood': self._calculate_sri(session_data, session_features)['retention_likelihood'],
+                'creative_independence_ratio': self._calculate_cir(session_data, session_features)['overall_score'],
+                'emotional_attachment_level': self._calculate_emotional_attachment(session_data, session_features)['attachment_level'],
+                'overall_cognitive_dependency': self._calculate_overall_dependency(session_data, session_features)['overall_dependency_score'],
+            })
+        
+        return pd.DataFrame(rows)
+    
+    def _calculate_ads(self, data: pd.DataFrame, features: Optional[pd.DataFrame] = None) -> Dict[str, float]:
         """
         Calculate Anthropomorphism Detection Score
         Tracks humanization of AI through language patterns
         """
         
-        total_anthropomorphic_instances = 0
-        pattern_counts = {}
+        features = self._features(data, features)
+        
+        # (interactions x patterns) matches, patterns grouped by category
+        matches = features[list(self._pattern_regexes)].to_numpy()
         
+        pattern_counts = {}
+        first = 0
         for category, patterns in self.anthropomorphic_patterns.items():
-            category_count = 0
-            for pattern in patterns:
-                # Ensure column exists and convert to string
-                if 'student_input' in data.columns:
-                    string_col = data['student_input'].fillna('').astype(str)
-                    matches = string_col.str.contains(
-                        pattern, case=False, regex=True, na=False
-                    ).sum()
-                    category_count += matches
-            
-            pattern_counts[category] = category_count
-            total_anthropomorphic_instances += category_count
+            pattern_counts[category] = int(matches[:, first:first + len(patterns)].sum())
+            first += len(patterns)
+        total_anthropomorphic_instances = matches.sum()
         
         # Calculate normalized score (0-1)
         ads_score = total_anthropomorphic_instances / (len(data) * 2)  # Normalize by interactions * 2
         ads_score = min(ads_score, 1.0)  # Cap at 1.0
         
         # Analyze progression
-        first_half = self._calculate_ads_for_subset(data.iloc[:len(data)//2])
-        second_half = self._calculate_ads_for_subset(data.iloc[len(data)//2:])
-        progression = second_half - first_half
+        half = len(data) // 2
+        progression = self._ads_ratio(matches[half:]) - self._ads_ratio(matches[:half])
         
         return {
             'overall_score': round(ads_score, 3),
@@ -170,29 +303,16 @@ class AnthropomorphismMetricsEvaluator:
             'risk_level': self._categorize_ads_risk(ads_score)
         }
     
-    def _calculate_cai(self, data: pd.DataFrame) -> Dict[str, float]:
+    def _calculate_cai(self, data: pd.DataFrame, features: Optional[pd.DataFrame] = None) -> Dict[str, float]:
         """
         Calculate Cognitive Autonomy Index
         Measures student's ability to generate independent solutions
         """
         
-        autonomous_count = 0
-        dependent_count = 0
+        features = self._features(data, features)
         
-        for _, row in data.iterrows():
-            input_text = str(row.get('student_input', '')).lower()
-            
-            # Check for dependent patterns
-            for pattern in self.autonomy_indicators['dependent_questions']:
-                if re.search(pattern, input_text):
-                    dependent_count += 1
-                    break
-            
-            # Check for autonomous patterns
-            for pattern in self.autonomy_indicators['autonomous_statements']:
-                if re.search(pattern, input_text):
-                    autonomous_count += 1
-                    break
+        autonomous_count = int(features['autonomous_statements'].sum())
+        dependent_count = int(features['dependent_questions'].sum())
         
         total_interactions = len(data)
         autonomy_ratio = autonomous_count / total_interactions if total_interactions > 0 else 0
@@ -203,49 +323,35 @@ class AnthropomorphismMetricsEvaluator:
         cai_score = max(0, min(cai_score, 1.0))  # Normalize to 0-1
         
         # Analyze complexity of autonomous inputs
-        autonomous_complexity = self._analyze_autonomous_complexity(data)
+        autonomous_complexity = self._analyze_autonomous_complexity(data, features)
         
         return {
             'overall_score': round(cai_score, 3),
             'autonomy_ratio': round(autonomy_ratio, 3),
             'dependency_ratio': round(dependency_ratio, 3),
             'autonomous_complexity': round(autonomous_complexity, 3),
-            'verification_seeking': round(self._calculate_verification_ratio(data), 3)
+            'verification_seeking': round(self._calculate_verification_ratio(data, features), 3)
         }
     
-    def _calculate_pbi(self, data: pd.DataFrame) -> Dict[str, float]:
+    def _calculate_pbi(self, data: pd.DataFrame, features: Optional[pd.DataFrame] = None) -> Dict[str, float]:
         """
         Calculate Professional Boundary Index
         Measures maintenance of educational relationship
         """
         
-        professional_count = 0
-        personal_count = 0
+        features = self._features(data, features)
         
-        # Analyze input types and content
-        for _, row in data.iterrows():
-            input_type = row.get('input_type', '')
-            input_text = str(row.get('student_input', '')).lower()
-            
-            # Professional indicators
-            if input_type in ['exploration', 'technical_question', 'design_question', 
-                            'feedback_request', 'improvement_seeking']:
-                professional_count += 1
-            elif any(term in input_text for term in 
-                   ['design', 'architecture', 'spatial', 'proportion', 'concept', 
-                    'circulation', 'structure', 'material']):
-                professional_count += 1
-            
-            # Personal indicators
-            if any(term in input_text for term in 
-                 ['feel', 'personal', 'life', 'friend', 'help me with my life']):
-                personal_count += 1
+        # Professional indicators: input type or architectural content
+        professional_count = int((features['professional_type'] | features['professional_terms']).sum())
+        
+        # Personal indicators
+        personal_count = int(features['personal_terms'].sum())
         
         total_interactions = len(data)
         professional_ratio = professional_count / total_interactions if total_interactions > 0 else 0
         
         # Check for conversation drift
-        drift_score = self._calculate_conversation_drift(data)
+        drift_score = self._calculate_conversation_drift(data, features)
         
         return {
             'overall_score': round(professional_ratio, 3),
@@ -255,35 +361,22 @@ class AnthropomorphismMetricsEvaluator:
             'boundary_status': 'maintained' if professional_ratio > 0.85 else 'at_risk'
         }
     
-    def _calculate_brs(self, data: pd.DataFrame) -> Dict[str, float]:
+    def _calculate_brs(self, data: pd.DataFrame, features: Optional[pd.DataFrame] = None) -> Dict[str, float]:
         """
         Calculate Bias Resistance Score
         Measures critical evaluation of AI suggestions
         """
         
-        questioning_count = 0
-        accepting_count = 0
+        features = self._features(data, features)
         
-        for _, row in data.iterrows():
-            input_text = str(row.get('student_input', '')).lower()
-            
-            # Check questioning patterns
-            for pattern in self.bias_indicators['questioning_ai']:
-                if re.search(pattern, input_text):
-                    questioning_count += 1
-                    break
-            
-            # Check accepting patterns
-            for pattern in self.bias_indicators['accepting_ai']:
-                if re.search(pattern, input_text):
-                    accepting_count += 1
-                    break
+        questioning_count = int(features['questioning_ai'].sum())
+        accepting_count = int(features['accepting_ai'].sum())
         
         total_responses = questioning_count + accepting_count
         resistance_ratio = questioning_count / total_responses if total_responses > 0 else 0.5
         
         # Analyze alternative generation
-        alternatives_score = self._analyze_alternative_generation(data)
+        alternatives_score = self._analyze_alternative_generation(data, features)
         
         return {
             'overall_score': round(resistance_ratio, 3),
@@ -293,44 +386,27 @@ class AnthropomorphismMetricsEvaluator:
             'critical_thinking_level': self._categorize_bias_resistance(resistance_ratio)
         }
     
-    def _calculate_nes(self, data: pd.DataFrame) -> Dict[str, float]:
+    def _calculate_nes(self, data: pd.DataFrame, features: Optional[pd.DataFrame] = None) -> Dict[str, float]:
         """
         Calculate Neural Engagement Score
         Proxy for cognitive complexity through concept diversity
         """
         
-        # Extract unique concepts and vocabulary
-        all_concepts = set()
-        technical_terms = set()
-        cross_domain_refs = 0
+        features = self._features(data, features)
         
-        technical_vocabulary = [
-            'spatial', 'proportion', 'circulation', 'hierarchy', 'adjacency',
-            'threshold', 'transparency', 'permeability', 'articulation', 'datum',
-            'axis', 'symmetry', 'rhythm', 'repetition', 'transformation'
-        ]
+        # Unique concepts: words > 5 characters across all inputs
+        concept_count = len({word for text in features['text'] for word in text.split()
+                             if len(word) > 5 and word.isalpha()})
         
-        for _, row in data.iterrows():
-            input_text = str(row.get('student_input', '')).lower()
-            words = input_text.split()
-            
-            # Track unique concepts (words > 5 characters)
-            concepts = {word for word in words if len(word) > 5 and word.isalpha()}
-            all_concepts.update(concepts)
-            
-            # Track technical vocabulary usage
-            for term in technical_vocabulary:
-                if term in input_text:
-                    technical_terms.add(term)
-            
-            # Detect cross-domain references
-            if any(domain in input_text for domain in 
-                 ['physics', 'biology', 'psychology', 'philosophy', 'art', 'music']):
-                cross_domain_refs += 1
+        # Technical vocabulary used anywhere in the session
+        technical_count = int(self._term_matches(features).any(axis=0).sum())
+        
+        # Inputs with cross-domain references
+        cross_domain_refs = int(features['cross_domain_references'].sum())
         
         # Calculate diversity metrics
-        concept_diversity = len(all_concepts) / len(data) if len(data) > 0 else 0
-        technical_diversity = len(technical_terms) / len(technical_vocabulary)
+        concept_diversity = concept_count / len(data) if len(data) > 0 else 0
+        technical_diversity = technical_count / len(self.technical_vocabulary)
         cross_domain_score = cross_domain_refs / len(data) if len(data) > 0 else 0
         
         # Calculate complexity from existing cognitive flags
@@ -352,30 +428,16 @@ class AnthropomorphismMetricsEvaluator:
             'cognitive_complexity': round(avg_cognitive_flags, 2)
         }
     
-    def _calculate_dti(self, data: pd.DataFrame) -> Dict[str, float]:
+    def _calculate_dti(self, data: pd.DataFrame, features: Optional[pd.DataFrame] = None) -> Dict[str, float]:
         """
         Calculate Divergent Thinking Index
         Measures generation of multiple perspectives
         """
         
-        # Analyze design moves and alternatives
-        divergent_indicators = [
-            'alternative', 'another way', 'different approach', 'what if',
-            'could also', 'might consider', 'option', 'possibility'
-        ]
-        
-        divergent_count = 0
-        alternative_proposals = []
+        features = self._features(data, features)
         
-        for _, row in data.iterrows():
-            input_text = str(row.get('student_input', '')).lower()
-            
-            # Count divergent thinking indicators
-            for indicator in divergent_indicators:
-                if indicator in input_text:
-                    divergent_count += 1
-                    alternative_proposals.append(row['interaction_number'])
-                    break
+        # Interactions with divergent thinking indicators
+        divergent_count = int(features['divergent_indicators'].sum())
         
         # Analyze design move diversity from metadata
         move_type_diversity = 0
@@ -389,50 +451,35 @@ class AnthropomorphismMetricsEvaluator:
         divergent_ratio = divergent_count / len(data) if len(data) > 0 else 0
         
         # Check for solution variety in specific problems
-        solution_variety = self._analyze_solution_variety(data)
+        solution_variety = self._analyze_solution_variety(data, features)
         
         return {
             'overall_score': round(divergent_ratio, 3),
             'alternative_generation_rate': round(divergent_ratio, 3),
             'move_type_diversity': round(move_type_diversity, 3),
             'solution_variety': round(solution_variety, 3),
-            'divergent_interactions': len(alternative_proposals)
+            'divergent_interactions': divergent_count
         }
     
-    def _calculate_sri(self, data: pd.DataFrame) -> Dict[str, float]:
+    def _calculate_sri(self, data: pd.DataFrame, features: Optional[pd.DataFrame] = None) -> Dict[str, float]:
         """
         Calculate Skill Retention Indicators
         Measures potential for lasting capability development
         """
         
-        # Analyze explanation quality
-        explanation_indicators = [
-            'because', 'therefore', 'this means', 'the reason',
-            'this works by', 'the principle', 'based on'
-        ]
+        features = self._features(data, features)
         
-        explanation_count = 0
-        concept_applications = 0
+        # Explanatory language
+        explanation_count = int(features['explanation_indicators'].sum())
         
-        for _, row in data.iterrows():
-            input_text = str(row.get('student_input', '')).lower()
-            
-            # Count explanatory language
-            for indicator in explanation_indicators:
-                if indicator in input_text:
-                    explanation_count += 1
-                    break
-            
-            # Detect concept application
-            if row.get('input_type') in ['exploration', 'hypothesis'] and \
-               row.get('input_length', 0) > 15:
-                concept_applications += 1
+        # Concept application: longer exploratory inputs
+        concept_applications = int((features['exploratory_type'] & (features['input_length'] > 15)).sum())
         
         # Analyze skill progression
         if 'student_skill_level' in data.columns:
-            skill_progression = data['student_skill_level'].apply(
-                lambda x: {'beginner': 1, 'intermediate': 2, 'advanced': 3}.get(x, 1)
-            )
+            skill_progression = data['student_skill_level'].map(
+                {'beginner': 1, 'intermediate': 2, 'advanced': 3}
+            ).fillna(1)
         else:
             skill_progression = pd.Series([1] * len(data))
         
@@ -455,48 +502,27 @@ class AnthropomorphismMetricsEvaluator:
             'explanation_quality': round(explanation_ratio, 3),
             'concept_application': round(application_ratio, 3),
             'skill_improvement': round(skill_improvement, 3),
-            'mastery_indicators': self._identify_mastery_indicators(data)
+            'mastery_indicators': self._identify_mastery_indicators(data, features)
         }
     
-    def _calculate_cir(self, data: pd.DataFrame) -> Dict[str, float]:
+    def _calculate_cir(self, data: pd.DataFrame, features: Optional[pd.DataFrame] = None) -> Dict[str, float]:
         """
         Calculate Creative Independence Ratio
         Balance between AI assistance and original creativity
         """
         
-        # Analyze original vs. suggested content
-        original_indicators = [
-            'my idea', 'i created', 'i designed', 'i came up with',
-            'my concept', 'i developed', 'my approach'
-        ]
-        
-        ai_following_indicators = [
-            'as you suggested', 'following your', 'based on your',
-            'like you said', 'using your method'
-        ]
+        features = self._features(data, features)
         
-        original_count = 0
-        ai_following_count = 0
-        
-        for _, row in data.iterrows():
-            input_text = str(row.get('student_input', '')).lower()
-            
-            for indicator in original_indicators:
-                if indicator in input_text:
-                    original_count += 1
-                    break
-            
-            for indicator in ai_following_indicators:
-                if indicator in input_text:
-                    ai_following_count += 1
-                    break
+        # Original vs. suggested content
+        original_count = int(features['original_indicators'].sum())
+        ai_following_count = int(features['ai_following_indicators'].sum())
         
         # Calculate creative independence
         total_creative = original_count + ai_following_count
         independence_ratio = original_count / total_creative if total_creative > 0 else 0.5
         
         # Analyze design vocabulary expansion
-        vocab_expansion = self._analyze_vocabulary_expansion(data)
+        vocab_expansion = self._analyze_vocabulary_expansion(data, features)
         
         return {
             'overall_score': round(independence_ratio, 3),
@@ -506,21 +532,25 @@ class AnthropomorphismMetricsEvaluator:
             'creative_autonomy': 'high' if independence_ratio > 0.6 else 'low'
         }
     
-    def _analyze_dependency_progression(self, data: pd.DataFrame) -> Dict[str, Any]:
+    def _analyze_dependency_progression(self, data: pd.DataFrame,
+                                        features: Optional[pd.DataFrame] = None) -> Dict[str, Any]:
         """
         Analyze how cognitive dependency changes over the session
         """
         
+        features = self._features(data, features)
+        
         # Split session into quarters
         quarter_size = max(len(data) // 4, 1)
         quarters = []
         
         for i in range(0, len(data), quarter_size):
             quarter_data = data.iloc[i:i+quarter_size]
+            quarter_features = features.iloc[i:i+quarter_size]
             
             # Calculate dependency metrics for each quarter
-            cai = self._calculate_cai(quarter_data)['overall_score']
-            ads = self._calculate_ads_for_subset(quarter_data)
+            cai = self._calculate_cai(quarter_data, quarter_features)['overall_score']
+            ads = self._calculate_ads_for_subset(quarter_data, quarter_features)
             
             quarters.append({
                 'quarter': len(quarters) + 1,
@@ -540,33 +570,20 @@ class AnthropomorphismMetricsEvaluator:
             'final_dependency_level': round(quarters[-1]['dependency_score'], 3)
         }
     
-    def _calculate_emotional_attachment(self, data: pd.DataFrame) -> Dict[str, float]:
+    def _calculate_emotional_attachment(self, data: pd.DataFrame,
+                                        features: Optional[pd.DataFrame] = None) -> Dict[str, float]:
         """
         Calculate emotional attachment level to AI
         """
         
-        # Count emotional language frequency
-        emotional_count = 0
-        trust_statements = 0
-        personal_sharing = 0
+        features = self._features(data, features)
         
-        for _, row in data.iterrows():
-            input_text = str(row.get('student_input', '')).lower()
-            
-            # Emotional language
-            for pattern in self.anthropomorphic_patterns['emotional_language']:
-                if re.search(pattern, input_text):
-                    emotional_count += 1
-                    break
-            
-            # Trust statements
-            if any(phrase in input_text for phrase in ['trust you', 'believe you', 'rely on you']):
-                trust_statements += 1
-            
-            # Personal sharing (non-architectural)
-            if row.get('input_type') not in ['technical_question', 'design_question'] and \
-               any(word in input_text for word in ['my life', 'feel', 'personal', 'problem']):
-                personal_sharing += 1
+        # Emotional language frequency and trust statements
+        emotional_count = int(features['emotional_language'].sum())
+        trust_statements = int(features['trust_statements'].sum())
+        
+        # Personal sharing (non-architectural)
+        personal_sharing = int((~features['question_type'] & features['personal_sharing']).sum())
         
         # Calculate attachment score
         attachment_score = (
@@ -583,11 +600,14 @@ class AnthropomorphismMetricsEvaluator:
             'attachment_risk': 'high' if attachment_score > 0.3 else 'moderate' if attachment_score > 0.15 else 'low'
         }
     
-    def _analyze_cognitive_load_distribution(self, data: pd.DataFrame) -> Dict[str, Any]:
+    def _analyze_cognitive_load_distribution(self, data: pd.DataFrame,
+                                             features: Optional[pd.DataFrame] = None) -> Dict[str, Any]:
         """
         Analyze how cognitive load is distributed between human and AI
         """
         
+        features = self._features(data, features)
+        
         # Use existing cognitive load data if available
         if 'cognitive_load' in data.columns:
             avg_load = data['cognitive_load'].mean()
@@ -598,14 +618,8 @@ class AnthropomorphismMetricsEvaluator:
             load_std = 0.2
         
         # Analyze who's doing the heavy lifting
-        ai_heavy_responses = 0
-        human_heavy_inputs = 0
-        
-        for _, row in data.iterrows():
-            if row.get('response_length', 0) > row.get('input_length', 0) * 3:
-                ai_heavy_responses += 1
-            if row.get('input_length', 0) > 20 and row.get('input_type') in ['exploration', 'hypothesis']:
-                human_heavy_inputs += 1
+        ai_heavy_responses = int((features['response_length'] > features['input_length'] * 3).sum())
+        human_heavy_inputs = int(((features['input_length'] > 20) & features['exploratory_type']).sum())
         
         ai_load_ratio = ai_heavy_responses / len(data) if len(data) > 0 else 0
         human_load_ratio = human_heavy_inputs / len(data) if len(data) > 0 else 0
@@ -619,16 +633,19 @@ class AnthropomorphismMetricsEvaluator:
                           'human_dominant' if human_load_ratio > ai_load_ratio * 2 else 'balanced'
         }
     
-    def _calculate_overall_dependency(self, data: pd.DataFrame) -> Dict[str, Any]:
+    def _calculate_overall_dependency(self, data: pd.DataFrame,
+                                      features: Optional[pd.DataFrame] = None) -> Dict[str, Any]:
         """
         Calculate overall cognitive dependency score combining all factors
         """
         
+        features = self._features(data, features)
+        
         # Get all component scores
-        cai = self._calculate_cai(data)['overall_score']
-        ads = self._calculate_ads(data)['overall_score']
-        brs = self._calculate_brs(data)['overall_score']
-        cir = self._calculate_cir(data)['overall_score']
+        cai = self._calculate_cai(data, features)['overall_score']
+        ads = self._calculate_ads(data, features)['overall_score']
+        brs = self._calculate_brs(data, features)['overall_score']
+        cir = self._calculate_cir(data, features)['overall_score']
         
         # Weight the components
         dependency_score = (
@@ -664,21 +681,23 @@ class AnthropomorphismMetricsEvaluator:
             }
         }
     
-    def _identify_risk_indicators(self, data: pd.DataFrame) -> List[Dict[str, Any]]:
+    def _identify_risk_indicators(self, data: pd.DataFrame,
+                                  features: Optional[pd.DataFrame] = None) -> List[Dict[str, Any]]:
         """
         Identify specific risk indicators that need attention
         """
         
+        features = self._features(data, features)
         risks = []
         
         # Check each metric against thresholds
         metrics = {
-            'cai': self._calculate_cai(data),
-            'ads': self._calculate_ads(data),
-            'pbi': self._calculate_pbi(data),
-            'brs': self._calculate_brs(data),
-            'nes': self._calculate_nes(data),
-            'emotional': self._calculate_emotional_attachment(data)
+            'cai': self._calculate_cai(data, features),
+            'ads': self._calculate_ads(data, features),
+            'pbi': self._calculate_pbi(data, features),
+            'brs': self._calculate_brs(data, features),
+            'nes': self._calculate_nes(data, features),
+            'emotional': self._calculate_emotional_attachment(data, features)
         }
         
         # Cognitive autonomy risk
@@ -745,21 +764,24 @@ class AnthropomorphismMetricsEvaluator:
     
     # Helper methods
     
-    def _calculate_ads_for_subset(self, data: pd.DataFrame) -> float:
+    def _calculate_ads_for_subset(self, data: pd.DataFrame, features: Optional[pd.DataFrame] = None) -> float:
         """Calculate ADS for a data subset"""
         if len(data) == 0:
             return 0.0
-            
-        total_instances = 0
-        if 'student_input' in data.columns:
-            string_col = data['student_input'].fillna('').astype(str)
-            for patterns in self.anthropomorphic_patterns.values():
-                for pattern in patterns:
-                    total_instances += string_col.str.contains(
-                        pattern, case=False, regex=True, na=False
-                    ).sum()
-        
-        return min(total_instances / (len(data) * 2), 1.0)
+        
+        features = self._features(data, features)
+        return self._ads_ratio(features[list(self._pattern_regexes)].to_numpy())
+    
+    @staticmethod
+    def _ads_ratio(matches: np.ndarray) -> float:
+        """Anthropomorphic pattern matches per interaction / 2, capped at 1 (0 without interactions)"""
+        if len(matches) == 0:
+            return 0.0
+        return min(matches.sum() / (len(matches) * 2), 1.0)
+    
+    def _term_matches(self, features: pd.DataFrame) -> np.ndarray:
+        """(interactions x technical_vocabulary) term usage"""
+        return features[[f'term_{term}' for term in self.technical_vocabulary]].to_numpy()
     
     def _categorize_ads_risk(self, score: float) -> str:
         """Categorize anthropomorphism risk level"""
@@ -772,66 +794,32 @@ class AnthropomorphismMetricsEvaluator:
         else:
             return 'critical'
     
-    def _analyze_autonomous_complexity(self, data: pd.DataFrame) -> float:
+    def _analyze_autonomous_complexity(self, data: pd.DataFrame, features: Optional[pd.DataFrame] = None) -> float:
         """Analyze complexity of autonomous inputs"""
-        autonomous_inputs = []
+        features = self._features(data, features)
+        autonomous_inputs = features.loc[features['autonomous_statements'], 'input_length']
         
-        for _, row in data.iterrows():
-            input_text = str(row.get('student_input', '')).lower()
-            for pattern in self.autonomy_indicators['autonomous_statements']:
-                if re.search(pattern, input_text):
-                    autonomous_inputs.append(row.get('input_length', 0))
-                    break
-        
-        if not autonomous_inputs:
+        if autonomous_inputs.empty:
             return 0.0
         
-        avg_length = np.mean(autonomous_inputs)
+        avg_length = autonomous_inputs.mean()
         # Normalize by typical complex input length (30 words)
         return min(avg_length / 30, 1.0)
     
-    def _calculate_verification_ratio(self, data: pd.DataFrame) -> float:
+    def _calculate_verification_ratio(self, data: pd.DataFrame, features: Optional[pd.DataFrame] = None) -> float:
         """Calculate ratio of verification-seeking behavior"""
-        verification_count = 0
-        
-        for _, row in data.iterrows():
-            input_text = str(row.get('student_input', '')).lower()
-            for pattern in self.autonomy_indicators['verification_seeking']:
-                if re.search(pattern, input_text):
-                    verification_count += 1
-                    break
-        
-        return verification_count / len(data) if len(data) > 0 else 0
+        features = self._features(data, features)
+        return int(features['verification_seeking'].sum()) / len(data) if len(data) > 0 else 0
     
-    def _calculate_conversation_drift(self, data: pd.DataFrame) -> float:
+    def _calculate_conversation_drift(self, data: pd.DataFrame, features: Optional[pd.DataFrame] = None) -> float:
         """Calculate how much conversation drifts from architecture"""
-        architectural_terms = [
-            'design', 'space', 'architecture', 'building', 'structure',
-            'material', 'form', 'function', 'circulation', 'proportion'
-        ]
-        
-        non_arch_count = 0
-        for _, row in data.iterrows():
-            input_text = str(row.get('student_input', '')).lower()
-            if not any(term in input_text for term in architectural_terms):
-                non_arch_count += 1
-        
-        return non_arch_count / len(data) if len(data) > 0 else 0
+        features = self._features(data, features)
+        return int((~features['architectural_terms']).sum()) / len(data) if len(data) > 0 else 0
     
-    def _analyze_alternative_generation(self, data: pd.DataFrame) -> float:
+    def _analyze_alternative_generation(self, data: pd.DataFrame, features: Optional[pd.DataFrame] = None) -> float:
         """Analyze generation of alternative solutions"""
-        alternative_keywords = [
-            'alternative', 'another', 'different', 'instead',
-            'other option', 'what if', 'could also'
-        ]
-        
-        alternative_count = 0
-        for _, row in data.iterrows():
-            input_text = str(row.get('student_input', '')).lower()
-            if any(keyword in input_text for keyword in alternative_keywords):
-                alternative_count += 1
-        
-        return alternative_count / len(data) if len(data) > 0 else 0
+        features = self._features(data, features)
+        return int(features['alternative_keywords'].sum()) / len(data) if len(data) > 0 else 0
     
     def _categorize_bias_resistance(self, score: float) -> str:
         """Categorize bias resistance level"""
@@ -844,7 +832,7 @@ class AnthropomorphismMetricsEvaluator:
         else:
             return 'concerning'
     
-    def _analyze_solution_variety(self, data: pd.DataFrame) -> float:
+    def _analyze_solution_variety(self, data: pd.DataFrame, features: Optional[pd.DataFrame] = None) -> float:
         """Analyze variety in proposed solutions"""
         # Use design moves if available
         if 'design_moves' in data.columns:
@@ -856,64 +844,27 @@ class AnthropomorphismMetricsEvaluator:
             return min(unique_approaches / max(total_moves, 1), 1.0)
         
         # Fallback to input analysis
-        solution_words = ['solution', 'approach', 'method', 'way', 'idea']
-        solution_count = 0
-        
-        for _, row in data.iterrows():
-            input_text = str(row.get('student_input', '')).lower()
-            if any(word in input_text for word in solution_words):
-                solution_count += 1
-        
-        return min(solution_count / len(data), 1.0) if len(data) > 0 else 0
+        features = self._features(data, features)
+        return min(int(features['solution_words'].sum()) / len(data), 1.0) if len(data) > 0 else 0
     
-    def _identify_mastery_indicators(self, data: pd.DataFrame) -> int:
-        """Count indicators of concept mastery"""
-        mastery_indicators = 0
-        
-        # Check for teaching others
-        teaching_patterns = ['this works because', 'the principle is', 'it means that']
-        
-        # Check for synthesis
-        synthesis_patterns = ['combining', 'integrating', 'brings together']
-        
-        # Check for evaluation
-        evaluation_patterns = ['better because', 'more effective', 'advantage is']
-        
-        for _, row in data.iterrows():
-            input_text = str(row.get('student_input', '')).lower()
-            
-            if any(pattern in input_text for pattern in 
-                 teaching_patterns + synthesis_patterns + evaluation_patterns):
-                mastery_indicators += 1
-        
-        return mastery_indicators
+    def _identify_mastery_indicators(self, data: pd.DataFrame, features: Optional[pd.DataFrame] = None) -> int:
+        """Count indicators of concept mastery (teaching others, synthesis, evaluation)"""
+        features = self._features(data, features)
+        return int(features['mastery_indicators'].sum())
     
-    def _analyze_vocabulary_expansion(self, data: pd.DataFrame) -> float:
+    def _analyze_vocabulary_expansion(self, data: pd.DataFrame, features: Optional[pd.DataFrame] = None) -> float:
         """Analyze expansion of design vocabulary over session"""
-        # Track unique architectural terms used
-        early_vocab = set()
-        late_vocab = set()
-        
-        architectural_terms = [
-            'spatial', 'proportion', 'circulation', 'hierarchy', 'threshold',
-            'transparency', 'permeability', 'articulation', 'datum', 'axis',
-            'symmetry', 'rhythm', 'repetition', 'transformation', 'adjacency'
-        ]
+        features = self._features(data, features)
         
+        # Track unique architectural terms used in each half
+        terms = self._term_matches(features)
         midpoint = len(data) // 2
-        
-        for i, row in data.iterrows():
-            input_text = str(row.get('student_input', '')).lower()
-            used_terms = {term for term in architectural_terms if term in input_text}
-            
-            if i < midpoint:
-                early_vocab.update(used_terms)
-            else:
-                late_vocab.update(used_terms)
+        early_vocab = terms[:midpoint].any(axis=0)
+        late_vocab = terms[midpoint:].any(axis=0)
         
         # Calculate expansion
-        new_terms = len(late_vocab - early_vocab)
-        expansion_rate = new_terms / len(architectural_terms) if len(architectural_terms) > 0 else 0
+        new_terms = int((late_vocab & ~early_vocab).sum())
+        expansion_rate = new_terms / len(self.technical_vocabulary) if len(self.technical_vocabulary) > 0 else 0
         
         return min(expansion_rate * 2, 1.0)  # Scale up for sensitivity
     
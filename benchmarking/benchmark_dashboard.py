@@ -16,7 +16,16 @@ from datetime import datetime
 import base64
 import re
 from collections import defaultdict
+from types import SimpleNamespace
 from typing import Dict, List, Any, Optional
+try:
+    from benchmarking.session_store import load_combined, read_session_file
+    from benchmarking.results_cache import file_fingerprint
+    from benchmarking.dashboard_context import DashboardDataContext
+except ImportError:
+    from session_store import load_combined, read_session_file
+    from results_cache import file_fingerprint
+    from dashboard_context import DashboardDataContext
 try:
     from thesis_colors import (
         THESIS_COLORS, METRIC_COLORS, COLOR_GRADIENTS, 
@@ -34,39 +43,61 @@ except ImportError:
         get_color_palette, get_metric_color, get_proficiency_color, get_agent_color
     )
 
-# Import linkography components
-try:
-    from linkography_analyzer import LinkographySessionAnalyzer
-    from linkography_visualization import LinkographVisualizer
-    from linkography_enhanced import EnhancedLinkographVisualizer, create_breakthrough_detection_chart
-    from linkography_types import LinkographSession
-    from linkography_session_insights import LinkographyInsightExtractor
-    from integrated_conclusion_analyzer import IntegratedConclusionAnalyzer, HolisticConclusion
-    LINKOGRAPHY_AVAILABLE = True
-except ImportError as e:
-    LINKOGRAPHY_AVAILABLE = False
-    print(f"Warning: Linkography modules not available - {e}")
+# Optional components are imported on first use (they pull in torch / sentence-transformers),
+# so sections that do not need them start without paying for the import.
+# Each import returns a namespace of the imported names (None if unavailable); it is kept as a
+# data context resource, and sections read the names from it rather than from this module,
+# whose globals Streamlit rebuilds on every rerun.
 
-# Import anthropomorphism components
-try:
-    from anthropomorphism_metrics_implementation import AnthropomorphismMetricsEvaluator
-    from anthropomorphism_dashboard_integration import (
-        create_dependency_progression_chart,
-        create_dependency_radar_chart,
-        create_autonomy_timeline,
-        create_autonomy_patterns,
-        create_language_pattern_chart,
-        create_attachment_timeline,
-        create_topic_distribution_chart,
-        create_cognitive_complexity_heatmap,
-        create_vocabulary_growth_chart,
-        create_risk_matrix,
-        create_anthropomorphism_dashboard_section
+
+def _import_linkography_modules():
+    """Import linkography components; returns them as a namespace, or None if unavailable"""
+    try:
+        from linkography_analyzer import LinkographySessionAnalyzer
+        from linkography_visualization import LinkographVisualizer
+        from linkography_enhanced import EnhancedLinkographVisualizer, create_breakthrough_detection_chart
+        from linkography_types import LinkographSession
+        from linkography_session_insights import LinkographyInsightExtractor
+        from integrated_conclusion_analyzer import IntegratedConclusionAnalyzer, HolisticConclusion
+    except ImportError as e:
+        print(f"Warning: Linkography modules not available - {e}")
+        return None
+    return SimpleNamespace(
+        LinkographySessionAnalyzer=LinkographySessionAnalyzer,
+        LinkographVisualizer=LinkographVisualizer,
+        EnhancedLinkographVisualizer=EnhancedLinkographVisualizer,
+        create_breakthrough_detection_chart=create_breakthrough_detection_chart,
+        LinkographSession=LinkographSession,
+        LinkographyInsightExtractor=LinkographyInsightExtractor,
+        IntegratedConclusionAnalyzer=IntegratedConclusionAnalyzer,
+        HolisticConclusion=HolisticConclusion,
+    )
+
+
+def _import_anthropomorphism_modules():
+    """Import anthropomorphism components; returns them as a namespace, or None if unavailable"""
+    try:
+        from anthropomorphism_metrics_implementation import AnthropomorphismMetricsEvaluator
+        import anthropomorphism_dashboard_integration as integration
+    except ImportError:
+        print("Warning: Anthropomorphism modules not available")
+        return None
+    return SimpleNamespace(
+        AnthropomorphismMetricsEvaluator=AnthropomorphismMetricsEvaluator,
+        **{name: getattr(integration, name) for name in (
+            'create_dependency_progression_chart',
+            'create_dependency_radar_chart',
+            'create_autonomy_timeline',
+            'create_autonomy_patterns',
+            'create_language_pattern_chart',
+            'create_attachment_timeline',
+            'create_topic_distribution_chart',
+            'create_cognitive_complexity_heatmap',
+            'create_vocabulary_growth_chart',
+            'create_risk_matrix',
+            'create_anthropomorphism_dashboard_section',
+        )}
     )
-    ANTHROPOMORPHISM_AVAILABLE = True
-except ImportError:
-    ANTHROPOMORPHISM_AVAILABLE = False
-    print("Warning: Anthropomorphism modules not available")
 
 
 # Page configuration
@@ -127,7 +158,75 @@ st.markdown(f"""
 """, unsafe_allow_html=True)
 
 
+# Cached analysis layer: objects below survive reruns and are shared by all browser sessions.
+# Loaders take a file fingerprint argument, so any change to their source files invalidates them.
+@st.cache_resource(show_spinner=False)
+def get_dashboard_context():
+    """Shared data context; BenchmarkDashboard registers its datasets and resources on it."""
+    return DashboardDataContext()
+
+
+@st.cache_resource(show_spinner=False)
+def get_linkography_components():
+    """Cached linkography analyzer and visualizers."""
+    modules = get_dashboard_context().get('linkography_modules')
+    return (modules.LinkographySessionAnalyzer(), modules.LinkographVisualizer(),
+            modules.EnhancedLinkographVisualizer())
+
+
+@st.cache_resource(show_spinner=False, max_entries=1)
+def load_linkography_sessions(fingerprint):
+    """Linkography sessions for the current source files (treat as read-only)."""
+    analyzer, _, _ = get_linkography_components()
+    return analyzer.analyze_all_sessions()
+
+
+@st.cache_data(show_spinner=False)
+def load_json_report(path, fingerprint):
+    """Parsed JSON report, reloaded only when the file changes."""
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+# Datasets and resources each section reads from the data context; loaded before the section renders
+SECTION_REQUIREMENTS = {
+    "Key Metrics": ('master_session_metrics', 'master_aggregate_metrics', 'thesis_data_metrics'),
+    "Proficiency Analysis": ('master_session_metrics', 'benchmark_report', 'evaluation_reports',
+                             'thesis_data_combined', 'thesis_data_metrics'),
+    "Cognitive Patterns": ('master_session_metrics', 'evaluation_reports', 'thesis_data_metrics'),
+    "Learning Progression": ('master_session_metrics', 'evaluation_reports', 'thesis_data_combined',
+                             'thesis_data_metrics'),
+    "Agent Effectiveness": ('master_session_metrics', 'evaluation_reports', 'thesis_data_combined',
+                            'thesis_data_metrics'),
+    "Comparative Analysis": ('master_session_metrics', 'evaluation_reports', 'thesis_data_metrics'),
+    "Cross-Platform Analysis": ('master_session_metrics',),
+    "Anthropomorphism Analysis": ('anthropomorphism_modules',),
+    "Personality Analysis": (),
+    "Linkography Analysis": ('linkography_modules',),
+    "Integrated Conclusions": ('linkography_modules', 'master_session_metrics', 'evaluation_reports'),
+    "Graph ML Analysis": (),
+    "Technical Details": ('master_aggregate_metrics',),
+    "Export Options": ('master_session_metrics', 'master_aggregate_metrics', 'benchmark_report',
+                       'evaluation_reports', 'thesis_data_metrics'),
+}
+
+
+def _context_dataset(name):
+    """Dashboard attribute backed by a data context dataset, loaded on first access"""
+    return property(lambda self: self.context.get(name), doc=f"{name} (loaded on first use)")
+
+
 class BenchmarkDashboard:
+    master_session_metrics = _context_dataset('master_session_metrics')
+    master_aggregate_metrics = _context_dataset('master_aggregate_metrics')
+    benchmark_report = _context_dataset('benchmark_report')
+    evaluation_reports = _context_dataset('evaluation_reports')
+    summary_text = _context_dataset('summary_text')
+    thesis_data_combined = _context_dataset('thesis_data_combined')
+    thesis_data_metrics = _context_dataset('thesis_data_metrics')
+    linkography_modules = _context_dataset('linkography_modules')
+    anthropomorphism_modules = _context_dataset('anthropomorphism_modules')
+    
     def __init__(self):
         # Always use absolute path from script location for consistency
         # This ensures it works regardless of where the script is run from
@@ -137,32 +236,57 @@ class BenchmarkDashboard:
         # Ensure the directory exists
         self.results_path.mkdir(exist_ok=True, parents=True)
         
-        # Load master metrics if available
-        self.master_session_metrics = None
-        self.master_aggregate_metrics = None
-        self.load_master_metrics()
+        # Nothing is loaded here: sections read their datasets from the shared context on first use
+        self.context = get_dashboard_context()
+        self._register_data_sources()
+    
+    def _register_data_sources(self):
+        """Declare how every dataset and resource of the data context is loaded"""
+        context = self.context
+        thesis_data_path = self._get_thesis_data_path()
         
-        self.load_data()
+        def thesis_sources():
+            return thesis_data_path.glob("interactions_*.csv") if thesis_data_path else []
+        
+        context.register_dataset(
+            'master_session_metrics', lambda: self._load_master_metrics_file("master_session_metrics.csv"),
+            lambda: [self.results_path / "master_session_metrics.csv"])
+        context.register_dataset(
+            'master_aggregate_metrics', lambda: self._load_master_metrics_file("master_aggregate_metrics.csv"),
+            lambda: [self.results_path / "master_aggregate_metrics.csv"])
+        context.register_dataset(
+            'benchmark_report', self._load_benchmark_report,
+            lambda: [self.results_path / "benchmark_report.json"], default=dict)
+        context.register_dataset(
+            'evaluation_reports', self._load_evaluation_reports,
+            lambda: (self.results_path / "evaluation_reports").glob("*.json"), default=dict)
+        context.register_dataset(
+            'summary_text', self._load_summary_text,
+            lambda: [self.results_path / "benchmark_summary.md"], default=lambda: "Error loading summary")
+        context.register_dataset(
+            'thesis_data_combined', self.load_thesis_data_combined, thesis_sources, default=pd.DataFrame)
+        context.register_dataset(
+            'thesis_data_metrics',
+            lambda: self.calculate_metrics_from_thesis_data(context.get('thesis_data_combined')),
+            thesis_sources, default=dict)
+        context.register_resource('linkography_modules', _import_linkography_modules)
+        context.register_resource('anthropomorphism_modules', _import_anthropomorphism_modules)
+    
+    def _load_master_metrics_file(self, filename):
+        """Load a master metrics CSV file if available"""
+        path = self.results_path / filename
+        if not path.exists():
+            return None
+        df = pd.read_csv(path)
+        if filename == "master_session_metrics.csv":
+            print(f"Loaded master session metrics: {len(df)} sessions")
+        else:
+            print(f"Loaded master aggregate metrics: {len(df)} metrics")
+        return df
     
     def load_master_metrics(self):
         """Load master metrics CSV files if available"""
-        try:
-            # Load session metrics
-            session_metrics_path = self.results_path / "master_session_metrics.csv"
-            if session_metrics_path.exists():
-                self.master_session_metrics = pd.read_csv(session_metrics_path)
-                print(f"Loaded master session metrics: {len(self.master_session_metrics)} sessions")
-            
-            # Load aggregate metrics
-            aggregate_metrics_path = self.results_path / "master_aggregate_metrics.csv"
-            if aggregate_metrics_path.exists():
-                self.master_aggregate_metrics = pd.read_csv(aggregate_metrics_path)
-                print(f"Loaded master aggregate metrics: {len(self.master_aggregate_metrics)} metrics")
-                
-        except Exception as e:
-            print(f"Warning: Could not load master metrics: {e}")
-            self.master_session_metrics = None
-            self.master_aggregate_metrics = None
+        self.context.require(('master_session_metrics', 'master_aggregate_metrics'))
         
     def _get_thesis_data_path(self):
         """Get the correct path to thesis_data directory"""
@@ -700,7 +824,7 @@ class BenchmarkDashboard:
         
         if session_file.exists():
             try:
-                return pd.read_csv(session_file)
+                return read_session_file(session_file)
             except Exception as e:
                 st.warning(f"Error reading session {session_id}: {str(e)}")
                 return None
@@ -710,7 +834,7 @@ class BenchmarkDashboard:
             if existing_sessions:
                 try:
                     # Load a random existing session as a template
-                    sample_session = pd.read_csv(existing_sessions[0])
+                    sample_session = read_session_file(existing_sessions[0])
                     # Replace session_id to match requested one
                     sample_session['session_id'] = session_id
                     return sample_session
@@ -721,41 +845,13 @@ class BenchmarkDashboard:
     
     def load_thesis_data_combined(self):
         """Load and combine all thesis data CSV files (similar to _load_thesis_data in anthropomorphism)"""
-        import glob
-        
         thesis_data_path = self._get_thesis_data_path()
         if not thesis_data_path:
             return pd.DataFrame()
         
-        # Find all interaction CSV files
-        pattern = str(thesis_data_path / "interactions_*.csv")
-        csv_files = glob.glob(pattern)
-        
-        if not csv_files:
-            return pd.DataFrame()
-        
-        # Load and combine all CSV files
-        dfs = []
-        for file in csv_files:
-            try:
-                df = pd.read_csv(file)
-                if not df.empty:
-                    # Extract session ID from filename or use session_id column
-                    if 'session_id' not in df.columns or df['session_id'].isna().all():
-                        # Extract from filename (interactions_SESSION_ID.csv)
-                        match = re.search(r'interactions_([a-f0-9-]+)\.csv', file)
-                        if match:
-                            df['session_id'] = match.group(1)
-                    dfs.append(df)
-            except Exception as e:
-                print(f"Error loading {file}: {e}")
-        
-        if dfs:
-            # Combine all dataframes
-            combined_df = pd.concat(dfs, ignore_index=True)
-            return combined_df
-        else:
-            return pd.DataFrame()
+        # One columnar scan for converted sessions, CSV parsing only for new/changed ones;
+        # rows without a session_id get it from their file name
+        return load_combined(thesis_data_path, 'interactions')
     
     def calculate_metrics_from_thesis_data(self, thesis_df):
         """Calculate metrics directly from thesis data (similar to evaluation reports)"""
@@ -799,52 +895,44 @@ class BenchmarkDashboard:
         
         return session_metrics
     
+    def _load_benchmark_report(self):
+        """Load benchmark report if it exists"""
+        benchmark_report_path = self.results_path / "benchmark_report.json"
+        if not benchmark_report_path.exists():
+            print(f"Warning: benchmark_report.json not found at {benchmark_report_path}")
+            return {}
+        with open(benchmark_report_path, 'r') as f:
+            return json.load(f)
+    
+    def _load_evaluation_reports(self):
+        """Load evaluation reports keyed by session id"""
+        evaluation_reports = {}
+        eval_dir = self.results_path / "evaluation_reports"
+        if eval_dir.exists():
+            for eval_file in eval_dir.glob("*.json"):
+                try:
+                    with open(eval_file, 'r') as f:
+                        session_data = json.load(f)
+                        session_id = session_data.get('session_metrics', {}).get('session_id', eval_file.stem)
+                        evaluation_reports[session_id] = session_data
+                except Exception as e:
+                    print(f"Warning: Error loading {eval_file}: {e}")
+        else:
+            print(f"Warning: evaluation_reports directory not found at {eval_dir}")
+        return evaluation_reports
+    
+    def _load_summary_text(self):
+        """Load benchmark summary if exists"""
+        summary_path = self.results_path / "benchmark_summary.md"
+        if not summary_path.exists():
+            return "Summary not available"
+        with open(summary_path, 'r') as f:
+            return f.read()
+    
     def load_data(self):
-        """Load all benchmarking results"""
-        try:
-            # Load benchmark report if it exists
-            benchmark_report_path = self.results_path / "benchmark_report.json"
-            if benchmark_report_path.exists():
-                with open(benchmark_report_path, 'r') as f:
-                    self.benchmark_report = json.load(f)
-            else:
-                print(f"Warning: benchmark_report.json not found at {benchmark_report_path}")
-                self.benchmark_report = {}
-            
-            # Load evaluation reports
-            self.evaluation_reports = {}
-            eval_dir = self.results_path / "evaluation_reports"
-            if eval_dir.exists():
-                for eval_file in eval_dir.glob("*.json"):
-                    try:
-                        with open(eval_file, 'r') as f:
-                            session_data = json.load(f)
-                            session_id = session_data.get('session_metrics', {}).get('session_id', eval_file.stem)
-                            self.evaluation_reports[session_id] = session_data
-                    except Exception as e:
-                        print(f"Warning: Error loading {eval_file}: {e}")
-            else:
-                print(f"Warning: evaluation_reports directory not found at {eval_dir}")
-            
-            # Load benchmark summary if exists
-            summary_path = self.results_path / "benchmark_summary.md"
-            if summary_path.exists():
-                with open(summary_path, 'r') as f:
-                    self.summary_text = f.read()
-            else:
-                self.summary_text = "Summary not available"
-            
-            # Load thesis data directly for up-to-date metrics
-            self.thesis_data_combined = self.load_thesis_data_combined()
-            self.thesis_data_metrics = self.calculate_metrics_from_thesis_data(self.thesis_data_combined)
-                
-        except Exception as e:
-            st.error(f"Error loading data: {str(e)}")
-            self.benchmark_report = {}
-            self.evaluation_reports = {}
-            self.summary_text = "Error loading summary"
-            self.thesis_data_combined = pd.DataFrame()
-            self.thesis_data_metrics = {}
+        """Load all benchmarking results (sections normally load only what they need, on first use)"""
+        self.context.require(('benchmark_report', 'evaluation_reports', 'summary_text',
+                              'thesis_data_combined', 'thesis_data_metrics'))
     
     def render_header(self):
         """Render dashboard header"""
@@ -2519,16 +2607,16 @@ class BenchmarkDashboard:
         placeholder = st.empty()
         
         with placeholder.container():
-            if not ANTHROPOMORPHISM_AVAILABLE:
+            if not self.anthropomorphism_modules:
                 st.warning("Anthropomorphism analysis modules not available. Please ensure all dependencies are installed.")
                 return
             
             # Use the enhanced version from anthropomorphism_dashboard_integration
-            create_anthropomorphism_dashboard_section()
+            self.anthropomorphism_modules.create_anthropomorphism_dashboard_section()
         return
         
         # Initialize evaluator
-        anthropomorphism_evaluator = AnthropomorphismMetricsEvaluator()
+        anthropomorphism_evaluator = self.anthropomorphism_modules.AnthropomorphismMetricsEvaluator()
         
         # Process sessions to get anthropomorphism metrics
         anthropomorphism_data = []
@@ -2623,13 +2711,13 @@ class BenchmarkDashboard:
         # Dependency Progression Chart
         st.subheader("Dependency Progression Throughout Sessions")
         
-        fig_progression = create_dependency_progression_chart()
+        fig_progression = self.anthropomorphism_modules.create_dependency_progression_chart()
         st.plotly_chart(fig_progression, use_container_width=True)
         
         # Comparative Radar Chart
         st.subheader("Multi-Dimensional Dependency Analysis")
         
-        fig_radar = create_dependency_radar_chart()
+        fig_radar = self.anthropomorphism_modules.create_dependency_radar_chart()
         st.plotly_chart(fig_radar, use_container_width=True)
         
         # Key insights
@@ -2660,7 +2748,7 @@ class BenchmarkDashboard:
         
         with col1:
             # Autonomy vs Dependency Timeline
-            fig_timeline = create_autonomy_timeline()
+            fig_timeline = self.anthropomorphism_modules.create_autonomy_timeline()
             st.plotly_chart(fig_timeline, use_container_width=True)
         
         with col2:
@@ -2687,7 +2775,7 @@ class BenchmarkDashboard:
         # Pattern Analysis
         st.subheader("Autonomy Pattern Analysis")
         
-        fig_patterns = create_autonomy_patterns()
+        fig_patterns = self.anthropomorphism_modules.create_autonomy_patterns()
         st.plotly_chart(fig_patterns, use_container_width=True)
     
     def _render_anthropomorphism_detection(self, data):
@@ -2703,13 +2791,13 @@ class BenchmarkDashboard:
         # Language Pattern Distribution
         st.subheader("Anthropomorphic Language Patterns")
         
-        fig_patterns = create_language_pattern_chart()
+        fig_patterns = self.anthropomorphism_modules.create_language_pattern_chart()
         st.plotly_chart(fig_patterns, use_container_width=True)
         
         # Emotional Attachment Timeline
         st.subheader("Emotional Attachment Progression")
         
-        fig_attachment = create_attachment_timeline()
+        fig_attachment = self.anthropomorphism_modules.create_attachment_timeline()
         st.plotly_chart(fig_attachment, use_container_width=True)
         
         # Risk Summary
@@ -2740,7 +2828,7 @@ class BenchmarkDashboard:
         """, unsafe_allow_html=True)
         
         # Topic Distribution
-        fig_topics = create_topic_distribution_chart()
+        fig_topics = self.anthropomorphism_modules.create_topic_distribution_chart()
         st.plotly_chart(fig_topics, use_container_width=True)
         
         # Boundary Maintenance Analysis
@@ -2810,7 +2898,7 @@ class BenchmarkDashboard:
         # Cognitive Complexity Heatmap
         st.subheader("Cognitive Complexity Throughout Sessions")
         
-        fig_heatmap = create_cognitive_complexity_heatmap()
+        fig_heatmap = self.anthropomorphism_modules.create_cognitive_complexity_heatmap()
         st.plotly_chart(fig_heatmap, use_container_width=True)
         
         # Vocabulary Expansion
@@ -2818,7 +2906,7 @@ class BenchmarkDashboard:
         
         with col1:
             st.subheader("Technical Vocabulary Growth")
-            fig_vocab = create_vocabulary_growth_chart()
+            fig_vocab = self.anthropomorphism_modules.create_vocabulary_growth_chart()
             st.plotly_chart(fig_vocab, use_container_width=True)
         
         with col2:
@@ -2853,7 +2941,7 @@ class BenchmarkDashboard:
         # Risk Matrix
         st.subheader("Cognitive Dependency Risk Matrix")
         
-        fig_matrix = create_risk_matrix()
+        fig_matrix = self.anthropomorphism_modules.create_risk_matrix()
         st.plotly_chart(fig_matrix, use_container_width=True)
         
         # Intervention Recommendations
@@ -2978,19 +3066,17 @@ class BenchmarkDashboard:
         """Render Linkography analysis section"""
         st.markdown('<h2 class="sub-header">Linkography Analysis</h2>', unsafe_allow_html=True)
         
-        if not LINKOGRAPHY_AVAILABLE:
+        if not self.linkography_modules:
             st.error("Linkography modules are not available. Please check installation.")
             return
         
         
-        # Initialize linkography analyzer
-        analyzer = LinkographySessionAnalyzer()
-        visualizer = LinkographVisualizer()
-        enhanced_visualizer = EnhancedLinkographVisualizer()
+        # Cached linkography analyzer
+        analyzer, visualizer, enhanced_visualizer = get_linkography_components()
         
-        # Analyze all sessions
+        # Analyze all sessions (recomputed only when evaluation reports or linkography files change)
         with st.spinner("Analyzing design sessions for linkographic patterns..."):
-            linkograph_sessions = analyzer.analyze_all_sessions()
+            linkograph_sessions = load_linkography_sessions(analyzer.sources_fingerprint())
         
         if not linkograph_sessions:
             st.warning("No sessions available for linkography analysis.")
@@ -3224,7 +3310,7 @@ class BenchmarkDashboard:
             Breakthrough moments are identified by sudden increases in link density, 
             indicating "aha moments" or cognitive integration points in the design process.
             """)
-            fig_breakthrough = create_breakthrough_detection_chart(overall_linkograph)
+            fig_breakthrough = self.linkography_modules.create_breakthrough_detection_chart(overall_linkograph)
             st.plotly_chart(fig_breakthrough, use_container_width=True)
             
             st.markdown("---")  # Add separator
@@ -3326,13 +3412,13 @@ class BenchmarkDashboard:
         and Anthropomorphism Detection.
         """)
         
-        if not LINKOGRAPHY_AVAILABLE:
+        if not self.linkography_modules:
             st.warning("Integrated conclusions require linkography modules to be available.")
             return
         
         # Initialize analyzers
-        conclusion_analyzer = IntegratedConclusionAnalyzer()
-        insight_extractor = LinkographyInsightExtractor()
+        conclusion_analyzer = self.linkography_modules.IntegratedConclusionAnalyzer()
+        insight_extractor = self.linkography_modules.LinkographyInsightExtractor()
         
         # Session selector
         st.markdown("### Select Session for Detailed Analysis")
@@ -3399,10 +3485,10 @@ class BenchmarkDashboard:
             
             # Try to get linkography data from the aggregated report
             try:
-                with open('benchmarking/results/aggregated_linkography_report.json', 'r') as f:
-                    linkography_report = json.load(f)
-                    if selected_session in linkography_report.get('session_details', {}):
-                        linkography_data = linkography_report['session_details'][selected_session]
+                report_path = 'benchmarking/results/aggregated_linkography_report.json'
+                linkography_report = load_json_report(report_path, file_fingerprint([report_path]))
+                if selected_session in linkography_report.get('session_details', {}):
+                    linkography_data = linkography_report['session_details'][selected_session]
             except:
                 pass
             
@@ -7810,6 +7896,10 @@ class BenchmarkDashboard:
             # Force a rerun to ensure the scroll takes effect
             st.rerun()
         
+        # Load only what the selected section needs (memoized across reruns and sessions)
+        with st.spinner("Loading data..."):
+            self.context.require(SECTION_REQUIREMENTS.get(selected_section, ()))
+        
         # Use a placeholder to ensure clean section switching
         section_container = st.empty()
         
@@ -0,0 +1,91 @@
+"""
+MEGA Architectural Mentor - Dashboard Data Context
+Lazily loaded datasets and resources shared by the benchmark dashboard sections
+
+BenchmarkDashboard used to load master metrics, the benchmark report, every
+evaluation JSON and the combined thesis data on every rerun, whichever section
+was open. Sections now declare what they need (SECTION_REQUIREMENTS in
+benchmark_dashboard.py) and read it from one DashboardDataContext:
+
+- A dataset is loaded on first use and kept together with a fingerprint of its
+  source files; it is reloaded only when one of them is added, removed or
+  modified.
+- A resource (optional modules, models) is built once on first use and kept
+  for the life of the process.
+
+The dashboard keeps a single context in st.cache_resource, so loaded values are
+shared across reruns and browser sessions. Values must be treated as read-only.
+"""
+
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+try:
+    from benchmarking.results_cache import file_fingerprint
+except ImportError:
+    from results_cache import file_fingerprint
+
+
+@dataclass
+class DatasetSpec:
+    """How to load one dataset and which files it is derived from."""
+    loader: Callable[[], Any]
+    sources: Callable[[], Iterable[Path]]
+    default: Callable[[], Any] = lambda: None  # value used when loading fails
+
+
+class DashboardDataContext:
+    """Datasets and resources loaded on first use and memoized."""
+
+    def __init__(self):
+        self._datasets: Dict[str, DatasetSpec] = {}
+        self._resources: Dict[str, Callable[[], Any]] = {}
+        self._values: Dict[str, Tuple[Optional[Tuple], Any]] = {}
+        # Reentrant: a loader may read another dataset of the same context
+        self._lock = threading.RLock()
+
+    def register_dataset(self, name: str, loader: Callable[[], Any], sources: Callable[[], Iterable[Path]],
+                         default: Callable[[], Any] = lambda: None) -> None:
+        self._datasets[name] = DatasetSpec(loader, sources, default)
+
+    def register_resource(self, name: str, factory: Callable[[], Any]) -> None:
+        self._resources[name] = factory
+
+    def get(self, name: str) -> Any:
+        """The named dataset (reloaded if its sources changed) or resource (built once)."""
+        if name in self._resources:
+            with self._lock:
+                if name not in self._values:
+                    self._values[name] = (None, self._resources[name]())
+                return self._values[name][1]
+
+        spec = self._datasets[name]
+        fingerprint = file_fingerprint(spec.sources())
+        with self._lock:
+            cached = self._values.get(name)
+            if cached is not None and cached[0] == fingerprint:
+                return cached[1]
+            try:
+                value = spec.loader()
+            except Exception as e:
+                print(f"Warning: Could not load {name}: {e}")
+                value = spec.default()
+            self._values[name] = (fingerprint, value)
+            return value
+
+    def require(self, names: Iterable[str]) -> List[Any]:
+        """Load every named dataset and resource (e.g. before rendering a section)."""
+        return [self.get(name) for name in names]
+
+    def is_loaded(self, name: str) -> bool:
+        return name in self._values
+
+    def invalidate(self, name: Optional[str] = None) -> None:
+        """Drop one memoized value, or all of them."""
+        with self._lock:
+            if name is None:
+                self._values.clear()
+            else:
+                self._values.pop(name, None)
@@ -12,6 +12,12 @@ from datetime import datetime
 from collections import defaultdict
 import re
 
+try:
+    from benchmarking.linkography_journal import find_linkography_files, load_linkography_data
+except ImportError:
+    from linkography_journal import find_linkography_files, load_linkography_data
+
+
 class MasterMetricsGenerator:
     def __init__(self, thesis_data_path="../thesis_data", output_path="benchmarking/results"):
         # Use absolute path resolution from current file location
@@ -118,14 +124,16 @@ class MasterMetricsGenerator:
     def load_linkography_data(self):
         """Load linkography analysis results"""
         linkography = {}
-        pattern = str(self.thesis_data_path / "linkography/linkography_*.json")
+        linkography_dir = self.thesis_data_path / "linkography"
+        if not linkography_dir.exists():
+            return linkography
         
-        for file in glob.glob(pattern):
+        # Finalized linkography JSON, or the journal of a session that was never finalized
+        for file in find_linkography_files(linkography_dir).values():
             try:
-                with open(file, 'r') as f:
-                    data = json.load(f)
-                    session_id = self.extract_session_id(file)
-                    linkography[session_id] = data
+                data = load_linkography_data(file)
+                session_id = self.extract_session_id(str(file))
+                linkography[session_id] = data
             except Exception as e:
                 print(f"   Error loading {file}: {e}")
                 
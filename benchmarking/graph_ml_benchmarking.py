@@ -2,11 +2,15 @@
 # This module implements Graph Neural Networks for analyzing user interaction patterns
 # and generating cognitive benchmarks based on the thesis requirements
 
+import ast
+import hashlib
 import json
+import os
+import time
 import numpy as np
 import pandas as pd
 from datetime import datetime
-from typing import Dict, List, Tuple, Any, Optional
+from typing import Dict, List, Tuple, Any, Optional, Union
 import networkx as nx
 from sklearn.preprocessing import StandardScaler
 from sklearn.cluster import KMeans
@@ -14,7 +18,7 @@ from sklearn.metrics import silhouette_score
 import torch
 import torch.nn as nn
 import torch.nn.functional as F
-from torch_geometric.data import Data, DataLoader
+from torch_geometric.data import Batch, Data, DataLoader
 from torch_geometric.nn import GCNConv, GATConv, SAGEConv, global_mean_pool
 import matplotlib.pyplot as plt
 import seaborn as sns
@@ -26,161 +30,393 @@ from thesis_colors import (
     get_color_palette, get_metric_color, get_proficiency_color, get_agent_color
 )
 
+# Look-ahead window for conceptual edges: interaction i links to i+1 .. i+CONCEPTUAL_WINDOW
+CONCEPTUAL_WINDOW = 4
+# Minimum Jaccard similarity of cognitive flags for a conceptual edge
+CONCEPTUAL_SIMILARITY_THRESHOLD = 0.5
+
+SKILL_LEVELS = ('beginner', 'intermediate', 'advanced')
+AGENT_TYPES = ('socratic', 'cognitive', 'knowledge', 'context')
+
+# Columns of the node feature matrix (InteractionGraph.x), in order
+NODE_FEATURE_NAMES = (
+    ('cognitive_load', 'learning_indicator', 'engagement_score',
+     'prevents_offloading', 'encourages_thinking', 'provides_scaffolding')
+    + tuple(f'skill_{level}' for level in SKILL_LEVELS)
+    + tuple(f'agent_{agent}' for agent in AGENT_TYPES)
+)
+
+# CognitiveGNN hyperparameters; output classes are Beginner, Intermediate, Advanced
+GNN_HIDDEN_DIM = 64
+GNN_OUTPUT_DIM = 3
+GNN_NUM_HEADS = 4
+GNN_BATCH_SIZE = 32
+GNN_LEARNING_RATE = 0.001
+# Mean learning indicator of a graph below 0.4 -> Beginner, below 0.7 -> Intermediate, else Advanced
+PSEUDO_LABEL_THRESHOLDS = (0.4, 0.7)
+
+GNN_CHECKPOINT_VERSION = 1
+GNN_CHECKPOINT_FILENAME = "gnn_checkpoint.pt"
+# torch threads for batched inference (0 = torch default)
+GNN_INFERENCE_THREADS = int(os.getenv("GNN_INFERENCE_THREADS", "0"))
+
+# Node attribute name -> source column of the interactions data
+NODE_ATTRIBUTE_COLUMNS = {
+    'timestamp': 'timestamp',
+    'interaction_type': 'input_type',
+    'agents_used': 'agents_used',
+    'response_type': 'response_type',
+    'skill_level': 'student_skill_level',
+    'prevents_offloading': 'prevents_cognitive_offloading',
+    'encourages_thinking': 'encourages_deep_thinking',
+    'provides_scaffolding': 'provides_scaffolding'
+}
+
+
+def _flag_column(values: pd.Series) -> np.ndarray:
+    """0/1 float array of a boolean column (also accepts 'True'/'False' strings from malformed rows)"""
+    if values.dtype == bool:
+        return values.to_numpy(dtype=np.float64)
+    lowered = values.astype(str).str.strip().str.lower()
+    return lowered.isin(('true', '1', '1.0')).to_numpy(dtype=np.float64)
+
+
+def parse_cognitive_flags(value: Any) -> frozenset:
+    """Flags of a cognitive_flags cell such as "['high_cop', 'multi_agent']" (empty for anything else)"""
+    if not isinstance(value, str):
+        return frozenset()
+    try:
+        flags = ast.literal_eval(value)
+    except (ValueError, SyntaxError, MemoryError, RecursionError):
+        return frozenset()
+    if not isinstance(flags, (list, tuple, set)):
+        return frozenset()
+    return frozenset(str(flag) for flag in flags)
+
+
+def feature_schema_hash() -> str:
+    """Hash of everything a trained CognitiveGNN depends on besides the data: node features, model and labels"""
+    schema = {
+        'version': GNN_CHECKPOINT_VERSION,
+        'node_features': NODE_FEATURE_NAMES,
+        'hidden_dim': GNN_HIDDEN_DIM,
+        'output_dim': GNN_OUTPUT_DIM,
+        'num_heads': GNN_NUM_HEADS,
+        'batch_size': GNN_BATCH_SIZE,
+        'learning_rate': GNN_LEARNING_RATE,
+        'pseudo_label_thresholds': PSEUDO_LABEL_THRESHOLDS,
+    }
+    return hashlib.sha256(json.dumps(schema, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+def graphs_data_hash(graphs: List["InteractionGraph"]) -> str:
+    """sha256 over the node features and edges of graphs, in order"""
+    digest = hashlib.sha256()
+    for graph in graphs:
+        for array in (graph.x, graph.edge_index, graph.edge_weight):
+            digest.update(str(array.shape).encode('utf-8'))
+            digest.update(np.ascontiguousarray(array).tobytes())
+    return digest.hexdigest()
+
+
+def pseudo_labels(graphs: List["InteractionGraph"]) -> np.ndarray:
+    """Proficiency pseudo-label of each graph from its mean learning indicator (placeholder for actual labels)"""
+    column = NODE_FEATURE_NAMES.index('learning_indicator')
+    means = np.array([graph.x[:, column].mean() if graph.num_nodes else np.nan for graph in graphs],
+                     dtype=np.float32)
+    # NaN (no nodes) lands in the last class, like the failed comparisons it replaces
+    return np.digitize(means, PSEUDO_LABEL_THRESHOLDS).astype(np.int64)
+
+
+def conceptual_edges_from_flags(flags: List[frozenset], window: int = CONCEPTUAL_WINDOW,
+                                threshold: float = CONCEPTUAL_SIMILARITY_THRESHOLD
+                                ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    (source, target, similarity) of every pair i < j <= i + window whose flag
+    sets are both non-empty and have Jaccard similarity above threshold.
+
+    Flags become a boolean row x flag matrix, so every look-ahead distance is
+    one vectorized intersection/union count.
+    """
+    n = len(flags)
+    vocabulary = {flag: k for k, flag in enumerate(sorted(set().union(*flags)))} if n > 1 else {}
+    if not vocabulary:
+        return np.array([], dtype=np.int64), np.array([], dtype=np.int64), np.array([], dtype=np.float64)
+
+    membership = np.zeros((n, len(vocabulary)), dtype=bool)
+    for row, row_flags in enumerate(flags):
+        membership[row, [vocabulary[flag] for flag in row_flags]] = True
+    counts = membership.sum(axis=1)
+
+    sources, targets, similarities = [], [], []
+    for distance in range(1, min(window, n - 1) + 1):
+        head, tail = membership[:-distance], membership[distance:]
+        union = (head | tail).sum(axis=1)
+        both = (counts[:-distance] > 0) & (counts[distance:] > 0)
+        similarity = np.divide((head & tail).sum(axis=1), union, out=np.zeros(len(union)), where=both)
+        keep = np.flatnonzero(both & (similarity > threshold))
+        sources.append(keep)
+        targets.append(keep + distance)
+        similarities.append(similarity[keep])
+
+    source, target, similarity = np.concatenate(sources), np.concatenate(targets), np.concatenate(similarities)
+    # Same order as the nested loop over i, then j
+    order = np.lexsort((target, source))
+    return source[order], target[order], similarity[order]
+
+
 class InteractionGraph:
-    """Constructs and manages interaction graphs from user data"""
+    """
+    Interaction graph of a session, stored column-wise.
+
+    Nodes are a node table plus a float32 feature matrix; edges are recorded as
+    id arrays and resolved into edge_index/edge_weight arrays on first access,
+    with networkx DiGraph semantics (a repeated edge keeps its first position
+    and takes its last attributes; a repeated node id likewise). The networkx
+    graph itself is only built when .graph is accessed, e.g. for visualization.
+    """
     
     def __init__(self):
-        self.graph = nx.DiGraph()
-        self.node_features = {}
-        self.edge_features = {}
+        # Raw insertion log: chunks of (ids, attribute table, features) and edge arrays
+        self._node_chunks: List[Tuple[List[str], pd.DataFrame, np.ndarray]] = []
+        self._edge_chunks: List[Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]] = []
         self.temporal_edges = []
         self.conceptual_edges = []
-        
+        self._invalidate()
+    
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_nx_graph'] = None  # rebuilt on demand
+        return state
+    
+    def _invalidate(self):
+        self._nodes = None
+        self._edges = None
+        self._nx_graph = None
+    
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> "InteractionGraph":
+        """Build the graph of one session's interactions in a few column operations"""
+        graph = cls()
+        ids = (df['session_id'].astype(str) + '_' + df['interaction_number'].astype(str)).tolist()
+        graph._append_nodes(ids, df)
+        
+        # Temporal edges between consecutive interactions
+        id_array = np.array(ids, dtype=object)
+        graph._append_edges(id_array[:-1], id_array[1:], np.ones(max(len(ids) - 1, 0)), conceptual=False)
+        
+        # Conceptual edges based on shared cognitive flags
+        # (Simplified - in practice, use embeddings for semantic similarity)
+        flags = [parse_cognitive_flags(value) for value in df['cognitive_flags']]
+        source, target, similarity = conceptual_edges_from_flags(flags)
+        graph._append_edges(id_array[source], id_array[target], similarity, conceptual=True)
+        return graph
+    
     def add_interaction_node(self, 
                            interaction_id: str,
                            interaction_data: Dict[str, Any]):
         """Add an interaction as a node in the graph"""
-        
-        # Extract node features
-        node_attrs = {
-            'timestamp': interaction_data['timestamp'],
-            'interaction_type': interaction_data['input_type'],
-            'agents_used': interaction_data['agents_used'],
-            'response_type': interaction_data['response_type'],
-            'cognitive_load': self._calculate_cognitive_load(interaction_data),
-            'learning_indicator': self._calculate_learning_indicator(interaction_data),
-            'engagement_score': self._calculate_engagement_score(interaction_data),
-            'skill_level': interaction_data['student_skill_level'],
-            'prevents_offloading': interaction_data['prevents_cognitive_offloading'],
-            'encourages_thinking': interaction_data['encourages_deep_thinking'],
-            'provides_scaffolding': interaction_data['provides_scaffolding']
-        }
-        
-        self.graph.add_node(interaction_id, **node_attrs)
-        self.node_features[interaction_id] = self._encode_node_features(node_attrs)
+        self._append_nodes([interaction_id], pd.DataFrame([interaction_data]))
         
     def add_temporal_edge(self, source_id: str, target_id: str):
         """Add temporal edge between consecutive interactions"""
-        
-        edge_attrs = {
-            'edge_type': 'temporal',
-            'weight': 1.0
-        }
-        
-        self.graph.add_edge(source_id, target_id, **edge_attrs)
-        self.temporal_edges.append((source_id, target_id))
+        self._append_edges(np.array([source_id], dtype=object), np.array([target_id], dtype=object),
+                           np.ones(1), conceptual=False)
         
     def add_conceptual_edge(self, source_id: str, target_id: str, similarity: float):
         """Add conceptual edge based on content similarity"""
-        
-        if similarity > 0.5:  # Threshold for conceptual connection
-            edge_attrs = {
-                'edge_type': 'conceptual',
-                'weight': similarity
-            }
-            
-            self.graph.add_edge(source_id, target_id, **edge_attrs)
-            self.conceptual_edges.append((source_id, target_id))
+        if similarity > CONCEPTUAL_SIMILARITY_THRESHOLD:  # Threshold for conceptual connection
+            self._append_edges(np.array([source_id], dtype=object), np.array([target_id], dtype=object),
+                               np.array([similarity], dtype=np.float64), conceptual=True)
+    
+    def _append_nodes(self, ids: List[str], df: pd.DataFrame):
+        columns = {attr: df[column].to_numpy() for attr, column in NODE_ATTRIBUTE_COLUMNS.items()}
+        derived = {
+            'cognitive_load': self._cognitive_load(df),
+            'learning_indicator': self._learning_indicator(df),
+            'engagement_score': self._engagement_score(df)
+        }
+        # Derived scores sit after response_type, as in the networkx node attributes
+        names = list(NODE_ATTRIBUTE_COLUMNS)
+        attrs = {**columns, **derived}
+        table = pd.DataFrame({name: attrs[name] for name in names[:4] + list(derived) + names[4:]})
+        self._node_chunks.append((list(ids), table, self._encode_node_features(df, table)))
+        self._invalidate()
     
-    def _calculate_cognitive_load(self, interaction: Dict) -> float:
+    def _append_edges(self, sources: np.ndarray, targets: np.ndarray, weights: np.ndarray, conceptual: bool):
+        if len(sources) == 0:
+            return
+        self._edge_chunks.append((sources, targets, np.asarray(weights, dtype=np.float64),
+                                  np.full(len(sources), conceptual)))
+        log = self.conceptual_edges if conceptual else self.temporal_edges
+        log.extend(zip(sources.tolist(), targets.tolist()))
+        self._invalidate()
+    
+    def _cognitive_load(self, df: pd.DataFrame) -> np.ndarray:
         """Calculate cognitive load from interaction metrics"""
         
         # Factors that increase cognitive load
-        input_complexity = len(interaction['student_input'].split()) / 50.0
-        response_complexity = len(interaction['agent_response'].split()) / 100.0
-        multi_agent = 1.0 if interaction['multi_agent_coordination'] else 0.5
+        input_complexity = df['student_input'].fillna('').astype(str).str.split().str.len().to_numpy() / 50.0
+        response_complexity = df['agent_response'].fillna('').astype(str).str.split().str.len().to_numpy() / 100.0
+        multi_agent = np.where(_flag_column(df['multi_agent_coordination']) > 0, 1.0, 0.5)
         
         # Normalize to 0-1 scale
-        cognitive_load = min((input_complexity + response_complexity) * multi_agent, 1.0)
-        
-        return cognitive_load
+        return np.minimum((input_complexity + response_complexity) * multi_agent, 1.0)
     
-    def _calculate_learning_indicator(self, interaction: Dict) -> float:
+    def _learning_indicator(self, df: pd.DataFrame) -> np.ndarray:
         """Calculate learning effectiveness indicator"""
         
         factors = [
-            interaction['prevents_cognitive_offloading'],
-            interaction['encourages_deep_thinking'],
-            interaction['provides_scaffolding'],
-            interaction['maintains_engagement'],
-            interaction['adapts_to_skill_level']
+            'prevents_cognitive_offloading',
+            'encourages_deep_thinking',
+            'provides_scaffolding',
+            'maintains_engagement',
+            'adapts_to_skill_level'
         ]
         
-        return sum(factors) / len(factors)
+        return sum(_flag_column(df[factor]) for factor in factors) / len(factors)
     
-    def _calculate_engagement_score(self, interaction: Dict) -> float:
+    def _engagement_score(self, df: pd.DataFrame) -> np.ndarray:
         """Calculate user engagement score"""
         
         # Based on input characteristics and response patterns
-        question_asked = 1.0 if '?' in interaction['student_input'] else 0.5
-        elaborative_input = 1.0 if interaction['input_length'] > 10 else 0.3
-        maintained_engagement = 1.0 if interaction['maintains_engagement'] else 0.5
+        question_asked = np.where(df['student_input'].astype(str).str.contains('?', regex=False), 1.0, 0.5)
+        elaborative_input = np.where(pd.to_numeric(df['input_length'], errors='coerce') > 10, 1.0, 0.3)
+        maintained_engagement = np.where(_flag_column(df['maintains_engagement']) > 0, 1.0, 0.5)
         
         return (question_asked + elaborative_input + maintained_engagement) / 3.0
     
-    def _encode_node_features(self, attrs: Dict) -> np.ndarray:
-        """Encode node attributes as feature vector"""
-        
-        # Categorical encodings
-        skill_encoding = {
-            'beginner': [1, 0, 0],
-            'intermediate': [0, 1, 0],
-            'advanced': [0, 0, 1]
-        }
-        
-        input_type_encoding = {
-            'feedback_request': [1, 0, 0, 0, 0],
-            'improvement_seeking': [0, 1, 0, 0, 0],
-            'knowledge_seeking': [0, 0, 1, 0, 0],
-            'confusion_expression': [0, 0, 0, 1, 0],
-            'general_statement': [0, 0, 0, 0, 1]
-        }
-        
-        # Combine features
-        features = []
-        
-        # Numerical features
-        features.extend([
-            attrs['cognitive_load'],
-            attrs['learning_indicator'],
-            attrs['engagement_score'],
-            float(attrs['prevents_offloading']),
-            float(attrs['encourages_thinking']),
-            float(attrs['provides_scaffolding'])
-        ])
+    def _encode_node_features(self, df: pd.DataFrame, table: pd.DataFrame) -> np.ndarray:
+        """Encode node attributes as a feature matrix (one row per node)"""
+        
+        columns = [
+            # Numerical features
+            table['cognitive_load'].to_numpy(dtype=np.float64),
+            table['learning_indicator'].to_numpy(dtype=np.float64),
+            table['engagement_score'].to_numpy(dtype=np.float64),
+            _flag_column(table['prevents_offloading']),
+            _flag_column(table['encourages_thinking']),
+            _flag_column(table['provides_scaffolding'])
+        ]
         
-        # Categorical features
-        features.extend(skill_encoding.get(attrs['skill_level'], [0, 0, 0]))
+        # Categorical features (one-hot skill level)
+        skill_level = table['skill_level']
+        columns.extend((skill_level == level).to_numpy(dtype=np.float64) for level in SKILL_LEVELS)
         
         # Agent usage (binary encoding for each agent type)
-        agent_types = ['socratic', 'cognitive', 'knowledge', 'context']
-        agent_encoding = [1.0 if agent in str(attrs['agents_used']) else 0.0 for agent in agent_types]
-        features.extend(agent_encoding)
+        agents_used = table['agents_used'].astype(str)
+        columns.extend(agents_used.str.contains(agent, regex=False).to_numpy(dtype=np.float64)
+                       for agent in AGENT_TYPES)
         
-        return np.array(features, dtype=np.float32)
+        return np.column_stack(columns).astype(np.float32)
     
-    def to_pytorch_geometric(self) -> Data:
-        """Convert NetworkX graph to PyTorch Geometric format"""
-        
-        # Get node features
-        node_ids = list(self.graph.nodes())
-        x = torch.tensor([self.node_features[nid] for nid in node_ids], dtype=torch.float)
-        
-        # Get edge indices
-        edge_index = []
-        edge_attr = []
-        
-        for source, target in self.graph.edges():
-            source_idx = node_ids.index(source)
-            target_idx = node_ids.index(target)
-            edge_index.append([source_idx, target_idx])
+    def _resolve_nodes(self):
+        if self._nodes is None:
+            if self._node_chunks:
+                ids = [node_id for chunk_ids, _, _ in self._node_chunks for node_id in chunk_ids]
+                table = pd.concat([chunk[1] for chunk in self._node_chunks], ignore_index=True)
+                features = np.concatenate([chunk[2] for chunk in self._node_chunks])
+            else:
+                ids, table = [], pd.DataFrame(columns=list(NODE_ATTRIBUTE_COLUMNS))
+                features = np.zeros((0, len(NODE_FEATURE_NAMES)), dtype=np.float32)
             
-            # Edge features
-            edge_data = self.graph[source][target]
-            edge_attr.append([edge_data['weight']])
+            # A repeated id is one node: first position, last attributes
+            index = pd.Index(ids)
+            if index.has_duplicates:
+                codes, unique_ids = pd.factorize(index)
+                last_row = pd.Series(np.arange(len(codes))).groupby(codes).last().to_numpy()
+                ids = list(unique_ids)
+                table = table.iloc[last_row].reset_index(drop=True)
+                features = features[last_row]
+            self._nodes = (ids, table, features)
+        return self._nodes
+    
+    def _resolve_edges(self):
+        if self._edges is None:
+            node_index = pd.Index(self.node_ids)
+            if self._edge_chunks:
+                sources, targets, weights, conceptual = (np.concatenate(parts) for parts in zip(*self._edge_chunks))
+                source = node_index.get_indexer(sources)
+                target = node_index.get_indexer(targets)
+                if (source < 0).any() or (target < 0).any():
+                    raise KeyError("Edge refers to an interaction that is not a node of the graph")
+            else:
+                source = target = np.array([], dtype=np.int64)
+                weights, conceptual = np.array([], dtype=np.float64), np.array([], dtype=bool)
+            
+            # A repeated edge keeps its first position and takes its last attributes;
+            # edges are ordered by source node, then by first insertion (networkx adjacency order)
+            key = source * max(len(node_index), 1) + target
+            _, first = np.unique(key, return_index=True)
+            _, last_reversed = np.unique(key[::-1], return_index=True)
+            last = len(key) - 1 - last_reversed
+            order = np.lexsort((first, source[first]))
+            first, last = first[order], last[order]
+            self._edges = (np.vstack([source[first], target[first]]).astype(np.int64),
+                           weights[last], conceptual[last])
+        return self._edges
+    
+    @property
+    def node_ids(self) -> List[str]:
+        return self._resolve_nodes()[0]
+    
+    @property
+    def node_table(self) -> pd.DataFrame:
+        """Node attributes, one row per node in node_ids order"""
+        return self._resolve_nodes()[1]
+    
+    @property
+    def x(self) -> np.ndarray:
+        """Node feature matrix (float32), one row per node in node_ids order"""
+        return self._resolve_nodes()[2]
+    
+    @property
+    def node_features(self) -> Dict[str, np.ndarray]:
+        return dict(zip(self.node_ids, self.x))
+    
+    @property
+    def edge_index(self) -> np.ndarray:
+        """(2, E) source/target node positions"""
+        return self._resolve_edges()[0]
+    
+    @property
+    def edge_weight(self) -> np.ndarray:
+        return self._resolve_edges()[1]
+    
+    @property
+    def edge_is_conceptual(self) -> np.ndarray:
+        return self._resolve_edges()[2]
+    
+    @property
+    def num_nodes(self) -> int:
+        return len(self.node_ids)
+    
+    @property
+    def num_edges(self) -> int:
+        return self.edge_index.shape[1]
+    
+    @property
+    def graph(self) -> nx.DiGraph:
+        """networkx view of the graph, built on first access"""
+        if self._nx_graph is None:
+            graph = nx.DiGraph()
+            graph.add_nodes_from(zip(self.node_ids, self.node_table.to_dict('records')))
+            ids = self.node_ids
+            graph.add_edges_from(
+                (ids[source], ids[target], {'edge_type': 'conceptual' if conceptual else 'temporal',
+                                            'weight': float(weight)})
+                for (source, target), weight, conceptual in zip(self.edge_index.T.tolist(), self.edge_weight,
+                                                               self.edge_is_conceptual)
+            )
+            self._nx_graph = graph
+        return self._nx_graph
+    
+    def to_pytorch_geometric(self) -> Data:
+        """Convert the graph to PyTorch Geometric format"""
         
-        edge_index = torch.tensor(edge_index, dtype=torch.long).t().contiguous()
-        edge_attr = torch.tensor(edge_attr, dtype=torch.float)
+        x = torch.from_numpy(self.x).float()
+        edge_index = torch.from_numpy(self.edge_index).long()
+        edge_attr = torch.from_numpy(self.edge_weight).float().view(-1, 1)
         
         return Data(x=x, edge_index=edge_index, edge_attr=edge_attr)
 
@@ -188,7 +424,7 @@ class InteractionGraph:
 class CognitiveGNN(nn.Module):
     """Graph Neural Network for cognitive pattern analysis"""
     
-    def __init__(self, input_dim: int, hidden_dim: int, output_dim: int, num_heads: int = 4):
+    def __init__(self, input_dim: int, hidden_dim: int, output_dim: int, num_heads: int = GNN_NUM_HEADS):
         super(CognitiveGNN, self).__init__()
         
         # Multi-layer GNN architecture
@@ -205,6 +441,11 @@ class CognitiveGNN(nn.Module):
         )
         
     def forward(self, x, edge_index, batch=None):
+        # Classification
+        return self.classifier(self.embed(x, edge_index, batch))
+    
+    def embed(self, x, edge_index, batch=None):
+        """Graph-level representation (node-level without batch) fed to the classifier"""
         # First GAT layer with multi-head attention
         x = F.relu(self.conv1(x, edge_index))
         x = F.dropout(x, p=0.3, training=self.training)
@@ -220,8 +461,7 @@ class CognitiveGNN(nn.Module):
         if batch is not None:
             x = global_mean_pool(x, batch)
         
-        # Classification
-        return self.classifier(x)
+        return x
 
 
 class CognitiveBenchmarkGenerator:
@@ -238,65 +478,61 @@ class CognitiveBenchmarkGenerator:
         if model_path and Path(model_path).exists():
             self.load_model(model_path)
     
-    def process_session_data(self, session_file: str) -> InteractionGraph:
-        """Process session data into interaction graph"""
+    def process_session_data(self, session_file: Union[str, pd.DataFrame]) -> InteractionGraph:
+        """Process session data (a CSV path or an already loaded DataFrame) into interaction graph"""
         
         # Load interaction data
-        df = pd.read_csv(session_file)
-        
-        # Create interaction graph
-        graph = InteractionGraph()
-        
-        # Add nodes for each interaction
-        for idx, row in df.iterrows():
-            interaction_id = f"{row['session_id']}_{row['interaction_number']}"
-            graph.add_interaction_node(interaction_id, row.to_dict())
+        df = session_file if isinstance(session_file, pd.DataFrame) else pd.read_csv(session_file)
         
-        # Add temporal edges
-        for i in range(len(df) - 1):
-            source_id = f"{df.iloc[i]['session_id']}_{df.iloc[i]['interaction_number']}"
-            target_id = f"{df.iloc[i+1]['session_id']}_{df.iloc[i+1]['interaction_number']}"
-            graph.add_temporal_edge(source_id, target_id)
-        
-        # Add conceptual edges based on similarity
-        # (Simplified - in practice, use embeddings for semantic similarity)
-        for i in range(len(df)):
-            for j in range(i + 1, min(i + 5, len(df))):  # Look ahead 5 interactions
-                source_row = df.iloc[i]
-                target_row = df.iloc[j]
-                
-                # Calculate simple similarity based on shared cognitive flags
-                source_flags = set(eval(source_row['cognitive_flags']) if isinstance(source_row['cognitive_flags'], str) else [])
-                target_flags = set(eval(target_row['cognitive_flags']) if isinstance(target_row['cognitive_flags'], str) else [])
-                
-                if source_flags and target_flags:
-                    similarity = len(source_flags.intersection(target_flags)) / len(source_flags.union(target_flags))
-                    
-                    source_id = f"{source_row['session_id']}_{source_row['interaction_number']}"
-                    target_id = f"{target_row['session_id']}_{target_row['interaction_number']}"
-                    graph.add_conceptual_edge(source_id, target_id, similarity)
-        
-        return graph
+        # Nodes for each interaction, temporal edges between consecutive interactions and
+        # conceptual edges between interactions sharing cognitive flags
+        return InteractionGraph.from_frame(df)
     
-    def train_gnn_model(self, graphs: List[InteractionGraph], epochs: int = 100):
-        """Train GNN model on interaction graphs"""
+    def train_gnn_model(self, graphs: List[InteractionGraph], epochs: int = 100,
+                        checkpoint_path: Optional[Union[str, Path]] = None,
+                        retrain: bool = False) -> Dict[str, Any]:
+        """
+        Train GNN model on interaction graphs.
+
+        With checkpoint_path, a checkpoint whose feature schema, data and epoch
+        count all match is loaded instead of training (unless retrain), and a
+        newly trained model is written there. Returns training statistics.
+        """
+        schema_hash = feature_schema_hash()
+        data_hash = graphs_data_hash(graphs)
+        checkpoint_path = Path(checkpoint_path) if checkpoint_path is not None else None
+        
+        if checkpoint_path is not None and not retrain and checkpoint_path.exists():
+            try:
+                checkpoint = torch.load(checkpoint_path, map_location='cpu')
+                if (checkpoint.get('schema_hash') == schema_hash
+                        and checkpoint.get('data_hash') == data_hash
+                        and checkpoint.get('epochs') == epochs):
+                    self.gnn_model = CognitiveGNN(checkpoint['input_dim'], GNN_HIDDEN_DIM, GNN_OUTPUT_DIM)
+                    self.gnn_model.load_state_dict(checkpoint['model_state'])
+                    self.gnn_model.eval()
+                    print(f"Reusing GNN checkpoint ({len(graphs)} graphs, schema and data unchanged)")
+                    return {**checkpoint['stats'], 'reused_checkpoint': True}
+            except Exception as e:
+                print(f"  [!]  Ignoring unreadable GNN checkpoint: {e}")
         
-        # Convert graphs to PyTorch format
+        # Convert graphs to PyTorch format; pseudo-labels are computed once and batched as data.y
         data_list = [g.to_pytorch_geometric() for g in graphs]
+        for data, label in zip(data_list, torch.from_numpy(pseudo_labels(graphs))):
+            data.y = label.view(1)
         
         # Create data loader
-        loader = DataLoader(data_list, batch_size=32, shuffle=True)
+        loader = DataLoader(data_list, batch_size=GNN_BATCH_SIZE, shuffle=True)
         
         # Initialize model
         input_dim = data_list[0].x.shape[1]
-        hidden_dim = 64
-        output_dim = 3  # Beginner, Intermediate, Advanced proficiency levels
         
-        self.gnn_model = CognitiveGNN(input_dim, hidden_dim, output_dim)
-        optimizer = torch.optim.Adam(self.gnn_model.parameters(), lr=0.001)
+        self.gnn_model = CognitiveGNN(input_dim, GNN_HIDDEN_DIM, GNN_OUTPUT_DIM)
+        optimizer = torch.optim.Adam(self.gnn_model.parameters(), lr=GNN_LEARNING_RATE)
         
         # Training loop
         self.gnn_model.train()
+        start = time.perf_counter()
         for epoch in range(epochs):
             total_loss = 0
             
@@ -306,12 +542,9 @@ class CognitiveBenchmarkGenerator:
                 # Forward pass
                 out = self.gnn_model(batch.x, batch.edge_index, batch.batch)
                 
-                # Create pseudo-labels based on learning indicators
+                # Calculate loss against the precomputed pseudo-labels
                 # (In practice, use actual labeled data)
-                labels = self._generate_pseudo_labels(batch)
-                
-                # Calculate loss
-                loss = F.cross_entropy(out, labels)
+                loss = F.cross_entropy(out, batch.y)
                 loss.backward()
                 optimizer.step()
                 
@@ -319,31 +552,93 @@ class CognitiveBenchmarkGenerator:
             
             if epoch % 20 == 0:
                 print(f"Epoch {epoch}, Loss: {total_loss / len(loader):.4f}")
+        elapsed = time.perf_counter() - start
+        self.gnn_model.eval()
+        
+        stats = {
+            'epochs': epochs,
+            'graphs': len(graphs),
+            'training_seconds': elapsed,
+            'epochs_per_sec': epochs / elapsed if elapsed > 0 else float('inf'),
+        }
+        print(f"Trained {epochs} epochs in {elapsed:.1f}s ({stats['epochs_per_sec']:.2f} epochs/sec)")
+        
+        if checkpoint_path is not None:
+            try:
+                checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = checkpoint_path.with_suffix('.tmp')
+                torch.save({
+                    'schema_hash': schema_hash,
+                    'data_hash': data_hash,
+                    'epochs': epochs,
+                    'input_dim': input_dim,
+                    'model_state': self.gnn_model.state_dict(),
+                    'stats': stats,
+                }, tmp_path)
+                os.replace(tmp_path, checkpoint_path)
+            except Exception as e:
+                print(f"  [!]  Could not save GNN checkpoint: {e}")
+        
+        return {**stats, 'reused_checkpoint': False}
     
     def _generate_pseudo_labels(self, batch) -> torch.Tensor:
         """Generate pseudo-labels for training (placeholder for actual labels)"""
         
-        # Extract average learning indicators per graph
-        learning_indicators = []
+        # Average learning indicator (index 1 in feature vector) per graph of the batch
+        column = NODE_FEATURE_NAMES.index('learning_indicator')
+        avg_learning = global_mean_pool(batch.x[:, column:column + 1], batch.batch).view(-1)
         
-        for i in range(batch.num_graphs):
-            mask = batch.batch == i
-            graph_features = batch.x[mask]
-            
-            # Learning indicator is at index 1 in feature vector
-            avg_learning = graph_features[:, 1].mean().item()
-            
-            # Map to proficiency level
-            if avg_learning < 0.4:
-                label = 0  # Beginner
-            elif avg_learning < 0.7:
-                label = 1  # Intermediate
-            else:
-                label = 2  # Advanced
-            
-            learning_indicators.append(label)
+        # Map to proficiency level: Beginner, Intermediate, Advanced
+        boundaries = torch.tensor(PSEUDO_LABEL_THRESHOLDS, dtype=avg_learning.dtype)
+        return torch.bucketize(avg_learning, boundaries, right=True)
+    
+    def embed_graphs(self, graphs: List[InteractionGraph], batch_size: Optional[int] = None,
+                     num_threads: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Graph embeddings and predicted proficiency levels of the trained GNN, in
+        one batched CPU pass under torch.inference_mode. batch_size defaults to
+        all graphs at once; num_threads to GNN_INFERENCE_THREADS (0 = torch default).
+        """
+        if self.gnn_model is None:
+            raise ValueError("GNN model has not been trained or loaded")
+        
+        num_threads = GNN_INFERENCE_THREADS if num_threads is None else num_threads
+        previous_threads = torch.get_num_threads()
+        if num_threads > 0:
+            torch.set_num_threads(num_threads)
+        
+        embeddings, logits = [], []
+        start = time.perf_counter()
+        try:
+            self.gnn_model.eval()
+            data_list = [g.to_pytorch_geometric() for g in graphs]
+            batch_size = batch_size or max(len(data_list), 1)
+            with torch.inference_mode():
+                for first in range(0, len(data_list), batch_size):
+                    batch = Batch.from_data_list(data_list[first:first + batch_size])
+                    embedding = self.gnn_model.embed(batch.x, batch.edge_index, batch.batch)
+                    embeddings.append(embedding)
+                    logits.append(self.gnn_model.classifier(embedding))
+        finally:
+            torch.set_num_threads(previous_threads)
+        elapsed = time.perf_counter() - start
+        
+        if embeddings:
+            embeddings = torch.cat(embeddings).numpy()
+            probabilities = F.softmax(torch.cat(logits), dim=1).numpy()
+        else:
+            embeddings = np.zeros((0, GNN_HIDDEN_DIM), dtype=np.float32)
+            probabilities = np.zeros((0, GNN_OUTPUT_DIM), dtype=np.float32)
+        graphs_per_sec = len(graphs) / elapsed if elapsed > 0 else float('inf')
+        print(f"Embedded {len(graphs)} graphs in {elapsed:.2f}s ({graphs_per_sec:.1f} graphs/sec)")
         
-        return torch.tensor(learning_indicators, dtype=torch.long)
+        return {
+            'embeddings': embeddings,
+            'probabilities': probabilities,
+            'predicted_levels': probabilities.argmax(axis=1),
+            'inference_seconds': elapsed,
+            'graphs_per_sec': graphs_per_sec,
+        }
     
     def generate_proficiency_clusters(self, graphs: List[InteractionGraph]) -> Dict[str, Any]:
         """Cluster users by cognitive proficiency patterns"""
@@ -434,34 +729,30 @@ class CognitiveBenchmarkGenerator:
     def _extract_graph_features(self, graph: InteractionGraph) -> np.ndarray:
         """Extract graph-level features for clustering"""
         
-        nodes = list(graph.graph.nodes())
+        n_nodes = graph.num_nodes
         
-        if not nodes:
+        if not n_nodes:
             return np.zeros(10)
         
         # Aggregate node features
-        cognitive_loads = [graph.graph.nodes[n]['cognitive_load'] for n in nodes]
-        learning_indicators = [graph.graph.nodes[n]['learning_indicator'] for n in nodes]
-        engagement_scores = [graph.graph.nodes[n]['engagement_score'] for n in nodes]
-        prevents_offloading = [graph.graph.nodes[n]['prevents_offloading'] for n in nodes]
-        encourages_thinking = [graph.graph.nodes[n]['encourages_thinking'] for n in nodes]
-        provides_scaffolding = [graph.graph.nodes[n]['provides_scaffolding'] for n in nodes]
+        nodes = graph.node_table
         
-        # Graph structural features
-        density = nx.density(graph.graph)
-        avg_degree = np.mean([d for n, d in graph.graph.degree()])
+        # Graph structural features (as nx.density / mean nx degree of the DiGraph)
+        n_edges = graph.num_edges
+        density = n_edges / (n_nodes * (n_nodes - 1)) if n_nodes > 1 else 0.0
+        avg_degree = 2.0 * n_edges / n_nodes
         
         # Temporal progression features
-        temporal_coherence = len(graph.temporal_edges) / max(len(nodes) - 1, 1)
-        conceptual_connectivity = len(graph.conceptual_edges) / max(len(nodes), 1)
+        temporal_coherence = len(graph.temporal_edges) / max(n_nodes - 1, 1)
+        conceptual_connectivity = len(graph.conceptual_edges) / max(n_nodes, 1)
         
         features = [
-            np.mean(cognitive_loads),
-            np.mean(learning_indicators),
-            np.mean(engagement_scores),
-            np.mean(prevents_offloading),
-            np.mean(encourages_thinking),
-            np.mean(provides_scaffolding),
+            np.mean(nodes['cognitive_load'].to_numpy()),
+            np.mean(nodes['learning_indicator'].to_numpy()),
+            np.mean(nodes['engagement_score'].to_numpy()),
+            np.mean(nodes['prevents_offloading'].to_numpy()),
+            np.mean(nodes['encourages_thinking'].to_numpy()),
+            np.mean(nodes['provides_scaffolding'].to_numpy()),
             density,
             avg_degree,
             temporal_coherence,
@@ -562,10 +853,7 @@ class CognitiveBenchmarkGenerator:
         
         # 1. Cognitive Load Distribution
         plt.figure(figsize=(10, 6))
-        cognitive_loads = []
-        for graph in graphs:
-            for node in graph.graph.nodes():
-                cognitive_loads.append(graph.graph.nodes[node]['cognitive_load'])
+        cognitive_loads = np.concatenate([graph.node_table['cognitive_load'].to_numpy() for graph in graphs]) if graphs else []
         
         plt.hist(cognitive_loads, bins=30, alpha=0.7, color=THESIS_COLORS['primary_purple'], edgecolor=THESIS_COLORS['primary_dark'])
         plt.xlabel('Cognitive Load')
@@ -577,8 +865,7 @@ class CognitiveBenchmarkGenerator:
         # 2. Learning Effectiveness Over Time
         plt.figure(figsize=(12, 6))
         for i, graph in enumerate(graphs[:5]):  # First 5 sessions
-            nodes = list(graph.graph.nodes())
-            learning_indicators = [graph.graph.nodes[n]['learning_indicator'] for n in nodes]
+            learning_indicators = graph.node_table['learning_indicator'].to_numpy()
             plt.plot(learning_indicators, label=f'Session {i+1}', alpha=0.7)
         
         plt.xlabel('Interaction Number')
@@ -591,11 +878,9 @@ class CognitiveBenchmarkGenerator:
         # 3. Agent Usage Patterns
         agent_usage = {'socratic': 0, 'cognitive': 0, 'knowledge': 0, 'context': 0}
         for graph in graphs:
-            for node in graph.graph.nodes():
-                agents = graph.graph.nodes[node]['agents_used']
-                for agent_type in agent_usage:
-                    if agent_type in str(agents).lower():
-                        agent_usage[agent_type] += 1
+            agents = graph.node_table['agents_used'].astype(str).str.lower()
+            for agent_type in agent_usage:
+                agent_usage[agent_type] += int(agents.str.contains(agent_type, regex=False).sum())
         
         plt.figure(figsize=(8, 8))
         plt.pie(agent_usage.values(), labels=agent_usage.keys(), autopct='%1.1f%%')
@@ -732,6 +1017,8 @@ class CognitiveBenchmarkGenerator:
         
         model_data = {
             'gnn_model_state': self.gnn_model.state_dict() if self.gnn_model else None,
+            'gnn_input_dim': self.gnn_model.conv1.in_channels if self.gnn_model else None,
+            'feature_schema_hash': feature_schema_hash(),
             'scaler': self.scaler,
             'proficiency_clusters': self.proficiency_clusters,
             'benchmark_profiles': self.benchmark_profiles
@@ -754,10 +1041,13 @@ class CognitiveBenchmarkGenerator:
         
         # Reconstruct GNN model if state dict exists
         if model_data['gnn_model_state']:
-            # You'll need to know the model dimensions
-            # This is a simplified version
-            self.gnn_model = CognitiveGNN(input_dim=16, hidden_dim=64, output_dim=3)
+            if model_data.get('feature_schema_hash', feature_schema_hash()) != feature_schema_hash():
+                print("  [!]  Saved GNN model uses a different feature schema; retrain it before use")
+            # Models saved before the input dimension was recorded used the current feature set
+            input_dim = model_data.get('gnn_input_dim') or len(NODE_FEATURE_NAMES)
+            self.gnn_model = CognitiveGNN(input_dim=input_dim, hidden_dim=GNN_HIDDEN_DIM, output_dim=GNN_OUTPUT_DIM)
             self.gnn_model.load_state_dict(model_data['gnn_model_state'])
+            self.gnn_model.eval()
         
         print(f"Model loaded from {path}")
 
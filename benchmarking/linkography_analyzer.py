@@ -16,7 +16,9 @@ from benchmarking.linkography_types import (
     MoveType, Modality, LinkographPattern, LinkographLink, LinkographMetrics
 )
 from benchmarking.linkography_engine import LinkographyEngine
+from benchmarking.linkography_journal import find_linkography_files, load_linkography_data
 from benchmarking.linkography_cognitive_mapping import CognitiveMappingService
+from benchmarking.results_cache import MISSING, SessionResultsCache, code_version, file_fingerprint, hash_files
 import time
 
 
@@ -26,16 +28,26 @@ class LinkographySessionAnalyzer:
     Integrates with the existing benchmarking data structure.
     """
     
-    def __init__(self):
-        self.engine = LinkographyEngine()
+    def __init__(self, results_path: Optional[Path] = None):
+        self._engine: Optional[LinkographyEngine] = None
         self.cognitive_mapper = CognitiveMappingService()
+        if results_path is not None:
+            self.results_path = Path(results_path)
         # Fix path to work from both root and benchmarking directory
-        if Path("results").exists():
+        elif Path("results").exists():
             self.results_path = Path("results")
         elif Path("benchmarking/results").exists():
             self.results_path = Path("benchmarking/results")
         else:
             self.results_path = Path(__file__).parent / "results"
+    
+    @property
+    def engine(self) -> LinkographyEngine:
+        # Built on first use: loading the SentenceTransformer is the expensive part,
+        # and fully cached analyze_all_sessions() runs never need it
+        if self._engine is None:
+            self._engine = LinkographyEngine()
+        return self._engine
         
     def analyze_session(self, session_data: Dict) -> LinkographSession:
         """
@@ -339,52 +351,85 @@ class LinkographySessionAnalyzer:
             raw_data={}  # Empty raw data for empty sessions
         )
     
-    def analyze_all_sessions(self) -> Dict[str, LinkographSession]:
-        """Analyze all available sessions in the benchmarking results"""
-        sessions = {}
-        
-        # First try to load from evaluation reports
-        eval_dir = self.results_path / "evaluation_reports"
-        if eval_dir.exists():
-            for eval_file in eval_dir.glob("*.json"):
-                with open(eval_file, 'r') as f:
-                    session_data = json.load(f)
-                
-                # Analyze session
-                linkograph_session = self.analyze_session(session_data)
-                sessions[linkograph_session.session_id] = linkograph_session
-        
-        # Also load directly from linkography files if available
+    def _linkography_dir(self) -> Path:
         # Fix path to work from both root and benchmarking directory
         if Path("../thesis_data/linkography").exists():
-            linkography_dir = Path("../thesis_data/linkography")
+            return Path("../thesis_data/linkography")
         elif Path("thesis_data/linkography").exists():
-            linkography_dir = Path("thesis_data/linkography")
-        else:
-            linkography_dir = Path(__file__).parent.parent / "thesis_data/linkography"
+            return Path("thesis_data/linkography")
+        return Path(__file__).parent.parent / "thesis_data/linkography"
+    
+    def analysis_sources(self) -> List[Tuple[str, Path]]:
+        """
+        (artifact kind, path) of every file analyze_all_sessions() reads:
+        evaluation reports first, then finalized linkography JSON or the journal
+        of a session that was never finalized.
+        """
+        sources = []
+        eval_dir = self.results_path / "evaluation_reports"
+        if eval_dir.exists():
+            sources.extend(('linkography_report', path) for path in eval_dir.glob("*.json"))
+        linkography_dir = self._linkography_dir()
         if linkography_dir.exists():
-            for linkography_file in linkography_dir.glob("linkography_*.json"):
-                # Skip moves files
-                if "moves" in linkography_file.name:
-                    continue
+            sources.extend(('linkography_file', path) for path in find_linkography_files(linkography_dir).values())
+        return sources
+    
+    def sources_fingerprint(self) -> Tuple[Tuple[str, int, int], ...]:
+        """Changes whenever a source of analyze_all_sessions() is added, removed or modified."""
+        return file_fingerprint(path for _, path in self.analysis_sources())
+    
+    def analyze_all_sessions(self, use_cache: bool = True) -> Dict[str, LinkographSession]:
+        """
+        Analyze all available sessions in the benchmarking results.
+        
+        The analysis of each source file is stored under <results>/cache as a
+        versioned artifact (see results_cache) and reused while the file and the
+        linkography code are unchanged, so only new or modified sessions are
+        analyzed again.
+        """
+        sessions = {}
+        cache = SessionResultsCache(self.results_path / "cache", enabled=use_cache)
+        sources = self.analysis_sources()
+        
+        for kind in ('linkography_report', 'linkography_file'):
+            cache.prune(kind, [path.stem for source_kind, path in sources if source_kind == kind])
+        
+        for kind, source_file in sources:
+            input_hash = hash_files([source_file])
+            version = code_version(kind)
+            session = cache.get(kind, source_file.stem, input_hash, version)
+            
+            if kind == 'linkography_report':
+                # First try to load from evaluation reports
+                if session is MISSING:
+                    with open(source_file, 'r') as f:
+                        session_data = json.load(f)
                     
+                    # Analyze session
+                    session = self.analyze_session(session_data)
+                    cache.put(kind, source_file.stem, input_hash, version, session)
+                sessions[session.session_id] = session
+                continue
+            
+            # Also load directly from linkography files if available
+            if session is MISSING:
                 try:
-                    with open(linkography_file, 'r') as f:
-                        linkograph_data = json.load(f)
-                    
-                    session_id = linkograph_data.get('session_id', '')
+                    linkograph_data = load_linkography_data(source_file)
                     
                     # Skip if already loaded from evaluation
-                    if session_id in sessions:
+                    if linkograph_data.get('session_id', '') in sessions:
                         continue
                     
                     # Create a LinkographSession from the linkography data
                     session = self._create_session_from_linkography(linkograph_data)
-                    if session:
-                        sessions[session.session_id] = session
-                        
+                    cache.put(kind, source_file.stem, input_hash, version, session)
+                    
                 except Exception as e:
-                    print(f"Error loading linkography file {linkography_file}: {e}")
+                    print(f"Error loading linkography file {source_file}: {e}")
+                    continue
+            
+            if session and session.session_id not in sessions:
+                sessions[session.session_id] = session
         
         return sessions
     
@@ -9,13 +9,13 @@ from typing import List, Dict, Tuple, Optional
 import uuid
 from datetime import datetime
 from sentence_transformers import SentenceTransformer
-from sklearn.metrics.pairwise import cosine_similarity
 import logging
 
 from benchmarking.linkography_types import (
     DesignMove, LinkographLink, Linkograph, LinkographMetrics,
     LinkographPattern, CognitiveLinkographMapping, LinkType
 )
+from benchmarking.linkography_incremental import IncrementalLinkographState
 
 
 class LinkographyEngine:
@@ -47,69 +47,93 @@ class LinkographyEngine:
         """Generate semantic embedding for design move content"""
         return self.model.encode(text, convert_to_numpy=True)
     
+    def generate_embeddings(self, moves: List[DesignMove]) -> None:
+        """Fill in missing move embeddings with a single batched encode call"""
+        pending = [move for move in moves if move.embedding is None]
+        if not pending:
+            return
+        embeddings = self.model.encode([move.content for move in pending], convert_to_numpy=True)
+        for move, embedding in zip(pending, embeddings):
+            move.embedding = embedding
+    
+    @staticmethod
+    def _normalized_embeddings(moves: List[DesignMove]) -> np.ndarray:
+        """Row-normalized embedding matrix; zero vectors stay zero (similarity 0)"""
+        matrix = np.vstack([np.asarray(move.embedding, dtype=np.float32).reshape(-1) for move in moves])
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return matrix / norms
+    
     def calculate_similarity(self, move1: DesignMove, move2: DesignMove) -> float:
         """Calculate cosine similarity between two design moves"""
         if move1.embedding is None:
             move1.embedding = self.generate_embedding(move1.content)
         if move2.embedding is None:
             move2.embedding = self.generate_embedding(move2.content)
-            
-        similarity = cosine_similarity(
-            move1.embedding.reshape(1, -1),
-            move2.embedding.reshape(1, -1)
-        )[0, 0]
         
-        return float(similarity)
+        normalized = self._normalized_embeddings([move1, move2])
+        return float(normalized[0] @ normalized[1])
     
     def generate_links(self, moves: List[DesignMove]) -> List[LinkographLink]:
         """
         Generate links between design moves using fuzzy linkography.
         
+        Only the band of pairs within max_link_range is scored: for each temporal
+        distance d the similarities of all (i, i + d) pairs come from one
+        row-wise product of the normalized embedding matrix, so the cost is
+        O(n * max_link_range) vector work instead of O(n^2) Python calls.
+        
         Args:
             moves: List of design moves in temporal order
             
         Returns:
             List of linkograph links
         """
-        links = []
+        if len(moves) < 2:
+            return []
         
         # Ensure all moves have embeddings
-        for move in moves:
-            if move.embedding is None:
-                move.embedding = self.generate_embedding(move.content)
+        self.generate_embeddings(moves)
+        normalized = self._normalized_embeddings(moves)
+        
+        sources, targets, similarities = [], [], []
+        for distance in range(1, min(self.max_link_range, len(moves) - 1) + 1):
+            band = np.einsum('ij,ij->i', normalized[:-distance], normalized[distance:])
+            earlier = np.nonzero(band >= self.similarity_threshold)[0]
+            if earlier.size == 0:
+                continue
+            later = earlier + distance
+            # Similarity is symmetric: link both directions, as the pairwise loop did
+            sources.extend((earlier, later))
+            targets.extend((later, earlier))
+            similarities.extend((band[earlier], band[earlier]))
+        
+        if not sources:
+            return []
+        
+        sources = np.concatenate(sources)
+        targets = np.concatenate(targets)
+        similarities = np.concatenate(similarities)
+        order = np.lexsort((targets, sources))
         
-        # Calculate pairwise similarities
-        for i, source_move in enumerate(moves):
-            for j, target_move in enumerate(moves):
-                if i == j:
-                    continue
-                    
-                # Check temporal distance
-                temporal_distance = abs(j - i)
-                if temporal_distance > self.max_link_range:
-                    continue
-                
-                # Calculate similarity
-                similarity = self.calculate_similarity(source_move, target_move)
-                
-                # Create link if above threshold
-                if similarity >= self.similarity_threshold:
-                    link_type: LinkType = 'forward' if j > i else 'backward'
-                    if abs(temporal_distance) <= 3 and similarity > 0.7:
-                        link_type = 'lateral'  # Strong nearby connections
-                    
-                    link = LinkographLink(
-                        id=str(uuid.uuid4()),
-                        source_move=source_move.id,
-                        target_move=target_move.id,
-                        strength=similarity,
-                        confidence=self._calculate_confidence(similarity, temporal_distance),
-                        link_type=link_type,
-                        temporal_distance=temporal_distance,
-                        semantic_similarity=similarity,
-                        automated=True
-                    )
-                    links.append(link)
+        links = []
+        for i, j, similarity in zip(sources[order].tolist(), targets[order].tolist(), similarities[order].tolist()):
+            temporal_distance = abs(j - i)
+            link_type: LinkType = 'forward' if j > i else 'backward'
+            if temporal_distance <= 3 and similarity > 0.7:
+                link_type = 'lateral'  # Strong nearby connections
+            
+            links.append(LinkographLink(
+                id=str(uuid.uuid4()),
+                source_move=moves[i].id,
+                target_move=moves[j].id,
+                strength=similarity,
+                confidence=self._calculate_confidence(similarity, temporal_distance),
+                link_type=link_type,
+                temporal_distance=temporal_distance,
+                semantic_similarity=similarity,
+                automated=True
+            ))
         
         return links
     
@@ -360,77 +384,86 @@ class LinkographyEngine:
     def update_linkograph_realtime(self, 
                                   current_linkograph: Linkograph,
                                   new_move: DesignMove) -> Linkograph:
-        """Update linkograph incrementally with a new design move"""
+        """Update linkograph incrementally with a new design move
+        
+        Only the last max_link_range moves are compared with the new move, and
+        metrics come from running statistics kept alongside the linkograph, so
+        an update costs O(max_link_range) regardless of session length. The
+        linkograph is updated in place and returned.
+        """
+        state = self._get_incremental_state(current_linkograph)
+        
         # Add embedding to new move
         if new_move.embedding is None:
             new_move.embedding = self.generate_embedding(new_move.content)
         
-        # Add new move
-        updated_moves = current_linkograph.moves + [new_move]
+        moves = current_linkograph.moves
+        window = moves[-self.max_link_range:]
+        window_start = len(moves) - len(window)
+        new_position = len(moves)
         
         # Generate links for new move
         new_links = []
-        for existing_move in current_linkograph.moves[-self.max_link_range:]:
-            similarity = self.calculate_similarity(existing_move, new_move)
-            
-            if similarity >= self.similarity_threshold:
-                temporal_distance = len(current_linkograph.moves) - current_linkograph.moves.index(existing_move)
-                
-                # Create backward link from new move to existing
-                link = LinkographLink(
-                    id=str(uuid.uuid4()),
-                    source_move=new_move.id,
-                    target_move=existing_move.id,
-                    strength=similarity,
-                    confidence=self._calculate_confidence(similarity, temporal_distance),
-                    link_type='backward',
-                    temporal_distance=temporal_distance,
-                    semantic_similarity=similarity,
-                    automated=True
-                )
-                new_links.append(link)
+        link_records = []
+        if window:
+            normalized = self._normalized_embeddings(window + [new_move])
+            similarities = (normalized[:-1] @ normalized[-1]).tolist()
+            for offset, (existing_move, similarity) in enumerate(zip(window, similarities)):
+                if similarity < self.similarity_threshold:
+                    continue
+                existing_position = window_start + offset
+                temporal_distance = new_position - existing_position
+                confidence = self._calculate_confidence(similarity, temporal_distance)
                 
-                # Create forward link from existing to new
-                forward_link = LinkographLink(
-                    id=str(uuid.uuid4()),
-                    source_move=existing_move.id,
-                    target_move=new_move.id,
-                    strength=similarity,
-                    confidence=self._calculate_confidence(similarity, temporal_distance),
-                    link_type='forward',
-                    temporal_distance=temporal_distance,
-                    semantic_similarity=similarity,
-                    automated=True
-                )
-                new_links.append(forward_link)
-        
-        # Update linkograph
-        updated_links = current_linkograph.links + new_links
-        
-        # Create new linkograph instance
-        updated_linkograph = Linkograph(
-            id=current_linkograph.id,
-            session_id=current_linkograph.session_id,
-            moves=updated_moves,
-            links=updated_links,
-            metrics=self.calculate_metrics(current_linkograph),  # Will recalculate
-            phase=new_move.phase,
-            generated_at=datetime.now().timestamp()
-        )
+                # Backward link from new move to existing, forward link from existing to new
+                for source, target, source_position, target_position, link_type in (
+                    (new_move, existing_move, new_position, existing_position, 'backward'),
+                    (existing_move, new_move, existing_position, new_position, 'forward'),
+                ):
+                    new_links.append(LinkographLink(
+                        id=str(uuid.uuid4()),
+                        source_move=source.id,
+                        target_move=target.id,
+                        strength=similarity,
+                        confidence=confidence,
+                        link_type=link_type,
+                        temporal_distance=temporal_distance,
+                        semantic_similarity=similarity,
+                        automated=True
+                    ))
+                    link_records.append((source_position, target_position, similarity, temporal_distance))
         
-        # Recalculate metrics
-        updated_linkograph.metrics = self.calculate_metrics(updated_linkograph)
+        moves.append(new_move)
+        current_linkograph.links.extend(new_links)
+        state.add_move(new_move, link_records)
+        self._sync_incremental_state(current_linkograph, state)
         
-        return updated_linkograph
+        current_linkograph.metrics = state.metrics()
+        current_linkograph.phase = new_move.phase
+        current_linkograph.generated_at = datetime.now().timestamp()
+        
+        return current_linkograph
+    
+    def _get_incremental_state(self, linkograph: Linkograph) -> IncrementalLinkographState:
+        """Running metric state for a linkograph, rebuilt if the linkograph changed behind our back"""
+        state = getattr(linkograph, '_incremental_state', None)
+        if state is None or getattr(linkograph, '_incremental_size', None) != (len(linkograph.moves), len(linkograph.links)):
+            state = IncrementalLinkographState.from_linkograph(linkograph)
+            self._sync_incremental_state(linkograph, state)
+        return state
+    
+    @staticmethod
+    def _sync_incremental_state(linkograph: Linkograph, state: IncrementalLinkographState) -> None:
+        # Plain attributes rather than dataclass fields, so serialization is unaffected
+        linkograph._incremental_state = state
+        linkograph._incremental_size = (len(linkograph.moves), len(linkograph.links))
     
     def generate_linkograph(self, 
                           moves: List[DesignMove],
                           session_id: str) -> Linkograph:
         """Generate a complete linkograph from a list of design moves"""
-        # Generate embeddings for all moves
-        for move in moves:
-            if move.embedding is None:
-                move.embedding = self.generate_embedding(move.content)
+        # Generate embeddings for all moves in one batch
+        self.generate_embeddings(moves)
         
         # Generate links
         links = self.generate_links(moves)
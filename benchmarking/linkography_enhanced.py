@@ -13,11 +13,11 @@ import math
 
 from linkography_types import Linkograph, DesignMove, LinkographLink, LinkographPattern
 from thesis_colors import THESIS_COLORS
-from linkography_intersection_cache import (
-    find_arc_intersection_cached, 
-    check_arcs_cross_cached,
-    clear_intersection_cache
-)
+from linkography_intersection_cache import clear_intersection_cache
+from linkography_intersection_precise import find_interleaving_pairs, solve_arc_intersections
+
+# Intersections closer than this are merged into one node
+INTERSECTION_MERGE_DISTANCE = 0.1
 
 
 @dataclass
@@ -177,46 +177,53 @@ class EnhancedLinkographVisualizer:
     def _find_intersection_nodes(self, 
                                  link_paths: Dict[Tuple[str, str], Tuple[int, int]], 
                                  link_strengths: Dict[Tuple[str, str], float]) -> List[IntersectionNode]:
-        """Find intersection points where links cross using cached calculations"""
+        """Find intersection points where links cross, solved analytically for all crossing pairs at once"""
         intersections = []
         link_list = list(link_paths.items())
+        if len(link_list) < 2:
+            return intersections
         
-        for i in range(len(link_list)):
-            for j in range(i + 1, len(link_list)):
-                link1_key, (s1, t1) = link_list[i]
-                link2_key, (s2, t2) = link_list[j]
-                
-                # Use cached check for whether arcs actually cross
-                if check_arcs_cross_cached(s1, t1, s2, t2):
-                    # Calculate intersection with caching and moderate precision
-                    intersection_point = find_arc_intersection_cached(s1, t1, s2, t2, precision=300)
-                    
-                    if intersection_point:  # Only add if we found a real intersection
-                        # Check if we already have an intersection very close to this point
-                        existing = None
-                        for node in intersections:
-                            dist = math.sqrt((node.position[0] - intersection_point[0])**2 + 
-                                           (node.position[1] - intersection_point[1])**2)
-                            if dist < 0.1:  # Threshold for considering points the same
-                                existing = node
-                                break
-                        
-                        if existing:
-                            # Add to existing intersection node
-                            if link1_key not in existing.links:
-                                existing.links.append(link1_key)
-                            if link2_key not in existing.links:
-                                existing.links.append(link2_key)
-                            existing.complexity = len(existing.links)
-                        else:
-                            # Create new intersection node only for real intersections
-                            node = IntersectionNode(
-                                position=intersection_point,
-                                links=[link1_key, link2_key],
-                                complexity=2,
-                                cognitive_significance=0
-                            )
-                            intersections.append(node)
+        endpoints = np.array([path for _, path in link_list], dtype=float)
+        first, second = find_interleaving_pairs(endpoints[:, 0], endpoints[:, 1])
+        xs, ys, found = solve_arc_intersections(
+            endpoints[first, 0], endpoints[first, 1], endpoints[second, 0], endpoints[second, 1]
+        )
+        
+        # Spatial hash with cell size = merge distance: a point within the merge
+        # distance of a node always lies in one of the 3x3 cells around it
+        cell_size = INTERSECTION_MERGE_DISTANCE
+        grid: Dict[Tuple[int, int], List[int]] = {}
+        
+        for i, j, x, y in zip(first[found].tolist(), second[found].tolist(), xs[found].tolist(), ys[found].tolist()):
+            link1_key = link_list[i][0]
+            link2_key = link_list[j][0]
+            cell_x, cell_y = int(math.floor(x / cell_size)), int(math.floor(y / cell_size))
+            
+            # Merge into the earliest node close to this point, if any
+            existing_index = None
+            for dx in (-1, 0, 1):
+                for dy in (-1, 0, 1):
+                    for node_index in grid.get((cell_x + dx, cell_y + dy), ()):
+                        node_x, node_y = intersections[node_index].position
+                        if math.hypot(node_x - x, node_y - y) < INTERSECTION_MERGE_DISTANCE and \
+                                (existing_index is None or node_index < existing_index):
+                            existing_index = node_index
+            
+            if existing_index is not None:
+                existing = intersections[existing_index]
+                if link1_key not in existing.links:
+                    existing.links.append(link1_key)
+                if link2_key not in existing.links:
+                    existing.links.append(link2_key)
+                existing.complexity = len(existing.links)
+            else:
+                grid.setdefault((cell_x, cell_y), []).append(len(intersections))
+                intersections.append(IntersectionNode(
+                    position=(x, y),
+                    links=[link1_key, link2_key],
+                    complexity=2,
+                    cognitive_significance=0
+                ))
         
         # Calculate significance for all nodes
         for node in intersections:
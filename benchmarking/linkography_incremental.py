@@ -0,0 +1,186 @@
+"""
+MEGA Architectural Mentor - Incremental Linkograph Metrics
+Running statistics that keep LinkographyEngine metrics current as moves are appended
+"""
+
+import math
+from typing import Dict, Iterable, List, Tuple
+
+from benchmarking.linkography_types import Linkograph, DesignMove, LinkographMetrics
+
+# (source position, target position, strength, temporal distance)
+LinkRecord = Tuple[int, int, float, int]
+
+# Pattern thresholds, identical to the batch detectors in LinkographyEngine
+CRITICAL_LINK_RATIO = 0.1
+CHUNK_WINDOW = 5
+CHUNK_DENSITY = 0.3
+WEB_CONNECTIONS = 5
+SAWTOOTH_LENGTH = 3
+
+
+class IncrementalLinkographState:
+    """
+    Linkograph statistics maintained per appended move.
+
+    Appending a move with k links costs O(k) (plus O(CHUNK_WINDOW^2) for the
+    chunk window ending at the new move), and metrics() is O(1). Links of a new
+    move only touch the new move, so chunk windows and sawtooth pairs that do
+    not contain it never change and are counted once.
+    """
+
+    def __init__(self):
+        self.move_count = 0
+        self.link_count = 0
+        self.total_strength = 0.0
+        self.strength_log_sum = 0.0  # sum of s * log2(s), for the entropy
+        self.max_temporal_distance = 0
+        self.phase_counts: Dict[str, int] = {'ideation': 0, 'visualization': 0, 'materialization': 0}
+
+        # Per-move link counts (forelinks = links where the move is the source)
+        self.forelinks: List[int] = []
+        self.backlinks: List[int] = []
+        # Moves per total degree, and the running counts derived from it
+        self.degree_histogram: Dict[int, int] = {}
+        self.critical_threshold = 0
+        self.critical_count = 0
+        self.web_count = 0
+
+        # Directed link counts between moves close enough to share a chunk window
+        self.near_links: Dict[Tuple[int, int], int] = {}
+        self.chunk_count = 0
+        self.sawtooth_run = 0
+        self.sawtooth_count = 0
+
+    @classmethod
+    def from_linkograph(cls, linkograph: Linkograph) -> "IncrementalLinkographState":
+        """Replay an existing linkograph (O(moves + links))."""
+        state = cls()
+        positions = {move.id: index for index, move in enumerate(linkograph.moves)}
+        links_by_move: Dict[int, List[LinkRecord]] = {}
+        for link in linkograph.links:
+            source = positions.get(link.source_move)
+            target = positions.get(link.target_move)
+            if source is None or target is None:
+                continue
+            links_by_move.setdefault(max(source, target), []).append(
+                (source, target, link.strength, link.temporal_distance)
+            )
+        for index, move in enumerate(linkograph.moves):
+            state.add_move(move, links_by_move.get(index, ()))
+        return state
+
+    def _degree(self, position: int) -> int:
+        return self.forelinks[position] + self.backlinks[position]
+
+    def _increment_degree(self, position: int) -> None:
+        degree = self._degree(position)
+        self.degree_histogram[degree] -= 1
+        self.degree_histogram[degree + 1] = self.degree_histogram.get(degree + 1, 0) + 1
+        if degree + 1 == self.critical_threshold:
+            self.critical_count += 1
+        if degree + 1 == WEB_CONNECTIONS:
+            self.web_count += 1
+
+    def _raise_critical_threshold(self) -> None:
+        # Smallest degree d with d / (2n) >= CRITICAL_LINK_RATIO, evaluated exactly
+        # as Linkograph.get_critical_moves does; it never decreases as n grows
+        threshold = self.critical_threshold
+        while threshold / (2 * self.move_count) < CRITICAL_LINK_RATIO:
+            self.critical_count -= self.degree_histogram.get(threshold, 0)
+            threshold += 1
+        self.critical_threshold = threshold
+
+    def add_move(self, move: DesignMove, links: Iterable[LinkRecord]) -> None:
+        """Append move (at position move_count) with its links to earlier moves."""
+        position = self.move_count
+        self.move_count += 1
+        if move.phase in self.phase_counts:
+            self.phase_counts[move.phase] += 1
+
+        self.forelinks.append(0)
+        self.backlinks.append(0)
+        self.degree_histogram[0] = self.degree_histogram.get(0, 0) + 1
+        if self.critical_threshold == 0:
+            self.critical_count += 1
+        self._raise_critical_threshold()
+
+        for source, target, strength, temporal_distance in links:
+            self.link_count += 1
+            self.total_strength += strength
+            if strength > 0:
+                self.strength_log_sum += strength * math.log2(strength)
+            self.max_temporal_distance = max(self.max_temporal_distance, temporal_distance)
+
+            self._increment_degree(source)
+            self.forelinks[source] += 1
+            self._increment_degree(target)
+            self.backlinks[target] += 1
+
+            if abs(target - source) < CHUNK_WINDOW:
+                self.near_links[(source, target)] = self.near_links.get((source, target), 0) + 1
+
+        # Chunk window ending at the new move
+        start = position - CHUNK_WINDOW + 1
+        if start >= 0:
+            internal = sum(
+                self.near_links.get((a, b), 0)
+                for a in range(start, position + 1)
+                for b in range(start, position + 1)
+                if a != b
+            )
+            if internal / (CHUNK_WINDOW * (CHUNK_WINDOW - 1)) > CHUNK_DENSITY:
+                self.chunk_count += 1
+            # Pairs that can no longer share a window with a future move
+            for a in range(start, position + 1):
+                self.near_links.pop((start, a), None)
+                self.near_links.pop((a, start), None)
+
+        # Sawtooth: runs of consecutive moves joined by a link previous -> new
+        if position > 0:
+            if self.near_links.get((position - 1, position), 0):
+                self.sawtooth_run = self.sawtooth_run + 1 if self.sawtooth_run else 2
+            else:
+                if self.sawtooth_run >= SAWTOOTH_LENGTH:
+                    self.sawtooth_count += 1
+                self.sawtooth_run = 0
+
+    @property
+    def entropy(self) -> float:
+        """Normalized Shannon entropy of the link strength distribution."""
+        if self.link_count == 0 or self.total_strength <= 0:
+            return 0.0
+        entropy = math.log2(self.total_strength) - self.strength_log_sum / self.total_strength
+        max_entropy = math.log2(self.link_count)
+        return entropy / max_entropy if max_entropy > 0 else 0
+
+    def metrics(self) -> LinkographMetrics:
+        """Current metrics, equivalent to LinkographyEngine.calculate_metrics."""
+        if self.move_count == 0:
+            return LinkographMetrics(
+                link_density=0.0,
+                critical_move_ratio=0.0,
+                entropy=0.0,
+                phase_balance={},
+                cognitive_indicators={}
+            )
+
+        return LinkographMetrics(
+            link_density=self.total_strength / self.move_count,
+            critical_move_ratio=self.critical_count / self.move_count,
+            entropy=self.entropy,
+            phase_balance={phase: count / self.move_count for phase, count in self.phase_counts.items()},
+            cognitive_indicators={
+                'deep_thinking': 0.0,
+                'offloading_prevention': 0.0,
+                'knowledge_integration': 0.0,
+                'learning_progression': 0.0,
+                'metacognitive_awareness': 0.0
+            },
+            avg_link_strength=self.total_strength / self.link_count if self.link_count else 0.0,
+            max_link_range=self.max_temporal_distance,
+            orphan_move_ratio=self.degree_histogram.get(0, 0) / self.move_count,
+            chunk_count=self.chunk_count,
+            web_count=self.web_count,
+            sawtooth_count=self.sawtooth_count
+        )
@@ -1,5 +1,8 @@
 """
 Cached intersection calculation for performance optimization
+
+Intersections are solved in closed form (see linkography_intersection_precise),
+so the cache only saves the small per-call overhead for repeated arc pairs.
 """
 
 from typing import Dict, Tuple, Optional, List
@@ -30,14 +33,13 @@ def check_arcs_cross_cached(s1: float, t1: float, s2: float, t2: float) -> bool:
 def find_arc_intersection_cached(s1: float, t1: float, s2: float, t2: float, 
                                 precision: int = 200) -> Optional[Tuple[float, float]]:
     """
-    Cached version of arc intersection with reduced default precision.
-    Uses 200 points by default (good enough for visual accuracy).
+    Cached version of arc intersection.
+    precision is unused (the solver is exact) and kept for existing callers.
     """
-    key = f"{_get_arc_key(s1, t1, s2, t2)}_{precision}"
+    key = _get_arc_key(s1, t1, s2, t2)
     
     if key not in _intersection_cache:
-        # Use lower precision for faster calculation
-        _intersection_cache[key] = find_arc_intersection(s1, t1, s2, t2, precision)
+        _intersection_cache[key] = find_arc_intersection(s1, t1, s2, t2)
     
     return _intersection_cache[key]
 
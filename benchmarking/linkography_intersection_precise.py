@@ -1,12 +1,21 @@
 """
 Mathematically precise intersection detection for linkography arcs
-Priority: PRECISION over performance
+
+Every linkograph arc is the same parabola scaled to its span:
+    y(x) = -2 * (x - s) * (t - x) / (t - s)    for s <= x <= t
+so two arcs meet where a quadratic in x has a root inside their common
+interval. Intersections are solved in closed form, vectorized over all
+candidate pairs, and candidates come from a sweep over arcs sorted by start,
+so only arcs whose move intervals interleave are ever compared.
 """
 
 import numpy as np
 from typing import List, Tuple, Optional
 import math
 
+# Slack when testing whether a root lies inside the common interval
+_ROOT_TOLERANCE = 1e-9
+
 
 def get_arc_point(start: float, end: float, t: float) -> Tuple[float, float]:
     """
@@ -21,6 +30,92 @@ def get_arc_point(start: float, end: float, t: float) -> Tuple[float, float]:
     return (x, y)
 
 
+def solve_arc_intersections(s1, t1, s2, t2) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Closed-form intersection of arc pairs, vectorized.
+    
+    Args:
+        s1, t1, s2, t2: Arrays (or scalars) with start and end of each arc pair;
+            arcs may be given in either direction
+        
+    Returns:
+        (x, y, found) arrays; where found is False, x and y are NaN. If two arcs
+        meet more than once the leftmost point is returned.
+    """
+    s1, t1, s2, t2 = (np.asarray(v, dtype=float) for v in (s1, t1, s2, t2))
+    s1, t1 = np.minimum(s1, t1), np.maximum(s1, t1)
+    s2, t2 = np.minimum(s2, t2), np.maximum(s2, t2)
+    span1 = t1 - s1
+    span2 = t2 - s2
+    
+    # span2 * (x - s1)(t1 - x) = span1 * (x - s2)(t2 - x)  ->  a x^2 + b x + c = 0
+    a = span1 - span2
+    b = span2 * (s1 + t1) - span1 * (s2 + t2)
+    c = span1 * s2 * t2 - span2 * s1 * t1
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        linear = np.isclose(a, 0.0)
+        discriminant = b * b - 4 * a * c
+        sqrt_disc = np.sqrt(np.where(discriminant >= 0, discriminant, np.nan))
+        # Numerically stable quadratic roots
+        q = -0.5 * (b + np.where(b >= 0, 1.0, -1.0) * sqrt_disc)
+        root_a = np.where(linear, -c / b, q / a)
+        root_b = np.where(linear, np.nan, c / q)
+    
+    low = np.maximum(s1, s2) - _ROOT_TOLERANCE
+    high = np.minimum(t1, t2) + _ROOT_TOLERANCE
+    valid_a = (root_a >= low) & (root_a <= high) & (span1 > 0) & (span2 > 0)
+    valid_b = (root_b >= low) & (root_b <= high) & (span1 > 0) & (span2 > 0)
+    
+    x = np.where(valid_a & valid_b, np.minimum(root_a, root_b),
+                 np.where(valid_a, root_a, np.where(valid_b, root_b, np.nan)))
+    found = valid_a | valid_b
+    with np.errstate(divide='ignore', invalid='ignore'):
+        y = np.where(found, -2.0 * (x - s1) * (t1 - x) / span1, np.nan)
+    return x, y, found
+
+
+def find_interleaving_pairs(starts, ends) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Sweep-line search for arc pairs whose intervals interleave (s1 < s2 < t1 < t2
+    or the reverse), the only pairs check_arcs_actually_cross accepts.
+    
+    Args:
+        starts, ends: Arc endpoints in either direction
+        
+    Returns:
+        (i, j) index arrays with i < j, in lexicographic order
+    """
+    starts = np.asarray(starts, dtype=float)
+    ends = np.asarray(ends, dtype=float)
+    low = np.minimum(starts, ends)
+    high = np.maximum(starts, ends)
+    if low.size < 2:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    
+    # Sweep by start: the arcs that can interleave with arc k are exactly those
+    # starting strictly inside (low[k], high[k]), a contiguous run in sorted order
+    order = np.argsort(low, kind='stable')
+    sorted_low = low[order]
+    first = np.searchsorted(sorted_low, low[order], side='right')
+    last = np.searchsorted(sorted_low, high[order], side='left')
+    counts = np.maximum(last - first, 0)
+    
+    outer = np.repeat(np.arange(order.size), counts)
+    offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    inner = np.repeat(first, counts) + offsets
+    
+    a = order[outer]
+    b = order[inner]
+    # Inner arc starts inside the outer one; it must also end outside it
+    keep = high[b] > high[a]
+    a, b = a[keep], b[keep]
+    
+    i, j = np.minimum(a, b), np.maximum(a, b)
+    pair_order = np.lexsort((j, i))
+    return i[pair_order], j[pair_order]
+
+
 def find_arc_intersection(s1: float, t1: float, s2: float, t2: float, 
                          precision: int = 1000) -> Optional[Tuple[float, float]]:
     """
@@ -29,60 +124,15 @@ def find_arc_intersection(s1: float, t1: float, s2: float, t2: float,
     Args:
         s1, t1: Start and end of first arc
         s2, t2: Start and end of second arc
-        precision: Number of points to sample on each arc
+        precision: Unused; kept for callers of the former sampled solver
         
     Returns:
         (x, y) coordinates of intersection, or None if no intersection
     """
-    # Ensure proper ordering
-    if s1 > t1:
-        s1, t1 = t1, s1
-    if s2 > t2:
-        s2, t2 = t2, s2
-    
-    # Generate points along both arcs
-    arc1_points = []
-    arc2_points = []
-    
-    for i in range(precision + 1):
-        t = i / precision
-        arc1_points.append(get_arc_point(s1, t1, t))
-        arc2_points.append(get_arc_point(s2, t2, t))
-    
-    # Find the closest approach between any two points
-    min_distance = float('inf')
-    intersection = None
-    
-    # For each segment of arc1
-    for i in range(len(arc1_points) - 1):
-        p1_start = arc1_points[i]
-        p1_end = arc1_points[i + 1]
-        
-        # Check against each segment of arc2
-        for j in range(len(arc2_points) - 1):
-            p2_start = arc2_points[j]
-            p2_end = arc2_points[j + 1]
-            
-            # Find intersection of two line segments
-            intersection_point = line_segment_intersection(
-                p1_start, p1_end, p2_start, p2_end
-            )
-            
-            if intersection_point:
-                # We found an actual intersection!
-                return intersection_point
-    
-    # If no exact intersection, find closest approach
-    for p1 in arc1_points:
-        for p2 in arc2_points:
-            dist = math.sqrt((p2[0] - p1[0])**2 + (p2[1] - p1[1])**2)
-            if dist < min_distance:
-                min_distance = dist
-                # Only consider it an intersection if points are very close
-                if dist < 0.1:  # Threshold for "touching"
-                    intersection = ((p1[0] + p2[0]) / 2, (p1[1] + p2[1]) / 2)
-    
-    return intersection
+    x, y, found = solve_arc_intersections(s1, t1, s2, t2)
+    if not found:
+        return None
+    return (float(x), float(y))
 
 
 def line_segment_intersection(p1: Tuple[float, float], p2: Tuple[float, float],
@@ -156,26 +206,15 @@ def calculate_precise_intersections(links: List[Tuple[int, int]],
     
     Args:
         links: List of (source, target) pairs
-        precision: Sampling precision for arc intersection
+        precision: Unused; kept for callers of the former sampled solver
         
     Returns:
-        List of (x, y) intersection points
+        List of (x, y) intersection points, ordered by link pair
     """
-    intersections = []
+    if len(links) < 2:
+        return []
     
-    # Check all pairs of links
-    for i in range(len(links)):
-        s1, t1 = links[i]
-        
-        for j in range(i + 1, len(links)):
-            s2, t2 = links[j]
-            
-            # First check if arcs can possibly cross
-            if check_arcs_actually_cross(s1, t1, s2, t2):
-                # Find precise intersection
-                intersection = find_arc_intersection(s1, t1, s2, t2, precision)
-                
-                if intersection:
-                    intersections.append(intersection)
-    
-    return intersections
\ No newline at end of file
+    endpoints = np.asarray(links, dtype=float)
+    i, j = find_interleaving_pairs(endpoints[:, 0], endpoints[:, 1])
+    x, y, found = solve_arc_intersections(endpoints[i, 0], endpoints[i, 1], endpoints[j, 0], endpoints[j, 1])
+    return list(zip(x[found].tolist(), y[found].tolist()))
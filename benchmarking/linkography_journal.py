@@ -0,0 +1,228 @@
+"""
+MEGA Architectural Mentor - Linkograph Journal
+Append-only JSONL log of a linkograph as it grows during a session
+
+The session loggers used to rewrite the whole linkography_<session>.json after
+every move, which is O(n^2) bytes over a session. Instead each logged move
+appends one record holding the move, the links it created and the current
+metrics; finalize() compacts the journal into the usual linkography JSON.
+
+Journal file: linkography_journal_<session_id>.jsonl
+    {"type": "header", "session_id": ..., "created_at": ..., "format_version": 1}
+    {"type": "move", "move": {...}, "links": [{...}, ...], "metrics": {...}}
+
+Readers accept both formats: load_linkography_data() returns the compacted
+JSON layout for either file, and load_linkograph() rebuilds a Linkograph.
+A truncated final line (crash mid-write) is ignored.
+"""
+
+import json
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+JOURNAL_FORMAT_VERSION = 1
+JOURNAL_PREFIX = "linkography_journal_"
+JOURNAL_SUFFIX = ".jsonl"
+
+# Fields persisted per move and per link
+MOVE_FIELDS = ('id', 'timestamp', 'session_id', 'user_id', 'phase', 'content',
+               'move_type', 'modality', 'cognitive_load', 'metadata')
+LINK_FIELDS = ('id', 'source_move', 'target_move', 'strength', 'confidence',
+               'link_type', 'temporal_distance', 'semantic_similarity', 'automated')
+
+
+def journal_path(data_dir: Union[str, Path], session_id: str) -> Path:
+    return Path(data_dir) / f"{JOURNAL_PREFIX}{session_id}{JOURNAL_SUFFIX}"
+
+
+def is_journal_file(path: Union[str, Path]) -> bool:
+    path = Path(path)
+    return path.name.startswith(JOURNAL_PREFIX) and path.suffix == JOURNAL_SUFFIX
+
+
+def move_to_record(move: Any) -> Dict[str, Any]:
+    """Serializable dict for a move object (embeddings are not journaled)."""
+    return {field: getattr(move, field) for field in MOVE_FIELDS if hasattr(move, field)}
+
+
+def link_to_record(link: Any) -> Dict[str, Any]:
+    return {field: getattr(link, field) for field in LINK_FIELDS if hasattr(link, field)}
+
+
+def header_record(session_id: str) -> Dict[str, Any]:
+    return {
+        'type': 'header',
+        'session_id': session_id,
+        'created_at': datetime.now().isoformat(),
+        'format_version': JOURNAL_FORMAT_VERSION
+    }
+
+
+def move_record(move: Any, links: List[Any], metrics: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Journal record for one appended move and the links it created."""
+    return {
+        'type': 'move',
+        'timestamp': datetime.now().isoformat(),
+        'move': move if isinstance(move, dict) else move_to_record(move),
+        'links': [link if isinstance(link, dict) else link_to_record(link) for link in links],
+        'metrics': metrics or {}
+    }
+
+
+def append_records(path: Union[str, Path], records: List[Dict[str, Any]]) -> None:
+    with open(path, 'a', encoding='utf-8') as f:
+        for record in records:
+            f.write(json.dumps(record, default=str) + '\n')
+
+
+def read_records(path: Union[str, Path]) -> Iterator[Dict[str, Any]]:
+    """Yield journal records, skipping a truncated or corrupt line."""
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                continue
+
+
+def read_journal(path: Union[str, Path]) -> Dict[str, Any]:
+    """Materialize a journal into the compacted linkography JSON layout."""
+    session_id = Path(path).name[len(JOURNAL_PREFIX):-len(JOURNAL_SUFFIX)]
+    created_at = None
+    last_timestamp = None
+    moves: List[Dict[str, Any]] = []
+    links: List[Dict[str, Any]] = []
+    metrics: Dict[str, Any] = {}
+
+    for record in read_records(path):
+        record_type = record.get('type')
+        if record_type == 'header':
+            session_id = record.get('session_id', session_id)
+            created_at = record.get('created_at')
+        elif record_type == 'move':
+            moves.append(record.get('move', {}))
+            links.extend(record.get('links', []))
+            metrics = record.get('metrics') or metrics
+            last_timestamp = record.get('timestamp', last_timestamp)
+
+    return {
+        'session_id': session_id,
+        'timestamp': last_timestamp or created_at or datetime.now().isoformat(),
+        'linkograph': {
+            'id': session_id,
+            'session_id': session_id,
+            'phase': moves[-1].get('phase', 'ideation') if moves else 'ideation',
+            'generated_at': last_timestamp or created_at,
+            'move_count': len(moves),
+            'link_count': len(links),
+            'moves': moves,
+            'links': links
+        },
+        'metrics': metrics,
+        'move_count': len(moves),
+        'link_count': len(links),
+        'source_format': 'journal'
+    }
+
+
+def load_linkography_data(path: Union[str, Path]) -> Dict[str, Any]:
+    """Load a compacted linkography JSON or a journal, always in the compacted layout."""
+    if is_journal_file(path):
+        return read_journal(path)
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def find_linkography_files(directory: Union[str, Path]) -> Dict[str, Path]:
+    """
+    Map session id -> linkography file in directory.
+
+    The compacted linkography_<session>.json wins; a journal is returned only
+    for sessions that were never finalized.
+    """
+    directory = Path(directory)
+    files: Dict[str, Path] = {}
+    for path in sorted(directory.glob("linkography_*.json")):
+        if "moves" in path.name:
+            continue
+        files[path.stem[len("linkography_"):]] = path
+    for path in sorted(directory.glob(f"{JOURNAL_PREFIX}*{JOURNAL_SUFFIX}")):
+        files.setdefault(path.name[len(JOURNAL_PREFIX):-len(JOURNAL_SUFFIX)], path)
+    return files
+
+
+def load_linkograph(path: Union[str, Path]):
+    """Rebuild a Linkograph from a journal or a compacted linkography JSON."""
+    from benchmarking.linkography_types import DesignMove, Linkograph, LinkographLink, LinkographMetrics
+
+    data = load_linkography_data(path)
+    session_id = data.get('session_id', '')
+    linkograph_dict = data.get('linkograph', {})
+
+    moves = [
+        DesignMove(
+            id=move['id'],
+            timestamp=move.get('timestamp', 0.0),
+            session_id=move.get('session_id', session_id),
+            user_id=move.get('user_id', 'participant'),
+            phase=move.get('phase', 'ideation'),
+            content=move.get('content', ''),
+            move_type=move.get('move_type', 'analysis'),
+            modality=move.get('modality', 'text'),
+            cognitive_load=move.get('cognitive_load'),
+            metadata=move.get('metadata') or {}
+        )
+        for move in linkograph_dict.get('moves', [])
+    ]
+
+    links = [
+        LinkographLink(
+            id=link['id'],
+            source_move=link['source_move'],
+            target_move=link['target_move'],
+            strength=link.get('strength', 0.5),
+            confidence=link.get('confidence', 0.8),
+            link_type=link.get('link_type', 'forward'),
+            temporal_distance=link.get('temporal_distance', 1),
+            semantic_similarity=link.get('semantic_similarity', link.get('strength', 0.5)),
+            automated=link.get('automated', True)
+        )
+        for link in linkograph_dict.get('links', [])
+    ]
+
+    metrics_data = data.get('metrics', {})
+    metrics = LinkographMetrics(
+        link_density=metrics_data.get('link_density', 0.0),
+        critical_move_ratio=metrics_data.get('critical_move_ratio', 0.0),
+        entropy=metrics_data.get('entropy', 0.0),
+        phase_balance=metrics_data.get('phase_balance', {}),
+        cognitive_indicators=metrics_data.get('cognitive_indicators', {}),
+        avg_link_strength=metrics_data.get('avg_link_strength', 0.0),
+        max_link_range=metrics_data.get('max_link_range', 0),
+        orphan_move_ratio=metrics_data.get('orphan_move_ratio', 0.0),
+        chunk_count=metrics_data.get('chunk_count', 0),
+        web_count=metrics_data.get('web_count', 0),
+        sawtooth_count=metrics_data.get('sawtooth_count', 0)
+    )
+
+    generated_at = linkograph_dict.get('generated_at')
+    if not isinstance(generated_at, (int, float)):
+        try:
+            generated_at = datetime.fromisoformat(generated_at).timestamp()
+        except (TypeError, ValueError):
+            generated_at = time.time()
+
+    return Linkograph(
+        id=linkograph_dict.get('id', session_id),
+        session_id=session_id,
+        moves=moves,
+        links=links,
+        metrics=metrics,
+        phase=linkograph_dict.get('phase', 'ideation'),
+        generated_at=generated_at
+    )
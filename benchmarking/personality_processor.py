@@ -15,6 +15,11 @@ from datetime import datetime
 from personality_models import PersonalityProfile, save_personality_profile
 from personality_analyzer import PersonalityAnalyzer, create_analyzer_with_fallback
 
+try:
+    from benchmarking.session_store import read_session_file
+except ImportError:
+    from session_store import read_session_file
+
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -215,8 +220,7 @@ class PersonalityProcessor:
             Combined user text string
         """
         try:
-            with open(full_log_path, 'r', encoding='utf-8') as f:
-                log_data = json.load(f)
+            log_data = read_session_file(full_log_path)
             
             user_texts = []
             
@@ -274,7 +278,7 @@ class PersonalityProcessor:
         # Try to extract text from interactions file
         if 'interactions' in session_files:
             try:
-                df = pd.read_csv(session_files['interactions'])
+                df = read_session_file(session_files['interactions'])
                 user_text = self.extract_user_text_from_interactions(df)
             except Exception as e:
                 logger.error(f"Failed to read interactions file for session {session_id}: {e}")
@@ -0,0 +1,139 @@
+"""
+MEGA Architectural Mentor - Session Results Cache
+Dependency-tracked per-session artifacts for incremental benchmarking runs
+
+Every per-session result of BenchmarkingPipeline (interaction graph,
+evaluation metrics, linkograph session, personality profile) is stored as
+
+    <output_dir>/cache/session_results/<kind>/<session id>.pkl
+
+together with two keys:
+    input_hash    sha256 over the contents of the session's input files
+    code_version  sha256 over the source of the modules that produce the artifact
+
+An entry is reused only when both keys match, so a run recomputes new
+sessions, changed sessions and everything a code change can affect, and reuses
+the rest. Aggregate stages (clustering, classifier, reports) always rerun over
+the full set of results.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple, Union
+
+RESULTS_CACHE_DIRNAME = "session_results"
+
+# Modules (benchmarking/*.py) each artifact kind depends on
+ARTIFACT_DEPENDENCIES: Dict[str, Tuple[str, ...]] = {
+    'graph': ('graph_ml_benchmarking', 'session_store'),
+    'evaluation': ('evaluation_metrics', 'session_store'),
+    # Linkography reads the session's evaluation report
+    'linkography': ('evaluation_metrics', 'session_store', 'linkography_analyzer', 'linkography_engine',
+                    'linkography_types', 'linkography_cognitive_mapping', 'linkography_incremental'),
+    'personality': ('personality_processor', 'personality_analyzer', 'personality_models', 'session_store'),
+    # Dashboard linkography analysis (LinkographySessionAnalyzer.analyze_all_sessions), per source file
+    'linkography_report': ('linkography_analyzer', 'linkography_engine', 'linkography_types',
+                           'linkography_cognitive_mapping'),
+    'linkography_file': ('linkography_analyzer', 'linkography_engine', 'linkography_types',
+                         'linkography_cognitive_mapping', 'linkography_journal'),
+}
+
+MISSING = object()
+
+
+def hash_files(paths: Iterable[Union[str, Path]]) -> str:
+    """sha256 over the names and contents of paths (missing files are skipped)."""
+    digest = hashlib.sha256()
+    for path in sorted(Path(p) for p in paths):
+        if not path.exists():
+            continue
+        digest.update(path.name.encode('utf-8'))
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+    return digest.hexdigest()
+
+
+def file_fingerprint(paths: Iterable[Union[str, Path]]) -> Tuple[Tuple[str, int, int], ...]:
+    """(path, size, mtime_ns) of every existing file in paths; cheap change detection for cached loaders."""
+    fingerprint = []
+    for path in sorted(Path(p) for p in paths):
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        fingerprint.append((str(path), stat.st_size, stat.st_mtime_ns))
+    return tuple(fingerprint)
+
+
+_code_versions: Dict[str, str] = {}
+
+
+def code_version(kind: str, variant: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Version of the code producing an artifact kind: a hash of its modules'
+    source, plus any runtime variant (e.g. which personality model is active).
+    """
+    if kind not in _code_versions:
+        module_dir = Path(__file__).parent
+        _code_versions[kind] = hash_files(module_dir / f"{name}.py" for name in ARTIFACT_DEPENDENCIES[kind])
+    version = _code_versions[kind]
+    if variant:
+        version += ':' + hashlib.sha256(json.dumps(variant, sort_keys=True, default=str).encode('utf-8')).hexdigest()[:16]
+    return version
+
+
+class SessionResultsCache:
+    """Per-session artifacts keyed by input hash and code version."""
+
+    def __init__(self, cache_dir: Union[str, Path], enabled: bool = True):
+        self.root = Path(cache_dir) / RESULTS_CACHE_DIRNAME
+        self.enabled = enabled
+        self.stats = {'hits': 0, 'misses': 0}
+
+    def _entry_path(self, kind: str, session_id: str) -> Path:
+        return self.root / kind / f"{session_id}.pkl"
+
+    def get(self, kind: str, session_id: str, input_hash: str, version: str) -> Any:
+        """The cached artifact, or MISSING if absent or out of date."""
+        path = self._entry_path(kind, session_id)
+        if self.enabled and path.exists():
+            try:
+                with open(path, 'rb') as f:
+                    entry = pickle.load(f)
+                if entry.get('input_hash') == input_hash and entry.get('code_version') == version:
+                    self.stats['hits'] += 1
+                    return entry['value']
+            except Exception as e:
+                print(f"  [!]  Ignoring unreadable cache entry {path.name}: {e}")
+        self.stats['misses'] += 1
+        return MISSING
+
+    def put(self, kind: str, session_id: str, input_hash: str, version: str, value: Any) -> None:
+        path = self._entry_path(kind, session_id)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix('.tmp')
+            with open(tmp_path, 'wb') as f:
+                pickle.dump({'input_hash': input_hash, 'code_version': version, 'value': value}, f,
+                            protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            print(f"  [!]  Could not cache {kind} result for {session_id}: {e}")
+
+    def prune(self, kind: str, keep: Iterable[str]) -> int:
+        """Delete entries of sessions that no longer exist; returns how many were removed."""
+        kind_dir = self.root / kind
+        if not kind_dir.exists():
+            return 0
+        keep = set(keep)
+        removed = 0
+        for path in kind_dir.glob("*.pkl"):
+            if path.stem not in keep:
+                path.unlink()
+                removed += 1
+        return removed
+
@@ -20,33 +20,50 @@ sys.path.append(str(Path(__file__).parent.parent))
 
 # Import benchmarking modules
 from benchmarking.graph_ml_benchmarking import (
-    InteractionGraph, CognitiveGNN, CognitiveBenchmarkGenerator
+    InteractionGraph, CognitiveGNN, CognitiveBenchmarkGenerator, GNN_CHECKPOINT_FILENAME, SKILL_LEVELS
 )
 from benchmarking.evaluation_metrics import (
     CognitiveMetricsEvaluator, evaluate_all_sessions
 )
 from benchmarking.visualization_tools import CognitiveBenchmarkVisualizer
 from benchmarking.user_proficiency_classifier import (
-    UserProficiencyClassifier, generate_training_data_from_sessions
+    UserProficiencyClassifier
 )
 from benchmarking.linkography_analyzer import LinkographySessionAnalyzer
 from benchmarking.pattern_recognition import CognitivePatternDetector
+from benchmarking.session_dataset import SessionDataset
+from benchmarking.session_workers import SessionWorkerPool, run_serial
+from benchmarking.results_cache import MISSING, SessionResultsCache, code_version, hash_files
 
 
 class BenchmarkingPipeline:
     """Complete benchmarking pipeline for cognitive assessment"""
     
-    def __init__(self, data_dir: str = "./thesis_data", output_dir: str = "./benchmarking/results"):
+    def __init__(self, data_dir: str = "./thesis_data", output_dir: str = "./benchmarking/results",
+                 use_dataset_cache: bool = True, workers: int = 1, use_results_cache: bool = True,
+                 gnn_threads: Optional[int] = None):
         self.data_dir = Path(data_dir)
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.cache_dir = self.output_dir / "cache"
+        self.use_dataset_cache = use_dataset_cache
+        
+        # Per-session results are reused while their inputs and producing code are unchanged
+        self.results_cache = SessionResultsCache(self.cache_dir, enabled=use_results_cache)
+        
+        # Per-session stages run on a process pool when workers > 1
+        self.workers = max(1, workers)
+        self._worker_pool: Optional[SessionWorkerPool] = None
+        
+        # torch threads for batched GNN inference (None = GNN_INFERENCE_THREADS)
+        self.gnn_threads = gnn_threads
         
         # Initialize components
         self.benchmark_generator = CognitiveBenchmarkGenerator()
         self.metrics_evaluator = CognitiveMetricsEvaluator()
         self.visualizer = CognitiveBenchmarkVisualizer(style='scientific')
         self.proficiency_classifier = UserProficiencyClassifier()
-        self.linkography_analyzer = LinkographySessionAnalyzer()
+        self.linkography_analyzer = LinkographySessionAnalyzer(results_path=self.output_dir)
         self.pattern_detector = CognitivePatternDetector()
         
         # Results storage
@@ -64,23 +81,36 @@ class BenchmarkingPipeline:
                          export_report: bool = True):
         """Run the complete benchmarking pipeline"""
         
+        try:
+            self._run_pipeline_stages(train_classifier, generate_visualizations, export_report)
+        finally:
+            if self._worker_pool is not None:
+                self._worker_pool.close()
+                self._worker_pool = None
+    
+    def _run_pipeline_stages(self, train_classifier: bool, generate_visualizations: bool, export_report: bool):
+        """Pipeline steps 1-10 (see run_full_pipeline)"""
+        
         print("\n" + "="*60)
         print("MEGA ARCHITECTURAL MENTOR - COGNITIVE BENCHMARKING SYSTEM")
         print("="*60 + "\n")
         
         # Step 1: Load and validate data
         print("Step 1: Loading interaction data...")
-        session_files = self._load_session_data()
+        dataset = self._load_session_data()
         
-        if not session_files:
+        if not dataset:
             print("[X] No interaction data found. Please run some sessions first.")
             return
         
-        print(f"[OK] Found {len(session_files)} session files")
-        self.results['sessions_analyzed'] = len(session_files)
+        source = " (cached, no files changed)" if dataset.from_cache else ""
+        print(f"[OK] Found {len(dataset)} session files{source}")
+        if self.workers > 1:
+            print(f"[OK] Per-session stages run on {self.workers} worker processes")
+        self.results['sessions_analyzed'] = len(dataset)
         
         # Warn about minimum data requirements
-        if len(session_files) < 3:
+        if len(dataset) < 3:
             print("\n[!]  Warning: Limited data available")
             print("   - Clustering will use rule-based assignment instead of ML clustering")
             print("   - For best results, collect at least 3-5 sessions")
@@ -88,13 +118,17 @@ class BenchmarkingPipeline:
         
         # Step 2: Process data into graphs
         print("\nStep 2: Processing data into interaction graphs...")
-        graphs = self._process_interaction_graphs(session_files)
+        graphs = self._process_interaction_graphs(dataset)
         print(f"[OK] Created {len(graphs)} interaction graphs")
         
         # Step 3: Train GNN model
         print("\nStep 3: Training Graph Neural Network model...")
-        self._train_gnn_model(graphs)
-        print("[OK] GNN model trained successfully")
+        gnn_stats = self._train_gnn_model(graphs)
+        if gnn_stats['reused_checkpoint']:
+            print("[OK] GNN model loaded from checkpoint (graphs and feature schema unchanged)")
+        else:
+            print(f"[OK] GNN model trained successfully ({gnn_stats['epochs_per_sec']:.2f} epochs/sec)")
+        print(f"[OK] Embedded {gnn_stats['graphs_embedded']} graphs ({gnn_stats['graphs_per_sec']:.1f} graphs/sec)")
         
         # Step 4: Generate cognitive benchmarks
         print("\nStep 4: Generating cognitive benchmarks...")
@@ -103,29 +137,29 @@ class BenchmarkingPipeline:
         
         # Step 5: Evaluate sessions
         print("\nStep 5: Evaluating cognitive metrics...")
-        evaluation_results = self._evaluate_sessions(session_files)
+        evaluation_results = self._evaluate_sessions(dataset)
         print("[OK] Session evaluation complete")
         
         # Step 6: Linkography Analysis
         print("\nStep 6: Performing linkography analysis...")
-        linkography_results = self._perform_linkography_analysis(session_files)
+        linkography_results = self._perform_linkography_analysis(dataset)
         print(f"[OK] Linkography analysis complete for {len(linkography_results)} sessions")
         
         # Step 7: Train proficiency classifier
         if train_classifier:
             print("\nStep 7: Training user proficiency classifier...")
-            self._train_proficiency_classifier(session_files)
+            self._train_proficiency_classifier(dataset)
             print("[OK] Proficiency classifier trained")
         
         # Step 8: Generate visualizations
         if generate_visualizations:
             print("\nStep 8: Generating visualizations...")
-            self._generate_visualizations(graphs, benchmarks, evaluation_results, linkography_results)
+            self._generate_visualizations(graphs, benchmarks, evaluation_results, linkography_results, dataset)
             print("[OK] Visualizations generated")
         
         # Step 9: Personality Analysis
         print("\nStep 9: Performing personality analysis...")
-        personality_results = self._perform_personality_analysis(session_files)
+        personality_results = self._perform_personality_analysis(dataset)
         print(f"[OK] Personality analysis complete for {len(personality_results)} sessions")
         
         # Step 10: Export comprehensive report
@@ -139,54 +173,110 @@ class BenchmarkingPipeline:
         print("="*60)
         self._print_summary()
     
-    def _load_session_data(self) -> List[Path]:
-        """Load all valid session data files with required columns"""
+    def _load_session_data(self) -> SessionDataset:
+        """Load all valid sessions (required columns, non-empty) once for the whole run"""
         
-        # Import session validator
-        from session_validator import get_valid_session_files
+        dataset = SessionDataset.load(self.data_dir, cache_dir=self.cache_dir,
+                                      use_cache=self.use_dataset_cache)
         
-        # Get only valid files with all required columns
-        valid_files = get_valid_session_files(self.data_dir)
+        for file_name, reason in dataset.skipped.items():
+            if reason == "empty file":
+                print(f"  [!]  Skipping empty file {file_name}")
         
-        # Additional check for non-empty files
-        final_valid_files = []
-        for file in valid_files:
-            try:
-                df = pd.read_csv(file)
-                if len(df) > 0:
-                    final_valid_files.append(file)
-                else:
-                    print(f"  [!]  Skipping empty file {file.name}")
-            except Exception as e:
-                print(f"  [!]  Skipping invalid file {file.name}: {str(e)}")
+        for kind in ('graph', 'evaluation', 'linkography'):
+            self.results_cache.prune(kind, dataset.session_ids)
         
-        return final_valid_files
+        return dataset
+    
+    def _uses_worker_pool(self, session_count: int) -> bool:
+        return self.workers > 1 and session_count > 1
+    
+    def _map_sessions(self, task: str, payloads: List[Any], local_fn) -> List[Any]:
+        """
+        Run a per-session task (see session_workers.SESSION_TASKS) on every payload.
+        Serial with this pipeline's own components, or on the worker pool with
+        --workers N; either way returns (ok, result or error) in payload order.
+        """
+        if not self._uses_worker_pool(len(payloads)):
+            return run_serial(local_fn, payloads)
+        if self._worker_pool is None:
+            self._worker_pool = SessionWorkerPool(self.workers)
+        return self._worker_pool.map(task, payloads)
+    
+    def _map_sessions_cached(self, kind: str, task: Optional[str], items: List[tuple], local_fn,
+                             variant: Optional[Dict[str, Any]] = None) -> List[tuple]:
+        """
+        _map_sessions with the results cache: items are (session_id, input_hash, payload).
+        Sessions whose cached artifact matches their input hash and the current code
+        version are reused; only the rest are computed (on the pool unless task is None).
+        Returns (ok, result, from_cache) in item order.
+        """
+        version = code_version(kind, variant)
+        outcomes: List[Optional[tuple]] = [None] * len(items)
+        pending = []
+        for index, (session_id, input_hash, _) in enumerate(items):
+            cached = self.results_cache.get(kind, session_id, input_hash, version)
+            if cached is MISSING:
+                pending.append(index)
+            else:
+                outcomes[index] = (True, cached, True)
+        
+        if pending:
+            payloads = [items[index][2] for index in pending]
+            computed = self._map_sessions(task, payloads, local_fn) if task else run_serial(local_fn, payloads)
+            for index, (ok, result) in zip(pending, computed):
+                outcomes[index] = (ok, result, False)
+                if ok:
+                    session_id, input_hash, _ = items[index]
+                    self.results_cache.put(kind, session_id, input_hash, version, result)
+        
+        print(f"  {len(items) - len(pending)} sessions reused from cache, {len(pending)} computed")
+        return outcomes
     
-    def _process_interaction_graphs(self, session_files: List[Path]) -> List[InteractionGraph]:
+    def _process_interaction_graphs(self, dataset: SessionDataset) -> List[InteractionGraph]:
         """Process session data into interaction graphs"""
         
         graphs = []
         
-        for i, session_file in enumerate(session_files):
-            print(f"  Processing session {i+1}/{len(session_files)}...", end='\r')
-            
-            try:
-                graph = self.benchmark_generator.process_session_data(str(session_file))
-                graphs.append(graph)
-            except Exception as e:
-                print(f"\n  [!]  Error processing {session_file.name}: {str(e)}")
+        print(f"  Processing {len(dataset)} sessions...")
+        outcomes = self._map_sessions_cached(
+            'graph', 'graph',
+            [(record.session_id, record.input_hash, record.interactions) for record in dataset],
+            self.benchmark_generator.process_session_data
+        )
+        
+        for record, (ok, result, _) in zip(dataset, outcomes):
+            if ok:
+                graphs.append(result)
+            else:
+                print(f"  [!]  Error processing {record.interactions_path.name}: {result}")
         
-        print()  # New line after progress
         return graphs
     
-    def _train_gnn_model(self, graphs: List[InteractionGraph]):
-        """Train the Graph Neural Network model"""
-        
-        self.benchmark_generator.train_gnn_model(graphs, epochs=50)
+    def _train_gnn_model(self, graphs: List[InteractionGraph]) -> Dict[str, Any]:
+        """Train the Graph Neural Network model (or reuse its checkpoint) and embed every graph"""
+        
+        # --recompute also retrains; otherwise an unchanged checkpoint is reused
+        stats = self.benchmark_generator.train_gnn_model(
+            graphs, epochs=50,
+            checkpoint_path=self.cache_dir / GNN_CHECKPOINT_FILENAME,
+            retrain=not self.results_cache.enabled
+        )
         
         # Save the model
         model_path = self.output_dir / "gnn_model.pkl"
         self.benchmark_generator.save_model(str(model_path))
+        
+        inference = self.benchmark_generator.embed_graphs(graphs, num_threads=self.gnn_threads)
+        levels = np.bincount(inference['predicted_levels'], minlength=len(SKILL_LEVELS))
+        stats.update({
+            'graphs_embedded': len(graphs),
+            'inference_seconds': inference['inference_seconds'],
+            'graphs_per_sec': inference['graphs_per_sec'],
+            'predicted_proficiency': dict(zip(SKILL_LEVELS, levels.tolist())),
+        })
+        self.results['gnn_model'] = stats
+        return stats
     
     def _generate_benchmarks(self, graphs: List[InteractionGraph]) -> Dict[str, Any]:
         """Generate cognitive benchmarks from graphs"""
@@ -207,39 +297,44 @@ class BenchmarkingPipeline:
         
         return benchmarks
     
-    def _perform_linkography_analysis(self, session_files: List[Path]) -> Dict[str, Any]:
+    def _perform_linkography_analysis(self, dataset: SessionDataset) -> Dict[str, Any]:
         """Perform linkography analysis on session data"""
         
         linkography_results = {}
         
-        for i, session_file in enumerate(session_files):
-            print(f"  Analyzing linkography for session {i+1}/{len(session_files)}...", end='\r')
-            
+        records, payloads = [], []
+        for record in dataset:
             try:
                 # Load evaluation report for this session
-                session_id = session_file.stem.replace('interactions_', '')
-                eval_report_path = self.output_dir / "evaluation_reports" / f"session_{session_id}_evaluation.json"
+                eval_report_path = self.output_dir / "evaluation_reports" / f"session_{record.session_id}_evaluation.json"
                 
                 if eval_report_path.exists():
                     with open(eval_report_path, 'r') as f:
                         session_data = json.load(f)
                     
-                    # Load interaction data and add to session_data
-                    interactions_df = pd.read_csv(session_file)
+                    # Add the interaction data to session_data
                     session_data['interaction_analysis'] = {
-                        'interactions': interactions_df.to_dict('records')
+                        'interactions': record.interactions.to_dict('records')
                     }
-                    
-                    # Perform linkography analysis
-                    linkography_report = self.linkography_analyzer.analyze_session(session_data)
-                    
-                    if linkography_report:
-                        linkography_results[session_id] = linkography_report
+                    records.append(record)
+                    payloads.append(session_data)
                 
             except Exception as e:
-                print(f"\n  [!]  Error in linkography analysis for {session_file.name}: {str(e)}")
+                print(f"  [!]  Error in linkography analysis for {record.interactions_path.name}: {str(e)}")
+        
+        # Perform linkography analysis
+        print(f"  Analyzing linkography for {len(payloads)} sessions...")
+        outcomes = self._map_sessions_cached(
+            'linkography', 'linkography',
+            [(record.session_id, record.input_hash, payload) for record, payload in zip(records, payloads)],
+            self.linkography_analyzer.analyze_session
+        )
         
-        print()  # New line after progress
+        for record, (ok, linkography_report, _) in zip(records, outcomes):
+            if not ok:
+                print(f"  [!]  Error in linkography analysis for {record.interactions_path.name}: {linkography_report}")
+            elif linkography_report:
+                linkography_results[record.session_id] = linkography_report
         
         # Store results
         self.results['linkography_analysis'] = linkography_results
@@ -254,36 +349,23 @@ class BenchmarkingPipeline:
             with open(aggregated_path, 'w') as f:
                 json.dump(aggregated_report, f, indent=2)
         
+        # The dashboard analyzes evaluation reports on its own (without interaction data) and
+        # caches that per file on first render; repeating it here would double this stage's cost
         return linkography_results
     
-    def _load_session_data_for_linkography(self, session_file: Path) -> Dict[str, Any]:
-        """Load session data in format suitable for linkography analysis"""
+    def _load_session_data_for_linkography(self, record) -> Dict[str, Any]:
+        """Session data (a SessionDataset record) in format suitable for linkography analysis"""
         
         try:
-            # Load interaction data
-            interactions_df = pd.read_csv(session_file)
-            
-            # Load design moves if available
-            session_id = session_file.stem.replace('interactions_', '')
-            design_moves_file = self.data_dir / f"design_moves_{session_id}.csv"
-            
             design_moves = []
-            if design_moves_file.exists():
-                design_moves_df = pd.read_csv(design_moves_file)
-                design_moves = design_moves_df.to_dict('records')
-            
-            # Load session summary if available
-            session_summary_file = self.data_dir / f"session_summary_{session_id}.json"
-            session_summary = {}
-            if session_summary_file.exists():
-                with open(session_summary_file, 'r') as f:
-                    session_summary = json.load(f)
+            if record.design_moves is not None:
+                design_moves = record.design_moves.to_dict('records')
             
             return {
-                "session_id": session_id,
-                "interactions": interactions_df.to_dict('records'),
+                "session_id": record.session_id,
+                "interactions": record.interactions.to_dict('records'),
                 "design_moves": design_moves,
-                "session_summary": session_summary
+                "session_summary": record.session_summary
             }
             
         except Exception as e:
@@ -403,15 +485,28 @@ class BenchmarkingPipeline:
                 converted[session_id] = session
         return converted
     
-    def _evaluate_sessions(self, session_files: List[Path]) -> Dict[str, Any]:
+    def _evaluate_sessions(self, dataset: SessionDataset) -> Dict[str, Any]:
         """Evaluate cognitive metrics for all sessions"""
         
         all_metrics = []
+        recomputed = set()
         
-        for session_file in session_files:
-            session_data = pd.read_csv(session_file)
-            metrics = self.metrics_evaluator.evaluate_session(session_data)
+        outcomes = self._map_sessions_cached(
+            'evaluation', 'evaluate',
+            [(record.session_id, record.input_hash, record.interactions) for record in dataset],
+            self.metrics_evaluator.evaluate_session
+        )
+        
+        for record, (ok, metrics, from_cache) in zip(dataset, outcomes):
+            if not ok:
+                print(f"  [!]  Error evaluating {record.interactions_path.name}: {metrics}")
+                continue
             all_metrics.append(metrics)
+            if not from_cache:
+                recomputed.add(metrics['session_id'])
+        
+        # Cached and worker-computed sessions never went through this evaluator; the dashboard reads its history
+        self.metrics_evaluator.metrics_history = list(all_metrics)
         
         # Calculate aggregate metrics
         aggregate_metrics = self._calculate_aggregate_metrics(all_metrics)
@@ -431,17 +526,20 @@ class BenchmarkingPipeline:
         
         for metrics in all_metrics:
             report_path = reports_dir / f"session_{metrics['session_id']}_evaluation.json"
-            self.metrics_evaluator.generate_evaluation_report(metrics, str(report_path))
+            if metrics['session_id'] in recomputed or not report_path.exists():
+                self.metrics_evaluator.generate_evaluation_report(metrics, str(report_path))
         
         return aggregate_metrics
     
-    def _train_proficiency_classifier(self, session_files: List[Path]):
+    def _train_proficiency_classifier(self, dataset: SessionDataset):
         """Train the user proficiency classifier"""
         
-        # Generate training data
-        training_data = generate_training_data_from_sessions(
-            [str(f) for f in session_files]
-        )
+        # Training data: sessions with their pseudo-labels (derived once by the dataset)
+        training_data = [
+            (record.interactions, record.features['proficiency_label'])
+            for record in dataset
+            if record.features.get('proficiency_label') is not None
+        ]
         
         if len(training_data) < 5:
             print("  [!]  Insufficient data for classifier training (need at least 5 sessions)")
@@ -456,10 +554,9 @@ class BenchmarkingPipeline:
         
         # Classify all sessions
         classifications = {}
-        for session_file in session_files:
-            session_data = pd.read_csv(session_file)
-            result = self.proficiency_classifier.classify_user(session_data)
-            classifications[session_file.stem] = result
+        for record in dataset:
+            result = self.proficiency_classifier.classify_user(record.interactions)
+            classifications[record.interactions_path.stem] = result
         
         self.results['proficiency_classifications'] = classifications
     
@@ -467,7 +564,8 @@ class BenchmarkingPipeline:
                                graphs: List[InteractionGraph],
                                benchmarks: Dict[str, Any],
                                evaluation_results: Dict[str, Any],
-                               linkography_results: Dict[str, Any] = None):
+                               linkography_results: Dict[str, Any] = None,
+                               dataset: Optional[SessionDataset] = None):
         """Generate all visualizations"""
         
         viz_dir = self.output_dir / "visualizations"
@@ -504,18 +602,12 @@ class BenchmarkingPipeline:
         
         # 4. Cognitive flow diagram
         if graphs:
-            # Import session validator
-            from session_validator import get_valid_session_files
-            
             # Combine data from valid sessions only for flow analysis
-            all_data = []
-            valid_files = get_valid_session_files(self.data_dir)
-            for session_file in valid_files:
-                df = pd.read_csv(session_file)
-                all_data.append(df)
+            if dataset is None:
+                dataset = self._load_session_data()
             
-            if all_data:
-                combined_data = pd.concat(all_data, ignore_index=True)
+            if dataset:
+                combined_data = dataset.combined_interactions()
                 flow_path = viz_dir / "cognitive_flow.html"
                 self.visualizer.create_cognitive_flow_diagram(
                     combined_data,
@@ -623,7 +715,7 @@ class BenchmarkingPipeline:
         
         return aggregate
     
-    def _perform_personality_analysis(self, session_files: List[Path]) -> List[Any]:
+    def _perform_personality_analysis(self, dataset: SessionDataset) -> List[Any]:
         """Perform personality analysis on session data"""
         
         # First, run personality analysis validation
@@ -649,21 +741,24 @@ class BenchmarkingPipeline:
                 return []
             
             personality_profiles = []
-            total_sessions = len(session_file_map)
             
-            for i, (session_id, files) in enumerate(session_file_map.items()):
-                print(f"  Analyzing personality for session {i+1}/{total_sessions}: {session_id}...", end='\r')
-                
-                try:
-                    profile = processor.process_single_session(session_id, files)
-                    if profile:
-                        personality_profiles.append(profile)
-                        # Save individual profile
-                        processor.save_personality_profile(profile)
-                        
-                except Exception as e:
-                    print(f"\n  [!] Failed to analyze session {session_id}: {e}")
-                    continue
+            print(f"  Analyzing personality for {len(session_file_map)} sessions...")
+            outcomes = self._map_sessions_cached(
+                'personality', None,
+                [(session_id, hash_files(files.values()), (session_id, files))
+                 for session_id, files in session_file_map.items()],
+                lambda item: processor.process_single_session(*item),
+                variant=processor.analyzer.get_model_info()
+            )
+            self.results_cache.prune('personality', session_file_map)
+            
+            for session_id, (ok, profile, _) in zip(session_file_map, outcomes):
+                if not ok:
+                    print(f"  [!] Failed to analyze session {session_id}: {profile}")
+                elif profile:
+                    personality_profiles.append(profile)
+                    # Save individual profile
+                    processor.save_personality_profile(profile)
             
             # Generate batch summary and correlations
             if personality_profiles:
@@ -1102,6 +1197,32 @@ def main():
         help="Skip generating the final report"
     )
     
+    parser.add_argument(
+        "--rebuild-dataset",
+        action="store_true",
+        help="Re-parse all session files instead of reusing the cached session dataset"
+    )
+    
+    parser.add_argument(
+        "--recompute",
+        action="store_true",
+        help="Recompute every session instead of reusing cached per-session results"
+    )
+    
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes for the per-session stages (default: 1, serial)"
+    )
+    
+    parser.add_argument(
+        "--gnn-threads",
+        type=int,
+        default=None,
+        help="torch threads for batched GNN inference (default: GNN_INFERENCE_THREADS env, 0 = torch default)"
+    )
+    
     parser.add_argument(
         "--no-dashboard",
         action="store_true",
@@ -1113,7 +1234,11 @@ def main():
     # Create pipeline
     pipeline = BenchmarkingPipeline(
         data_dir=args.data_dir,
-        output_dir=args.output_dir
+        output_dir=args.output_dir,
+        use_dataset_cache=not args.rebuild_dataset,
+        workers=args.workers,
+        use_results_cache=not args.recompute,
+        gnn_threads=args.gnn_threads
     )
     
     # Generate master metrics first
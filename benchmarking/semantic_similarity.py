@@ -6,10 +6,19 @@ Provides advanced text similarity detection using sentence transformers
 
 import numpy as np
 import pandas as pd
-from typing import List, Dict, Tuple, Any, Optional
+from typing import List, Dict, Tuple, Any, Optional, Iterator
 from sentence_transformers import SentenceTransformer, util
 from sklearn.metrics.pairwise import cosine_similarity
+from sklearn.preprocessing import normalize
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
 import torch
+try:
+    import faiss
+    FAISS_AVAILABLE = True
+except ImportError:
+    FAISS_AVAILABLE = False
+
 from thesis_colors import (
     THESIS_COLORS, METRIC_COLORS, COLOR_GRADIENTS, 
     PLOTLY_COLORSCALES, CHART_COLORS, UI_COLORS,
@@ -17,6 +26,213 @@ from thesis_colors import (
 )
 
 
+# Rows of the similarity matrix computed at a time by the blocked routines
+SIMILARITY_BLOCK_SIZE = 1024
+# Above this many moves analyze_design_move_similarity no longer materializes the N x N matrix
+DENSE_SIMILARITY_MAX_MOVES = 4096
+# Histogram resolution for quantiles of similarity distributions too large to hold in memory
+DISTRIBUTION_HISTOGRAM_BINS = 20000
+
+
+def similarity_blocks(embeddings: np.ndarray, block_size: int = SIMILARITY_BLOCK_SIZE,
+                      max_distance: Optional[int] = None) -> Iterator[Tuple[int, np.ndarray]]:
+    """
+    Yield the upper triangle of the cosine similarity matrix block by block.
+
+    Each item is (start, block) with block[r, c] = similarity(start + r, start + c)
+    for rows start..start+block_size and columns from start on (only up to
+    max_distance past the block when given). Peak memory is one block, never
+    the full N x N matrix; the caller keeps entries with c > r.
+    """
+    unit = normalize(np.asarray(embeddings))
+    n = len(unit)
+    for start in range(0, n, block_size):
+        stop = min(start + block_size, n)
+        column_stop = n if max_distance is None else min(n, stop + max_distance)
+        yield start, unit[start:stop] @ unit[start:column_stop].T
+
+
+def _block_pair_mask(block: np.ndarray, max_distance: Optional[int] = None) -> np.ndarray:
+    """Mask of a similarity block's entries with j > i (and j - i <= max_distance)."""
+    offsets = np.arange(block.shape[1])[None, :] - np.arange(block.shape[0])[:, None]
+    mask = offsets > 0
+    if max_distance is not None:
+        mask &= offsets <= max_distance
+    return mask
+
+
+def similar_pairs(embeddings: np.ndarray, threshold: float, max_distance: Optional[int] = None,
+                  top_k: Optional[int] = None,
+                  block_size: int = SIMILARITY_BLOCK_SIZE) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Index pairs i < j with similarity >= threshold (and j - i <= max_distance).
+
+    Returns (i, j, similarity) sorted by similarity, highest first, ties in
+    (i, j) order. With top_k only the k most similar pairs are kept; candidates
+    are trimmed with argpartition after every block.
+    """
+    rows, cols, sims = [], [], []
+    kept = 0
+    for start, block in similarity_blocks(embeddings, block_size, max_distance):
+        r, c = np.nonzero((block >= threshold) & _block_pair_mask(block, max_distance))
+        rows.append(r + start)
+        cols.append(c + start)
+        sims.append(block[r, c])
+        kept += len(r)
+        if top_k is not None and kept > top_k:
+            rows, cols, sims = [np.concatenate(rows)], [np.concatenate(cols)], [np.concatenate(sims)]
+            best = np.argpartition(-sims[0], top_k - 1)[:top_k]
+            rows, cols, sims = [rows[0][best]], [cols[0][best]], [sims[0][best]]
+            kept = top_k
+
+    if not rows:
+        empty = np.array([], dtype=int)
+        return empty, empty, np.array([], dtype=float)
+    i, j, similarity = np.concatenate(rows), np.concatenate(cols), np.concatenate(sims)
+    order = np.lexsort((j, i, -similarity))
+    if top_k is not None:
+        order = order[:top_k]
+    return i[order], j[order], similarity[order]
+
+
+def _distribution_summary(values: np.ndarray) -> Dict[str, float]:
+    return {
+        "mean": float(np.mean(values)),
+        "median": float(np.median(values)),
+        "std": float(np.std(values)),
+        "q25": float(np.percentile(values, 25)),
+        "q75": float(np.percentile(values, 75)),
+        "min": float(np.min(values)),
+        "max": float(np.max(values))
+    }
+
+
+def blocked_similarity_statistics(embeddings: np.ndarray,
+                                  block_size: int = SIMILARITY_BLOCK_SIZE) -> Dict[str, Any]:
+    """
+    Matrix-wide and pairwise statistics without materializing the matrix.
+
+    Returns the mean/max/min/std of the full matrix (as np.mean(matrix) etc.
+    would) and the distribution of the off-diagonal pairs. Mean, std, min and
+    max are exact; median and quartiles come from a histogram with
+    DISTRIBUTION_HISTOGRAM_BINS bins over [-1, 1], i.e. within 1e-4.
+    """
+    n = len(embeddings)
+    edges = np.linspace(-1.0, 1.0, DISTRIBUTION_HISTOGRAM_BINS + 1)
+    histogram = np.zeros(DISTRIBUTION_HISTOGRAM_BINS, dtype=np.int64)
+    pair_count, pair_sum, pair_sq = 0, 0.0, 0.0
+    pair_min, pair_max = np.inf, -np.inf
+    diag_sum, diag_sq, diag_min, diag_max = 0.0, 0.0, np.inf, -np.inf
+
+    for start, block in similarity_blocks(embeddings, block_size):
+        values = block[_block_pair_mask(block)].astype(np.float64)
+        diagonal = np.diagonal(block).astype(np.float64)
+        if len(values):
+            pair_count += len(values)
+            pair_sum += values.sum()
+            pair_sq += np.square(values).sum()
+            pair_min, pair_max = min(pair_min, values.min()), max(pair_max, values.max())
+            histogram += np.histogram(np.clip(values, -1.0, 1.0), bins=edges)[0]
+        diag_sum += diagonal.sum()
+        diag_sq += np.square(diagonal).sum()
+        diag_min, diag_max = min(diag_min, diagonal.min()), max(diag_max, diagonal.max())
+
+    total = n * n
+    matrix_mean = (2 * pair_sum + diag_sum) / total
+    matrix_var = (2 * pair_sq + diag_sq) / total - matrix_mean ** 2
+    stats = {
+        "average_similarity": float(matrix_mean),
+        "max_similarity": float(max(pair_max, diag_max)),
+        "min_similarity": float(min(pair_min, diag_min)),
+        "similarity_std": float(np.sqrt(max(matrix_var, 0.0))),
+        "similarity_distribution": {}
+    }
+    if pair_count:
+        pair_mean = pair_sum / pair_count
+        cumulative = np.cumsum(histogram) / pair_count
+        centers = (edges[:-1] + edges[1:]) / 2
+
+        def quantile(q):
+            return float(centers[min(np.searchsorted(cumulative, q), len(centers) - 1)])
+
+        stats["similarity_distribution"] = {
+            "mean": float(pair_mean),
+            "median": quantile(0.5),
+            "std": float(np.sqrt(max(pair_sq / pair_count - pair_mean ** 2, 0.0))),
+            "q25": quantile(0.25),
+            "q75": quantile(0.75),
+            "min": float(pair_min),
+            "max": float(pair_max)
+        }
+    return stats
+
+
+def _components_from_edges(n: int, rows: np.ndarray, cols: np.ndarray) -> List[List[int]]:
+    """
+    Connected components of the graph on n nodes with edges (rows[k], cols[k]).
+
+    Components are ordered by their smallest index and list their members in
+    ascending order.
+    """
+    graph = coo_matrix((np.ones(len(rows), dtype=np.int8), (rows, cols)), shape=(n, n))
+    _, labels = connected_components(graph, directed=False)
+    # Relabel by first occurrence so components come out in order of their smallest member
+    _, first, labels = np.unique(labels, return_index=True, return_inverse=True)
+    labels = np.argsort(np.argsort(first))[labels]
+    order = np.argsort(labels, kind='stable')
+    boundaries = np.flatnonzero(np.diff(labels[order])) + 1
+    return [group.tolist() for group in np.split(order, boundaries)]
+
+
+def _approximate_neighbor_edges(embeddings: np.ndarray, threshold: float,
+                                neighbors: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Edges to each point's approximate nearest neighbours (faiss HNSW) with similarity >= threshold."""
+    unit = np.ascontiguousarray(normalize(np.asarray(embeddings)), dtype=np.float32)
+    index = faiss.IndexHNSWFlat(unit.shape[1], 32, faiss.METRIC_INNER_PRODUCT)
+    index.add(unit)
+    similarity, neighbor = index.search(unit, min(neighbors + 1, len(unit)))
+    source = np.repeat(np.arange(len(unit)), neighbor.shape[1]).reshape(neighbor.shape)
+    keep = (neighbor >= 0) & (neighbor != source) & (similarity >= threshold)
+    return source[keep], neighbor[keep]
+
+
+def similarity_clusters(embeddings: np.ndarray, threshold: float, neighbors: Optional[int] = None,
+                        block_size: int = SIMILARITY_BLOCK_SIZE) -> List[List[int]]:
+    """
+    Single-linkage clusters at threshold: connected components of the graph
+    linking every pair with similarity >= threshold.
+
+    The thresholded pairs are found block by block (similar_pairs), so only the
+    sparse edge list is ever held in memory. With neighbors=k the graph instead
+    links each point to its k approximate nearest neighbours above threshold
+    (faiss HNSW index), which scales to large cross-session move corpora; an
+    edge between points that are not among each other's k nearest is missed,
+    so clusters can split where the exact graph would join them.
+    """
+    n = len(embeddings)
+    if n == 0:
+        return []
+    if neighbors is not None and not FAISS_AVAILABLE:
+        print("[!] faiss not installed, using exact similarity graph for clustering")
+        neighbors = None
+    if neighbors is not None:
+        rows, cols = _approximate_neighbor_edges(embeddings, threshold, neighbors)
+    else:
+        rows, cols, _ = similar_pairs(embeddings, threshold, block_size=block_size)
+    return _components_from_edges(n, rows, cols)
+
+
+def _mean_pairwise_similarity(unit: np.ndarray) -> float:
+    """Mean cosine similarity over ordered pairs i != j of normalized rows (NaN for a single row)."""
+    k = len(unit)
+    if k < 2:
+        return float('nan')
+    total = unit.sum(axis=0)
+    # sum over all (i, j) of u_i . u_j is |sum u|^2; remove the diagonal terms |u_i|^2
+    pair_sum = float(total @ total) - float(np.einsum('ij,ij->', unit, unit))
+    return pair_sum / (k * (k - 1))
+
+
 class SemanticSimilarityAnalyzer:
     """Advanced semantic similarity analysis for design moves"""
     
@@ -53,30 +269,26 @@ class SemanticSimilarityAnalyzer:
         return similarity_matrix
     
     def find_similar_pairs(self, texts: List[str], threshold: float = 0.6, 
-                          cache_key: Optional[str] = None) -> List[Dict[str, Any]]:
-        """Find pairs of texts with similarity above threshold"""
-        
-        similarity_matrix = self.calculate_similarity_matrix(texts, cache_key)
-        similar_pairs = []
-        
-        for i in range(len(texts)):
-            for j in range(i + 1, len(texts)):
-                similarity = similarity_matrix[i][j]
-                
-                if similarity >= threshold:
-                    pair = {
-                        "text1": texts[i],
-                        "text2": texts[j],
-                        "index1": i,
-                        "index2": j,
-                        "similarity": float(similarity)
-                    }
-                    similar_pairs.append(pair)
-        
-        # Sort by similarity (highest first)
-        similar_pairs.sort(key=lambda x: x['similarity'], reverse=True)
-        
-        return similar_pairs
+                          cache_key: Optional[str] = None, top_k: Optional[int] = None,
+                          embeddings: Optional[np.ndarray] = None) -> List[Dict[str, Any]]:
+        """Find pairs of texts with similarity above threshold (only the top_k most similar if given)"""
+        
+        if embeddings is None:
+            embeddings = self.encode_texts(texts, cache_key)
+        
+        # Sorted by similarity (highest first)
+        index1, index2, similarity = similar_pairs(embeddings, threshold, top_k=top_k)
+        
+        return [
+            {
+                "text1": texts[i],
+                "text2": texts[j],
+                "index1": int(i),
+                "index2": int(j),
+                "similarity": float(value)
+            }
+            for i, j, value in zip(index1, index2, similarity)
+        ]
     
     def analyze_design_move_similarity(self, moves: List[Dict[str, Any]], 
                                      threshold: float = 0.6) -> Dict[str, Any]:
@@ -87,12 +299,22 @@ class SemanticSimilarityAnalyzer:
         
         # Extract move contents
         contents = [move.get('content', '') for move in moves]
-        
-        # Calculate similarity matrix
-        similarity_matrix = self.calculate_similarity_matrix(contents)
+        embeddings = self.encode_texts(contents)
         
         # Find similar pairs
-        similar_pairs = self.find_similar_pairs(contents, threshold)
+        similar_pairs = self.find_similar_pairs(contents, threshold, embeddings=embeddings)
+        
+        if len(moves) > DENSE_SIMILARITY_MAX_MOVES:
+            # Too large for an N x N matrix: blocked statistics, no matrix in the result
+            return {
+                "similarity_matrix": None,
+                "similar_pairs": similar_pairs,
+                "high_similarity_pairs": len(similar_pairs),
+                **blocked_similarity_statistics(embeddings)
+            }
+        
+        # Calculate similarity matrix
+        similarity_matrix = cosine_similarity(embeddings)
         
         # Analyze similarity patterns
         analysis = {
@@ -111,39 +333,32 @@ class SemanticSimilarityAnalyzer:
     def _analyze_similarity_distribution(self, similarity_matrix: np.ndarray) -> Dict[str, Any]:
         """Analyze the distribution of similarity scores"""
         
-        # Flatten matrix (excluding diagonal)
-        similarities = []
-        for i in range(len(similarity_matrix)):
-            for j in range(i + 1, len(similarity_matrix)):
-                similarities.append(similarity_matrix[i][j])
+        # Upper triangle (excluding diagonal)
+        similarity_matrix = np.asarray(similarity_matrix)
+        similarities = similarity_matrix[np.triu_indices(len(similarity_matrix), k=1)]
         
-        if not similarities:
+        if not len(similarities):
             return {}
         
-        similarities = np.array(similarities)
-        
-        return {
-            "mean": float(np.mean(similarities)),
-            "median": float(np.median(similarities)),
-            "std": float(np.std(similarities)),
-            "q25": float(np.percentile(similarities, 25)),
-            "q75": float(np.percentile(similarities, 75)),
-            "min": float(np.min(similarities)),
-            "max": float(np.max(similarities))
-        }
+        return _distribution_summary(similarities)
     
     def detect_conceptual_clusters(self, moves: List[Dict[str, Any]], 
-                                 similarity_threshold: float = 0.7) -> List[Dict[str, Any]]:
-        """Detect conceptual clusters of similar design moves"""
+                                 similarity_threshold: float = 0.7,
+                                 neighbors: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Detect conceptual clusters of similar design moves (single linkage at
+        similarity_threshold). With neighbors=k the similarity graph is built
+        from approximate k nearest neighbours, see similarity_clusters.
+        """
         
         if len(moves) < 2:
             return []
         
         contents = [move.get('content', '') for move in moves]
-        similarity_matrix = self.calculate_similarity_matrix(contents)
+        unit = normalize(np.asarray(self.encode_texts(contents)))
         
-        # Use hierarchical clustering to find conceptual groups
-        clusters = self._hierarchical_clustering(similarity_matrix, similarity_threshold)
+        # Connected components of the thresholded similarity graph
+        clusters = similarity_clusters(unit, similarity_threshold, neighbors=neighbors)
         
         # Convert clusters to move groups
         conceptual_clusters = []
@@ -152,12 +367,7 @@ class SemanticSimilarityAnalyzer:
             cluster_contents = [moves[i].get('content', '') for i in cluster_indices]
             
             # Calculate cluster characteristics
-            cluster_similarity = np.mean([
-                similarity_matrix[i][j] 
-                for i in cluster_indices 
-                for j in cluster_indices 
-                if i != j
-            ])
+            cluster_similarity = _mean_pairwise_similarity(unit[cluster_indices])
             
             conceptual_cluster = {
                 "cluster_id": len(conceptual_clusters),
@@ -175,40 +385,12 @@ class SemanticSimilarityAnalyzer:
     
     def _hierarchical_clustering(self, similarity_matrix: np.ndarray, 
                                threshold: float) -> List[List[int]]:
-        """Simple hierarchical clustering based on similarity matrix"""
+        """Single-linkage clusters of a similarity matrix: connected components at threshold"""
         
-        n = len(similarity_matrix)
-        clusters = [[i] for i in range(n)]
-        
-        # Merge clusters based on similarity
-        merged = True
-        while merged and len(clusters) > 1:
-            merged = False
-            
-            for i in range(len(clusters)):
-                for j in range(i + 1, len(clusters)):
-                    # Check if clusters should be merged
-                    should_merge = False
-                    
-                    for idx1 in clusters[i]:
-                        for idx2 in clusters[j]:
-                            if similarity_matrix[idx1][idx2] >= threshold:
-                                should_merge = True
-                                break
-                        if should_merge:
-                            break
-                    
-                    if should_merge:
-                        # Merge clusters
-                        clusters[i].extend(clusters[j])
-                        clusters.pop(j)
-                        merged = True
-                        break
-                
-                if merged:
-                    break
+        similarity_matrix = np.asarray(similarity_matrix)
+        rows, cols = np.nonzero(np.triu(similarity_matrix >= threshold, k=1))
         
-        return clusters
+        return _components_from_edges(len(similarity_matrix), rows, cols)
     
     def analyze_phase_similarity(self, moves: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Analyze similarity patterns within and between design phases"""
@@ -291,31 +473,23 @@ class SemanticSimilarityAnalyzer:
             return []
         
         contents = [move.get('content', '') for move in moves]
-        similarity_matrix = self.calculate_similarity_matrix(contents)
-        
-        semantic_links = []
-        
-        for i in range(len(moves)):
-            for j in range(i + 1, len(moves)):
-                similarity = similarity_matrix[i][j]
-                distance = j - i
-                
-                if similarity >= threshold and distance <= max_distance:
-                    link = {
-                        "source_move": moves[i],
-                        "target_move": moves[j],
-                        "source_index": i,
-                        "target_index": j,
-                        "similarity": float(similarity),
-                        "distance": distance,
-                        "link_type": "semantic"
-                    }
-                    semantic_links.append(link)
-        
-        # Sort by similarity (highest first)
-        semantic_links.sort(key=lambda x: x['similarity'], reverse=True)
-        
-        return semantic_links
+        embeddings = self.encode_texts(contents)
+        
+        # Only the band within max_distance of the diagonal is computed; sorted by similarity (highest first)
+        source, target, similarity = similar_pairs(embeddings, threshold, max_distance=max_distance)
+        
+        return [
+            {
+                "source_move": moves[i],
+                "target_move": moves[j],
+                "source_index": int(i),
+                "target_index": int(j),
+                "similarity": float(value),
+                "distance": int(j - i),
+                "link_type": "semantic"
+            }
+            for i, j, value in zip(source, target, similarity)
+        ]
     
     def clear_cache(self):
         """Clear the embeddings cache"""
@@ -0,0 +1,190 @@
+"""
+MEGA Architectural Mentor - Session Dataset
+Parsed session data shared by every stage of a benchmarking run
+
+BenchmarkingPipeline used to re-read each interactions CSV in every stage
+(validation, graphs, evaluation, linkography, classifier, visualizations).
+A SessionDataset is built once per run and handed to each stage instead. It
+holds, per valid session, the interactions and design moves DataFrames, the
+session summary and a few derived features.
+
+Building goes through the session store (benchmarking/session_store.py), so
+converted sessions come from one Parquet scan. The built dataset is also
+pickled to <cache_dir>/session_dataset.pkl together with the size and mtime of
+every source file; a later run on unchanged thesis_data loads that pickle and
+skips parsing entirely. Any added, removed or modified file rebuilds it.
+
+Stages must treat the DataFrames as read-only (copy before modifying).
+"""
+
+import os
+import pickle
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+import pandas as pd
+
+from benchmarking.results_cache import hash_files
+from benchmarking.session_store import SESSION_SCHEMAS, load_table
+from benchmarking.user_proficiency_classifier import assign_proficiency_label
+
+try:
+    from benchmarking.session_validator import REQUIRED_COLUMNS
+except ImportError:
+    from session_validator import REQUIRED_COLUMNS
+
+DATASET_CACHE_VERSION = 2
+DATASET_CACHE_FILENAME = "session_dataset.pkl"
+
+# Source tables a dataset is built from; their files make up the cache key
+DATASET_TABLES = ('interactions', 'design_moves', 'session_summary')
+
+
+@dataclass
+class SessionRecord:
+    """Everything loaded for one session."""
+    session_id: str
+    interactions_path: Path
+    interactions: pd.DataFrame
+    design_moves: Optional[pd.DataFrame] = None
+    session_summary: Dict[str, Any] = field(default_factory=dict)
+    features: Dict[str, Any] = field(default_factory=dict)
+    input_hash: str = ''  # content hash of the session's source files (results cache key)
+
+
+def _derive_features(interactions: pd.DataFrame, design_moves: Optional[pd.DataFrame]) -> Dict[str, Any]:
+    """Per-session values several stages need, computed once."""
+    try:
+        proficiency_label = assign_proficiency_label(interactions)
+    except Exception:
+        proficiency_label = None
+    return {
+        'interaction_count': len(interactions),
+        'design_move_count': len(design_moves) if design_moves is not None else 0,
+        'proficiency_label': proficiency_label,
+    }
+
+
+def source_fingerprint(data_dir: Union[str, Path]) -> List[Tuple[str, int, int]]:
+    """(file name, size, mtime_ns) of every source file a dataset is built from."""
+    data_dir = Path(data_dir)
+    fingerprint = []
+    for table in DATASET_TABLES:
+        schema = SESSION_SCHEMAS[table]
+        for path in sorted(data_dir.glob(f"{schema.prefix}*{schema.suffix}")):
+            stat = path.stat()
+            fingerprint.append((path.name, stat.st_size, stat.st_mtime_ns))
+    return fingerprint
+
+
+class SessionDataset:
+    """Valid sessions of a thesis_data directory, parsed once per benchmarking run."""
+
+    def __init__(self, data_dir: Union[str, Path], sessions: Dict[str, SessionRecord],
+                 skipped: Optional[Dict[str, str]] = None):
+        self.data_dir = Path(data_dir)
+        self.sessions = sessions
+        self.skipped = skipped or {}  # file name -> reason
+        self.from_cache = False
+
+    def __len__(self) -> int:
+        return len(self.sessions)
+
+    def __iter__(self) -> Iterator[SessionRecord]:
+        return iter(self.sessions.values())
+
+    def __contains__(self, session_id: str) -> bool:
+        return session_id in self.sessions
+
+    def get(self, session_id: str) -> Optional[SessionRecord]:
+        return self.sessions.get(session_id)
+
+    @property
+    def session_ids(self) -> List[str]:
+        return list(self.sessions)
+
+    @property
+    def session_files(self) -> List[Path]:
+        return [record.interactions_path for record in self.sessions.values()]
+
+    def combined_interactions(self) -> pd.DataFrame:
+        """All sessions' interactions in one DataFrame."""
+        frames = [record.interactions for record in self.sessions.values()]
+        return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+
+    @classmethod
+    def build(cls, data_dir: Union[str, Path]) -> "SessionDataset":
+        """Parse every valid session in data_dir (sessions with all required columns and at least one row)."""
+        data_dir = Path(data_dir)
+        interactions = load_table(data_dir, 'interactions')
+        design_moves = load_table(data_dir, 'design_moves', interactions.keys())
+        summaries = load_table(data_dir, 'session_summary', interactions.keys())
+
+        sessions: Dict[str, SessionRecord] = {}
+        skipped: Dict[str, str] = {}
+        interactions_schema = SESSION_SCHEMAS['interactions']
+        for session_id in sorted(interactions):
+            df = interactions[session_id]
+            path = interactions_schema.source_path(data_dir, session_id)
+            missing = [column for column in REQUIRED_COLUMNS if column not in df.columns]
+            if missing:
+                skipped[path.name] = f"missing columns: {', '.join(missing)}"
+                continue
+            if len(df) == 0:
+                skipped[path.name] = "empty file"
+                continue
+            moves = design_moves.get(session_id)
+            sessions[session_id] = SessionRecord(
+                session_id=session_id,
+                interactions_path=path,
+                interactions=df,
+                design_moves=moves,
+                session_summary=summaries.get(session_id) or {},
+                features=_derive_features(df, moves),
+                input_hash=hash_files(SESSION_SCHEMAS[table].source_path(data_dir, session_id)
+                                      for table in DATASET_TABLES),
+            )
+        return cls(data_dir, sessions, skipped)
+
+    @classmethod
+    def load(cls, data_dir: Union[str, Path], cache_dir: Optional[Union[str, Path]] = None,
+             use_cache: bool = True) -> "SessionDataset":
+        """
+        Build the dataset, or load it from cache_dir when no source file changed
+        since it was cached. Without cache_dir (or with use_cache=False) it is
+        always rebuilt; the rebuilt dataset is still written to cache_dir.
+        """
+        data_dir = Path(data_dir)
+        fingerprint = source_fingerprint(data_dir)
+        cache_path = Path(cache_dir) / DATASET_CACHE_FILENAME if cache_dir is not None else None
+
+        if use_cache and cache_path is not None and cache_path.exists():
+            try:
+                with open(cache_path, 'rb') as f:
+                    cached = pickle.load(f)
+                if (cached.get('version') == DATASET_CACHE_VERSION
+                        and cached.get('data_dir') == str(data_dir.resolve())
+                        and cached.get('fingerprint') == fingerprint):
+                    dataset = cached['dataset']
+                    dataset.from_cache = True
+                    return dataset
+            except Exception as e:
+                print(f"  [!]  Ignoring unreadable session dataset cache: {e}")
+
+        dataset = cls.build(data_dir)
+        if cache_path is not None:
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = cache_path.with_suffix('.tmp')
+                with open(tmp_path, 'wb') as f:
+                    pickle.dump({
+                        'version': DATASET_CACHE_VERSION,
+                        'data_dir': str(data_dir.resolve()),
+                        'fingerprint': fingerprint,
+                        'dataset': dataset,
+                    }, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, cache_path)
+            except Exception as e:
+                print(f"  [!]  Could not cache session dataset: {e}")
+        return dataset
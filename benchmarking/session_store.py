@@ -0,0 +1,546 @@
+"""
+MEGA Architectural Mentor - Columnar Session Store
+Typed Parquet copy of thesis_data, partitioned by session
+
+The benchmarking pipeline, the dashboards and the personality processor all
+re-parse the same interactions_*.csv, design_moves_*.csv and *.json files.
+The session store converts them once into Parquet tables:
+
+    thesis_data/session_store/
+        _manifest.json          source file, size, mtime and columns per session
+        interactions.parquet
+        design_moves.parquet
+        full_log.parquet
+        session_summary.parquet
+
+Each table is partitioned by session: rows carry a `session` key column
+(<id> is the file name without its table prefix, e.g.
+unified_session_20250903_144626) and are stored sorted by it, so a session is
+one contiguous slice and session filters are pushed into the Parquet read.
+thesis_data sessions are small (tens of rows), so one file per table keeps a
+full load to a single read instead of paying file/row-group overhead per
+session. Conversion is incremental: only new or changed sources are parsed,
+the other sessions are carried over from the existing file.
+
+Column types come from SESSION_SCHEMAS (the schema registry): declared columns
+are coerced to their type, undeclared CSV columns are stored as strings. A
+session whose declared columns do not all parse (e.g. the column-shifted legacy
+sessions) is reported at conversion time and left out of the store, so readers
+parse its source file as before instead of seeing values turned into nulls.
+The dtypes pd.read_csv inferred for each session are kept in the manifest and
+restored when the session is read back, so a per-session read returns the same
+frame as parsing the source. JSON sources are stored as one JSON text
+payload per record.
+
+Readers go through load_table() / load_combined() / read_session_file(), which
+serve every up-to-date session from a single Parquet scan and fall back to parsing the
+original file for sessions that are missing or changed since conversion, so
+callers never see stale data. Without pyarrow everything falls back to the
+original files.
+
+Build or refresh the store with:
+    python convert_data_format.py --parquet
+"""
+
+import json
+import os
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+STORE_DIRNAME = "session_store"
+MANIFEST_FILENAME = "_manifest.json"
+PARTITION_FIELD = "session"
+DTYPES_METADATA_KEY = b"pandas_dtypes"
+# Inferred dtypes restored on read; string dtypes are left to the running pandas version
+_RESTORED_DTYPES = {'int64', 'float64', 'bool', 'object'}
+
+
+@dataclass
+class TableSchema:
+    """Registry entry: where a table comes from and how its columns are typed."""
+    name: str
+    prefix: str          # source files are <prefix><session id><suffix>
+    suffix: str
+    kind: str            # 'csv', 'json_records' (a JSON list) or 'json_document' (one JSON object)
+    version: int = 1
+    columns: Dict[str, str] = field(default_factory=dict)  # column -> 'bool' | 'int64' | 'float64' | 'string'
+
+    def session_key(self, path: Union[str, Path]) -> Optional[str]:
+        name = Path(path).name
+        if name.startswith(self.prefix) and name.endswith(self.suffix):
+            return name[len(self.prefix):len(name) - len(self.suffix)]
+        return None
+
+    def source_path(self, data_dir: Union[str, Path], session_key: str) -> Path:
+        return Path(data_dir) / f"{self.prefix}{session_key}{self.suffix}"
+
+
+_INTERACTION_FLAGS = [
+    'prevents_cognitive_offloading', 'encourages_deep_thinking', 'provides_scaffolding',
+    'maintains_engagement', 'adapts_to_skill_level', 'multi_agent_coordination',
+    'appropriate_agent_selection', 'response_coherence', 'knowledge_integrated',
+]
+
+SESSION_SCHEMAS: Dict[str, TableSchema] = {
+    'interactions': TableSchema(
+        name='interactions', prefix='interactions_', suffix='.csv', kind='csv', version=3,
+        columns={
+            **{flag: 'bool' for flag in _INTERACTION_FLAGS},
+            'interaction_number': 'int64',
+            'input_length': 'int64',
+            'response_length': 'int64',
+            'cognitive_flags_count': 'int64',
+            'design_moves_count': 'int64',
+            'sources_count': 'int64',
+            'response_time': 'float64',
+            'confidence_score': 'float64',
+            'phase_confidence': 'float64',
+            'phase_duration': 'float64',
+            'phase_progression_score': 'float64',
+            **{column: 'string' for column in (
+                'session_id', 'timestamp', 'student_input', 'agent_response', 'input_type',
+                'student_skill_level', 'understanding_level', 'confidence_level', 'engagement_level',
+                'response_type', 'routing_path', 'primary_agent', 'agents_used', 'agent_data',
+                'cognitive_flags', 'cognitive_state', 'context_classification', 'current_phase',
+                'design_moves', 'move_types', 'move_modalities', 'performance_metrics',
+                'phase_characteristics', 'phase_recommendations', 'phase_scores',
+                'scientific_metrics', 'sources_used',
+            )},
+        },
+    ),
+    'design_moves': TableSchema(
+        name='design_moves', prefix='design_moves_', suffix='.csv', kind='csv', version=3,
+        columns={
+            'interaction_number': 'int64',
+            'move_number': 'int64',
+            'micro_timestamp': 'float64',
+            'cognitive_load': 'float64',
+            **{column: 'string' for column in (
+                'session_id', 'timestamp', 'content', 'phase', 'move_type', 'modality', 'source', 'context',
+            )},
+        },
+    ),
+    'full_log': TableSchema(name='full_log', prefix='full_log_', suffix='.json', kind='json_records'),
+    'session_summary': TableSchema(name='session_summary', prefix='session_summary_', suffix='.json',
+                                   kind='json_document'),
+}
+
+class SchemaMismatchError(ValueError):
+    """A source file whose declared columns cannot be typed without losing values."""
+
+
+_TRUE_VALUES = {True, 'True', 'true', 'TRUE', 1, '1'}
+_FALSE_VALUES = {False, 'False', 'false', 'FALSE', 0, '0'}
+
+
+def _coerce_column(values: pd.Series, dtype: str) -> Optional["pa.Array"]:
+    """
+    Convert a pandas column to the declared Arrow type.
+
+    Returns None when the conversion would lose data: a non-empty cell that does
+    not parse, or a fractional value in an int64 column.
+    """
+    present = values.notna()
+    if dtype == 'bool':
+        converted = [True if v in _TRUE_VALUES else False if v in _FALSE_VALUES else None
+                     for v in values.tolist()]
+        if any(v is None for v, keep in zip(converted, present.tolist()) if keep):
+            return None
+        return pa.array(converted, type=pa.bool_())
+    if dtype in ('int64', 'float64'):
+        numeric = pd.to_numeric(values, errors='coerce')
+        if (numeric.isna() & present).any():
+            return None
+        if dtype == 'int64':
+            if (numeric.notna() & (numeric != numeric.round())).any():
+                return None
+            converted = [None if pd.isna(v) else int(v) for v in numeric.tolist()]
+            return pa.array(converted, type=pa.int64())
+        return pa.array(numeric.to_numpy(dtype='float64'), type=pa.float64(), from_pandas=True)
+    converted = [None if (not isinstance(v, str) and pd.isna(v)) else str(v) for v in values.tolist()]
+    return pa.array(converted, type=pa.string())
+
+
+def _payload_table(records: List[Any]) -> "pa.Table":
+    return pa.table({
+        'record_index': pa.array(range(len(records)), type=pa.int64()),
+        'payload': pa.array([json.dumps(record, ensure_ascii=False, default=str) for record in records],
+                            type=pa.string()),
+    })
+
+
+class SessionStore:
+    """One Parquet file per table, rows grouped by session, plus a manifest of their sources."""
+
+    def __init__(self, root: Union[str, Path]):
+        self.root = Path(root)
+        self.manifest_path = self.root / MANIFEST_FILENAME
+        self._lock = threading.Lock()
+        self.manifest = self._load_manifest()
+        self.manifest_mtime_ns = self.manifest_path.stat().st_mtime_ns if self.manifest_path.exists() else None
+
+    def _load_manifest(self) -> Dict[str, Any]:
+        try:
+            if self.manifest_path.exists():
+                with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+        except Exception as e:
+            print(f"Could not read session store manifest, ignoring store: {e}")
+        return {'tables': {}}
+
+    def _save_manifest(self) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.manifest_path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.manifest, f, indent=2)
+        os.replace(tmp_path, self.manifest_path)
+        self.manifest_mtime_ns = self.manifest_path.stat().st_mtime_ns
+
+    @staticmethod
+    def _source_signature(source: Path) -> Dict[str, int]:
+        stat = source.stat()
+        return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+    def is_fresh(self, table: str, session_key: str, source: Path) -> bool:
+        """True if the stored partition was converted from source as it is now."""
+        entry = self.manifest.get('tables', {}).get(table, {}).get(session_key)
+        if not entry or entry.get('version') != SESSION_SCHEMAS[table].version:
+            return False
+        try:
+            signature = self._source_signature(source)
+        except OSError:
+            return False
+        return entry.get('size') == signature['size'] and entry.get('mtime_ns') == signature['mtime_ns']
+
+    def sessions(self, table: str) -> List[str]:
+        return sorted(self.manifest.get('tables', {}).get(table, {}))
+
+    def table_path(self, table: str) -> Path:
+        return self.root / f"{table}.parquet"
+
+    def to_arrow(self, table: str, source: Path) -> "pa.Table":
+        """Parse one source file into its typed Arrow table."""
+        schema = SESSION_SCHEMAS[table]
+        if schema.kind == 'csv':
+            df = pd.read_csv(source)
+            arrays, names, uncoerced = [], [], []
+            for column in df.columns:
+                array = _coerce_column(df[column], schema.columns.get(column, 'string'))
+                if array is None:
+                    uncoerced.append(str(column))
+                names.append(str(column))
+                arrays.append(array)
+            if uncoerced:
+                raise SchemaMismatchError(
+                    f"{', '.join(uncoerced)} do not fit the {table} schema types; "
+                    f"the session stays on its source file")
+            # Remember what pd.read_csv inferred, so readers get the same dtypes back
+            dtypes = {str(column): str(df[column].dtype) for column in df.columns}
+            return pa.table(arrays, names=names).replace_schema_metadata(
+                {DTYPES_METADATA_KEY: json.dumps(dtypes)})
+
+        with open(source, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if schema.kind == 'json_records':
+            return _payload_table(data if isinstance(data, list) else [data])
+        return _payload_table([data])
+
+    def read(self, table: str, sessions: Optional[Iterable[str]] = None,
+             columns: Optional[List[str]] = None) -> "pa.Table":
+        """Read a table, optionally only some sessions/columns; the session column is always included."""
+        path = self.table_path(table)
+        if not path.exists():
+            return pa.table({PARTITION_FIELD: pa.array([], type=pa.string())})
+        if columns is not None:
+            available = pq.read_schema(path).names
+            columns = [c for c in columns if c in available and c != PARTITION_FIELD] + [PARTITION_FIELD]
+        filters = [(PARTITION_FIELD, 'in', list(sessions))] if sessions is not None else None
+        return pq.read_table(path, columns=columns, filters=filters)
+
+    def update_table(self, table: str, converted: Dict[str, Any], removed: Iterable[str] = ()) -> int:
+        """
+        Replace the partitions of converted sessions ({session id: (arrow table, source path)})
+        and drop removed ones; unchanged sessions are carried over without re-parsing.
+        Returns the number of rows written for converted sessions.
+        """
+        replaced = set(converted) | set(removed)
+        parts = []
+        existing = self.read(table)
+        if existing.num_rows:
+            keep = pc.invert(pc.is_in(existing.column(PARTITION_FIELD), value_set=pa.array(sorted(replaced), type=pa.string())))
+            parts.append(existing.filter(keep))
+        for session_key, (arrow_table, _) in converted.items():
+            parts.append(arrow_table.replace_schema_metadata(None).append_column(PARTITION_FIELD, pa.array([session_key] * arrow_table.num_rows,
+                                                                             type=pa.string())))
+
+        path = self.table_path(table)
+        self.root.mkdir(parents=True, exist_ok=True)
+        if parts:
+            # Sessions with different undeclared columns are unified (missing -> null)
+            combined = pa.concat_tables(parts, promote_options='default').sort_by(PARTITION_FIELD)
+            tmp_path = path.with_suffix('.tmp')
+            pq.write_table(combined, tmp_path, compression='zstd')
+            os.replace(tmp_path, path)
+
+        with self._lock:
+            entries = self.manifest.setdefault('tables', {}).setdefault(table, {})
+            for session_key in removed:
+                entries.pop(session_key, None)
+            for session_key, (arrow_table, source) in converted.items():
+                entries[session_key] = {
+                    'source': source.name,
+                    'version': SESSION_SCHEMAS[table].version,
+                    'rows': arrow_table.num_rows,
+                    'columns': arrow_table.column_names,
+                    'dtypes': json.loads((arrow_table.schema.metadata or {}).get(DTYPES_METADATA_KEY, b'{}')),
+                    **self._source_signature(source),
+                }
+        return sum(arrow_table.num_rows for arrow_table, _ in converted.values())
+
+    def scan(self, table: str, sessions: Optional[Iterable[str]] = None,
+             columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """Read a table (optionally a subset of sessions/columns) as one DataFrame with a session column."""
+        return self.read(table, sessions=sessions, columns=columns).to_pandas()
+
+    def session_frames(self, table: str, sessions: Optional[Iterable[str]] = None) -> Dict[str, pd.DataFrame]:
+        """One scan, split into a DataFrame per session (original column order, no session column)."""
+        frames: Dict[str, pd.DataFrame] = {}
+        df = self.scan(table, sessions=sessions)
+        if df.empty:
+            return frames
+        entries = self.manifest.get('tables', {}).get(table, {})
+        # Rows are sorted by session, so every session is one contiguous slice
+        keys = df[PARTITION_FIELD].to_numpy()
+        starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+        ends = np.r_[starts[1:], len(keys)]
+        for start, end in zip(starts, ends):
+            session_key = str(keys[start])
+            # Keep exactly this session's own columns, in source order
+            entry = entries.get(session_key, {})
+            columns = entry.get('columns') or [c for c in df.columns if c != PARTITION_FIELD]
+            frames[session_key] = _restore_dtypes(df.iloc[start:end][columns].reset_index(drop=True),
+                                                  entry.get('dtypes', {}))
+        return frames
+
+
+def _restore_dtypes(frame: pd.DataFrame, dtypes: Dict[str, str]) -> pd.DataFrame:
+    """
+    Cast a session's columns back to the dtypes pd.read_csv inferred for its source.
+
+    The unified table widens them: an int64 column that other sessions leave
+    empty reads back as float64, a bool column as object.
+    """
+    for column, dtype in dtypes.items():
+        if dtype in _RESTORED_DTYPES and column in frame.columns and str(frame[column].dtype) != dtype:
+            try:
+                frame[column] = frame[column].astype(dtype)
+            except (TypeError, ValueError):
+                pass
+    return frame
+
+
+def _decode_payloads(df: pd.DataFrame, kind: str) -> Any:
+    records = [json.loads(payload) for payload in df.sort_values('record_index')['payload']]
+    return records if kind == 'json_records' else (records[0] if records else {})
+
+
+def _find_sources(data_dir: Path, schema: TableSchema,
+                  session_keys: Optional[Iterable[str]] = None) -> Dict[str, Path]:
+    """Session id -> source file for every session (or only session_keys) present in data_dir."""
+    if session_keys is not None:
+        sources = {key: schema.source_path(data_dir, key) for key in session_keys}
+        return {key: path for key, path in sources.items() if path.exists()}
+    sources = {}
+    for path in sorted(data_dir.glob(f"{schema.prefix}*{schema.suffix}")):
+        key = schema.session_key(path)
+        if key is not None:
+            sources[key] = path
+    return sources
+
+
+def _read_source(table: str, source: Path) -> Any:
+    if SESSION_SCHEMAS[table].kind == 'csv':
+        return pd.read_csv(source)
+    with open(source, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+_stores: Dict[str, SessionStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_session_store(data_dir: Union[str, Path] = "thesis_data") -> Optional[SessionStore]:
+    """The store under data_dir (shared per path), or None if pyarrow is missing or nothing was converted."""
+    if not PYARROW_AVAILABLE:
+        return None
+    root = (Path(data_dir) / STORE_DIRNAME).resolve()
+    with _stores_lock:
+        manifest_path = root / MANIFEST_FILENAME
+        if not manifest_path.exists():
+            return None
+        store = _stores.get(str(root))
+        # Reload when the converter has run since the store was opened
+        if store is None or store.manifest_mtime_ns != manifest_path.stat().st_mtime_ns:
+            store = _stores[str(root)] = SessionStore(root)
+    return store
+
+
+def load_table(data_dir: Union[str, Path], table: str,
+               session_keys: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+    """
+    Load a table for every session in data_dir (or only session_keys).
+
+    Returns {session id: DataFrame} for CSV tables and {session id: parsed JSON}
+    for JSON tables. Up-to-date sessions come from one Parquet scan; missing or
+    changed ones are parsed from their source files.
+    """
+    schema = SESSION_SCHEMAS[table]
+    data_dir = Path(data_dir)
+    sources = _find_sources(data_dir, schema, session_keys)
+
+    results: Dict[str, Any] = {}
+    store = get_session_store(data_dir)
+    fresh = [key for key, path in sources.items() if store is not None and store.is_fresh(table, key, path)]
+    if fresh:
+        try:
+            frames = store.session_frames(table, fresh)
+            for key, frame in frames.items():
+                results[key] = frame if schema.kind == 'csv' else _decode_payloads(frame, schema.kind)
+        except Exception as e:
+            print(f"Session store scan failed for {table}, reading source files: {e}")
+
+    for key, path in sources.items():
+        if key not in results:
+            try:
+                results[key] = _read_source(table, path)
+            except Exception as e:
+                print(f"Error loading {path}: {e}")
+    return results
+
+
+def load_combined(data_dir: Union[str, Path], table: str,
+                  session_keys: Optional[Iterable[str]] = None) -> pd.DataFrame:
+    """
+    Load a CSV table for every session in data_dir as one DataFrame.
+
+    Rows keep their session's session_id column; a session_id missing from the
+    source is filled from the file name. Up-to-date sessions come straight from
+    the Parquet scan without being split per session.
+    """
+    schema = SESSION_SCHEMAS[table]
+    data_dir = Path(data_dir)
+    sources = _find_sources(data_dir, schema, session_keys)
+
+    parts = []
+    loaded = set()
+    store = get_session_store(data_dir)
+    fresh = [key for key, path in sources.items() if store is not None and store.is_fresh(table, key, path)]
+    if fresh:
+        try:
+            df = store.scan(table, sessions=fresh)
+            loaded = set(df[PARTITION_FIELD].unique())
+            parts.append(df)
+        except Exception as e:
+            print(f"Session store scan failed for {table}, reading source files: {e}")
+
+    for key, path in sources.items():
+        if key not in loaded:
+            try:
+                df = pd.read_csv(path)
+            except Exception as e:
+                print(f"Error loading {path}: {e}")
+                continue
+            df[PARTITION_FIELD] = key
+            parts.append(df)
+
+    parts = [df for df in parts if not df.empty]
+    if not parts:
+        return pd.DataFrame()
+    combined = pd.concat(parts, ignore_index=True)
+    if 'session_id' in combined.columns:
+        combined['session_id'] = combined['session_id'].fillna(combined[PARTITION_FIELD])
+    else:
+        combined['session_id'] = combined[PARTITION_FIELD]
+    return combined.drop(columns=[PARTITION_FIELD])
+
+
+def read_session_file(path: Union[str, Path]) -> Any:
+    """Drop-in for pd.read_csv / json.load on a thesis_data session file, served from the store when fresh."""
+    path = Path(path)
+    for table, schema in SESSION_SCHEMAS.items():
+        key = schema.session_key(path)
+        if key is not None:
+            loaded = load_table(path.parent, table, [key])
+            if key in loaded:
+                return loaded[key]
+            break
+    if path.suffix == '.csv':
+        return pd.read_csv(path)
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def convert_thesis_data(data_dir: Union[str, Path] = "thesis_data", force: bool = False,
+                        tables: Optional[Iterable[str]] = None) -> Dict[str, Dict[str, int]]:
+    """
+    Convert (or refresh) the session store under data_dir.
+
+    Only sources that are new or changed since the last conversion are
+    rewritten unless force is set; partitions whose source was deleted are
+    dropped. Returns per-table counts of converted, unchanged, removed and
+    failed sessions.
+    """
+    if not PYARROW_AVAILABLE:
+        raise RuntimeError("pyarrow is required for the session store: pip install pyarrow")
+
+    data_dir = Path(data_dir)
+    store = SessionStore(data_dir / STORE_DIRNAME)
+    report: Dict[str, Dict[str, int]] = {}
+
+    for table in (tables or SESSION_SCHEMAS):
+        counts = {'converted': 0, 'unchanged': 0, 'removed': 0, 'failed': 0, 'rows': 0}
+        sources = _find_sources(data_dir, SESSION_SCHEMAS[table])
+
+        converted, unconvertible = {}, []
+        for key, path in sources.items():
+            if not force and store.is_fresh(table, key, path):
+                counts['unchanged'] += 1
+                continue
+            try:
+                converted[key] = (store.to_arrow(table, path), path)
+                counts['converted'] += 1
+            except SchemaMismatchError as e:
+                counts['failed'] += 1
+                unconvertible.append(key)
+                print(f"  [!]  Not converting {path.name}: {e}")
+            except Exception as e:
+                counts['failed'] += 1
+                print(f"  [!]  Could not convert {path.name}: {e}")
+
+        # Sessions that no longer convert must not keep serving an older partition
+        removed = sorted((set(store.sessions(table)) - set(sources)) | (set(store.sessions(table)) & set(unconvertible)))
+        counts['removed'] = len(removed)
+        if converted or removed or not store.table_path(table).exists():
+            counts['rows'] = store.update_table(table, converted, removed)
+
+        report[table] = counts
+        print(f"  {table}: {counts['converted']} converted ({counts['rows']} rows), "
+              f"{counts['unchanged']} unchanged, {counts['removed']} removed, {counts['failed']} failed")
+
+    store.manifest['schemas'] = {name: {'version': schema.version, 'columns': schema.columns}
+                                 for name, schema in SESSION_SCHEMAS.items()}
+    store._save_manifest()
+    return report
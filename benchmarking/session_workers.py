@@ -0,0 +1,123 @@
+"""
+MEGA Architectural Mentor - Session Worker Pool
+Process-pool fan-out for the per-session benchmarking stages
+
+The graph, evaluation and linkography stages of BenchmarkingPipeline handle
+every session independently. With --workers N they are mapped over a pool of N
+processes instead of a serial loop:
+
+- Results come back in submission order, so merged output is identical to a
+  serial run regardless of which worker finished first.
+- Each worker builds a component (CognitiveBenchmarkGenerator,
+  CognitiveMetricsEvaluator, LinkographySessionAnalyzer and its
+  SentenceTransformer) the first time it needs it and reuses it for every later
+  session and stage; the pool lives for the whole pipeline run.
+- Workers are started with 'spawn' (the default on Windows, and safe with torch
+  already imported in the parent) and limited to one BLAS/torch thread each, so
+  N workers use N cores instead of oversubscribing them.
+- A failing session is reported as (False, error message) instead of raising,
+  so one bad session never aborts the others.
+"""
+
+import multiprocessing
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+# Components built at most once per worker process
+_components: Dict[str, Any] = {}
+
+
+def _component(name: str) -> Any:
+    if name not in _components:
+        if name == 'benchmark_generator':
+            from benchmarking.graph_ml_benchmarking import CognitiveBenchmarkGenerator
+            _components[name] = CognitiveBenchmarkGenerator()
+        elif name == 'metrics_evaluator':
+            from benchmarking.evaluation_metrics import CognitiveMetricsEvaluator
+            _components[name] = CognitiveMetricsEvaluator()
+        elif name == 'linkography_analyzer':
+            from benchmarking.linkography_analyzer import LinkographySessionAnalyzer
+            _components[name] = LinkographySessionAnalyzer()
+        else:
+            raise KeyError(f"Unknown worker component: {name}")
+    return _components[name]
+
+
+def build_interaction_graph(interactions):
+    return _component('benchmark_generator').process_session_data(interactions)
+
+
+def evaluate_session(interactions):
+    return _component('metrics_evaluator').evaluate_session(interactions)
+
+
+def analyze_linkography(session_data):
+    return _component('linkography_analyzer').analyze_session(session_data)
+
+
+SESSION_TASKS: Dict[str, Callable[[Any], Any]] = {
+    'graph': build_interaction_graph,
+    'evaluate': evaluate_session,
+    'linkography': analyze_linkography,
+}
+
+
+def _init_worker() -> None:
+    # The pool provides the parallelism: one math thread per worker
+    for var in ("OMP_NUM_THREADS", "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS"):
+        os.environ[var] = "1"
+    os.environ.setdefault("TOKENIZERS_PARALLELISM", "false")
+    if 'torch' in sys.modules:
+        sys.modules['torch'].set_num_threads(1)
+
+
+def _run_task(task: str, payload: Any) -> Tuple[bool, Any]:
+    try:
+        return True, SESSION_TASKS[task](payload)
+    except Exception as e:
+        return False, f"{type(e).__name__}: {e}"
+
+
+def run_serial(fn: Callable[[Any], Any], payloads: Sequence[Any]) -> List[Tuple[bool, Any]]:
+    """Same contract as SessionWorkerPool.map, in-process with the caller's own component."""
+    outcomes = []
+    for payload in payloads:
+        try:
+            outcomes.append((True, fn(payload)))
+        except Exception as e:
+            outcomes.append((False, f"{type(e).__name__}: {e}"))
+    return outcomes
+
+
+class SessionWorkerPool:
+    """Process pool shared by the per-session stages of one pipeline run."""
+
+    def __init__(self, workers: int):
+        self.workers = max(1, workers)
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def __enter__(self) -> "SessionWorkerPool":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def map(self, task: str, payloads: Sequence[Any]) -> List[Tuple[bool, Any]]:
+        """Run SESSION_TASKS[task] on every payload; returns (ok, result or error) in payload order."""
+        if not payloads:
+            return []
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers,
+                                                 mp_context=multiprocessing.get_context("spawn"),
+                                                 initializer=_init_worker)
+        # A few chunks per worker: low IPC overhead, still balanced when sessions differ in size
+        chunksize = max(1, len(payloads) // (self.workers * 4))
+        return list(self._executor.map(_run_task, repeat(task), payloads, chunksize=chunksize))
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
@@ -1,7 +1,11 @@
 """
 Convert existing CSV data to include required columns for benchmarking dashboard
+
+    python convert_data_format.py                 # add missing columns to the legacy session CSV
+    python convert_data_format.py --parquet       # build/refresh thesis_data/session_store (Parquet)
 """
 
+import argparse
 import pandas as pd
 import json
 import os
@@ -86,45 +90,72 @@ def convert_csv_format(input_file, output_file):
     print(f"Converted {input_file} -> {output_file}")
     return df
 
-# Convert the existing file
-thesis_data_dir = Path("C:/Users/aponw/OneDrive/Escritorio/MaCAD Thesis/macad-thesis-25/thesis_data")
-existing_file = thesis_data_dir / "interactions_unified_session_20250823_234828.csv"
 
-if existing_file.exists():
-    # Create backup
-    backup_file = thesis_data_dir / "interactions_unified_session_20250823_234828_original.csv"
-    
-    # Read and convert
-    df = pd.read_csv(existing_file)
-    
-    # Save original as backup
-    df.to_csv(backup_file, index=False)
-    print(f"Backed up original to {backup_file}")
-    
-    # Convert and overwrite
-    converted_df = convert_csv_format(existing_file, existing_file)
-    
-    # Show what columns we now have
-    print(f"\nColumns in converted file:")
-    print(f"Total columns: {len(converted_df.columns)}")
-    
-    # Check for required columns
-    required_cols = [
-        'prevents_cognitive_offloading',
-        'encourages_deep_thinking', 
-        'provides_scaffolding',
-        'maintains_engagement',
-        'adapts_to_skill_level',
-        'multi_agent_coordination',
-        'appropriate_agent_selection',
-        'response_coherence'
-    ]
-    
-    print("\nRequired columns check:")
-    for col in required_cols:
-        if col in converted_df.columns:
-            print(f"✓ {col}")
-        else:
-            print(f"✗ {col}")
-else:
-    print(f"File not found: {existing_file}")
\ No newline at end of file
+def convert_legacy_session():
+    """Add the required columns to the legacy session file (one-off fix)"""
+    thesis_data_dir = Path("C:/Users/aponw/OneDrive/Escritorio/MaCAD Thesis/macad-thesis-25/thesis_data")
+    existing_file = thesis_data_dir / "interactions_unified_session_20250823_234828.csv"
+
+    if existing_file.exists():
+        # Create backup
+        backup_file = thesis_data_dir / "interactions_unified_session_20250823_234828_original.csv"
+    
+        # Read and convert
+        df = pd.read_csv(existing_file)
+    
+        # Save original as backup
+        df.to_csv(backup_file, index=False)
+        print(f"Backed up original to {backup_file}")
+    
+        # Convert and overwrite
+        converted_df = convert_csv_format(existing_file, existing_file)
+    
+        # Show what columns we now have
+        print(f"\nColumns in converted file:")
+        print(f"Total columns: {len(converted_df.columns)}")
+    
+        # Check for required columns
+        required_cols = [
+            'prevents_cognitive_offloading',
+            'encourages_deep_thinking', 
+            'provides_scaffolding',
+            'maintains_engagement',
+            'adapts_to_skill_level',
+            'multi_agent_coordination',
+            'appropriate_agent_selection',
+            'response_coherence'
+        ]
+    
+        print("\nRequired columns check:")
+        for col in required_cols:
+            if col in converted_df.columns:
+                print(f"✓ {col}")
+            else:
+                print(f"✗ {col}")
+    else:
+        print(f"File not found: {existing_file}")
+
+
+def convert_to_parquet(data_dir, force=False):
+    """Convert thesis_data into the columnar session store (see benchmarking/session_store.py)"""
+    from benchmarking.session_store import convert_thesis_data, STORE_DIRNAME
+
+    print(f"Converting {data_dir} -> {Path(data_dir) / STORE_DIRNAME}")
+    report = convert_thesis_data(data_dir, force=force)
+    failed = sum(counts['failed'] for counts in report.values())
+    print(f"Session store ready ({failed} files failed)")
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Convert thesis data files")
+    parser.add_argument("--parquet", action="store_true",
+                        help="Build/refresh the columnar session store instead of fixing the legacy CSV")
+    parser.add_argument("--data-dir", default="thesis_data", help="thesis_data directory (default: thesis_data)")
+    parser.add_argument("--force", action="store_true", help="Reconvert every session, not only new/changed ones")
+    args = parser.parse_args()
+
+    if args.parquet:
+        convert_to_parquet(args.data_dir, force=args.force)
+    else:
+        convert_legacy_session()
@@ -6,13 +6,20 @@ the analysis results in categories for later reference throughout conversations.
 """
 
 import os
+import copy
 import json
 import hashlib
+import threading
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 from PIL import Image
 import tempfile
 
+# Records queued on the background writer but not yet on disk, by record path;
+# readers consult this first so a record stored this turn is visible immediately
+_pending_records: Dict[str, Dict[str, Any]] = {}
+_pending_lock = threading.Lock()
+
 
 class ImageDatabase:
     """Database for storing and retrieving image analysis data."""
@@ -167,25 +174,63 @@ class ImageDatabase:
             "stored_timestamp": datetime.now().isoformat()
         }
 
-        # Save to JSON file
-        record_path = os.path.join(self.storage_path, f"{image_id}.json")
-        with open(record_path, 'w') as f:
-            json.dump(record, f, indent=2)
+        # Save to JSON file, in the background writer when available; the queued
+        # record is a copy so later changes by the caller do not leak into it
+        record_path = self._record_path(image_id)
+        record = copy.deepcopy(record)
+        try:
+            from utils.write_behind import submit_write
+        except ImportError:
+            self._write_record(record_path, record)
+        else:
+            with _pending_lock:
+                _pending_records[record_path] = record
+            submit_write(self._write_record, record_path, record, key=record_path, label="image analysis record")
 
         print(f"📁 Stored image analysis: {image_id}")
         return image_id
 
-    def get_image_analysis(self, image_id: str) -> Optional[Dict[str, Any]]:
-        """Retrieve stored image analysis by ID."""
-        record_path = os.path.join(self.storage_path, f"{image_id}.json")
+    def _record_path(self, image_id: str) -> str:
+        return os.path.join(self.storage_path, f"{image_id}.json")
 
+    @staticmethod
+    def _write_record(record_path: str, record: Dict[str, Any]) -> None:
+        # Write to a temp file and swap it in, so readers never see a truncated record
+        tmp_path = f"{record_path}.tmp"
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump(record, f, indent=2)
+            os.replace(tmp_path, record_path)
+        finally:
+            with _pending_lock:
+                if _pending_records.get(record_path) is record:
+                    del _pending_records[record_path]
+
+    def _load_record(self, image_id: str) -> Optional[Dict[str, Any]]:
+        """The stored record (including one still queued for writing), or None."""
+        record_path = self._record_path(image_id)
+        with _pending_lock:
+            pending = _pending_records.get(record_path)
+        if pending is not None:
+            return copy.deepcopy(pending)
         if not os.path.exists(record_path):
             return None
+        with open(record_path, 'r') as f:
+            return json.load(f)
+
+    def _stored_image_ids(self) -> List[str]:
+        """IDs of all stored records, on disk or still queued for writing."""
+        image_ids = {filename[:-5] for filename in os.listdir(self.storage_path) if filename.endswith('.json')}
+        prefix = os.path.join(self.storage_path, "")
+        with _pending_lock:
+            image_ids.update(os.path.basename(path)[:-5] for path in _pending_records if path.startswith(prefix))
+        return sorted(image_ids)
 
+    def get_image_analysis(self, image_id: str) -> Optional[Dict[str, Any]]:
+        """Retrieve stored image analysis by ID."""
         try:
-            with open(record_path, 'r') as f:
-                record = json.load(f)
-            return record.get("analysis")
+            record = self._load_record(image_id)
+            return record.get("analysis") if record is not None else None
         except Exception as e:
             print(f"❌ Error retrieving image analysis {image_id}: {e}")
             return None
@@ -194,13 +239,11 @@ class ImageDatabase:
         """Search for images by drawing type."""
         matching_ids = []
 
-        for filename in os.listdir(self.storage_path):
-            if filename.endswith('.json'):
-                image_id = filename[:-5]  # Remove .json extension
-                analysis = self.get_image_analysis(image_id)
+        for image_id in self._stored_image_ids():
+            analysis = self.get_image_analysis(image_id)
 
-                if analysis and analysis.get("architectural_elements", {}).get("drawing_type") == drawing_type:
-                    matching_ids.append(image_id)
+            if analysis and analysis.get("architectural_elements", {}).get("drawing_type") == drawing_type:
+                matching_ids.append(image_id)
 
         return matching_ids
 
@@ -208,27 +251,26 @@ class ImageDatabase:
         """Get all images from the current conversation session."""
         images = []
 
-        for filename in os.listdir(self.storage_path):
-            if filename.endswith('.json'):
-                image_id = filename[:-5]
-                record_path = os.path.join(self.storage_path, filename)
+        for image_id in self._stored_image_ids():
+            filename = f"{image_id}.json"
 
-                try:
-                    with open(record_path, 'r') as f:
-                        record = json.load(f)
+            try:
+                record = self._load_record(image_id)
+                if record is None:
+                    continue
 
-                    # Add summary info for conversation reference
-                    summary = {
-                        "image_id": image_id,
-                        "drawing_type": record.get("analysis", {}).get("architectural_elements", {}).get("drawing_type", "unknown"),
-                        "upload_time": record.get("analysis", {}).get("contextual_information", {}).get("upload_timestamp"),
-                        "user_context": record.get("analysis", {}).get("contextual_information", {}).get("user_context", ""),
-                        "technical_summary": self._create_technical_summary(record.get("analysis", {}))
-                    }
-                    images.append(summary)
+                # Add summary info for conversation reference
+                summary = {
+                    "image_id": image_id,
+                    "drawing_type": record.get("analysis", {}).get("architectural_elements", {}).get("drawing_type", "unknown"),
+                    "upload_time": record.get("analysis", {}).get("contextual_information", {}).get("upload_timestamp"),
+                    "user_context": record.get("analysis", {}).get("contextual_information", {}).get("user_context", ""),
+                    "technical_summary": self._create_technical_summary(record.get("analysis", {}))
+                }
+                images.append(summary)
 
-                except Exception as e:
-                    print(f"❌ Error reading image record {filename}: {e}")
+            except Exception as e:
+                print(f"❌ Error reading image record {filename}: {e}")
 
         # Sort by upload time (most recent first)
         images.sort(key=lambda x: x.get("upload_time", ""), reverse=True)
@@ -33,6 +33,10 @@ class ModeProcessor:
         self.test_dashboard = test_dashboard
         self.image_database = image_database
 
+        # Optional callback receiving orchestrator stream events for the current turn
+        # (set by process_input, consumed by _process_mentor_mode)
+        self.stream_handler = None
+
         # If orchestrator is None, try to create one directly
         if self.orchestrator is None:
             try:
@@ -152,8 +156,13 @@ class ModeProcessor:
         except AttributeError:
             print("🎯 TASK_UI: Task manager is None - cannot render tasks")
 
-    async def process_input(self, user_input: str, mode: str, image_path: str = None) -> str:
-        """Process user input based on the selected mode with optional image."""
+    async def process_input(self, user_input: str, mode: str, image_path: str = None, stream_handler=None) -> str:
+        """Process user input based on the selected mode with optional image.
+
+        stream_handler, if given, is called with each streaming event (progress,
+        token, final, error) while the MENTOR orchestrator runs; other modes ignore it.
+        """
+        self.stream_handler = stream_handler
         try:
             print(f"🔍 PROCESS_INPUT_START: user_input='{user_input[:50]}...', mode='{mode}'")
 
@@ -264,6 +273,8 @@ class ModeProcessor:
         except Exception as e:
             st.error(f"❌ Error in process_input: {str(e)}")
             return f"An error occurred: {str(e)}"
+        finally:
+            self.stream_handler = None
 
     def _enhance_input_with_image_context(self, user_input: str) -> str:
         """Image context is now bundled at dashboard level - no enhancement needed here."""
@@ -906,7 +917,16 @@ class ModeProcessor:
         print(f"🎯 MODE_PROCESSOR: Last message: {state.messages[-1].get('content', '')[:100] if state.messages else 'No messages'}...")
 
         try:
-            result = await self.orchestrator.process_student_input(state)
+            if self.stream_handler is not None and hasattr(self.orchestrator, "astream_student_input"):
+                result = {}
+                async for event in self.orchestrator.astream_student_input(state):
+                    self.stream_handler(event)
+                    if event.get("type") == "final":
+                        result = event.get("result", {})
+                    elif event.get("type") == "error":
+                        raise RuntimeError(event.get("error", "Streaming failed"))
+            else:
+                result = await self.orchestrator.process_student_input(state)
             print(f"✅ MODE_PROCESSOR: Orchestrator returned result")
             print(f"   Result keys: {list(result.keys()) if isinstance(result, dict) else 'Not a dict'}")
 
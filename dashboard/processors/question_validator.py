@@ -194,7 +194,16 @@ Only flag as inappropriate if clearly harmful, illegal, or completely unrelated
 Default to APPROPRIATE and ON-TOPIC unless there's a clear reason not to.
 """
 
-            response = self.client.chat.completions.create(
+            # Persistent response cache: identical validation prompts are answered
+            # without an API call, across sessions and restarts
+            try:
+                from utils.client_manager import cached_chat_completion
+            except ImportError:
+                def cached_chat_completion(client, **kwargs):
+                    return client.chat.completions.create(**kwargs)
+
+            response = cached_chat_completion(
+                self.client,
                 model="gpt-4o-mini",  # Use mini for cost efficiency
                 messages=[{"role": "user", "content": validation_prompt}],
                 max_tokens=200,
@@ -338,6 +338,57 @@ def hide_typing_indicator():
     """, unsafe_allow_html=True)
 
 
+class StreamingResponseRenderer:
+    """Render an orchestrator response incrementally while it is being generated.
+
+    Pass `handle_event` as the stream handler to the mode processor. Progress
+    events update a status line, token events grow the agent message in place.
+    Call `clear()` once the final message has been stored in session state.
+    """
+
+    def __init__(self, mentor_label: str = "Mentor"):
+        self.mentor_label = mentor_label
+        self.status_placeholder = st.empty()
+        self.message_placeholder = st.empty()
+        self.text = ""
+
+    def handle_event(self, event: Dict[str, Any]):
+        try:
+            event_type = event.get("type")
+            if event_type == "progress":
+                self.status_placeholder.caption(f"⏳ {event.get('message', '')}...")
+            elif event_type == "token":
+                self.text += event.get("text", "")
+                self._render_text()
+            elif event_type == "final":
+                self.status_placeholder.empty()
+            elif event_type == "error":
+                self.status_placeholder.caption("⚠️ Something went wrong while generating the response")
+        except Exception as e:
+            # Rendering problems must never interrupt response generation
+            print(f"⚠️ STREAMING_RENDER: {e}")
+
+    def _render_text(self):
+        self.message_placeholder.markdown(
+            f"""
+            <div class="message agent-message">
+                <div class="message-avatar agent-avatar"></div>
+                <div class="message-content agent-content">
+                    <div class="message-header">
+                        <span class="agent-name">{self.mentor_label}</span>
+                    </div>
+                    <div class="message-text">{safe_markdown_to_html(self.text)}▌</div>
+                </div>
+            </div>
+            """,
+            unsafe_allow_html=True,
+        )
+
+    def clear(self):
+        self.status_placeholder.empty()
+        self.message_placeholder.empty()
+
+
 def render_single_message(message: Dict[str, Any]):
     """Render a single message in the chat interface with image support."""
     if message["role"] == "user":
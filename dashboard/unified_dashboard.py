@@ -23,7 +23,7 @@ from dashboard.ui.chat_components import (
     get_chat_input, render_chat_message, response_contains_questions,
     render_mentor_type_selection, render_template_selection,
     render_skill_level_selection, render_project_description_input, validate_input,
-    render_chat_interface
+    render_chat_interface, StreamingResponseRenderer
 )
 from dashboard.ui.sidebar_components import render_complete_sidebar
 from dashboard.ui.analysis_components import render_cognitive_analysis_dashboard, render_metrics_summary, render_phase_progress_section
@@ -37,6 +37,8 @@ from dashboard.core.image_database import ImageDatabase
 # Import external dependencies
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from phase_progression_system import PhaseProgressionSystem
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '../thesis-agents'))
+from utils.client_manager import aclose_async_client, run_with_async_client
 from thesis_tests.test_dashboard import TestDashboard
 from thesis_tests.data_models import InteractionData, TestPhase, TestGroup
 
@@ -83,6 +85,27 @@ def get_cached_orchestrator():
         return None
 
 
+@st.cache_resource
+def get_cached_embedding_service():
+    """Get the shared knowledge-base embedding service, warming it up in the background."""
+    import sys
+    import os
+
+    thesis_agents_path = os.path.join(os.path.dirname(__file__), '../thesis-agents')
+    if thesis_agents_path not in sys.path:
+        sys.path.insert(0, thesis_agents_path)
+
+    try:
+        from knowledge_base.embedding_service import get_embedding_service
+        service = get_embedding_service()
+        # Loads the model and embeds frequent domain queries without blocking the first render
+        service.warm_up(background=True)
+        return service
+    except Exception as e:
+        print(f"⚠️ DASHBOARD: Embedding service warm-up unavailable: {e}")
+        return None
+
+
 # Removed: get_cached_mentor - functionality integrated into dashboard
 
 
@@ -119,6 +142,7 @@ class UnifiedArchitecturalDashboard:
         # Lazy + cached heavy objects
         self.orchestrator = get_cached_orchestrator()
         self.phase_system = get_cached_phase_system()
+        self.embedding_service = get_cached_embedding_service()
         
         # Phase analyzer
         self.phase_analyzer = PhaseAnalyzer()
@@ -566,6 +590,7 @@ class UnifiedArchitecturalDashboard:
                 **analysis_result  # Merge analysis result into top level for compatibility
             }
         finally:
+            loop.run_until_complete(aclose_async_client())
             loop.close()
     
     def _create_default_analysis_results(self):
@@ -625,7 +650,7 @@ class UnifiedArchitecturalDashboard:
         })
         
         # Process response based on current mode
-        response = asyncio.run(self.mode_processor.process_input(initial_input, current_mode))
+        response = run_with_async_client(self.mode_processor.process_input(initial_input, current_mode))
         
         # Add Socratic question if needed (only for MENTOR mode)
         combined_response = self._add_socratic_question_if_needed(response, current_mode)
@@ -1079,6 +1104,7 @@ class UnifiedArchitecturalDashboard:
                 return bundled_message
 
             finally:
+                loop.run_until_complete(aclose_async_client())
                 loop.close()
 
         except Exception as e:
@@ -1239,12 +1265,17 @@ class UnifiedArchitecturalDashboard:
     def _generate_and_display_response(self, user_input: str, image_path: str = None):
         """Generate and display the AI response with optional image."""
         # Simple spinner without typing indicator to avoid conflicts
+        # Streamed tokens and progress render below it until the final message is stored
+        stream_view = StreamingResponseRenderer()
 
         with st.spinner("Thinking..."):
             try:
                 # Process response based on current mode with image support
-                response = asyncio.run(
-                    self.mode_processor.process_input(user_input, st.session_state.current_mode, image_path)
+                response = run_with_async_client(
+                    self.mode_processor.process_input(
+                        user_input, st.session_state.current_mode, image_path,
+                        stream_handler=stream_view.handle_event,
+                    )
                 )
                 
                 # Extract the actual response content from the response object
@@ -1404,6 +1435,7 @@ class UnifiedArchitecturalDashboard:
                         else:
                             print(f"🎨 DEBUG: Phase result has no generated_image key")
 
+                stream_view.clear()
                 st.session_state.messages.append(assistant_message)
 
                 # CRITICAL FIX: Only rerun if we haven't already set pending_rerun
@@ -1439,6 +1471,7 @@ class UnifiedArchitecturalDashboard:
                     pass
                 
             except Exception as e:
+                stream_view.clear()
                 error_response = f"I apologize, but I encountered an error: {str(e)}"
                 st.session_state.messages.append({
                     "role": "assistant",
@@ -2485,10 +2485,18 @@ class PhaseProgressionSystem:
                 "last_updated": progress.last_updated.isoformat()
             }
         
-        with open(filename, 'w') as f:
-            json.dump(session_data, f, indent=2)
+        def write_session():
+            with open(filename, 'w') as f:
+                json.dump(session_data, f, indent=2)
+            logger.info(f"Session saved to: {filename}")
         
-        logger.info(f"Session saved to: {filename}")
+        # Written by the background writer when available (session_data is a fresh snapshot)
+        try:
+            from utils.write_behind import submit_write
+        except ImportError:
+            write_session()
+        else:
+            submit_write(write_session, key=filename, label="phase session save")
         return {"success": True, "filename": filename}
 
 # Example usage and testing
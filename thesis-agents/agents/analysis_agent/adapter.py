@@ -14,6 +14,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from state_manager import ArchMentorState, StudentProfile, VisualArtifact
 from utils.agent_response import AgentResponse, ResponseType, CognitiveFlag, ResponseBuilder, EnhancementMetrics
+from utils.client_manager import cached_chat_completion
 from vision.sketch_analyzer import SketchAnalyzer
 from knowledge_base.knowledge_manager import KnowledgeManager
 from conversation_progression import ConversationProgressionManager
@@ -193,7 +194,8 @@ class AnalysisAgent:
                 "library, museum/gallery, retail/commercial, restaurant/food service, industrial/manufacturing, mixed-use, cultural center, sports/recreation, transportation, religious/worship).\n\n"
                 f"BRIEF: \"{brief}\"\n\nReturn ONLY the building type as a short phrase."
             )
-            resp = self.client.client.chat.completions.create(
+            resp = cached_chat_completion(
+                self.client.client,
                 model=self.client.model,
                 messages=[system, user],
                 max_tokens=16,
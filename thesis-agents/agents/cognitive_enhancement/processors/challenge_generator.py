@@ -6,6 +6,7 @@ import random
 from ..config import CHALLENGE_TEMPLATES
 from ...common import TextProcessor, MetricsCalculator, AgentTelemetry, LLMClient
 from state_manager import ArchMentorState
+from utils.client_manager import achat_completion
 
 
 class ChallengeGeneratorProcessor:
@@ -1573,7 +1574,6 @@ class ChallengeGeneratorProcessor:
     async def _generate_ai_contextual_story_prompt(self, user_message: str, building_type: str) -> str:
         """OPTIMIZED: Generate flexible story prompt using AI with performance improvements"""
         try:
-            import openai
             import hashlib
 
             # PERFORMANCE: Create cache key for this request
@@ -1588,8 +1588,6 @@ class ChallengeGeneratorProcessor:
             if not hasattr(self, '_story_cache'):
                 self._story_cache = {}
 
-            client = openai.OpenAI()
-
             # Escape quotes in user message to prevent string formatting issues
             safe_user_message = user_message.replace('"', '\\"').replace("'", "\\'")
             safe_building_type = building_type.replace('"', '\\"').replace("'", "\\'")
@@ -1618,7 +1616,7 @@ class ChallengeGeneratorProcessor:
             Example format: "Tell the story of [perspective] in your {safe_building_type}. How does [topic-specific element] [specific action/impact]? What [specific questions about user experience/design impact]?"
             """
 
-            story_response = client.chat.completions.create(
+            story_response = await achat_completion(
                 model="gpt-4o-mini",
                 messages=[{"role": "user", "content": story_generation_prompt}],
                 max_tokens=200,
@@ -1681,9 +1679,6 @@ class ChallengeGeneratorProcessor:
     async def _generate_ai_contextual_time_travel_prompt(self, user_message: str, building_type: str) -> str:
         """Generate flexible time travel prompt using AI for any architectural topic"""
         try:
-            import openai
-            client = openai.OpenAI()
-
             time_travel_prompt = f"""
             Create a time travel challenge for an architecture student working on a {building_type} project.
 
@@ -1702,7 +1697,7 @@ class ChallengeGeneratorProcessor:
             Example structure: "Travel through time with your {building_type}'s [specific topic]. In 1950, [period-specific consideration]. Today, [current consideration]. In 2050, [future consideration]."
             """
 
-            response = client.chat.completions.create(
+            response = await achat_completion(
                 model="gpt-4o-mini",
                 messages=[{"role": "user", "content": time_travel_prompt}],
                 max_tokens=200,
@@ -1718,9 +1713,6 @@ class ChallengeGeneratorProcessor:
     async def _generate_ai_contextual_transformation_prompt(self, user_message: str, building_type: str) -> str:
         """Generate flexible transformation prompt using AI for any architectural topic"""
         try:
-            import openai
-            client = openai.OpenAI()
-
             # Escape quotes in user message to prevent string formatting issues
             safe_user_message = user_message.replace('"', '\\"').replace("'", "\\'")
             safe_building_type = building_type.replace('"', '\\"').replace("'", "\\'")
@@ -1743,7 +1735,7 @@ class ChallengeGeneratorProcessor:
             Example structure: "Your {safe_building_type} needs to [specific transformation challenge]. [Specific scenarios]. What [specific design elements] would enable these transformations?"
             """
 
-            response = client.chat.completions.create(
+            response = await achat_completion(
                 model="gpt-4o-mini",
                 messages=[{"role": "user", "content": transformation_prompt}],
                 max_tokens=200,
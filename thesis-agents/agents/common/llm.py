@@ -2,9 +2,8 @@
 Shared LLM client wrapper for consistent API usage across agents.
 """
 
-import os
 from typing import Dict, Any, List, Optional
-from openai import OpenAI
+from utils.client_manager import get_shared_client, achat_completion
 from .telemetry import AgentTelemetry
 
 
@@ -15,7 +14,9 @@ class LLMClient:
     """
     
     def __init__(self, model: str = "gpt-4o", temperature: float = 0.3):
-        self.client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        # Pooled sync client for the few remaining synchronous callers;
+        # generate_completion goes through the shared async client.
+        self.client = get_shared_client()
         self.model = model
         self.temperature = temperature
         self.telemetry = AgentTelemetry()
@@ -26,7 +27,8 @@ class LLMClient:
         max_tokens: Optional[int] = None,
         temperature: Optional[float] = None,
         tools: Optional[List] = None,
-        tool_choice: Optional[str] = None
+        tool_choice: Optional[str] = None,
+        cache: bool = False
     ) -> Dict[str, Any]:
         """
         Generate completion with consistent error handling and logging.
@@ -37,6 +39,7 @@ class LLMClient:
             temperature: Temperature override
             tools: Optional tools for function calling
             tool_choice: Tool choice strategy
+            cache: Serve/store the response via the persistent LLM response cache
             
         Returns:
             Dictionary with response content and metadata
@@ -57,7 +60,7 @@ class LLMClient:
             if tool_choice:
                 kwargs["tool_choice"] = tool_choice
             
-            response = self.client.chat.completions.create(**kwargs)
+            response = await achat_completion(cache=cache, **kwargs)
             
             result = {
                 "content": response.choices[0].message.content,
@@ -3,11 +3,11 @@ Input classification processing module for analyzing and classifying student inp
 """
 from typing import Dict, Any, List, Optional
 import re
-from openai import OpenAI
 import os
 from ..schemas import CoreClassification
 from ...common import TextProcessor, MetricsCalculator, AgentTelemetry
 from state_manager import ArchMentorState
+from utils.client_manager import get_shared_client, achat_completion
 
 
 class InputClassificationProcessor:
@@ -19,7 +19,7 @@ class InputClassificationProcessor:
         self.telemetry = AgentTelemetry("input_classification")
         self.text_processor = TextProcessor()
         self.metrics_calculator = MetricsCalculator()
-        self.client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        self.client = get_shared_client()
 
         # Initialize analysis patterns from original
         self.analysis_patterns = self._initialize_analysis_patterns()
@@ -1038,11 +1038,12 @@ class InputClassificationProcessor:
         """
 
         try:
-            response = self.client.chat.completions.create(
+            response = await achat_completion(
                 model="gpt-4o",
                 messages=[{"role": "user", "content": prompt}],
                 max_tokens=200,
-                temperature=0.2
+                temperature=0.2,
+                cache=True
             )
 
             classification_text = response.choices[0].message.content.strip()
@@ -15,6 +15,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from state_manager import ArchMentorState
 from utils.agent_response import AgentResponse, ResponseType, CognitiveFlag, ResponseBuilder, EnhancementMetrics
+from utils.client_manager import achat_completion, run_with_async_client
 
 # Import modular components
 from .config import *
@@ -639,12 +640,6 @@ class DomainExpertAgent:
                                                     project_context: str, gap_type: str, state: ArchMentorState) -> str:
         """Generate AI-powered contextual knowledge response that encourages thinking."""
 
-        # Import OpenAI client
-        from openai import OpenAI
-        import os
-
-        client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-
         # Check if visual analysis is available
         visual_context = ""
         visual_insights = state.agent_context.get('visual_insights', {})
@@ -738,7 +733,7 @@ class DomainExpertAgent:
         print(f"🔄 CACHE_DISABLED: Generating fresh response for user input: {user_input[:50]}...")
 
         try:
-            response = client.chat.completions.create(
+            response = await achat_completion(
                 model="gpt-4o",  # PERFORMANCE: Use cheaper model
                 messages=[{"role": "user", "content": prompt}],
                 max_tokens=500,  # INCREASED: Fix contextual response truncation
@@ -872,11 +867,6 @@ class DomainExpertAgent:
                                                       project_context: str, gap_type: str) -> str:
         """Generate LLM-based fallback response when AI fails."""
 
-        from openai import OpenAI
-        import os
-
-        client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-
         # Check if visual analysis is available for fallback too
         visual_context = ""
         visual_insights = state.agent_context.get('visual_insights', {})
@@ -915,7 +905,7 @@ class DomainExpertAgent:
         """
 
         try:
-            response = client.chat.completions.create(
+            response = await achat_completion(
                 model="gpt-4o",
                 messages=[{"role": "user", "content": prompt}],
                 max_tokens=500,  # INCREASED: Fix fallback response truncation
@@ -940,8 +930,7 @@ class DomainExpertAgent:
     def _generate_fallback_knowledge_response(self, user_input: str, building_type: str,
                                             project_context: str, gap_type: str) -> str:
         """Legacy fallback method - now calls LLM version."""
-        import asyncio
-        return asyncio.run(self._generate_llm_fallback_knowledge_response(user_input, building_type, project_context, gap_type))
+        return run_with_async_client(self._generate_llm_fallback_knowledge_response(user_input, building_type, project_context, gap_type))
 
     def _generate_fallback_response(self, state: ArchMentorState, context_classification: Dict,
                                   analysis_result: Dict, routing_decision: Dict) -> AgentResponse:
@@ -2400,13 +2389,8 @@ What questions do you have about your design?"""
         # - ONE thought-provoking question that connects these examples to the user's community center project and encourages deeper thinking about application
       
         try:
-            # Use OpenAI client directly like the old repository
-            from openai import OpenAI
-            import os
-            
-            client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-            
-            response = client.chat.completions.create(
+            # Shared pooled async client (utils.client_manager)
+            response = await achat_completion(
                 model="gpt-4o",
                 messages=[{"role": "user", "content": synthesis_prompt}],
                 max_tokens=450,  # INCREASED: Allow space for examples + conclusion + provoking question
@@ -2480,12 +2464,7 @@ What questions do you have about your design?"""
             Do NOT include questions or follow-ups - just provide the strategies.
             """
 
-            from openai import OpenAI
-            import os
-
-            client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-
-            response = client.chat.completions.create(
+            response = await achat_completion(
                 model="gpt-4o",
                 messages=[{"role": "user", "content": strategies_prompt}],
                 max_tokens=400,  # INCREASED: Fix strategies response truncation
@@ -1173,11 +1173,6 @@ Generate a contextual response that builds on their input:
     async def _generate_ai_clarifying_response(self, last_message: str, building_type: str, state: ArchMentorState) -> str:
         """Generate AI-powered clarifying response."""
 
-        from openai import OpenAI
-        import os
-
-        client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-
         prompt = f"""
         You are an expert architectural mentor who provides advanced, contextual guidance through sophisticated questioning.
 
@@ -1234,11 +1229,6 @@ Generate a contextual response that builds on their input:
     async def _generate_ai_challenging_question(self, last_message: str, building_type: str, state: ArchMentorState) -> str:
         """Generate AI-powered challenging question."""
 
-        from openai import OpenAI
-        import os
-
-        client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-
         # FIXED: Extract the specific topic from the student's message for topic-specific questions
         topic_keywords = self._extract_topic_keywords(last_message)
         main_topic = topic_keywords[0] if topic_keywords else "design approach"
@@ -1300,11 +1290,6 @@ Generate a contextual response that builds on their input:
     async def _generate_ai_exploratory_question(self, last_message: str, building_type: str, state: ArchMentorState) -> str:
         """Generate AI-powered exploratory question."""
 
-        from openai import OpenAI
-        import os
-
-        client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-
         prompt = f"""
         You are a Socratic tutor encouraging exploration in architecture.
 
@@ -1339,11 +1324,6 @@ Generate a contextual response that builds on their input:
     async def _generate_ai_adaptive_question(self, last_message: str, building_type: str, state: ArchMentorState) -> str:
         """Generate AI-powered adaptive question."""
 
-        from openai import OpenAI
-        import os
-
-        client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-
         prompt = f"""
         You are an accomplished architectural educator employing adaptive Socratic pedagogy to advance student learning through strategic inquiry.
 
@@ -1372,11 +1352,6 @@ Generate a contextual response that builds on their input:
     async def _generate_llm_fallback_question(self, user_input: str, building_type: str, state: ArchMentorState) -> str:
         """Generate LLM-based fallback question instead of hardcoded responses."""
 
-        from openai import OpenAI
-        import os
-
-        client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-
         # Get recent context from conversation
         recent_context = ""
         if hasattr(state, 'messages') and state.messages:
@@ -2114,11 +2089,6 @@ Focus on their specific question, not general {building_type} information.
     async def _generate_ai_multi_agent_socratic_questions(self, user_input: str, building_type: str, domain_knowledge: str, state: ArchMentorState) -> str:
         """Generate multiple socratic questions for multi-agent synthesis."""
 
-        from openai import OpenAI
-        import os
-
-        client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-
         # Truncate domain knowledge for context
         domain_context = domain_knowledge[:800] if domain_knowledge else "No domain knowledge available"
 
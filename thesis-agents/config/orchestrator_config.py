@@ -16,6 +16,10 @@ class OrchestratorConfig:
     AI_MODEL: str = "gpt-4o"
     AI_MAX_TOKENS: int = 1500  # Increased for generous responses
     AI_TEMPERATURE: float = 0.3
+
+    # Run independent specialist agents concurrently on multi-agent routes
+    # (see orchestration.graph_builder.ROUTE_AGENT_DEPENDENCIES)
+    PARALLEL_AGENT_EXECUTION: bool = True
     
     # Pattern matching lists
     FOLLOWUP_EXAMPLE_PATTERNS: List[str] = None
@@ -103,6 +107,10 @@ class OrchestratorConfig:
     AI_MODEL: str = "gpt-4o"
     AI_MAX_TOKENS: int = 1500  # Increased for generous responses
     AI_TEMPERATURE: float = 0.3
+
+    # Run independent specialist agents concurrently on multi-agent routes
+    # (see orchestration.graph_builder.ROUTE_AGENT_DEPENDENCIES)
+    PARALLEL_AGENT_EXECUTION: bool = True
     
     # Pattern matching lists
     FOLLOWUP_EXAMPLE_PATTERNS: List[str] = None
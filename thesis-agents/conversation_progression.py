@@ -513,11 +513,10 @@ class ConversationProgressionManager:
         """Create personalized opening message using LLM instead of hardcoded templates"""
         
         try:
-            # Import OpenAI client for dynamic response generation
-            from openai import OpenAI
-            import os
-            
-            client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+            # Shared pooled client for dynamic response generation
+            from utils.client_manager import get_shared_client
+
+            client = get_shared_client()
             
             intent = intent_analysis.get("primary_intent", "general_inquiry")
             topic = intent_analysis.get("primary_topic", "architecture")
@@ -40,7 +40,27 @@ except ImportError:
         GENERIC_AI = "GENERIC_AI"
         CONTROL = "CONTROL"
 
+try:
+    from .session_log_writer import SessionLogWriter
+except ImportError:
+    from session_log_writer import SessionLogWriter
+
+try:
+    from utils.write_behind import drain_writes
+except ImportError:
+    def drain_writes(timeout=None):
+        return True
 
+# Columns of the real-time CSV logs
+PHASE_TRANSITION_FIELDS = [
+    'session_id', 'timestamp', 'from_phase', 'to_phase',
+    'trigger_reason', 'phase_duration', 'test_group', 'interaction_count_at_transition'
+]
+DESIGN_MOVE_FIELDS = [
+    'id', 'session_id', 'timestamp', 'sequence_number', 'content',
+    'move_type', 'phase', 'modality', 'move_source', 'design_focus',
+    'test_group', 'cognitive_operation', 'cognitive_load'
+]
 
 
 # Custom JSON encoder to handle ConversationMilestone and other non-serializable objects
@@ -86,6 +106,9 @@ class InteractionLogger:
         # Create data directory
         os.makedirs("./thesis_data", exist_ok=True)
 
+        # Buffered real-time CSV logs (flushed by size/time and on export)
+        self.log_writer = SessionLogWriter()
+
         # Initialize phase tracking
         self.phase_start_times[self.current_phase] = self.session_start
 
@@ -547,17 +570,7 @@ class InteractionLogger:
         """Save individual interaction to CSV for real-time analysis"""
         
         filename = f"./thesis_data/interactions_{self.session_id}.csv"
-        
-        # Check if file exists to determine if we need headers
-        file_exists = os.path.exists(filename)
-        
-        with open(filename, 'a', newline='', encoding='utf-8') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=interaction.keys())
-            
-            if not file_exists:
-                writer.writeheader()
-            
-            writer.writerow(interaction)
+        self.log_writer.write_row(filename, interaction)
     
     def get_session_summary(self) -> Dict[str, Any]:
         """Generate comprehensive session summary with enhanced metrics"""
@@ -1029,6 +1042,8 @@ class InteractionLogger:
             return
         
         filename = f"./thesis_data/design_moves_{self.session_id}.csv"
+        # The real-time log is rewritten below; later rows append to the new file
+        self.log_writer.release(filename)
         
         with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
             fieldnames = self.design_moves[0].keys()
@@ -1046,6 +1061,8 @@ class InteractionLogger:
             return
         
         filename = f"./thesis_data/interactions_{self.session_id}.csv"
+        # The real-time log is rewritten below; later rows append to the new file
+        self.log_writer.release(filename)
         
         with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
             # Get all fieldnames from all interactions
@@ -1070,6 +1087,10 @@ class InteractionLogger:
     def export_for_thesis_analysis(self):
         """Export comprehensive data for thesis analysis with enhanced metrics"""
         
+        # Make every queued and buffered real-time write durable before exporting
+        drain_writes()
+        self.log_writer.flush()
+        
         # Export session summary
         summary = self.get_session_summary()
         with open(f"./thesis_data/session_summary_{self.session_id}.json", 'w') as f:
@@ -1101,6 +1122,13 @@ class InteractionLogger:
             except Exception as e:
                 print(f"⚠️ Linkography export failed: {e}")
 
+            # The journal is the per-move record, and the only one a session that is never
+            # finalized leaves behind, so it is uploaded even when the export above fails
+            journal_file = str(self.linkography_logger.journal_file)
+            if os.path.exists(journal_file):
+                linkography_files.append(journal_file)
+                print(f"   - {os.path.basename(journal_file)}")
+
         print(f"Thesis data exported:")
         print(f"   - interactions_{self.session_id}.csv")
         print(f"   - design_moves_{self.session_id}.csv")
@@ -1534,38 +1562,12 @@ class InteractionLogger:
     def _save_phase_transition_to_csv(self, transition: Dict[str, Any]):
         """Save phase transition to CSV file"""
         transitions_file = f"./thesis_data/phase_transitions_{self.session_id}.csv"
-
-        # Create file with headers if it doesn't exist
-        if not os.path.exists(transitions_file):
-            with open(transitions_file, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=[
-                    'session_id', 'timestamp', 'from_phase', 'to_phase',
-                    'trigger_reason', 'phase_duration', 'test_group', 'interaction_count_at_transition'
-                ])
-                writer.writeheader()
-
-        # Append transition data
-        with open(transitions_file, 'a', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=[
-                'session_id', 'timestamp', 'from_phase', 'to_phase',
-                'trigger_reason', 'phase_duration', 'test_group', 'interaction_count_at_transition'
-            ])
-            writer.writerow(transition)
+        self.log_writer.write_row(transitions_file, transition, PHASE_TRANSITION_FIELDS)
 
     def _save_design_move_to_csv(self, move):
         """Save design move to CSV file"""
         moves_file = f"./thesis_data/design_moves_{self.session_id}.csv"
 
-        # Create file with headers if it doesn't exist
-        if not os.path.exists(moves_file):
-            with open(moves_file, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=[
-                    'id', 'session_id', 'timestamp', 'sequence_number', 'content',
-                    'move_type', 'phase', 'modality', 'move_source', 'design_focus',
-                    'test_group', 'cognitive_operation', 'cognitive_load'
-                ])
-                writer.writeheader()
-
         # Prepare move data for CSV
         if THESIS_MODELS_AVAILABLE and hasattr(move, 'to_dict'):
             # Use thesis model's to_dict method if available
@@ -1576,38 +1578,29 @@ class InteractionLogger:
             move_data = move.copy() if isinstance(move, dict) else asdict(move)
             move_data['test_group'] = self.test_group
 
-        # Append move data
-        with open(moves_file, 'a', newline='', encoding='utf-8') as f:
-            fieldnames = [
-                'id', 'session_id', 'timestamp', 'sequence_number', 'content',
-                'move_type', 'phase', 'modality', 'move_source', 'design_focus',
-                'test_group', 'cognitive_operation', 'cognitive_load'
-            ]
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-
-            # Handle timestamp formatting
-            if 'timestamp' in move_data and hasattr(move_data['timestamp'], 'isoformat'):
-                move_data['timestamp'] = move_data['timestamp'].isoformat()
-
-            # Handle enum values and filter to only include expected fields
-            filtered_data = {}
-            for key in fieldnames:
-                if key in move_data:
-                    value = move_data[key]
-                    if hasattr(value, 'value'):  # Enum
-                        filtered_data[key] = value.value
-                    else:
-                        filtered_data[key] = value
+        # Handle timestamp formatting
+        if 'timestamp' in move_data and hasattr(move_data['timestamp'], 'isoformat'):
+            move_data['timestamp'] = move_data['timestamp'].isoformat()
+
+        # Handle enum values and filter to only include expected fields
+        filtered_data = {}
+        for key in DESIGN_MOVE_FIELDS:
+            if key in move_data:
+                value = move_data[key]
+                if hasattr(value, 'value'):  # Enum
+                    filtered_data[key] = value.value
                 else:
-                    # Provide default values for missing fields
-                    if key == 'cognitive_operation':
-                        filtered_data[key] = 'analysis'
-                    elif key == 'cognitive_load':
-                        filtered_data[key] = 'medium'
-                    else:
-                        filtered_data[key] = ''
-
-            writer.writerow(filtered_data)
+                    filtered_data[key] = value
+            else:
+                # Provide default values for missing fields
+                if key == 'cognitive_operation':
+                    filtered_data[key] = 'analysis'
+                elif key == 'cognitive_load':
+                    filtered_data[key] = 'medium'
+                else:
+                    filtered_data[key] = ''
+
+        self.log_writer.write_row(moves_file, filtered_data, DESIGN_MOVE_FIELDS)
 
 # Benchmark comparison functions for thesis
 def compare_with_baseline(session_summary: Dict[str, Any]) -> Dict[str, Any]:
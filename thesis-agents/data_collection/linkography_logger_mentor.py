@@ -11,6 +11,30 @@ from typing import List, Dict, Optional, Any
 from pathlib import Path
 import uuid
 
+try:
+    from utils.write_behind import submit_write, drain_writes
+except ImportError:
+    def submit_write(fn, *args, key=None, label=None, **kwargs):
+        fn(*args, **kwargs)
+        return False
+
+    def drain_writes(timeout=None):
+        return True
+
+
+def _write_json(path: Path, data: Dict[str, Any]) -> None:
+    with open(path, 'w') as f:
+        json.dump(data, f, indent=2)
+
+# Add project root to path for benchmarking imports
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+# The journal helpers only use the standard library, so they are needed and
+# available even when the linkography engine's dependencies are not
+from benchmarking.linkography_journal import journal_path, header_record, move_record, append_records
+
 # Try to import benchmarking dependencies
 BENCHMARKING_AVAILABLE = False
 try:
@@ -19,11 +43,6 @@ try:
     # This prevents the PyTorch device conversion error in cloud environments
     os.environ['CUDA_VISIBLE_DEVICES'] = ''  # Disable CUDA completely
 
-    # Add project root to path for benchmarking imports
-    project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-    if project_root not in sys.path:
-        sys.path.insert(0, project_root)
-
     from benchmarking.linkography_engine import LinkographyEngine
     from benchmarking.linkography_types import (
         DesignMove as LinkographyMove,
@@ -76,6 +95,9 @@ class MentorLinkographyLogger:
         
         self.linkography_file = self.data_dir / f"linkography_{session_id}.json"
         self.moves_log = self.data_dir / f"linkography_moves_{session_id}.jsonl"
+        # Append-only journal, compacted into linkography_file by finalize()
+        self.journal_file = journal_path(self.data_dir, session_id)
+        self._journaled_link_count = 0
         
         # Initialize files
         self._initialize_files()
@@ -85,6 +107,10 @@ class MentorLinkographyLogger:
         # Create empty moves log
         with open(self.moves_log, 'w') as f:
             pass
+
+        # Start a fresh journal
+        with open(self.journal_file, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(header_record(self.session_id)) + '\n')
     
     def create_design_move_from_interaction(self, content: str, move_type: str, 
                                           move_source: str, phase: str = "ideation",
@@ -170,12 +196,11 @@ class MentorLinkographyLogger:
         # Add to moves list
         self.moves.append(linkography_move)
 
-        # Log to JSONL file
-        with open(self.moves_log, 'a') as f:
-            f.write(json.dumps({
-                'timestamp': datetime.now().isoformat(),
-                'move': move_dict
-            }) + '\n')
+        # Log to JSONL file (in the background writer, in order)
+        submit_write(append_records, self.moves_log, [{
+            'timestamp': datetime.now().isoformat(),
+            'move': move_dict
+        }], label="linkography move log")
 
         # Update linkograph
         if self.current_linkograph is None:
@@ -223,66 +248,23 @@ class MentorLinkographyLogger:
         self.log_design_move_from_dict(ai_move)
 
     def _save_current_linkograph(self):
-        """Save current linkograph state"""
-        if self.current_linkograph:
-            # Convert linkograph to dictionary format
-            if self.benchmarking_available and hasattr(self.current_linkograph, 'moves'):
-                moves_data = [
-                    {
-                        'id': getattr(m, 'id', str(uuid.uuid4())),
-                        'timestamp': getattr(m, 'timestamp', datetime.now().timestamp()),
-                        'content': getattr(m, 'content', ''),
-                        'move_type': getattr(m, 'move_type', 'analysis'),
-                        'phase': getattr(m, 'phase', 'ideation'),
-                        'modality': getattr(m, 'modality', 'text')
-                    } for m in self.current_linkograph.moves
-                ]
-
-                links_data = []
-                if hasattr(self.current_linkograph, 'links'):
-                    links_data = [
-                        {
-                            'id': getattr(l, 'id', str(uuid.uuid4())),
-                            'source_move': getattr(l, 'source_move', ''),
-                            'target_move': getattr(l, 'target_move', ''),
-                            'strength': getattr(l, 'strength', 0.5),
-                            'link_type': getattr(l, 'link_type', 'temporal')
-                        } for l in self.current_linkograph.links
-                    ]
-            else:
-                # Fallback: use simple move data
-                moves_data = [
-                    {
-                        'id': getattr(m, 'id', str(uuid.uuid4())),
-                        'timestamp': getattr(m, 'timestamp', datetime.now().timestamp()),
-                        'content': getattr(m, 'content', ''),
-                        'move_type': getattr(m, 'move_type', 'analysis'),
-                        'phase': getattr(m, 'phase', 'ideation'),
-                        'modality': getattr(m, 'modality', 'text')
-                    } for m in self.moves
-                ]
-                links_data = []
-
-            linkograph_data = {
-                'session_id': self.session_id,
-                'timestamp': datetime.now().isoformat(),
-                'linkograph': {
-                    'id': getattr(self.current_linkograph, 'id', str(uuid.uuid4())),
-                    'session_id': self.session_id,
-                    'phase': 'mixed',
-                    'generated_at': datetime.now().isoformat(),
-                    'move_count': len(moves_data),
-                    'link_count': len(links_data),
-                    'moves': moves_data,
-                    'links': links_data
-                },
-                'metrics': self._get_metrics_dict(),
-                'move_count': len(self.moves),
-                'link_count': len(links_data)
-            }
+        """Append the newest move and the links it created to the linkograph journal"""
+        if not self.current_linkograph:
+            return
+
+        if self.benchmarking_available and hasattr(self.current_linkograph, 'moves'):
+            moves = self.current_linkograph.moves
+            links = getattr(self.current_linkograph, 'links', [])
+        else:
+            moves = self.moves
+            links = []
+        if not moves:
+            return
 
-            with open(self.linkography_file, 'w') as f:
-                json.dump(linkograph_data, f, indent=2)
+        new_links = links[self._journaled_link_count:]
+        self._journaled_link_count = len(links)
+        record = move_record(moves[-1], new_links, self._get_metrics_dict())
+        submit_write(append_records, self.journal_file, [record], label="linkography journal")
 
     def _get_metrics_dict(self) -> Dict[str, float]:
         """Get metrics dictionary"""
@@ -370,8 +352,13 @@ class MentorLinkographyLogger:
             'benchmarking_available': self.benchmarking_available
         }
 
-        with open(self.linkography_file, 'w') as f:
-            json.dump(final_data, f, indent=2)
+        # Compaction: materialize the journaled linkograph as one JSON file.
+        # Queued behind pending journal appends, then waited for, since callers
+        # read the file right after finalizing
+        self._journaled_link_count = len(getattr(self.current_linkograph, 'links', [])) if self.current_linkograph else 0
+        submit_write(_write_json, self.linkography_file, final_data,
+                     key=str(self.linkography_file), label="final linkography")
+        drain_writes()
 
     def _get_linkograph_dict(self) -> Dict[str, Any]:
         """Get linkograph as dictionary"""
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Buffered CSV writer for per-session thesis logs
+
+Every chat turn produces several log rows (interaction, design moves, phase
+transitions). Instead of opening, appending and closing a CSV per row, a
+SessionLogWriter keeps one append handle per file open for the session and
+buffers rows in memory. Buffers are written out when FLUSH_ROWS rows are
+pending, at the latest FLUSH_SECONDS after the oldest unflushed row was
+buffered (a daemon timer fires even if no further row arrives, e.g. when a
+participant stops chatting), on an explicit flush()
+(InteractionLogger.export_for_thesis_analysis calls it), and at interpreter
+exit. Automatic flushes run on the background writer (see utils.write_behind).
+Each flush ends with an fsync.
+
+Crash guarantee: rows are durable once the flush that wrote them has returned.
+If the process dies mid-session, at most the rows buffered since the last
+completed flush are lost, i.e. fewer than FLUSH_ROWS rows, all buffered within
+the last FLUSH_SECONDS (plus however long the background writer takes to run
+the flush). Rows are written whole, so a file never ends in a partially written
+row unless the machine itself fails during a flush.
+"""
+
+import atexit
+import csv
+import os
+import threading
+import time
+import weakref
+from typing import Any, Dict, List, Optional, Sequence
+
+try:
+    from utils.write_behind import submit_write
+except ImportError:
+    submit_write = None
+
+# Flush thresholds (overridable via environment)
+FLUSH_ROWS = int(os.getenv("THESIS_LOG_FLUSH_ROWS", "50"))
+FLUSH_SECONDS = float(os.getenv("THESIS_LOG_FLUSH_SECONDS", "5"))
+
+
+class _CSVSink:
+    """One open CSV append handle plus its pending rows."""
+
+    def __init__(self, path: str, fieldnames: Sequence[str]):
+        self.path = path
+        existing_header = self._read_header(path)
+        self.file = open(path, 'a', newline='', encoding='utf-8')
+        # Appending to an existing file keeps its column order
+        self.fieldnames = existing_header or list(fieldnames)
+        self.writer = csv.DictWriter(self.file, fieldnames=self.fieldnames, restval='', extrasaction='ignore')
+        if not existing_header:
+            self.writer.writeheader()
+        self.pending: List[Dict[str, Any]] = []
+
+    @staticmethod
+    def _read_header(path: str) -> Optional[List[str]]:
+        if not os.path.exists(path) or os.path.getsize(path) == 0:
+            return None
+        with open(path, 'r', newline='', encoding='utf-8') as f:
+            return next(csv.reader(f), None)
+
+    def flush(self) -> None:
+        if self.pending:
+            new_fields = list(dict.fromkeys(key for row in self.pending for key in row if key not in self.fieldnames))
+            if new_fields:
+                self._extend_header(new_fields)
+            self.writer.writerows(self.pending)
+            self.pending = []
+        self.file.flush()
+        os.fsync(self.file.fileno())
+
+    def _extend_header(self, new_fields: List[str]) -> None:
+        """Rewrite the file with new_fields appended to its header (rows gain empty cells)."""
+        try:
+            self.file.flush()
+            with open(self.path, 'r', newline='', encoding='utf-8') as f:
+                rows = list(csv.DictReader(f))
+            fieldnames = self.fieldnames + new_fields
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.DictWriter(f, fieldnames=fieldnames, restval='')
+                writer.writeheader()
+                writer.writerows(rows)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+        except (OSError, ValueError, csv.Error) as e:
+            print(f"⚠️ Could not add columns {new_fields} to {self.path}, their values are dropped: {e}")
+            return
+        self.file.close()
+        self.file = open(self.path, 'a', newline='', encoding='utf-8')
+        self.fieldnames = fieldnames
+        self.writer = csv.DictWriter(self.file, fieldnames=self.fieldnames, restval='', extrasaction='ignore')
+
+    def close(self) -> None:
+        self.flush()
+        self.file.close()
+
+
+class SessionLogWriter:
+    """Session-scoped buffered writer for the thesis_data CSV logs."""
+
+    def __init__(self, flush_rows: int = FLUSH_ROWS, flush_seconds: float = FLUSH_SECONDS):
+        self.flush_rows = flush_rows
+        self.flush_seconds = flush_seconds
+        self._sinks: Dict[str, _CSVSink] = {}
+        self._pending_rows = 0
+        self._last_flush = time.monotonic()
+        self._flush_timer: Optional[threading.Timer] = None
+        self._lock = threading.RLock()
+        _open_writers.add(self)
+
+    def write_row(self, path: str, row: Dict[str, Any], fieldnames: Optional[Sequence[str]] = None) -> None:
+        """
+        Buffer one row for path.
+
+        fieldnames sets the header when the file is new (defaults to the row's
+        keys); rows for an existing file follow its header and missing fields
+        are left empty. Fields the header lacks are appended to it at the next
+        flush, which rewrites the file once.
+        """
+        with self._lock:
+            sink = self._sinks.get(path)
+            if sink is None:
+                sink = self._sinks[path] = _CSVSink(path, fieldnames or list(row.keys()))
+            sink.pending.append(row)
+            self._pending_rows += 1
+            due = self._pending_rows >= self.flush_rows or time.monotonic() - self._last_flush >= self.flush_seconds
+            if not due and self._flush_timer is None:
+                # Bound how long the oldest pending row waits if no further row arrives
+                self._flush_timer = threading.Timer(self.flush_seconds, self._timed_flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+        if due:
+            self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        if submit_write is not None:
+            submit_write(self.flush, key=("session-log-flush", id(self)), label="session log flush")
+        else:
+            self.flush()
+
+    def _timed_flush(self) -> None:
+        with self._lock:
+            self._flush_timer = None
+            due = self._pending_rows > 0
+        if due:
+            self._schedule_flush()
+
+    def _flush_locked(self) -> None:
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        for sink in self._sinks.values():
+            try:
+                sink.flush()
+            except (OSError, ValueError) as e:
+                print(f"⚠️ Failed to flush {sink.path}: {e}")
+        self._pending_rows = 0
+        self._last_flush = time.monotonic()
+
+    def flush(self) -> None:
+        """Write out all buffered rows and fsync every open file."""
+        with self._lock:
+            self._flush_locked()
+
+    def release(self, path: str) -> None:
+        """Flush and close the handle for path, e.g. before the file is rewritten."""
+        with self._lock:
+            sink = self._sinks.pop(path, None)
+            if sink is not None:
+                self._pending_rows -= len(sink.pending)
+                sink.close()
+
+    def close(self) -> None:
+        """Flush and close every handle; the writer reopens files if used again."""
+        with self._lock:
+            for path in list(self._sinks):
+                try:
+                    self.release(path)
+                except (OSError, ValueError) as e:
+                    print(f"⚠️ Failed to close {path}: {e}")
+
+
+_open_writers: "weakref.WeakSet[SessionLogWriter]" = weakref.WeakSet()
+
+
+@atexit.register
+def _close_open_writers() -> None:
+    for writer in list(_open_writers):
+        writer.close()
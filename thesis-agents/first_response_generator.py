@@ -1,7 +1,6 @@
 # first_response_generator.py - Enhanced First Response Generation
 from typing import Dict, Any, List, Optional, Tuple
 import os
-from openai import OpenAI
 from dotenv import load_dotenv
 import sys
 import logging
@@ -10,6 +9,7 @@ import logging
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from state_manager import ArchMentorState
+from utils.client_manager import get_shared_client, achat_completion
 from conversation_progression import ConversationProgressionManager, ConversationPhase, DesignSpaceDimension
 
 load_dotenv()
@@ -20,7 +20,7 @@ class FirstResponseGenerator:
     """Generates progressive first responses that open design spaces and guide users"""
     
     def __init__(self, domain: str = "architecture"):
-        self.client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        self.client = get_shared_client()
         self.domain = domain
         self.progression_manager = ConversationProgressionManager(domain)
         self.name = "first_response_generator"
@@ -187,7 +187,7 @@ Focus on opening the design space rather than providing answers.
         try:
             logger.info("Generating AI response with context length: %d", len(context))
             
-            response = self.client.chat.completions.create(
+            response = await achat_completion(
                 model="gpt-4",
                 messages=[
                     {
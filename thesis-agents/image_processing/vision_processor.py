@@ -9,7 +9,7 @@ import json
 from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 from dataclasses import dataclass
-from openai import OpenAI
+from utils.client_manager import get_shared_client, achat_completion
 import streamlit as st
 from PIL import Image
 import io
@@ -37,7 +37,7 @@ class VisionProcessor:
     """Handles image processing and GPT Vision analysis"""
     
     def __init__(self):
-        self.client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        self.client = get_shared_client()
         self.image_storage_path = "thesis_data/uploaded_images"
         os.makedirs(self.image_storage_path, exist_ok=True)
     
@@ -152,7 +152,7 @@ class VisionProcessor:
         """
         
         try:
-            response = self.client.chat.completions.create(
+            response = await achat_completion(
                 model="gpt-4o",
                 messages=[
                     {
@@ -0,0 +1,152 @@
+"""
+Lexical BM25 index for the knowledge base.
+
+Kept alongside the Chroma collection: every chunk added to the vector store is
+also tokenized into an inverted index, so exact-term queries ("ADA door
+widths") are answered without an embedding pass. The index is persisted as
+JSON next to ``vectorstore/`` and updated incrementally as chunks are added.
+"""
+
+import json
+import math
+import os
+import re
+import threading
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+STOP_WORDS = {
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by',
+    'is', 'are', 'was', 'were', 'be', 'it', 'as', 'this', 'that', 'from', 'what', 'how',
+}
+
+_TOKEN_PATTERN = re.compile(r'\b\w+\b')
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercased word tokens without stop words or single characters."""
+    return [token for token in _TOKEN_PATTERN.findall(text.lower()) if len(token) > 1 and token not in STOP_WORDS]
+
+
+class BM25Index:
+    """Persistent inverted index with Okapi BM25 scoring."""
+
+    def __init__(self, path: Path, k1: float = 1.5, b: float = 0.75):
+        self.path = Path(path)
+        self.k1 = k1
+        self.b = b
+        self._lock = threading.Lock()
+
+        # doc_id -> {"content", "metadata", "length"}
+        self.documents: Dict[str, Dict] = {}
+        # term -> {doc_id: term frequency}
+        self.postings: Dict[str, Dict[str, int]] = {}
+        self.total_length = 0
+
+        self._load()
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self.documents = data.get("documents", {})
+            self.postings = data.get("postings", {})
+            self.total_length = sum(doc["length"] for doc in self.documents.values())
+        except Exception as e:
+            print(f"Could not load BM25 index {self.path}: {e}")
+            self.documents, self.postings, self.total_length = {}, {}, 0
+
+    def save(self) -> None:
+        """Write the index atomically."""
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({"documents": self.documents, "postings": self.postings}, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self.documents
+
+    def add_documents(self, ids: Iterable[str], contents: Iterable[str], metadatas: Iterable[Dict]) -> int:
+        """Index documents that are not indexed yet; returns how many were added."""
+        added = 0
+        with self._lock:
+            for doc_id, content, metadata in zip(ids, contents, metadatas):
+                if doc_id in self.documents:
+                    continue
+                tokens = tokenize(content)
+                self.documents[doc_id] = {"content": content, "metadata": metadata or {}, "length": len(tokens)}
+                self.total_length += len(tokens)
+                for term, frequency in Counter(tokens).items():
+                    self.postings.setdefault(term, {})[doc_id] = frequency
+                added += 1
+        return added
+
+    def remove_documents(self, ids: Iterable[str]) -> int:
+        """Drop documents from the index; returns how many were removed."""
+        removed = 0
+        with self._lock:
+            for doc_id in ids:
+                document = self.documents.pop(doc_id, None)
+                if document is None:
+                    continue
+                self.total_length -= document["length"]
+                for term in set(tokenize(document["content"])):
+                    postings = self.postings.get(term)
+                    if postings is not None:
+                        postings.pop(doc_id, None)
+                        if not postings:
+                            del self.postings[term]
+                removed += 1
+        return removed
+
+    def clear(self) -> None:
+        with self._lock:
+            self.documents, self.postings, self.total_length = {}, {}, 0
+        self.save()
+
+    def search(self, query: str, n_results: int = 10) -> List[Tuple[str, float]]:
+        """Return up to n_results (doc_id, score) pairs, best first."""
+        terms = set(tokenize(query))
+        with self._lock:
+            doc_count = len(self.documents)
+            if not terms or doc_count == 0:
+                return []
+            avg_length = self.total_length / doc_count or 1.0
+
+            scores: Dict[str, float] = {}
+            for term in terms:
+                postings = self.postings.get(term)
+                if not postings:
+                    continue
+                idf = math.log(1 + (doc_count - len(postings) + 0.5) / (len(postings) + 0.5))
+                for doc_id, frequency in postings.items():
+                    length = self.documents[doc_id]["length"]
+                    norm = frequency + self.k1 * (1 - self.b + self.b * length / avg_length)
+                    scores[doc_id] = scores.get(doc_id, 0.0) + idf * frequency * (self.k1 + 1) / norm
+
+        return sorted(scores.items(), key=lambda item: item[1], reverse=True)[:n_results]
+
+    def get(self, doc_id: str) -> Optional[Dict]:
+        return self.documents.get(doc_id)
+
+
+_indexes_lock = threading.Lock()
+_shared_indexes: Dict[str, BM25Index] = {}
+
+
+def get_shared_index(path: Path) -> BM25Index:
+    """Return the process-wide index persisted at path, loading it on first use."""
+    key = str(Path(path).resolve())
+    with _indexes_lock:
+        index = _shared_indexes.get(key)
+        if index is None:
+            index = _shared_indexes[key] = BM25Index(path)
+    return index
@@ -0,0 +1,222 @@
+"""
+Process-wide query embedding service for the knowledge base.
+
+Loads the SentenceTransformer embedding function once per process (instead of
+once per KnowledgeManager) and keeps a bounded LRU of query embeddings keyed
+by (model, normalized query text), so repeated and expanded domain queries are
+not re-encoded. Misses in a batch are encoded together in a single call.
+
+Timing is recorded for every batch so ``stats()`` can show how much of the
+retrieval latency is spent embedding.
+"""
+
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+# Models tried in order of preference
+EMBEDDING_MODELS = [
+    "all-mpnet-base-v2",      # Best general purpose (768-dim)
+    "all-MiniLM-L6-v2",       # Faster, still good (384-dim)
+    "paraphrase-mpnet-base-v2" # Good for paraphrases
+]
+
+# Frequent domain queries embedded in the background at startup
+WARMUP_QUERIES = [
+    "community center",
+    "community center civic center public facility",
+    "community center design architecture planning",
+    "design architecture planning",
+    "space area room",
+    "sustainable green environmental",
+    "materials steel concrete",
+    "construction building development",
+    "accessibility ADA requirements",
+    "adaptive reuse",
+    "natural lighting daylight",
+    "circulation and wayfinding",
+    "building codes and standards",
+    "structural systems",
+    "public space design",
+]
+
+DEFAULT_CACHE_SIZE = 2048
+
+_UNLOADED = object()
+
+
+def normalize_query(text: str) -> str:
+    """Cache key form of a query: lowercased with collapsed whitespace."""
+    return re.sub(r"\s+", " ", text or "").strip().lower()
+
+
+def embedding_function_name(embedding_function) -> str:
+    """Stable name for an embedding function, used to keep cache entries per model."""
+    for attr in ("model_name", "_model_name", "MODEL_NAME"):
+        name = getattr(embedding_function, attr, None)
+        if isinstance(name, str) and name:
+            return name
+    return type(embedding_function).__name__
+
+
+class EmbeddingService:
+    """Shared embedding model plus a bounded LRU of query embeddings."""
+
+    def __init__(self, model_names: Optional[List[str]] = None, cache_size: int = DEFAULT_CACHE_SIZE):
+        self.model_names = model_names or EMBEDDING_MODELS
+        self.cache_size = cache_size
+
+        self._embedding_function: Any = _UNLOADED
+        self._load_lock = threading.Lock()
+        self._cache: "OrderedDict[tuple, List[float]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._warmup_thread: Optional[threading.Thread] = None
+
+        self.metrics = {
+            "embed_calls": 0,
+            "texts_requested": 0,
+            "texts_encoded": 0,
+            "cache_hits": 0,
+            "embedding_seconds": 0.0,
+            "retrieval_calls": 0,
+            "retrieval_seconds": 0.0,
+            "model_load_seconds": 0.0,
+        }
+
+    def get_embedding_function(self):
+        """Load (once) and return the preferred SentenceTransformer embedding function, or None."""
+        if self._embedding_function is _UNLOADED:
+            with self._load_lock:
+                if self._embedding_function is _UNLOADED:
+                    started = time.time()
+                    self._embedding_function = self._load_embedding_function()
+                    self.metrics["model_load_seconds"] = time.time() - started
+        return self._embedding_function
+
+    def _load_embedding_function(self):
+        try:
+            import chromadb.utils.embedding_functions as embedding_functions
+        except ImportError:
+            print("sentence-transformers not available. Install with: pip install sentence-transformers")
+            return None
+
+        for model in self.model_names:
+            try:
+                print(f"Attempting to load {model}...")
+                embedding_function = embedding_functions.SentenceTransformerEmbeddingFunction(
+                    model_name=model
+                )
+                print(f"Successfully loaded {model}")
+                return embedding_function
+            except Exception as e:
+                print(f"Failed to load {model}: {e}")
+                continue
+
+        print("All embedding models failed, using default")
+        return None
+
+    def embed(self, texts: List[str], embedding_function=None) -> List[List[float]]:
+        """Embed texts, encoding only cache misses and those in a single batch.
+
+        embedding_function defaults to the shared model; pass the collection's own
+        function when it differs so query vectors match the stored ones.
+        """
+        embedding_function = embedding_function or self.get_embedding_function()
+        if embedding_function is None:
+            raise RuntimeError("No embedding function available")
+
+        model_name = embedding_function_name(embedding_function)
+        keys = [(model_name, normalize_query(text)) for text in texts]
+        results: List[Optional[List[float]]] = [None] * len(texts)
+        missing: Dict[tuple, List[int]] = {}
+
+        with self._cache_lock:
+            for i, key in enumerate(keys):
+                cached = self._cache.get(key)
+                if cached is not None:
+                    self._cache.move_to_end(key)
+                    results[i] = cached
+                else:
+                    missing.setdefault(key, []).append(i)
+
+        started = time.time()
+        if missing:
+            encode_texts = [texts[positions[0]] for positions in missing.values()]
+            embeddings = embedding_function(encode_texts)
+            with self._cache_lock:
+                for (key, positions), embedding in zip(missing.items(), embeddings):
+                    vector = [float(x) for x in embedding]
+                    for i in positions:
+                        results[i] = vector
+                    self._cache[key] = vector
+                    self._cache.move_to_end(key)
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        elapsed = time.time() - started
+
+        with self._cache_lock:
+            self.metrics["embed_calls"] += 1
+            self.metrics["texts_requested"] += len(texts)
+            self.metrics["texts_encoded"] += len(missing)
+            self.metrics["cache_hits"] += len(texts) - sum(len(p) for p in missing.values())
+            self.metrics["embedding_seconds"] += elapsed
+        return results
+
+    def record_retrieval(self, seconds: float) -> None:
+        """Record the wall time of one retrieval (embedding + vector search)."""
+        with self._cache_lock:
+            self.metrics["retrieval_calls"] += 1
+            self.metrics["retrieval_seconds"] += seconds
+
+    def warm_up(self, queries: Optional[List[str]] = None, background: bool = True) -> Optional[threading.Thread]:
+        """Load the model and pre-embed frequent domain queries.
+
+        With background=True the work runs on a daemon thread and the thread is
+        returned; repeated calls while it is running do nothing.
+        """
+        queries = WARMUP_QUERIES if queries is None else queries
+
+        def run():
+            started = time.time()
+            try:
+                if self.get_embedding_function() is not None and queries:
+                    self.embed(queries)
+                print(f"Embedding service warmed up in {time.time() - started:.2f}s ({len(queries)} queries)")
+            except Exception as e:
+                print(f"Embedding warm-up failed: {e}")
+
+        if not background:
+            run()
+            return None
+        if self._warmup_thread is not None and self._warmup_thread.is_alive():
+            return self._warmup_thread
+        self._warmup_thread = threading.Thread(target=run, name="embedding-warmup", daemon=True)
+        self._warmup_thread.start()
+        return self._warmup_thread
+
+    def stats(self) -> Dict[str, Any]:
+        """Embedding metrics, including the share of retrieval time spent embedding."""
+        with self._cache_lock:
+            stats = dict(self.metrics)
+            stats["cache_entries"] = len(self._cache)
+        stats["cache_hit_rate"] = stats["cache_hits"] / stats["texts_requested"] if stats["texts_requested"] else 0.0
+        stats["embedding_share_of_retrieval"] = (
+            stats["embedding_seconds"] / stats["retrieval_seconds"] if stats["retrieval_seconds"] else 0.0
+        )
+        return stats
+
+
+_service_lock = threading.Lock()
+_shared_service: Optional[EmbeddingService] = None
+
+
+def get_embedding_service() -> EmbeddingService:
+    """Return the process-wide embedding service."""
+    global _shared_service
+    if _shared_service is None:
+        with _service_lock:
+            if _shared_service is None:
+                _shared_service = EmbeddingService()
+    return _shared_service
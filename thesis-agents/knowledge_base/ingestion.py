@@ -0,0 +1,248 @@
+"""
+Parallel, incremental PDF ingestion for the knowledge base.
+
+PDF text extraction, cleaning and chunking run in a process pool; the chunks
+of several documents are then embedded together and written to Chroma in
+large batches. A manifest of per-file content hashes (``ingestion_manifest.json``
+next to ``vectorstore/``) lets a re-run skip PDFs that have not changed.
+
+Usage:
+    km = KnowledgeManager("architecture")
+    report = IngestionPipeline(km, workers=4).run()
+"""
+
+import hashlib
+import json
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+MANIFEST_FILENAME = "ingestion_manifest.json"
+DEFAULT_BATCH_SIZE = 256
+
+
+def file_sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def extract_pdf_document(pdf_path: str, sha256: Optional[str] = None) -> Dict[str, Any]:
+    """Worker: hash (unless sha256 is given), extract, clean and chunk one PDF (runs in a child process)."""
+    try:
+        from .knowledge_manager import KnowledgeManager
+    except ImportError:
+        from knowledge_manager import KnowledgeManager
+
+    started = time.time()
+    result = {"pdf_path": pdf_path, "chunks": [], "pages": 0, "error": None}
+    try:
+        result["sha256"] = sha256 or file_sha256(pdf_path)
+        result["pdf_metadata"] = KnowledgeManager.extract_pdf_metadata(pdf_path)
+        text, pages = KnowledgeManager.extract_pdf_text(pdf_path)
+        result["pages"] = pages
+        if text.strip():
+            cleaned_text = KnowledgeManager.clean_text(text)
+            result["chunks"] = KnowledgeManager.split_text_into_chunks(cleaned_text, max_length=800, overlap=100)
+        else:
+            result["error"] = "No text extracted"
+    except Exception as e:
+        result["error"] = str(e)
+    result["extract_seconds"] = time.time() - started
+    return result
+
+
+class IngestionPipeline:
+    """Ingest a directory of PDFs into a KnowledgeManager's collection."""
+
+    def __init__(self, knowledge_manager, workers: Optional[int] = None,
+                 batch_size: int = DEFAULT_BATCH_SIZE, source_type: str = "local_pdf"):
+        self.km = knowledge_manager
+        self.workers = workers or max(1, min(os.cpu_count() or 1, 8))
+        self.batch_size = batch_size
+        self.source_type = source_type
+        self.manifest_path = Path(self.km.base_path) / MANIFEST_FILENAME
+        self.manifest = self._load_manifest()
+
+        self._pending = ([], [], [])
+        self._report: Dict[str, Any] = {}
+        self._file_hashes: Dict[str, str] = {}  # hashes computed while checking for changes
+
+    def _load_manifest(self) -> Dict[str, Dict]:
+        try:
+            if self.manifest_path.exists():
+                with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+        except Exception as e:
+            print(f"Could not read ingestion manifest, re-ingesting everything: {e}")
+        return {}
+
+    def _save_manifest(self) -> None:
+        try:
+            with open(self.manifest_path, 'w', encoding='utf-8') as f:
+                json.dump(self.manifest, f, indent=2, ensure_ascii=False)
+        except Exception as e:
+            print(f"Error saving ingestion manifest: {e}")
+
+    def _changed_files(self, pdf_files: List[Path], force: bool) -> List[Path]:
+        if force:
+            return pdf_files
+        changed = []
+        for pdf_file in pdf_files:
+            sha256 = self._file_hashes[str(pdf_file)] = file_sha256(str(pdf_file))
+            entry = self.manifest.get(pdf_file.name)
+            if entry and entry.get("sha256") == sha256:
+                continue
+            changed.append(pdf_file)
+        return changed
+
+    def run(self, pdf_directory: Optional[str] = None, force: bool = False) -> Dict[str, Any]:
+        """Ingest new or changed PDFs and return a throughput report."""
+        pdf_directory_path = Path(pdf_directory) if pdf_directory else Path(self.km.local_pdfs_path)
+        self._report = {
+            "files_found": 0, "files_skipped": 0, "files_processed": 0, "files_failed": 0,
+            "pages": 0, "chunks": 0, "chunks_written": 0,
+            "extract_seconds": 0.0, "embed_seconds": 0.0, "write_seconds": 0.0,
+        }
+        started = time.time()
+
+        if not pdf_directory_path.exists():
+            print(f"PDF directory not found: {pdf_directory_path}")
+            return self._finish(started)
+
+        pdf_files = sorted(pdf_directory_path.glob("*.pdf"))
+        self._report["files_found"] = len(pdf_files)
+        if not pdf_files:
+            print(f"No PDF files found in: {pdf_directory_path}")
+            return self._finish(started)
+
+        self._file_hashes = {}
+        to_process = self._changed_files(pdf_files, force)
+        self._report["files_skipped"] = len(pdf_files) - len(to_process)
+        print(f"Found {len(pdf_files)} PDF files, {len(to_process)} new or changed "
+              f"({self._report['files_skipped']} unchanged, skipped)")
+
+        if to_process:
+            paths = [str(pdf_file) for pdf_file in to_process]
+            if self.workers > 1 and len(paths) > 1:
+                # spawn: the parent has already loaded torch and the embedding model, which fork does not handle safely
+                with ProcessPoolExecutor(max_workers=min(self.workers, len(paths)),
+                                         mp_context=multiprocessing.get_context("spawn")) as pool:
+                    futures = [pool.submit(extract_pdf_document, path, self._file_hashes.get(path)) for path in paths]
+                    for i, future in enumerate(as_completed(futures), 1):
+                        self._collect(future.result(), i, len(paths))
+            else:
+                for i, path in enumerate(paths, 1):
+                    self._collect(extract_pdf_document(path, self._file_hashes.get(path)), i, len(paths))
+            self._flush()
+            self.km.save_citations_db()
+            self._save_manifest()
+
+        return self._finish(started)
+
+    def _collect(self, extracted: Dict[str, Any], index: int, total: int) -> None:
+        pdf_name = Path(extracted["pdf_path"]).name
+        self._report["extract_seconds"] += extracted.get("extract_seconds", 0.0)
+
+        if extracted["error"] or not extracted["chunks"]:
+            print(f"({index}/{total}) Failed {pdf_name}: {extracted['error'] or 'no chunks'}")
+            self._report["files_failed"] += 1
+            return
+
+        pdf_metadata = extracted["pdf_metadata"]
+        title = pdf_metadata["title"]
+        chunks = extracted["chunks"]
+        print(f"({index}/{total}) {title}: {extracted['pages']} pages, {len(chunks)} chunks")
+
+        if pdf_name in self.manifest:
+            # Changed since the last run: drop its old chunks before re-adding
+            self.km._remove_file_chunks(pdf_name)
+
+        self.km.citations_db[title.lower().replace(' ', '_').replace('/', '_')] = pdf_metadata
+        ids, documents, metadatas = self.km._build_chunk_records(
+            chunks, title, pdf_metadata["author"], self.source_type, pdf_metadata
+        )
+        for column, values in zip(self._pending, (ids, documents, metadatas)):
+            column.extend(values)
+
+        self._report["files_processed"] += 1
+        self._report["pages"] += extracted["pages"]
+        self._report["chunks"] += len(chunks)
+        # The manifest is only written after the final flush, so an interrupted run re-ingests this file
+        self.manifest[pdf_name] = {
+            "sha256": extracted["sha256"],
+            "title": title,
+            "pages": extracted["pages"],
+            "chunks": len(chunks),
+            "ingested_at": datetime.now().isoformat(),
+        }
+
+        if len(self._pending[0]) >= self.batch_size:
+            self._flush()
+
+    def _flush(self) -> None:
+        """Embed all pending chunks not yet in Chroma in one pass and write them in one Chroma call."""
+        ids, documents, metadatas = self._pending
+        if not ids:
+            return
+        self._pending = ([], [], [])
+
+        # Chunks already stored (e.g. a vectorstore built before the manifest existed)
+        # are not embedded again; the BM25 index backfills them on the next search
+        try:
+            existing_ids = set(self.km.collection.get(ids=list(ids), include=[])["ids"])
+        except Exception:
+            existing_ids = set()
+        keep, seen = [], set()
+        for position, doc_id in enumerate(ids):
+            if doc_id not in existing_ids and doc_id not in seen:
+                seen.add(doc_id)
+                keep.append(position)
+        if not keep:
+            return
+        ids = [ids[i] for i in keep]
+        documents = [documents[i] for i in keep]
+        metadatas = [metadatas[i] for i in keep]
+
+        embeddings = None
+        embedding_function = getattr(self.km.collection, "_embedding_function", None) or self.km.embedding_function
+        if embedding_function is not None:
+            started = time.time()
+            try:
+                embeddings = [[float(x) for x in vector] for vector in embedding_function(documents)]
+            except Exception as e:
+                print(f"Batched embedding failed, letting Chroma embed: {e}")
+            self._report["embed_seconds"] += time.time() - started
+
+        started = time.time()
+        self._report["chunks_written"] += self.km._add_records_to_db(ids, documents, metadatas, embeddings)
+        self._report["write_seconds"] += time.time() - started
+
+    def _finish(self, started: float) -> Dict[str, Any]:
+        report = self._report
+        report["wall_seconds"] = wall = time.time() - started
+        report["pages_per_sec"] = report["pages"] / wall if wall else 0.0
+        report["chunks_per_sec"] = report["chunks"] / wall if wall else 0.0
+        report["workers"] = self.workers
+
+        print(f"\nIngestion report:")
+        print(f"   Files: {report['files_processed']} processed, {report['files_skipped']} skipped, "
+              f"{report['files_failed']} failed (of {report['files_found']})")
+        print(f"   Pages: {report['pages']}, chunks: {report['chunks']} ({report['chunks_written']} new in Chroma)")
+        print(f"   Time: {wall:.1f}s wall, {report['extract_seconds']:.1f}s extraction over {self.workers} workers, "
+              f"{report['embed_seconds']:.1f}s embedding, {report['write_seconds']:.1f}s writing")
+        print(f"   Throughput: {report['pages_per_sec']:.1f} pages/sec, {report['chunks_per_sec']:.1f} chunks/sec")
+        return report
+
+
+def clear_manifest(base_path) -> None:
+    """Forget ingested files so the next run re-ingests everything."""
+    manifest_path = Path(base_path) / MANIFEST_FILENAME
+    if manifest_path.exists():
+        manifest_path.unlink()
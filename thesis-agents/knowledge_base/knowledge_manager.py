@@ -11,6 +11,16 @@ import importlib.util
 from typing import List, Dict, Any, Optional, Tuple
 from pathlib import Path
 from datetime import datetime
+import time
+
+try:
+    from .embedding_service import get_embedding_service
+    from .bm25_index import get_shared_index
+    from .ingestion import IngestionPipeline, clear_manifest
+except ImportError:
+    from embedding_service import get_embedding_service
+    from bm25_index import get_shared_index
+    from ingestion import IngestionPipeline, clear_manifest
 
 class KnowledgeManager:
     def __init__(self, domain: str = "architecture"):
@@ -87,39 +97,27 @@ class KnowledgeManager:
                     metadata={"description": f"Enhanced knowledge base for {domain} (fallback)"}
                 )
         
+        # Document count is needed for every query's n_results; cache it and
+        # invalidate whenever this manager changes the collection
+        self._count_cache: Optional[int] = None
+
+        # Lexical index persisted next to vectorstore/, kept in sync with the collection;
+        # loaded on first use (plain search_knowledge never needs it)
+        self._lexical_index = None
+
         # Load citation database
         self.citations_db = self.load_citations_db()
     
+    @property
+    def lexical_index(self):
+        """BM25 index for this knowledge base, shared by every manager on the same path"""
+        if self._lexical_index is None:
+            self._lexical_index = get_shared_index(self.base_path / "bm25_index.json")
+        return self._lexical_index
+    
     def _get_better_embeddings(self):
-        """Get better embedding function with fallback options"""
-        try:
-            import chromadb.utils.embedding_functions as embedding_functions
-
-            # Try multiple embedding models in order of preference
-            embedding_models = [
-                "all-mpnet-base-v2",      # Best general purpose (768-dim)
-                "all-MiniLM-L6-v2",       # Faster, still good (384-dim)
-                "paraphrase-mpnet-base-v2" # Good for paraphrases
-            ]
-
-            for model in embedding_models:
-                try:
-                    print(f"Attempting to load {model}...")
-                    embedding_function = embedding_functions.SentenceTransformerEmbeddingFunction(
-                        model_name=model
-                    )
-                    print(f"Successfully loaded {model}")
-                    return embedding_function
-                except Exception as e:
-                    print(f"Failed to load {model}: {e}")
-                    continue
-
-            print("All embedding models failed, using default")
-            return None
-
-        except ImportError:
-            print("sentence-transformers not available. Install with: pip install sentence-transformers")
-            return None
+        """Get better embedding function with fallback options (loaded once per process)"""
+        return get_embedding_service().get_embedding_function()
     
     def load_citations_db(self) -> Dict:
         """Load citation information from JSON file"""
@@ -140,7 +138,8 @@ class KnowledgeManager:
         except Exception as e:
             print(f"Error saving citations: {e}")
     
-    def extract_pdf_metadata(self, pdf_path: str) -> Dict[str, Any]:
+    @staticmethod
+    def extract_pdf_metadata(pdf_path: str) -> Dict[str, Any]:
         """Extract metadata from PDF for better citations"""
         metadata = {
             "file_path": pdf_path,
@@ -189,7 +188,8 @@ class KnowledgeManager:
         
         return metadata
     
-    def clean_text(self, text: str) -> str:
+    @staticmethod
+    def clean_text(text: str) -> str:
         """Clean text to improve embedding quality"""
         
         # Replace problematic encoding characters
@@ -208,7 +208,8 @@ class KnowledgeManager:
         
         return text.strip()
     
-    def split_text_into_chunks(self, text: str, max_length: int = 800, overlap: int = 100) -> List[str]:
+    @staticmethod
+    def split_text_into_chunks(text: str, max_length: int = 800, overlap: int = 100) -> List[str]:
         """Enhanced chunking that preserves semantic meaning"""
         
         # Clean up text
@@ -255,9 +256,11 @@ class KnowledgeManager:
         # Filter out very short chunks
         return [chunk for chunk in chunks if len(chunk) > 50]
     
-    def _add_chunks_to_db(self, chunks: List[str], title: str, author: str, source_type: str, pdf_metadata: Dict):
-        """Add chunks to ChromaDB with enhanced metadata"""
+    def _build_chunk_records(self, chunks: List[str], title: str, author: str, source_type: str,
+                             pdf_metadata: Dict) -> Tuple[List[str], List[str], List[Dict]]:
+        """Build (ids, documents, metadatas) for a document's chunks"""
         
+        ids, documents, metadatas = [], [], []
         for i, chunk in enumerate(chunks):
             doc_id = f"{self.domain}_{title.lower().replace(' ', '_').replace('/', '_')}_{i}"
             
@@ -288,19 +291,85 @@ class KnowledgeManager:
                 "has_spatial_info": any(spatial in chunk.lower() for spatial in ["space", "room", "area", "floor"])
             }
             
-            # Check if already exists
-            try:
-                existing = self.collection.get(ids=[doc_id])
-                if existing['ids']:
+            ids.append(doc_id)
+            documents.append(chunk)
+            metadatas.append(chunk_metadata)
+        
+        return ids, documents, metadatas
+    
+    def _add_records_to_db(self, ids: List[str], documents: List[str], metadatas: List[Dict],
+                           embeddings: Optional[List] = None) -> int:
+        """Add chunk records in one Chroma write, skipping ids that already exist.
+        
+        Returns the number of chunks written. The lexical index is updated for
+        every record, which also backfills chunks already present in Chroma.
+        """
+        if not ids:
+            return 0
+        
+        existing_ids = set()
+        try:
+            existing_ids = set(self.collection.get(ids=list(ids), include=[])['ids'])
+        except Exception:
+            pass
+        
+        keep, seen = [], set()
+        for position, doc_id in enumerate(ids):
+            if doc_id in existing_ids or doc_id in seen:
+                continue
+            seen.add(doc_id)
+            keep.append(position)
+        
+        if keep:
+            add_kwargs = {
+                "documents": [documents[i] for i in keep],
+                "metadatas": [metadatas[i] for i in keep],
+                "ids": [ids[i] for i in keep],
+            }
+            if embeddings is not None:
+                add_kwargs["embeddings"] = [embeddings[i] for i in keep]
+            self.collection.add(**add_kwargs)
+            self._count_cache = None
+        
+        # Incremental lexical index update
+        if self.lexical_index.add_documents(ids, documents, metadatas):
+            self.lexical_index.save()
+        
+        return len(keep)
+    
+    def _add_chunks_to_db(self, chunks: List[str], title: str, author: str, source_type: str, pdf_metadata: Dict):
+        """Add chunks to ChromaDB with enhanced metadata"""
+        self._add_records_to_db(*self._build_chunk_records(chunks, title, author, source_type, pdf_metadata))
+    
+    @staticmethod
+    def extract_pdf_text(pdf_path: str) -> Tuple[str, int]:
+        """Extract text with [Page N] markers; returns (text, page count).
+        
+        Returns empty text for encrypted PDFs that cannot be decrypted.
+        """
+        with open(pdf_path, 'rb') as file:
+            pdf_reader = PyPDF2.PdfReader(file)
+            
+            if pdf_reader.is_encrypted:
+                print(f"   PDF is encrypted/protected")
+                try:
+                    pdf_reader.decrypt('')
+                    print(f"   Successfully decrypted with empty password")
+                except Exception as decrypt_error:
+                    print(f"   Cannot decrypt PDF: {decrypt_error}")
+                    return "", 0
+            
+            text = ""
+            for page_num, page in enumerate(pdf_reader.pages):
+                try:
+                    page_text = page.extract_text()
+                    if page_text and page_text.strip():
+                        text += f"[Page {page_num + 1}]\n{page_text}\n\n"
+                except Exception as e:
+                    print(f"      Error reading page {page_num + 1}: {e}")
                     continue
-            except Exception:
-                pass
             
-            self.collection.add(
-                documents=[chunk],
-                metadatas=[chunk_metadata],
-                ids=[doc_id]
-            )
+            return text, len(pdf_reader.pages)
     
     def add_pdf_document(self, pdf_path: str, custom_title: str = "", custom_author: str = "", source_type: str = "local_pdf") -> bool:
         """Extract text from PDF and add to knowledge base with enhanced processing"""
@@ -318,27 +387,7 @@ class KnowledgeManager:
         
         try:
             # Extract text from PDF
-            with open(pdf_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                
-                if pdf_reader.is_encrypted:
-                    print(f"   PDF is encrypted/protected")
-                    try:
-                        pdf_reader.decrypt('')
-                        print(f"   Successfully decrypted with empty password")
-                    except Exception as decrypt_error:
-                        print(f"   Cannot decrypt PDF: {decrypt_error}")
-                        return False
-                
-                text = ""
-                for page_num, page in enumerate(pdf_reader.pages):
-                    try:
-                        page_text = page.extract_text()
-                        if page_text and page_text.strip():
-                            text += f"[Page {page_num + 1}]\n{page_text}\n\n"
-                    except Exception as e:
-                        print(f"      Error reading page {page_num + 1}: {e}")
-                        continue
+            text, _ = self.extract_pdf_text(pdf_path)
             
             if not text.strip():
                 print(f"   No text extracted from {title}")
@@ -373,30 +422,23 @@ class KnowledgeManager:
         print(f"   Expanded query: '{expanded_query}'")
 
         try:
-            results = self.collection.query(
-                query_texts=[expanded_query],
-                n_results=min(n_results * 2, self.collection.count())  # Get more to filter
-            )
+            # Goes through the shared embedding cache (get more to filter)
+            documents, metadatas, distances = self._multi_query([expanded_query], [n_results * 2])[0]
             
             knowledge_results = []
             
-            if results["documents"] and results["documents"][0]:
-                for i, (doc, metadata, distance) in enumerate(zip(
-                    results["documents"][0],
-                    results["metadatas"][0], 
-                    results["distances"][0]
-                )):
-                    if distance <= 1.2:  # Better distance threshold
-                        similarity = 1.0 - distance
-                        
-                        if similarity > min_similarity:  # Improved threshold
-                            knowledge_results.append({
-                                "content": doc,
-                                "metadata": metadata,
-                                "similarity": similarity,
-                                "distance": distance,
-                                "rank": i + 1
-                            })
+            for i, (doc, metadata, distance) in enumerate(zip(documents, metadatas, distances)):
+                if distance <= 1.2:  # Better distance threshold
+                    similarity = 1.0 - distance
+                    
+                    if similarity > min_similarity:  # Improved threshold
+                        knowledge_results.append({
+                            "content": doc,
+                            "metadata": metadata,
+                            "similarity": similarity,
+                            "distance": distance,
+                            "rank": i + 1
+                        })
             
             print(f"Found {len(knowledge_results)} relevant results")
             
@@ -450,17 +492,26 @@ class KnowledgeManager:
         
         print(f"Enhanced search for: '{query}'")
         
+        keywords = self._extract_query_keywords(query)
+        expanded_query = self._expand_query_intelligently(query)
+        
+        # Both vector strategies share one batched embedding pass and one Chroma query
+        semantic_raw, expanded_raw = self._multi_query(
+            [query, expanded_query],
+            [n_results * 2, n_results]
+        )
+        
         # Strategy 1: Direct semantic search
-        semantic_results = self._semantic_search(query, n_results * 2)
+        semantic_results = self._build_semantic_results(semantic_raw)
         
-        # Strategy 2: Keyword-based search
-        keyword_results = self._keyword_search(query, n_results)
+        # Strategy 2: Lexical BM25 search (no embedding needed)
+        keyword_results = self._keyword_search(query, n_results * 2)
         
         # Strategy 3: Query expansion search
-        expanded_results = self._expanded_search(query, n_results)
+        expanded_results = self._build_expanded_results(expanded_raw, expanded_query)
         
-        # Combine and deduplicate results
-        all_results = self._merge_search_results([
+        # Fuse the ranked lists with reciprocal rank fusion
+        all_results = self._reciprocal_rank_fusion([
             ('semantic', semantic_results),
             ('keyword', keyword_results),
             ('expanded', expanded_results)
@@ -468,7 +519,7 @@ class KnowledgeManager:
         
         # Rerank results if enabled
         if enable_reranking and all_results:
-            all_results = self._rerank_results(query, all_results)
+            all_results = self._rerank_results(query, all_results, keywords)
         
         # Return top results
         final_results = all_results[:n_results]
@@ -476,106 +527,139 @@ class KnowledgeManager:
         print(f"Found {len(final_results)} results after enhancement")
         return final_results
     
-    def _semantic_search(self, query: str, n_results: int) -> List[Dict]:
-        """Standard semantic search using embeddings"""
+    def _collection_count(self) -> int:
+        """Number of documents in the collection (cached until this manager modifies it)"""
+        if self._count_cache is None:
+            self._count_cache = self.collection.count()
+        return self._count_cache
+    
+    def _embed_queries(self, texts: List[str]) -> Optional[List]:
+        """Embed query texts in one batch with the collection's embedding function.
+        
+        Returns None when the function is not accessible; callers then pass the
+        texts to Chroma, which embeds them in a single batch as well.
+        """
+        embedding_function = getattr(self.collection, "_embedding_function", None) or self.embedding_function
+        if embedding_function is None:
+            return None
         try:
-            results = self.collection.query(
-                query_texts=[query],
-                n_results=min(n_results, self.collection.count())
-            )
+            return get_embedding_service().embed(texts, embedding_function)
+        except Exception as e:
+            print(f"Batched query embedding failed, letting Chroma embed: {e}")
+            return None
+    
+    def _multi_query(self, queries: List[str], n_results: List[int]) -> List[Tuple[List, List, List]]:
+        """Run several queries as one Chroma request.
+        
+        Returns (documents, metadatas, distances) per query, each truncated to
+        that query's own n_results. Failures yield empty results, like the
+        single-query searches they replace.
+        """
+        empty = [([], [], []) for _ in queries]
+        try:
+            limit = min(max(n_results), self._collection_count())
+            if limit <= 0:
+                return empty
             
-            search_results = []
-            if results["documents"] and results["documents"][0]:
-                for doc, metadata, distance in zip(
-                    results["documents"][0],
-                    results["metadatas"][0],
-                    results["distances"][0]
-                ):
-                    similarity = 1.0 - distance
-                    if similarity > 0.2:  # Minimum threshold
-                        search_results.append({
-                            "content": doc,
-                            "metadata": metadata,
-                            "similarity": similarity,
-                            "distance": distance,
-                            "search_method": "semantic"
-                        })
+            started = time.time()
+            embeddings = self._embed_queries(queries)
+            if embeddings is not None:
+                results = self.collection.query(query_embeddings=embeddings, n_results=limit)
+            else:
+                results = self.collection.query(query_texts=queries, n_results=limit)
+            get_embedding_service().record_retrieval(time.time() - started)
             
-            return search_results
+            batched = []
+            for i, n in enumerate(n_results):
+                documents = (results["documents"] or [[]] * len(queries))[i] or []
+                metadatas = (results["metadatas"] or [[]] * len(queries))[i] or []
+                distances = (results["distances"] or [[]] * len(queries))[i] or []
+                batched.append((documents[:n], metadatas[:n], distances[:n]))
+            return batched
         except Exception as e:
-            print(f"Semantic search failed: {e}")
-            return []
+            print(f"Batched search failed: {e}")
+            return empty
+    
+    def _semantic_search(self, query: str, n_results: int) -> List[Dict]:
+        """Standard semantic search using embeddings"""
+        return self._build_semantic_results(self._multi_query([query], [n_results])[0])
+    
+    def _build_semantic_results(self, raw: Tuple[List, List, List]) -> List[Dict]:
+        search_results = []
+        for doc, metadata, distance in zip(*raw):
+            similarity = 1.0 - distance
+            if similarity > 0.2:  # Minimum threshold
+                search_results.append({
+                    "content": doc,
+                    "metadata": metadata,
+                    "similarity": similarity,
+                    "distance": distance,
+                    "search_method": "semantic"
+                })
+        return search_results
     
     def _keyword_search(self, query: str, n_results: int) -> List[Dict]:
-        """Keyword-based search for exact matches"""
+        """Keyword-based search for exact matches using the BM25 lexical index"""
         try:
-            # Extract keywords from query
+            self._ensure_lexical_index()
             keywords = self._extract_query_keywords(query)
+            hits = self.lexical_index.search(query, n_results)
+            if not hits:
+                return []
             
-            # Search with keyword-enhanced query
-            results = self.collection.query(
-                query_texts=[" ".join(keywords)],
-                n_results=min(n_results, self.collection.count())
-            )
-            
+            top_score = hits[0][1] or 1.0
             search_results = []
-            if results["documents"] and results["documents"][0]:
-                for doc, metadata, distance in zip(
-                    results["documents"][0],
-                    results["metadatas"][0],
-                    results["distances"][0]
-                ):
-                    # Boost score if keywords appear in content
-                    keyword_boost = self._calculate_keyword_match_score(doc, keywords)
-                    adjusted_similarity = (1.0 - distance) * (1.0 + keyword_boost)
-                    
-                    if adjusted_similarity > 0.3:
-                        search_results.append({
-                            "content": doc,
-                            "metadata": metadata,
-                            "similarity": min(adjusted_similarity, 1.0),
-                            "distance": distance,
-                            "search_method": "keyword",
-                            "keyword_boost": keyword_boost
-                        })
-            
+            for doc_id, score in hits:
+                document = self.lexical_index.get(doc_id)
+                search_results.append({
+                    "content": document["content"],
+                    "metadata": document["metadata"],
+                    "similarity": score / top_score,
+                    "bm25_score": score,
+                    "search_method": "keyword",
+                    "keyword_boost": self._calculate_keyword_match_score(document["content"], keywords)
+                })
             return search_results
         except Exception as e:
             print(f"Keyword search failed: {e}")
             return []
     
+    def _ensure_lexical_index(self) -> None:
+        """Backfill the BM25 index with collection chunks it is missing (e.g. an older vectorstore).
+        
+        The index can be partial rather than empty: chunks added after an upgrade
+        are indexed incrementally while the pre-upgrade corpus is not.
+        """
+        if len(self.lexical_index) >= self._collection_count():
+            return
+        missing = [doc_id for doc_id in self.collection.get(include=[])["ids"] if doc_id not in self.lexical_index]
+        if not missing:
+            return
+        print(f"Building BM25 index for {len(missing)} chunks of the existing collection...")
+        existing = self.collection.get(ids=missing, include=["documents", "metadatas"])
+        added = self.lexical_index.add_documents(existing["ids"], existing["documents"], existing["metadatas"])
+        self.lexical_index.save()
+        print(f"   Indexed {added} chunks")
+    
     def _expanded_search(self, query: str, n_results: int) -> List[Dict]:
         """Search with query expansion"""
-        try:
-            expanded_query = self._expand_query_intelligently(query)
-            
-            results = self.collection.query(
-                query_texts=[expanded_query],
-                n_results=min(n_results, self.collection.count())
-            )
-            
-            search_results = []
-            if results["documents"] and results["documents"][0]:
-                for doc, metadata, distance in zip(
-                    results["documents"][0],
-                    results["metadatas"][0],
-                    results["distances"][0]
-                ):
-                    similarity = 1.0 - distance
-                    if similarity > 0.25:
-                        search_results.append({
-                            "content": doc,
-                            "metadata": metadata,
-                            "similarity": similarity,
-                            "distance": distance,
-                            "search_method": "expanded",
-                            "expanded_query": expanded_query
-                        })
-            
-            return search_results
-        except Exception as e:
-            print(f"Expanded search failed: {e}")
-            return []
+        expanded_query = self._expand_query_intelligently(query)
+        return self._build_expanded_results(self._multi_query([expanded_query], [n_results])[0], expanded_query)
+    
+    def _build_expanded_results(self, raw: Tuple[List, List, List], expanded_query: str) -> List[Dict]:
+        search_results = []
+        for doc, metadata, distance in zip(*raw):
+            similarity = 1.0 - distance
+            if similarity > 0.25:
+                search_results.append({
+                    "content": doc,
+                    "metadata": metadata,
+                    "similarity": similarity,
+                    "distance": distance,
+                    "search_method": "expanded",
+                    "expanded_query": expanded_query
+                })
+        return search_results
     
     def _extract_query_keywords(self, query: str) -> List[str]:
         """Extract meaningful keywords from query"""
@@ -618,42 +702,46 @@ class KnowledgeManager:
         expanded_terms = [query] + expansions
         return " ".join(expanded_terms)
     
-    def _merge_search_results(self, result_sets: List[Tuple[str, List[Dict]]]) -> List[Dict]:
-        """Merge and deduplicate results from different search methods"""
-        merged = {}  # Use content hash as key to deduplicate
+    def _reciprocal_rank_fusion(self, result_sets: List[Tuple[str, List[Dict]]], k: int = 60) -> List[Dict]:
+        """Fuse ranked result lists: score = sum over lists of 1 / (k + rank)"""
+        fused = {}
         
         for method_name, results in result_sets:
-            for result in results:
-                content_hash = hash(result['content'][:100])  # Use first 100 chars as key
+            for rank, result in enumerate(results, 1):
+                content_key = result['content'][:100]
                 
-                if content_hash in merged:
-                    # Update if this result has higher similarity
-                    if result['similarity'] > merged[content_hash]['similarity']:
-                        merged[content_hash] = result
-                    # Add method info
-                    if 'search_methods' not in merged[content_hash]:
-                        merged[content_hash]['search_methods'] = []
-                    merged[content_hash]['search_methods'].append(method_name)
+                if content_key in fused:
+                    entry = fused[content_key]
+                    # Keep the payload of the strongest individual hit
+                    if result['similarity'] > entry['similarity']:
+                        result.update(search_methods=entry['search_methods'], rrf_score=entry['rrf_score'])
+                        fused[content_key] = entry = result
                 else:
-                    result['search_methods'] = [method_name]
-                    merged[content_hash] = result
+                    result['search_methods'] = []
+                    result['rrf_score'] = 0.0
+                    fused[content_key] = entry = result
+                
+                entry['search_methods'].append(method_name)
+                entry['rrf_score'] += 1.0 / (k + rank)
         
-        # Convert back to list and sort by similarity
-        merged_results = list(merged.values())
-        merged_results.sort(key=lambda x: x['similarity'], reverse=True)
+        fused_results = sorted(fused.values(), key=lambda x: x['rrf_score'], reverse=True)
+        if fused_results:
+            top_score = fused_results[0]['rrf_score']
+            for result in fused_results:
+                result['fused_score'] = result['rrf_score'] / top_score
         
-        return merged_results
+        return fused_results
     
-    def _rerank_results(self, query: str, results: List[Dict]) -> List[Dict]:
+    def _rerank_results(self, query: str, results: List[Dict], keywords: Optional[List[str]] = None) -> List[Dict]:
         """Rerank results using multiple factors"""
         
+        if keywords is None:
+            keywords = self._extract_query_keywords(query)
+        
         for result in results:
             score_components = {
-                'semantic_similarity': result['similarity'] * 0.4,
-                'keyword_relevance': self._calculate_keyword_match_score(
-                    result['content'], 
-                    self._extract_query_keywords(query)
-                ) * 0.3,
+                'semantic_similarity': result.get('fused_score', result['similarity']) * 0.4,
+                'keyword_relevance': self._calculate_keyword_match_score(result['content'], keywords) * 0.3,
                 'content_quality': result['metadata'].get('complexity_score', 0.5) * 0.2,
                 'source_authority': self._calculate_source_authority(result['metadata']) * 0.1
             }
@@ -789,6 +877,9 @@ class KnowledgeManager:
                     name=self.collection_name,
                     metadata={"description": f"Enhanced knowledge base for {self.domain}"}
                 )
+            self._count_cache = None
+            self.lexical_index.clear()
+            clear_manifest(self.base_path)
             print("   Created fresh collection")
             
             # Clear citations database
@@ -798,52 +889,41 @@ class KnowledgeManager:
         except Exception as e:
             print(f"Error clearing database: {e}")
     
-    def process_local_pdfs(self, pdf_directory: Optional[str] = None) -> None:
-        """Process all PDFs from a local directory with enhanced processing"""
+    def process_local_pdfs(self, pdf_directory: Optional[str] = None, workers: Optional[int] = None,
+                           force: bool = False) -> Dict[str, Any]:
+        """Process all PDFs from a local directory with enhanced processing
+        
+        Extraction runs in a process pool and unchanged PDFs (same content hash
+        as the last run) are skipped; pass force=True to re-ingest everything.
+        Returns the ingestion throughput report.
+        """
         
         if pdf_directory is None:
             pdf_directory_path = self.local_pdfs_path
         else:
             pdf_directory_path = Path(pdf_directory)
         
-        if not pdf_directory_path.exists():
-            print(f"PDF directory not found: {pdf_directory_path}")
-            return
-        
-        pdf_files = list(pdf_directory_path.glob("*.pdf"))
-        
-        if not pdf_files:
-            print(f"No PDF files found in: {pdf_directory_path}")
-            return
-        
-        print(f"Found {len(pdf_files)} PDF files to process with enhanced methods")
-        
-        processed_count = 0
-        failed_count = 0
-        
-        for i, pdf_file in enumerate(pdf_files, 1):
-            try:
-                print(f"\nProcessing ({i}/{len(pdf_files)}): {pdf_file.name}")
-                
-                success = self.add_pdf_document(
-                    str(pdf_file), 
-                    source_type="local_pdf"
-                )
-                
-                if success:
-                    processed_count += 1
-                else:
-                    failed_count += 1
-                
-            except Exception as e:
-                print(f"Failed to process {pdf_file.name}: {e}")
-                failed_count += 1
-                continue
+        print(f"Processing PDFs from {pdf_directory_path} with enhanced methods")
+        report = IngestionPipeline(self, workers=workers).run(str(pdf_directory_path), force=force)
         
         print(f"\nEnhanced processing complete!")
-        print(f"   Successfully processed: {processed_count} files")
-        print(f"   Failed: {failed_count} files")
+        print(f"   Successfully processed: {report['files_processed']} files")
+        print(f"   Failed: {report['files_failed']} files")
         print(f"   Total documents in database: {self.collection.count()}")
+        return report
+    
+    def _remove_file_chunks(self, file_name: str) -> None:
+        """Delete every chunk that came from file_name (used before re-ingesting a changed PDF)"""
+        try:
+            ids = self.collection.get(where={"file_name": file_name}, include=[])['ids']
+            if ids:
+                self.collection.delete(ids=ids)
+                self._count_cache = None
+                self.lexical_index.remove_documents(ids)
+                self.lexical_index.save()
+                print(f"   Removed {len(ids)} outdated chunks from {file_name}")
+        except Exception as e:
+            print(f"   Could not remove old chunks for {file_name}: {e}")
     
     def get_collection_stats(self):
         """Get enhanced statistics about the knowledge base"""
@@ -876,7 +956,8 @@ class KnowledgeManager:
                 "sources": dict(list(sources.items())[:10]),
                 "domains": list(domains),
                 "source_types": source_types,
-                "enhanced_processing": True
+                "enhanced_processing": True,
+                "embedding": get_embedding_service().stats()
             }
             
         except Exception as e:
@@ -1,14 +1,47 @@
 from langgraph.graph import StateGraph, END
 
 
-def build_workflow(state_cls, handlers, route_decision_fn):
+# Per-route agent dependencies for the fan-out/fan-in mode.
+# Each entry maps an agent node to the agents whose results it must see first.
+# The domain expert, Socratic tutor and cognitive enhancement agent all read
+# analysis_result (visual analysis, cognitive flags and state, milestone
+# context), so they start once the analysis agent is done and then run
+# concurrently with each other.
+ROUTE_AGENT_DEPENDENCIES = {
+    "multi_agent_comprehensive": {
+        "analysis_agent": (),
+        "domain_expert": ("analysis_agent",),
+        "socratic_tutor": ("analysis_agent",),
+        "cognitive_enhancement": ("analysis_agent",),
+    },
+    "balanced_guidance": {
+        "analysis_agent": (),
+        "domain_expert": ("analysis_agent",),
+        "socratic_tutor": ("analysis_agent",),
+        "cognitive_enhancement": ("analysis_agent",),
+    },
+    "knowledge_with_challenge": {
+        "analysis_agent": (),
+        "domain_expert": ("analysis_agent",),
+        "socratic_tutor": ("analysis_agent",),
+        "cognitive_enhancement": ("analysis_agent",),
+    },
+}
+
+
+def build_workflow(state_cls, handlers, route_decision_fn, parallel_routes=None):
     """Construct the StateGraph with nodes and edges mirroring original wiring.
 
     handlers is a simple namespace/object with attributes:
       context, router, analysis, domain_expert, socratic, cognitive, synthesizer
+    and optionally `parallel` (see nodes.parallel.make_parallel_agents_node).
     route_decision_fn(state) -> str is used in conditional edges for the router.
+    parallel_routes lists the routing paths that go through the parallel node
+    instead of the sequential agent chain; it is ignored without handlers.parallel.
     """
     workflow = StateGraph(state_cls)
+    parallel_handler = getattr(handlers, "parallel", None)
+    parallel_routes = set(parallel_routes or ()) if parallel_handler else set()
 
     workflow.add_node("context_agent", handlers.context)
     workflow.add_node("router", handlers.router)
@@ -17,32 +50,34 @@ def build_workflow(state_cls, handlers, route_decision_fn):
     workflow.add_node("socratic_tutor", handlers.socratic)
     workflow.add_node("cognitive_enhancement", handlers.cognitive)
     workflow.add_node("synthesizer", handlers.synthesizer)
+    if parallel_routes:
+        workflow.add_node("parallel_agents", parallel_handler)
 
     workflow.set_entry_point("context_agent")
     workflow.add_edge("context_agent", "router")
 
-    workflow.add_conditional_edges(
-        "router",
-        route_decision_fn,
-        {
-            "progressive_opening": "synthesizer",
-            "topic_transition": "synthesizer",
-            "cognitive_intervention": "cognitive_enhancement",
-            "socratic_exploration": "socratic_tutor",
-            "design_guidance": "analysis_agent",
-            "multi_agent_comprehensive": "analysis_agent",
-            "knowledge_with_challenge": "analysis_agent",
-            "socratic_clarification": "socratic_tutor",
-            "supportive_scaffolding": "socratic_tutor",
-            "cognitive_challenge": "cognitive_enhancement",
-            "foundational_building": "socratic_tutor",
-            "balanced_guidance": "analysis_agent",
-            "knowledge_only": "domain_expert",
-            "socratic_focus": "analysis_agent",
-            "error": "synthesizer",  # CRITICAL FIX: Handle error route
-            "default": "analysis_agent",
-        },
-    )
+    router_path_map = {
+        "progressive_opening": "synthesizer",
+        "topic_transition": "synthesizer",
+        "cognitive_intervention": "cognitive_enhancement",
+        "socratic_exploration": "socratic_tutor",
+        "design_guidance": "analysis_agent",
+        "multi_agent_comprehensive": "analysis_agent",
+        "knowledge_with_challenge": "analysis_agent",
+        "socratic_clarification": "socratic_tutor",
+        "supportive_scaffolding": "socratic_tutor",
+        "cognitive_challenge": "cognitive_enhancement",
+        "foundational_building": "socratic_tutor",
+        "balanced_guidance": "analysis_agent",
+        "knowledge_only": "domain_expert",
+        "socratic_focus": "analysis_agent",
+        "error": "synthesizer",  # CRITICAL FIX: Handle error route
+        "default": "analysis_agent",
+    }
+    for route in parallel_routes:
+        router_path_map[route] = "parallel_agents"
+
+    workflow.add_conditional_edges("router", route_decision_fn, router_path_map)
 
     # After analysis
     def after_analysis_routing(state):
@@ -86,6 +121,8 @@ def build_workflow(state_cls, handlers, route_decision_fn):
     )
 
     workflow.add_edge("cognitive_enhancement", "synthesizer")
+    if parallel_routes:
+        workflow.add_edge("parallel_agents", "synthesizer")
     workflow.add_edge("synthesizer", END)
 
     return workflow.compile()
@@ -7,6 +7,7 @@ from orchestration.nodes.domain_expert import make_domain_expert_node
 from orchestration.nodes.socratic import make_socratic_node
 from orchestration.nodes.cognitive_enhancement import make_cognitive_enhancement_node
 from orchestration.nodes.synthesizer import make_synthesizer_node
+from orchestration.nodes.parallel import make_parallel_agents_node
 
 __all__ = [
     "make_context_node",
@@ -16,6 +17,7 @@ __all__ = [
     "make_socratic_node",
     "make_cognitive_enhancement_node",
     "make_synthesizer_node",
+    "make_parallel_agents_node",
 ]
 
 
@@ -12,8 +12,9 @@ def make_cognitive_enhancement_node(cognitive_agent, state_validator, state_moni
         state_monitor.record_state_change(state["student_state"], "cognitive_enhancement_node_input")
 
         student_state = state["student_state"]
-        analysis_result = state.get("analysis_result", {})
-        context_classification = state.get("student_classification", {})
+        # Copies: in fan-out mode other agents share these dicts; updates are returned instead
+        analysis_result = dict(state.get("analysis_result", {}) or {})
+        context_classification = dict(state.get("student_classification", {}) or {})
         routing_decision = state.get("routing_decision", {})
 
         enhancement_result = await cognitive_agent.provide_challenge(
@@ -40,7 +41,12 @@ def make_cognitive_enhancement_node(cognitive_agent, state_validator, state_moni
                 "error_message": "Result was not an AgentResponse or dict"
             }
 
-        result_state = {**state, "cognitive_enhancement_result": enhancement_result}
+        result_state = {
+            **state,
+            "analysis_result": analysis_result,
+            "student_classification": context_classification,
+            "cognitive_enhancement_result": enhancement_result,
+        }
 
         output_validation = state_validator.validate_state(result_state["student_state"])
         if not output_validation.is_valid:
@@ -12,7 +12,8 @@ def make_domain_expert_node(domain_expert, state_validator, state_monitor, logge
         state_monitor.record_state_change(state["student_state"], "domain_expert_node_input")
 
         student_state = state["student_state"]
-        analysis_result = state.get("analysis_result", {})
+        # Copies: in fan-out mode other agents share these dicts; updates are returned instead
+        analysis_result = dict(state.get("analysis_result", {}) or {})
 
         visual_analysis = analysis_result.get("visual_analysis", {})
         if visual_analysis and not visual_analysis.get("error"):
@@ -36,7 +37,7 @@ def make_domain_expert_node(domain_expert, state_validator, state_monitor, logge
         primary_gap = cognitive_flags[0].replace("needs_", "").replace("_guidance", "_awareness") if cognitive_flags else "brief_development"
 
         # Prepare required arguments according to DomainExpertAgent API
-        context_classification = state.get("student_classification", {}) or {}
+        context_classification = dict(state.get("student_classification", {}) or {})
         if primary_gap and isinstance(context_classification, dict):
             context_classification["primary_gap"] = primary_gap
         routing_decision = state.get("routing_decision", {}) or {}
@@ -101,7 +102,12 @@ def make_domain_expert_node(domain_expert, state_validator, state_monitor, logge
                 "error_message": "Result was not an AgentResponse or dict"
             }
 
-        result_state = {**state, "domain_expert_result": domain_result}
+        result_state = {
+            **state,
+            "analysis_result": analysis_result,
+            "student_classification": context_classification,
+            "domain_expert_result": domain_result,
+        }
 
         output_validation = state_validator.validate_state(result_state["student_state"])
         if not output_validation.is_valid:
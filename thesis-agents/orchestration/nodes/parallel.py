@@ -0,0 +1,98 @@
+import asyncio
+import time
+from typing import Callable, Dict, Any, Iterable, Mapping
+
+from orchestration.types import WorkflowState
+
+
+def _changed_keys(agent_input: Dict[str, Any], agent_output: Mapping[str, Any], merged_state: Dict[str, Any]) -> Dict[str, Any]:
+    """Keys the agent actually produced, ready to merge into the fan-in state.
+
+    Agents return copies of shared dicts (analysis_result, student_classification)
+    with their additions, so a dict-valued key is merged entry by entry onto the
+    current merged value; replacing the whole dict would drop entries written by
+    agents that ran concurrently.
+    """
+    updates: Dict[str, Any] = {}
+    for key, value in agent_output.items():
+        before = agent_input.get(key)
+        if before is value:
+            continue
+        if isinstance(value, dict) and isinstance(before, dict):
+            changed = {k: v for k, v in value.items() if k not in before or before[k] is not v}
+            if not changed:
+                continue
+            current = merged_state.get(key)
+            value = {**(current if isinstance(current, dict) else before), **changed}
+        updates[key] = value
+    return updates
+
+
+def make_parallel_agents_node(agent_handlers: Mapping[str, Callable], route_dependencies: Mapping[str, Mapping[str, Iterable[str]]], logger) -> Callable[[WorkflowState], WorkflowState]:
+    """Fan-out/fan-in node for multi-agent routes.
+
+    agent_handlers maps graph node names (analysis_agent, domain_expert, ...) to the
+    regular node handlers. route_dependencies maps a routing path to
+    {agent_name: (prerequisite agent names)}; every agent is started as soon as its
+    prerequisites have finished, so independent agents overlap instead of running
+    as a chain. The synthesizer joins on the merged state this node returns.
+    """
+
+    async def handler(state: WorkflowState) -> WorkflowState:
+        routing_path = (state.get("routing_decision", {}) or {}).get("path", "default")
+        dependencies = route_dependencies.get(routing_path)
+        if not dependencies:
+            logger.warning(f"No agent dependency map for route '{routing_path}', running full chain")
+            dependencies = {
+                "analysis_agent": (),
+                "domain_expert": ("analysis_agent",),
+                "socratic_tutor": ("domain_expert",),
+                "cognitive_enhancement": ("socratic_tutor",),
+            }
+
+        merged_state: Dict[str, Any] = dict(state)
+        tasks: Dict[str, asyncio.Task] = {}
+        timings: Dict[str, float] = {}
+
+        async def run_agent(agent_name: str) -> Dict[str, Any]:
+            prerequisites = tuple(dependencies.get(agent_name, ()))
+            if prerequisites:
+                await asyncio.gather(*(tasks[name] for name in prerequisites))
+
+            # Each agent sees the shared state plus the results of its prerequisites
+            agent_input = dict(merged_state)
+            started = time.time()
+            agent_output = await agent_handlers[agent_name](agent_input)
+            timings[agent_name] = time.time() - started
+
+            updates = _changed_keys(agent_input, agent_output, merged_state)
+            merged_state.update(updates)
+            return updates
+
+        unknown = [
+            name for name in {*dependencies, *(dep for deps in dependencies.values() for dep in deps)}
+            if name not in agent_handlers or name not in dependencies
+        ]
+        if unknown:
+            raise ValueError(f"Unknown agents in dependency map for '{routing_path}': {unknown}")
+
+        started = time.time()
+        for agent_name in dependencies:
+            tasks[agent_name] = asyncio.create_task(run_agent(agent_name))
+        try:
+            await asyncio.gather(*tasks.values())
+        except Exception:
+            for task in tasks.values():
+                task.cancel()
+            raise
+
+        wall_time = time.time() - started
+        logger.info(
+            f"Parallel agents for '{routing_path}' finished in {wall_time:.2f}s "
+            f"(sequential sum {sum(timings.values()):.2f}s): "
+            + ", ".join(f"{name}={elapsed:.2f}s" for name, elapsed in timings.items())
+        )
+        merged_state["agent_timings"] = {**timings, "wall_time": wall_time}
+        return merged_state
+
+    return handler
@@ -16,8 +16,9 @@ def make_socratic_node(socratic_agent, state_validator, state_monitor, logger) -
         agent_guidance = milestone_guidance.get("agent_guidance", {})
 
         student_state = state["student_state"]
-        analysis_result = state.get("analysis_result", {})
-        context_classification = state.get("student_classification", {})
+        # Copies: in fan-out mode other agents share these dicts; updates are returned instead
+        analysis_result = dict(state.get("analysis_result", {}) or {})
+        context_classification = dict(state.get("student_classification", {}) or {})
         domain_expert_result = state.get("domain_expert_result", {})
         
         # Add routing path and gamified behavior to context classification so Socratic tutor knows which route to use
@@ -104,7 +105,12 @@ def make_socratic_node(socratic_agent, state_validator, state_monitor, logger) -
                 "error_message": "Result was not an AgentResponse or dict"
             }
 
-        result_state = {**state, "socratic_result": socratic_result}
+        result_state = {
+            **state,
+            "analysis_result": analysis_result,
+            "student_classification": context_classification,
+            "socratic_result": socratic_result,
+        }
 
         output_validation = state_validator.validate_state(result_state["student_state"])
         if not output_validation.is_valid:
@@ -1,6 +1,7 @@
 from typing import Callable, Dict, Any, Tuple
 
 from orchestration.types import WorkflowState
+from orchestration.streaming import run_blocking
 
 
 def make_synthesizer_node(synthesize_fn, ensure_quality_fn, state_validator, state_monitor, logger) -> Callable[[WorkflowState], WorkflowState]:
@@ -18,7 +19,8 @@ def make_synthesizer_node(synthesize_fn, ensure_quality_fn, state_validator, sta
         # ALWAYS call synthesize_fn to ensure image enhancement is applied
         # The synthesize_fn will handle existing responses appropriately
         logger.info("✅ SYNTHESIZER_NODE: Calling synthesize_fn (always applies image enhancement)")
-        final_response, metadata = synthesize_fn(state)
+        # Off-loop only while streaming, so token events can reach the consumer
+        final_response, metadata = await run_blocking(synthesize_fn, state)
         logger.info(f"🔍 SYNTHESIZER_NODE: Synthesized response length: {len(final_response)}")
         logger.info(f"🔍 SYNTHESIZER_NODE: Synthesized response preview: {final_response[:200]}...")
 
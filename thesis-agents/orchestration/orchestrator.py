@@ -7,7 +7,7 @@ from typing import Any, Dict, List, Optional
 from langgraph.graph import StateGraph
 
 from orchestration.types import WorkflowState
-from orchestration.graph_builder import build_workflow
+from orchestration.graph_builder import build_workflow, ROUTE_AGENT_DEPENDENCIES
 from orchestration.nodes import (
     make_context_node,
     make_router_node,
@@ -16,8 +16,16 @@ from orchestration.nodes import (
     make_socratic_node,
     make_cognitive_enhancement_node,
     make_synthesizer_node,
+    make_parallel_agents_node,
 )
 from orchestration.synthesis import build_synthesizer
+from orchestration.streaming import (
+    STAGE_MESSAGES,
+    StreamSink,
+    activate_sink,
+    create_completion_text,
+    deactivate_sink,
+)
 
 
 class LangGraphOrchestrator:
@@ -92,8 +100,23 @@ class LangGraphOrchestrator:
         handlers.cognitive = cognitive_h
         handlers.synthesizer = synthesizer_h
 
+        # Fan-out/fan-in node for multi-agent routes
+        parallel_routes = []
+        if getattr(self.config, "PARALLEL_AGENT_EXECUTION", False):
+            handlers.parallel = make_parallel_agents_node(
+                {
+                    "analysis_agent": analysis_h,
+                    "domain_expert": domain_h,
+                    "socratic_tutor": socratic_h,
+                    "cognitive_enhancement": cognitive_h,
+                },
+                ROUTE_AGENT_DEPENDENCIES,
+                self.logger,
+            )
+            parallel_routes = list(ROUTE_AGENT_DEPENDENCIES)
+
         # Build workflow
-        self.workflow = build_workflow(WorkflowState, handlers, self.route_decision)
+        self.workflow = build_workflow(WorkflowState, handlers, self.route_decision, parallel_routes)
 
         # Expose handlers for legacy helper methods (execute_agent_sequence)
         self.handlers = handlers
@@ -693,15 +716,15 @@ class LangGraphOrchestrator:
 
 
             try:
-                import openai
-                client = openai.OpenAI()
-                synthesis_response = client.chat.completions.create(
+                from utils.client_manager import get_shared_client
+                client = get_shared_client()
+                synthesized_text = create_completion_text(
+                    client,
                     model="gpt-4o",
                     messages=[{"role": "user", "content": synthesis_prompt}],
                     max_tokens=800,
                     temperature=0.7
-                )
-                synthesized_text = synthesis_response.choices[0].message.content.strip()
+                ).strip()
                 # Apply simple paragraph formatting without changing content balance
                 formatted_text = self._format_response_for_readability(synthesized_text)
                 return formatted_text, "multi_agent_comprehensive"
@@ -787,15 +810,15 @@ class LangGraphOrchestrator:
 
                 """
 
-                import openai
-                client = openai.OpenAI()
-                synthesis_response = client.chat.completions.create(
+                from utils.client_manager import get_shared_client
+                client = get_shared_client()
+                synthesized_text = create_completion_text(
+                    client,
                     model="gpt-4o",
                     messages=[{"role": "user", "content": synthesis_prompt}],
                     max_tokens=1000,
                     temperature=0.7
-                )
-                synthesized_text = synthesis_response.choices[0].message.content.strip() if synthesis_response.choices[0].message.content else ""
+                ).strip()
                 formatted_text = self._format_response_for_readability(synthesized_text)
                 return formatted_text, "socratic_clarification"
             except Exception as e:
@@ -879,8 +902,8 @@ class LangGraphOrchestrator:
                 # This should weave questions throughout the content, not dump them at the end
 
                 try:
-                    import openai
-                    client = openai.OpenAI()
+                    from utils.client_manager import get_shared_client
+                    client = get_shared_client()
 
                     synthesis_prompt = f"""
                     You are an expert architectural educator providing in-depth knowledge with integrated questioning.
@@ -918,13 +941,13 @@ class LangGraphOrchestrator:
                     Write a comprehensive educational response that teaches advanced architectural knowledge while challenging their thinking throughout.
                     """
 
-                    synthesis_response = client.chat.completions.create(
+                    synthesized_text = create_completion_text(
+                        client,
                         model="gpt-4o",
                         messages=[{"role": "user", "content": synthesis_prompt}],
                         max_tokens=600,
                         temperature=0.7
-                    )
-                    synthesized_text = synthesis_response.choices[0].message.content.strip()
+                    ).strip()
 
                     # Apply paragraph formatting to ensure proper structure
                     formatted_text = self._format_response_for_readability(synthesized_text)
@@ -1361,6 +1384,74 @@ class LangGraphOrchestrator:
         import time
         start_time = time.time()
 
+        initial_state = self._prepare_initial_state(student_state)
+
+        print(f"\n🔄 Processing through agent workflow...")
+        final_state = await self.workflow.ainvoke(initial_state)
+
+        return self._finalize_result(initial_state, final_state, start_time)
+
+    async def astream_student_input(self, student_state):
+        """Streaming variant of process_student_input.
+
+        Async generator yielding progress events as graph nodes finish, synthesizer
+        tokens as the model produces them, and finally one {"type": "final"} event
+        carrying the same dict process_student_input returns (response, metadata,
+        routing, gamification). Errors are reported as {"type": "error"} events.
+        See orchestration.streaming for the event shapes.
+        """
+        import asyncio
+        import time
+        start_time = time.time()
+
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        sink = StreamSink(loop, queue)
+        finished = object()
+
+        async def run_workflow():
+            try:
+                initial_state = self._prepare_initial_state(student_state)
+                final_state = dict(initial_state)
+
+                print(f"\n🔄 Streaming through agent workflow...")
+                async for update in self.workflow.astream(initial_state, stream_mode="updates"):
+                    for node_name, node_state in update.items():
+                        if isinstance(node_state, dict):
+                            final_state.update(node_state)
+                        sink.emit({
+                            "type": "progress",
+                            "stage": node_name,
+                            "message": STAGE_MESSAGES.get(node_name, node_name),
+                        })
+
+                result = self._finalize_result(initial_state, final_state, start_time)
+                sink.emit({"type": "final", "result": result})
+            except Exception as e:
+                self.logger.error(f"Streaming workflow failed: {e}")
+                sink.emit({"type": "error", "error": str(e)})
+            finally:
+                queue.put_nowait(finished)
+
+        # The workflow task inherits the active sink; this generator's context does not keep it
+        token = activate_sink(sink)
+        try:
+            task = asyncio.create_task(run_workflow())
+        finally:
+            deactivate_sink(token)
+
+        try:
+            while True:
+                event = await queue.get()
+                if event is finished:
+                    break
+                yield event
+        finally:
+            if not task.done():
+                task.cancel()
+
+    def _prepare_initial_state(self, student_state) -> WorkflowState:
+        """Update conversation progression and build the initial workflow state for one turn."""
         # Get user input first
         user_messages = [m for m in student_state.messages if m.get("role") == "user"]
 
@@ -1422,9 +1513,13 @@ class LangGraphOrchestrator:
             conversation_progression=progression_analysis,
             milestone_guidance=milestone_guidance,
         )
+        return initial_state
 
-        print(f"\n🔄 Processing through agent workflow...")
-        final_state = await self.workflow.ainvoke(initial_state)
+    def _finalize_result(self, initial_state: WorkflowState, final_state: Dict[str, Any], start_time: float) -> Dict[str, Any]:
+        """Build the caller-facing result dict from the final workflow state."""
+        import time
+        progression_analysis = initial_state.get("conversation_progression", {})
+        milestone_guidance = initial_state.get("milestone_guidance", {})
 
         processing_time = time.time() - start_time
         self.logger.info(f"Workflow completed in {processing_time:.2f}s")
@@ -1935,8 +2030,8 @@ The question should help them think about HOW to use this knowledge in their des
 Generate only the question (no introduction, no explanation):
 """
 
-            import openai
-            client = openai.OpenAI()
+            from utils.client_manager import get_shared_client
+            client = get_shared_client()
             response = client.chat.completions.create(
                 model="gpt-4o",
                 messages=[{"role": "user", "content": prompt}],
@@ -1990,8 +2085,8 @@ Format:
 Generate the synthesis section only (starting with "**Key Insights from These Examples:**"):
 """
 
-            import openai
-            client = openai.OpenAI()
+            from utils.client_manager import get_shared_client
+            client = get_shared_client()
             response = client.chat.completions.create(
                 model="gpt-4o",
                 messages=[{"role": "user", "content": prompt}],
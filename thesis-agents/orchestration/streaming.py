@@ -0,0 +1,131 @@
+"""Streaming support for the orchestrator.
+
+`LangGraphOrchestrator.astream_student_input` installs a StreamSink for the
+duration of one turn. Code anywhere below it (graph nodes, synthesis helpers,
+even code running on a worker thread) can push events to the sink without
+knowing whether anyone is listening; without an active sink every helper
+here degrades to the plain, non-streaming behavior.
+
+Event shapes yielded to the caller:
+    {"type": "progress", "stage": <node name>, "message": <label>}
+    {"type": "token", "text": <delta>}
+    {"type": "final", "result": <same dict as process_student_input>}
+    {"type": "error", "error": <message>}
+"""
+
+import asyncio
+import contextvars
+import threading
+from typing import Any, Callable, Dict, Optional
+
+
+# Human-readable labels for node completion events
+STAGE_MESSAGES = {
+    "context_agent": "Understanding your message",
+    "router": "Choosing how to respond",
+    "analysis_agent": "Analyzing your design",
+    "domain_expert": "Gathering architectural knowledge",
+    "socratic_tutor": "Preparing guiding questions",
+    "cognitive_enhancement": "Designing a thinking challenge",
+    "parallel_agents": "Consulting specialist agents",
+    "synthesizer": "Composing the response",
+}
+
+
+class StreamSink:
+    """Thread-safe bridge from producers to the async consumer of one turn."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, queue: asyncio.Queue):
+        self.loop = loop
+        self.queue = queue
+        self.tokens_emitted = 0
+
+    def emit(self, event: Dict[str, Any]) -> None:
+        if event.get("type") == "token":
+            self.tokens_emitted += 1
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self.loop:
+            self.queue.put_nowait(event)
+        else:
+            self.loop.call_soon_threadsafe(self.queue.put_nowait, event)
+
+
+_active_sink: contextvars.ContextVar[Optional[StreamSink]] = contextvars.ContextVar(
+    "orchestration_stream_sink", default=None
+)
+
+
+def get_active_sink() -> Optional[StreamSink]:
+    return _active_sink.get()
+
+
+def activate_sink(sink: StreamSink) -> contextvars.Token:
+    return _active_sink.set(sink)
+
+
+def deactivate_sink(token: contextvars.Token) -> None:
+    _active_sink.reset(token)
+
+
+def emit_event(event: Dict[str, Any]) -> None:
+    """Push an event to the active sink, if any."""
+    sink = _active_sink.get()
+    if sink is not None:
+        sink.emit(event)
+
+
+def create_completion_text(client, **kwargs) -> str:
+    """Run a sync chat completion and return its text, streaming tokens when a sink is active.
+
+    Drop-in for `client.chat.completions.create(...).choices[0].message.content`
+    in synthesis code: the full text is still returned, so post-processing is
+    unchanged, but listeners see tokens as soon as the model produces them.
+    """
+    sink = _active_sink.get()
+    if sink is None:
+        response = client.chat.completions.create(**kwargs)
+        return response.choices[0].message.content or ""
+
+    parts = []
+    for chunk in client.chat.completions.create(stream=True, **kwargs):
+        if not chunk.choices:
+            continue
+        delta = chunk.choices[0].delta.content
+        if delta:
+            parts.append(delta)
+            sink.emit({"type": "token", "text": delta})
+    return "".join(parts)
+
+
+async def run_blocking(fn: Callable, *args, **kwargs):
+    """Run blocking synthesis code off the event loop while a stream is active.
+
+    Keeps the loop free to deliver token events while `fn` waits on the network.
+    The Streamlit script context is attached to the worker thread so code that
+    touches st.session_state keeps working. Without an active sink `fn` runs
+    inline, exactly as before.
+    """
+    if _active_sink.get() is None:
+        return fn(*args, **kwargs)
+
+    script_ctx = None
+    try:
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+        script_ctx = get_script_run_ctx()
+    except Exception:
+        pass
+
+    def call():
+        if script_ctx is not None:
+            try:
+                from streamlit.runtime.scriptrunner import add_script_run_ctx
+                add_script_run_ctx(threading.current_thread(), script_ctx)
+            except Exception:
+                pass
+        return fn(*args, **kwargs)
+
+    # asyncio.to_thread copies contextvars, so the sink stays visible in `fn`
+    return await asyncio.to_thread(call)
@@ -34,6 +34,7 @@ class WorkflowState(TypedDict):
     domain_expert_result: Dict[str, Any]
     socratic_result: Dict[str, Any]
     cognitive_enhancement_result: Dict[str, Any]
+    agent_timings: Dict[str, float]
 
     # Conversation progression
     conversation_progression: Dict[str, Any]
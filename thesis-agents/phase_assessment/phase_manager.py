@@ -9,9 +9,9 @@ from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
 import os
-from openai import OpenAI
 
 from state_manager import ArchMentorState
+from utils.client_manager import get_shared_client, achat_completion
 
 
 class DesignPhase(Enum):
@@ -62,7 +62,7 @@ class PhaseAssessmentManager:
     """
     
     def __init__(self):
-        self.client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        self.client = get_shared_client()
         
         # Phase weights from phase_based.txt
         self.phase_weights = {
@@ -281,7 +281,7 @@ class PhaseAssessmentManager:
             RESPONSE: Write only the question, no explanations or formatting.
             """
             
-            response = self.client.chat.completions.create(
+            response = await achat_completion(
                 model="gpt-4o",
                 messages=[{"role": "user", "content": prompt}],
                 max_tokens=150,
@@ -392,11 +392,12 @@ class PhaseAssessmentManager:
         """
         
         try:
-            response = self.client.chat.completions.create(
+            response = await achat_completion(
                 model="gpt-4o",
                 messages=[{"role": "user", "content": prompt}],
                 max_tokens=200,
-                temperature=0.1
+                temperature=0.1,
+                cache=True
             )
             
             # Parse the JSON response
@@ -444,7 +445,7 @@ class PhaseAssessmentManager:
         """
         
         try:
-            response = self.client.chat.completions.create(
+            response = await achat_completion(
                 model="gpt-4o",
                 messages=[{"role": "user", "content": prompt}],
                 max_tokens=200,
@@ -1,11 +1,22 @@
 """
 Shared OpenAI client manager to avoid multiple client instances per agent.
+
+Provides a pooled synchronous client for the remaining sync call sites and a
+pooled ``AsyncOpenAI`` client for coroutines, so agents running concurrently
+actually overlap on the network instead of blocking the event loop.
 """
 
-from typing import Optional
+from typing import Any, Dict, Optional
+import asyncio
 import os
 import threading
-from openai import OpenAI
+import weakref
+
+import httpx
+from openai import AsyncOpenAI, OpenAI
+from openai.types.chat import ChatCompletion
+
+from .llm_cache import get_llm_cache, make_cache_key
 
 try:
     from .secrets_manager import get_openai_api_key
@@ -14,10 +25,37 @@ except ImportError:
     def get_openai_api_key() -> str:
         return os.getenv("OPENAI_API_KEY", "")
 
+# Connection pool and timeout settings (overridable via environment)
+MAX_CONNECTIONS = int(os.getenv("LLM_MAX_CONNECTIONS", "20"))
+MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("LLM_MAX_KEEPALIVE_CONNECTIONS", "10"))
+KEEPALIVE_EXPIRY = float(os.getenv("LLM_KEEPALIVE_EXPIRY", "30"))
+REQUEST_TIMEOUT = float(os.getenv("LLM_REQUEST_TIMEOUT", "60"))
+CONNECT_TIMEOUT = float(os.getenv("LLM_CONNECT_TIMEOUT", "10"))
+MAX_RETRIES = int(os.getenv("LLM_MAX_RETRIES", "2"))
+
+# Maximum in-flight requests per model; models not listed use the default
+MODEL_CONCURRENCY_LIMITS: Dict[str, int] = {
+    "gpt-4o": 8,
+    "gpt-4o-mini": 16,
+}
+DEFAULT_MODEL_CONCURRENCY = int(os.getenv("LLM_DEFAULT_MODEL_CONCURRENCY", "8"))
+
 _client_lock = threading.Lock()
 _shared_client: Optional[OpenAI] = None
 
 
+def _pool_limits() -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=MAX_CONNECTIONS,
+        max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=KEEPALIVE_EXPIRY,
+    )
+
+
+def _timeout() -> httpx.Timeout:
+    return httpx.Timeout(REQUEST_TIMEOUT, connect=CONNECT_TIMEOUT)
+
+
 def get_shared_client() -> OpenAI:
     """Return a singleton OpenAI client configured from secrets manager.
 
@@ -29,7 +67,128 @@ def get_shared_client() -> OpenAI:
         with _client_lock:
             if _shared_client is None:
                 api_key = get_openai_api_key()
-                _shared_client = OpenAI(api_key=api_key)
+                _shared_client = OpenAI(
+                    api_key=api_key,
+                    timeout=_timeout(),
+                    max_retries=MAX_RETRIES,
+                    http_client=httpx.Client(limits=_pool_limits(), timeout=_timeout()),
+                )
     return _shared_client
 
 
+class _AsyncClientState:
+    """Async client and per-model semaphores bound to one event loop."""
+
+    def __init__(self):
+        self.client = AsyncOpenAI(
+            api_key=get_openai_api_key(),
+            timeout=_timeout(),
+            max_retries=MAX_RETRIES,
+            http_client=httpx.AsyncClient(limits=_pool_limits(), timeout=_timeout()),
+        )
+        self.semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    def semaphore_for(self, model: str) -> asyncio.Semaphore:
+        if model not in self.semaphores:
+            limit = MODEL_CONCURRENCY_LIMITS.get(model, DEFAULT_MODEL_CONCURRENCY)
+            self.semaphores[model] = asyncio.Semaphore(limit)
+        return self.semaphores[model]
+
+
+# httpx async connections and asyncio semaphores belong to the loop that created
+# them. Streamlit runs each turn in a fresh loop (asyncio.run), so keep one
+# state per loop; callers that own a loop close its client before the loop ends
+# (run_with_async_client / aclose_async_client) instead of leaving the pool to GC.
+_async_states: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _AsyncClientState]" = weakref.WeakKeyDictionary()
+
+
+def _get_async_state() -> _AsyncClientState:
+    loop = asyncio.get_running_loop()
+    with _client_lock:
+        state = _async_states.get(loop)
+        if state is None:
+            state = _AsyncClientState()
+            _async_states[loop] = state
+    return state
+
+
+def get_async_client() -> AsyncOpenAI:
+    """Return the pooled AsyncOpenAI client for the running event loop.
+
+    Must be called from inside a coroutine. The client keeps a bounded pool of
+    keep-alive connections that is shared by every agent running on the loop.
+    """
+    return _get_async_state().client
+
+
+def _cache_lookup(cache: bool, model: str, messages: Any, kwargs: Dict[str, Any]):
+    """Return (cache, key, cached response) for a request; cache is None when not caching."""
+    response_cache = get_llm_cache() if cache and not kwargs.get("stream") else None
+    if response_cache is None:
+        return None, None, None
+    key = make_cache_key(
+        model, messages, kwargs.get("temperature"), kwargs.get("max_tokens"),
+        **{k: v for k, v in kwargs.items() if k not in ("temperature", "max_tokens")},
+    )
+    payload = response_cache.get(key)
+    return response_cache, key, ChatCompletion.model_validate(payload) if payload is not None else None
+
+
+def _cache_store(response_cache, key: str, model: str, response) -> None:
+    if response_cache is not None and isinstance(response, ChatCompletion):
+        response_cache.set(key, response.model_dump(mode="json"), model=model)
+
+
+async def achat_completion(model: str, messages: Any, timeout: Optional[float] = None,
+                           cache: bool = False, **kwargs):
+    """Awaitable drop-in for ``client.chat.completions.create``.
+
+    Waits for a slot in the per-model concurrency limit (per event loop), then issues the request
+    on the shared async client. Returns the same response object as the sync API.
+
+    With cache=True the response is looked up in (and stored to) the persistent LLM
+    response cache first; use it for deterministic, low-temperature calls only.
+    """
+    response_cache, key, cached = _cache_lookup(cache, model, messages, kwargs)
+    if cached is not None:
+        return cached
+
+    state = _get_async_state()
+    async with state.semaphore_for(model):
+        response = await state.client.chat.completions.create(
+            model=model,
+            messages=messages,
+            timeout=timeout if timeout is not None else _timeout(),
+            **kwargs,
+        )
+    _cache_store(response_cache, key, model, response)
+    return response
+
+
+def cached_chat_completion(client: OpenAI, model: str, messages: Any, cache: bool = True, **kwargs):
+    """Sync counterpart of ``achat_completion(..., cache=True)`` for an existing client."""
+    response_cache, key, cached = _cache_lookup(cache, model, messages, kwargs)
+    if cached is not None:
+        return cached
+    response = client.chat.completions.create(model=model, messages=messages, **kwargs)
+    _cache_store(response_cache, key, model, response)
+    return response
+
+
+async def aclose_async_client() -> None:
+    """Close the async client bound to the running loop (call before the loop ends)."""
+    loop = asyncio.get_running_loop()
+    with _client_lock:
+        state = _async_states.pop(loop, None)
+    if state is not None:
+        await state.client.close()
+
+
+def run_with_async_client(coro):
+    """``asyncio.run(coro)`` that closes the loop's pooled async client before the loop ends."""
+    async def main():
+        try:
+            return await coro
+        finally:
+            await aclose_async_client()
+    return asyncio.run(main())
@@ -0,0 +1,246 @@
+"""
+Content-addressed cache for LLM responses.
+
+Responses are keyed by a hash of the request (model, messages, temperature,
+max_tokens and any other generation parameters) and kept in two tiers:
+
+- an in-process LRU for repeated calls within one run
+- a SQLite file on disk, so deterministic calls (classification, grading,
+  building-type detection) are answered across sessions and restarts
+
+Both tiers honour a TTL. The disk tier is additionally bounded by size and
+evicts least recently used entries first. Callers opt in per call, see
+``utils.client_manager.achat_completion(..., cache=True)``.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+# Cache settings (overridable via environment)
+CACHE_PATH = os.getenv("LLM_CACHE_PATH", os.path.join("cache", "llm_responses.sqlite3"))
+CACHE_TTL_SECONDS = float(os.getenv("LLM_CACHE_TTL_SECONDS", str(7 * 24 * 3600)))
+CACHE_MEMORY_ENTRIES = int(os.getenv("LLM_CACHE_MEMORY_ENTRIES", "512"))
+CACHE_MAX_DISK_MB = float(os.getenv("LLM_CACHE_MAX_DISK_MB", "100"))
+CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "true").lower() not in ("0", "false", "no")
+
+# Check the disk size limit every N writes rather than on every insert
+_EVICTION_CHECK_INTERVAL = 50
+
+
+def make_cache_key(model: str, messages: Any, temperature: Optional[float] = None,
+                   max_tokens: Optional[int] = None, **params) -> str:
+    """Stable SHA-256 key for a chat completion request.
+
+    Extra generation parameters (tools, response_format, top_p, ...) are part
+    of the key so requests that differ only in those never share an entry.
+    """
+    payload = {
+        "model": model,
+        "messages": messages,
+        "temperature": temperature,
+        "max_tokens": max_tokens,
+        "params": {k: v for k, v in params.items() if v is not None},
+    }
+    encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """Two-tier (memory LRU + SQLite) cache of JSON-serializable LLM responses."""
+
+    def __init__(self, db_path: str = CACHE_PATH, ttl_seconds: float = CACHE_TTL_SECONDS,
+                 memory_entries: int = CACHE_MEMORY_ENTRIES, max_disk_mb: float = CACHE_MAX_DISK_MB):
+        """
+        Args:
+            db_path: SQLite file for the persistent tier (None keeps the cache in memory only)
+            ttl_seconds: Entries older than this are treated as misses and removed
+            memory_entries: Capacity of the in-process LRU tier
+            max_disk_mb: Size budget of the on-disk tier
+        """
+        self.ttl_seconds = ttl_seconds
+        self.memory_entries = memory_entries
+        self.max_disk_bytes = int(max_disk_mb * 1024 * 1024)
+
+        self._memory: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._writes_since_check = 0
+        self._stats = {
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "writes": 0,
+            "expired": 0,
+            "evicted": 0,
+        }
+
+        self._conn: Optional[sqlite3.Connection] = None
+        if db_path:
+            try:
+                Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+                self._conn = sqlite3.connect(db_path, check_same_thread=False, timeout=5)
+                self._conn.execute("PRAGMA journal_mode=WAL")
+                self._conn.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS llm_responses (
+                        key TEXT PRIMARY KEY,
+                        model TEXT,
+                        payload TEXT NOT NULL,
+                        size INTEGER NOT NULL,
+                        created_at REAL NOT NULL,
+                        last_access REAL NOT NULL
+                    )
+                    """
+                )
+                self._conn.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_llm_responses_last_access ON llm_responses(last_access)"
+                )
+                self._conn.commit()
+            except sqlite3.Error as e:
+                print(f"⚠️ LLM cache: disk tier unavailable ({e}), using memory only")
+                self._conn = None
+
+    def _is_expired(self, created_at: float, now: float) -> bool:
+        return self.ttl_seconds > 0 and now - created_at > self.ttl_seconds
+
+    def _remember(self, key: str, value: Any, created_at: float) -> None:
+        self._memory[key] = (value, created_at)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for key, or None on a miss."""
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                value, created_at = entry
+                if not self._is_expired(created_at, now):
+                    self._memory.move_to_end(key)
+                    self._stats["memory_hits"] += 1
+                    return value
+                del self._memory[key]
+                self._stats["expired"] += 1
+
+            if self._conn is not None:
+                try:
+                    row = self._conn.execute(
+                        "SELECT payload, created_at FROM llm_responses WHERE key = ?", (key,)
+                    ).fetchone()
+                    if row is not None:
+                        payload, created_at = row
+                        if self._is_expired(created_at, now):
+                            self._conn.execute("DELETE FROM llm_responses WHERE key = ?", (key,))
+                            self._conn.commit()
+                            self._stats["expired"] += 1
+                        else:
+                            self._conn.execute(
+                                "UPDATE llm_responses SET last_access = ? WHERE key = ?", (now, key)
+                            )
+                            self._conn.commit()
+                            value = json.loads(payload)
+                            self._remember(key, value, created_at)
+                            self._stats["disk_hits"] += 1
+                            return value
+                except (sqlite3.Error, ValueError) as e:
+                    print(f"⚠️ LLM cache read failed: {e}")
+
+            self._stats["misses"] += 1
+            return None
+
+    def set(self, key: str, value: Any, model: Optional[str] = None) -> None:
+        """Store a JSON-serializable value under key in both tiers."""
+        now = time.time()
+        with self._lock:
+            self._remember(key, value, now)
+            self._stats["writes"] += 1
+            if self._conn is None:
+                return
+            try:
+                payload = json.dumps(value, ensure_ascii=False)
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO llm_responses (key, model, payload, size, created_at, last_access) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, model, payload, len(payload.encode("utf-8")), now, now),
+                )
+                self._conn.commit()
+                self._writes_since_check += 1
+                if self._writes_since_check >= _EVICTION_CHECK_INTERVAL:
+                    self._writes_since_check = 0
+                    self._evict(now)
+            except (sqlite3.Error, TypeError, ValueError) as e:
+                print(f"⚠️ LLM cache write failed: {e}")
+
+    def _evict(self, now: float) -> None:
+        """Drop expired rows, then least recently used rows until under the size budget."""
+        if self.ttl_seconds > 0:
+            cursor = self._conn.execute(
+                "DELETE FROM llm_responses WHERE created_at < ?", (now - self.ttl_seconds,)
+            )
+            self._stats["expired"] += max(cursor.rowcount, 0)
+
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM llm_responses").fetchone()[0]
+        if total > self.max_disk_bytes:
+            excess = total - self.max_disk_bytes
+            freed = 0
+            doomed = []
+            for key, size in self._conn.execute("SELECT key, size FROM llm_responses ORDER BY last_access"):
+                doomed.append((key,))
+                freed += size
+                if freed >= excess:
+                    break
+            self._conn.executemany("DELETE FROM llm_responses WHERE key = ?", doomed)
+            self._stats["evicted"] += len(doomed)
+        self._conn.commit()
+
+    def evict(self) -> None:
+        """Run TTL and size eviction on the disk tier now."""
+        with self._lock:
+            if self._conn is not None:
+                self._evict(time.time())
+
+    def clear(self) -> None:
+        """Remove every entry from both tiers."""
+        with self._lock:
+            self._memory.clear()
+            if self._conn is not None:
+                self._conn.execute("DELETE FROM llm_responses")
+                self._conn.commit()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters plus current tier sizes."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["memory_entries"] = len(self._memory)
+            if self._conn is not None:
+                count, size = self._conn.execute(
+                    "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM llm_responses"
+                ).fetchone()
+                stats["disk_entries"] = count
+                stats["disk_bytes"] = size
+        lookups = stats["memory_hits"] + stats["disk_hits"] + stats["misses"]
+        stats["hit_rate"] = (stats["memory_hits"] + stats["disk_hits"]) / lookups if lookups else 0.0
+        return stats
+
+
+_cache_lock = threading.Lock()
+_shared_cache: Optional[LLMResponseCache] = None
+
+
+def get_llm_cache() -> Optional[LLMResponseCache]:
+    """Return the process-wide response cache, or None when LLM_CACHE_ENABLED is off."""
+    global _shared_cache
+    if not CACHE_ENABLED:
+        return None
+    if _shared_cache is None:
+        with _cache_lock:
+            if _shared_cache is None:
+                _shared_cache = LLMResponseCache()
+    return _shared_cache
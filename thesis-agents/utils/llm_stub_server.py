@@ -0,0 +1,163 @@
+"""
+Local OpenAI-compatible stub server for exercising the LLM client layer offline.
+
+Implements ``POST /v1/chat/completions`` (plain and ``stream: true``) with a
+configurable artificial latency, so concurrency, pooling and streaming can be
+checked without network access or an API key.
+
+Usage:
+    python utils/llm_stub_server.py --port 8765 --delay 1.0
+    OPENAI_BASE_URL=http://127.0.0.1:8765/v1 OPENAI_API_KEY=stub streamlit run mentor.py
+
+Or from Python:
+    server, base_url = start_stub_server(delay=0.5)
+    os.environ["OPENAI_BASE_URL"] = base_url
+    ...
+    server.shutdown()
+"""
+
+import argparse
+import json
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Tuple
+
+
+DEFAULT_REPLY = "This is a stub response from the local LLM server."
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, so connection pooling is observable
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def do_POST(self):
+        if not self.path.rstrip("/").endswith("/chat/completions"):
+            self._send_json(404, {"error": {"message": f"Unknown path {self.path}"}})
+            return
+
+        length = int(self.headers.get("Content-Length", 0))
+        try:
+            body = json.loads(self.rfile.read(length) or b"{}")
+        except json.JSONDecodeError:
+            self._send_json(400, {"error": {"message": "Invalid JSON body"}})
+            return
+
+        with self.server.stats_lock:
+            self.server.request_count += 1
+            self.server.in_flight += 1
+            self.server.max_in_flight = max(self.server.max_in_flight, self.server.in_flight)
+        try:
+            time.sleep(self.server.delay)
+            model = body.get("model", "stub-model")
+            reply = self.server.reply
+            if body.get("stream"):
+                self._send_stream(model, reply)
+            else:
+                self._send_json(200, _completion_payload(model, reply))
+        finally:
+            with self.server.stats_lock:
+                self.server.in_flight -= 1
+
+    def _send_json(self, status: int, payload: dict):
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _send_stream(self, model: str, reply: str):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        completion_id = f"chatcmpl-{uuid.uuid4().hex[:12]}"
+        words = reply.split(" ")
+        for i, word in enumerate(words):
+            token = word if i == 0 else " " + word
+            chunk = _chunk_payload(completion_id, model, {"content": token}, None)
+            self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode("utf-8"))
+            self.wfile.flush()
+            time.sleep(self.server.token_delay)
+        final = _chunk_payload(completion_id, model, {}, "stop")
+        self.wfile.write(f"data: {json.dumps(final)}\n\ndata: [DONE]\n\n".encode("utf-8"))
+        self.wfile.flush()
+        self.close_connection = True
+
+
+def _completion_payload(model: str, reply: str) -> dict:
+    return {
+        "id": f"chatcmpl-{uuid.uuid4().hex[:12]}",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": model,
+        "choices": [{
+            "index": 0,
+            "message": {"role": "assistant", "content": reply},
+            "finish_reason": "stop",
+        }],
+        "usage": {"prompt_tokens": 0, "completion_tokens": len(reply.split()), "total_tokens": len(reply.split())},
+    }
+
+
+def _chunk_payload(completion_id: str, model: str, delta: dict, finish_reason) -> dict:
+    return {
+        "id": completion_id,
+        "object": "chat.completion.chunk",
+        "created": int(time.time()),
+        "model": model,
+        "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+    }
+
+
+def start_stub_server(host: str = "127.0.0.1", port: int = 0, delay: float = 0.5,
+                      token_delay: float = 0.02, reply: str = DEFAULT_REPLY,
+                      verbose: bool = False) -> Tuple[ThreadingHTTPServer, str]:
+    """Start the stub server on a daemon thread and return (server, base_url).
+
+    port=0 picks a free port. ``server.request_count`` and ``server.max_in_flight``
+    show how many requests arrived and how many overlapped.
+    """
+    server = ThreadingHTTPServer((host, port), _StubHandler)
+    server.daemon_threads = True
+    server.delay = delay
+    server.token_delay = token_delay
+    server.reply = reply
+    server.verbose = verbose
+    server.stats_lock = threading.Lock()
+    server.request_count = 0
+    server.in_flight = 0
+    server.max_in_flight = 0
+
+    thread = threading.Thread(target=server.serve_forever, name="llm-stub-server", daemon=True)
+    thread.start()
+    bound_host, bound_port = server.server_address[:2]
+    return server, f"http://{bound_host}:{bound_port}/v1"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local OpenAI-compatible stub server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--delay", type=float, default=0.5, help="Seconds to wait before answering")
+    parser.add_argument("--token-delay", type=float, default=0.02, help="Seconds between streamed tokens")
+    parser.add_argument("--reply", default=DEFAULT_REPLY)
+    args = parser.parse_args()
+
+    server, base_url = start_stub_server(args.host, args.port, args.delay, args.token_delay, args.reply, verbose=True)
+    print(f"LLM stub server listening on {base_url}")
+    print(f"Set OPENAI_BASE_URL={base_url} and OPENAI_API_KEY=stub to use it")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
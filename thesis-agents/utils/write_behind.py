@@ -0,0 +1,219 @@
+"""
+Write-behind queue for thesis_data persistence.
+
+Session logs, linkography snapshots, image analysis records, session saves and
+Dropbox uploads are handed to one bounded queue and executed by a dedicated
+writer thread, so the Streamlit script thread never waits on disk or network
+while rendering a reply.
+
+- Ordering: tasks run one at a time in submission order.
+- Coalescing: tasks submitted with a ``key`` (e.g. the path of a snapshot file
+  that is rewritten on every move) replace a still-pending task with the same
+  key instead of queueing another write.
+- Backpressure: when the queue is full, ``submit`` blocks until there is room
+  (warning once WRITE_BEHIND_PUT_TIMEOUT has passed), so a slow disk slows the
+  producer down instead of dropping or reordering writes.
+- Drain: ``drain()`` waits for everything queued so far (call it at session
+  end / before exporting); the queue is also drained at interpreter exit.
+
+Usage:
+    from utils.write_behind import submit_write
+    submit_write(write_json, path, data, key=path)
+"""
+
+import atexit
+import os
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Optional
+
+# Queue settings (overridable via environment)
+WRITE_BEHIND_ENABLED = os.getenv("WRITE_BEHIND_ENABLED", "true").lower() not in ("0", "false", "no")
+WRITE_BEHIND_MAX_PENDING = int(os.getenv("WRITE_BEHIND_MAX_PENDING", "1000"))
+WRITE_BEHIND_PUT_TIMEOUT = float(os.getenv("WRITE_BEHIND_PUT_TIMEOUT", "0.5"))
+WRITE_BEHIND_DRAIN_SECONDS = float(os.getenv("WRITE_BEHIND_DRAIN_SECONDS", "30"))
+
+_STOP = object()
+
+
+class _WriteTask:
+    __slots__ = ("fn", "args", "kwargs", "key", "label", "enqueued_at")
+
+    def __init__(self, fn: Callable, args: tuple, kwargs: Dict[str, Any],
+                 key: Optional[Hashable], label: Optional[str]):
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.key = key
+        self.label = label or getattr(fn, "__qualname__", repr(fn))
+        self.enqueued_at = time.monotonic()
+
+
+class WriteBehindQueue:
+    """Bounded queue of write tasks executed in order by one writer thread."""
+
+    def __init__(self, max_pending: int = WRITE_BEHIND_MAX_PENDING,
+                 put_timeout: float = WRITE_BEHIND_PUT_TIMEOUT):
+        self.put_timeout = put_timeout
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max_pending)
+        self._keyed: Dict[Hashable, _WriteTask] = {}
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._stats = {
+            "submitted": 0,
+            "completed": 0,
+            "failed": 0,
+            "coalesced": 0,
+            "blocked": 0,
+            "max_queue_depth": 0,
+            "total_wait_seconds": 0.0,
+            "total_write_seconds": 0.0,
+            "max_write_seconds": 0.0,
+            "last_error": None,
+        }
+
+    def _ensure_thread(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="thesis-data-writer", daemon=True)
+            self._thread.start()
+
+    def submit(self, fn: Callable, *args, key: Optional[Hashable] = None,
+               label: Optional[str] = None, **kwargs) -> bool:
+        """
+        Queue fn(*args, **kwargs) for the writer thread.
+
+        Returns True if the task was queued (or merged into a pending task with
+        the same key), False if it ran on the calling thread because it was
+        submitted from the writer thread itself.
+        """
+        task = _WriteTask(fn, args, kwargs, key, label)
+        if threading.current_thread() is self._thread:
+            # A write scheduling another write: waiting for room would deadlock
+            self._execute(task, time.monotonic())
+            return False
+
+        with self._lock:
+            self._stats["submitted"] += 1
+            if key is not None:
+                pending = self._keyed.get(key)
+                if pending is not None:
+                    # Still queued: replace its payload, keep its position
+                    pending.fn, pending.args, pending.kwargs = fn, args, kwargs
+                    self._stats["coalesced"] += 1
+                    return True
+                self._keyed[key] = task
+            self._ensure_thread()
+
+        try:
+            self._queue.put(task, timeout=self.put_timeout)
+        except queue.Full:
+            with self._lock:
+                self._stats["blocked"] += 1
+            print(f"⚠️ Write queue full ({self._queue.maxsize} pending), waiting to queue {task.label}")
+            self._queue.put(task)
+
+        with self._lock:
+            self._stats["max_queue_depth"] = max(self._stats["max_queue_depth"], self._queue.qsize())
+        return True
+
+    def _execute(self, task: _WriteTask, started: float) -> None:
+        try:
+            task.fn(*task.args, **task.kwargs)
+            failed, error = False, None
+        except Exception as e:
+            failed, error = True, f"{task.label}: {e}"
+            print(f"❌ Background write failed ({error})")
+        elapsed = time.monotonic() - started
+        with self._lock:
+            self._stats["failed" if failed else "completed"] += 1
+            self._stats["total_write_seconds"] += elapsed
+            self._stats["max_write_seconds"] = max(self._stats["max_write_seconds"], elapsed)
+            if error:
+                self._stats["last_error"] = error
+
+    def _run(self) -> None:
+        while True:
+            task = self._queue.get()
+            try:
+                if task is _STOP:
+                    return
+                started = time.monotonic()
+                with self._lock:
+                    # From here on, new submits with this key queue a fresh write
+                    if task.key is not None and self._keyed.get(task.key) is task:
+                        del self._keyed[task.key]
+                    self._stats["total_wait_seconds"] += started - task.enqueued_at
+                self._execute(task, started)
+            finally:
+                self._queue.task_done()
+
+    def drain(self, timeout: Optional[float] = WRITE_BEHIND_DRAIN_SECONDS) -> bool:
+        """Wait until every queued write has finished; False if timeout expired first."""
+        if threading.current_thread() is self._thread:
+            return False
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
+        return True
+
+    def shutdown(self, timeout: Optional[float] = WRITE_BEHIND_DRAIN_SECONDS) -> bool:
+        """Drain the queue and stop the writer thread."""
+        drained = self.drain(timeout)
+        thread = self._thread
+        if thread is not None and thread.is_alive():
+            self._queue.put(_STOP)
+            thread.join(timeout)
+        if not drained:
+            print(f"⚠️ Write queue not drained at shutdown ({self._queue.qsize()} writes pending)")
+        return drained
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue depth and write latency metrics."""
+        with self._lock:
+            stats = dict(self._stats)
+        finished = stats["completed"] + stats["failed"]
+        stats["queue_depth"] = self._queue.qsize()
+        stats["avg_wait_seconds"] = stats["total_wait_seconds"] / finished if finished else 0.0
+        stats["avg_write_seconds"] = stats["total_write_seconds"] / finished if finished else 0.0
+        return stats
+
+
+_queue_lock = threading.Lock()
+_shared_queue: Optional[WriteBehindQueue] = None
+
+
+def get_write_behind_queue() -> WriteBehindQueue:
+    """Return the process-wide write-behind queue."""
+    global _shared_queue
+    if _shared_queue is None:
+        with _queue_lock:
+            if _shared_queue is None:
+                _shared_queue = WriteBehindQueue()
+    return _shared_queue
+
+
+def submit_write(fn: Callable, *args, key: Optional[Hashable] = None,
+                 label: Optional[str] = None, **kwargs) -> bool:
+    """Run fn in the background writer (or inline when WRITE_BEHIND_ENABLED is off)."""
+    if not WRITE_BEHIND_ENABLED:
+        fn(*args, **kwargs)
+        return False
+    return get_write_behind_queue().submit(fn, *args, key=key, label=label, **kwargs)
+
+
+def drain_writes(timeout: Optional[float] = WRITE_BEHIND_DRAIN_SECONDS) -> bool:
+    """Wait for all pending background writes."""
+    if _shared_queue is None:
+        return True
+    return _shared_queue.drain(timeout)
+
+
+@atexit.register
+def _shutdown_shared_queue() -> None:
+    if _shared_queue is not None:
+        _shared_queue.shutdown()
@@ -10,7 +10,7 @@ import json
 from datetime import datetime
 from typing import Dict, Any, List, Optional, Tuple
 from PIL import Image
-from openai import OpenAI
+from utils.client_manager import get_shared_client, achat_completion
 from .image_analysis_cache import get_image_cache
 
 
@@ -25,7 +25,7 @@ class ComprehensiveVisionAnalyzer:
     
     def __init__(self, domain: str = "architecture", use_cache: bool = True):
         self.domain = domain
-        self.client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        self.client = get_shared_client()
         self.use_cache = use_cache
 
         # Initialize cache if enabled
@@ -88,7 +88,7 @@ class ComprehensiveVisionAnalyzer:
             print("📤 Sending comprehensive analysis request to GPT-4V...")
 
             # Call GPT-4V for analysis
-            response = self.client.chat.completions.create(
+            response = await achat_completion(
                 model="gpt-4o",
                 messages=[
                     {
@@ -228,7 +228,7 @@ class ComprehensiveVisionAnalyzer:
             print("📤 Sending enhanced comprehensive analysis request to GPT-4V...")
 
             # Call GPT-4V for analysis
-            response = self.client.chat.completions.create(
+            response = await achat_completion(
                 model="gpt-4o",
                 messages=[
                     {
@@ -636,7 +636,7 @@ class ComprehensiveVisionAnalyzer:
             print("📤 Sending detailed understanding request to GPT-4V...")
 
             # Call GPT-4V for detailed understanding
-            response = self.client.chat.completions.create(
+            response = await achat_completion(
                 model="gpt-4o",
                 messages=[
                     {
@@ -242,9 +242,14 @@ class ReplicateImageGenerator:
 
                 print(f"✅ Image saved locally to: {filepath}")
 
-                # Also save to Dropbox if requested
+                # Also save to Dropbox if requested, without holding up the reply
                 if save_to_dropbox:
-                    self._save_to_dropbox(filepath, filename, phase)
+                    try:
+                        from utils.write_behind import submit_write
+                    except ImportError:
+                        self._save_to_dropbox(filepath, filename, phase)
+                    else:
+                        submit_write(self._save_to_dropbox, filepath, filename, phase, label="dropbox image upload")
 
                 return filepath
             else:
@@ -317,8 +322,8 @@ class DesignPromptGenerator:
     """Generate image prompts from conversation history and design context"""
 
     def __init__(self):
-        from openai import OpenAI
-        self.client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        from utils.client_manager import get_shared_client
+        self.client = get_shared_client()
 
     def generate_image_prompt_from_conversation(self, conversation_history: list, phase: str, project_type: str = "community center") -> str:
         """Generate an image prompt based on conversation history and current phase"""
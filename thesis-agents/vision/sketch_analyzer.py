@@ -3,7 +3,6 @@ import base64
 import cv2
 import numpy as np
 from PIL import Image
-from openai import OpenAI
 import os
 import sys
 import json
@@ -24,9 +23,11 @@ except ImportError:
             pass
         return os.getenv("OPENAI_API_KEY", "")
 
+from utils.client_manager import get_shared_client, achat_completion
+
 class SketchAnalyzer:
     def __init__(self, domain="architecture"):
-        self.client = OpenAI(api_key=get_openai_api_key())
+        self.client = get_shared_client()
         self.domain = domain
         
         # Enhanced domain-specific analysis prompts with structured classification
@@ -238,7 +239,7 @@ class SketchAnalyzer:
             print("📤 Sending to GPT-4V...")
             
             # Call GPT-4O
-            response = self.client.chat.completions.create(
+            response = await achat_completion(
                 model="gpt-4o",
                 messages=[
                     {
@@ -454,7 +455,7 @@ class SketchAnalyzer:
             print("📤 Sending comprehensive analysis request to GPT-4V...")
 
             # Call GPT-4O for comprehensive analysis
-            response = self.client.chat.completions.create(
+            response = await achat_completion(
                 model="gpt-4o",
                 messages=[
                     {
@@ -562,7 +563,7 @@ class SketchAnalyzer:
             print("📤 Sending to GPT-4V for detailed description...")
 
             # Call GPT-4O for detailed description
-            response = self.client.chat.completions.create(
+            response = await achat_completion(
                 model="gpt-4o",
                 messages=[
                     {
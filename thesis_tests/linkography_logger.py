@@ -20,6 +20,7 @@ from benchmarking.linkography_types import (
     Linkograph,
     LinkographLink
 )
+from benchmarking.linkography_journal import journal_path, header_record, move_record, append_records
 from thesis_tests.data_models import DesignMove, MoveType, TestPhase
 
 
@@ -40,6 +41,9 @@ class LinkographyLogger:
         
         self.linkography_file = self.data_dir / f"linkography_{session_id}.json"
         self.moves_log = self.data_dir / f"linkography_moves_{session_id}.jsonl"
+        # Append-only journal, compacted into linkography_file by finalize()
+        self.journal_file = journal_path(self.data_dir, session_id)
+        self._journaled_link_count = 0
         
         # Initialize files
         self._initialize_files()
@@ -49,6 +53,10 @@ class LinkographyLogger:
         # Create empty moves log
         with open(self.moves_log, 'w') as f:
             pass
+        
+        # Start a fresh journal
+        with open(self.journal_file, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(header_record(self.session_id)) + '\n')
     
     def convert_to_linkography_move(self, design_move: DesignMove) -> LinkographyMove:
         """Convert test design move to linkography move"""
@@ -150,48 +158,14 @@ class LinkographyLogger:
         self._save_current_linkograph()
     
     def _save_current_linkograph(self):
-        """Save current linkograph state"""
-        if self.current_linkograph:
-            # Convert linkograph to dictionary format
-            linkograph_dict = {
-                'id': self.current_linkograph.id,
-                'session_id': self.current_linkograph.session_id,
-                'phase': self.current_linkograph.phase,
-                'generated_at': self.current_linkograph.generated_at,
-                'move_count': len(self.current_linkograph.moves),
-                'link_count': len(self.current_linkograph.links),
-                'moves': [
-                    {
-                        'id': m.id,
-                        'timestamp': m.timestamp,
-                        'content': m.content,
-                        'move_type': m.move_type,
-                        'phase': m.phase,
-                        'modality': m.modality
-                    } for m in self.current_linkograph.moves
-                ],
-                'links': [
-                    {
-                        'id': l.id,
-                        'source_move': l.source_move,
-                        'target_move': l.target_move,
-                        'strength': l.strength,
-                        'link_type': l.link_type
-                    } for l in self.current_linkograph.links
-                ]
-            }
+        """Append the newest move and the links it created to the linkograph journal"""
+        if self.current_linkograph and self.current_linkograph.moves:
+            links = self.current_linkograph.links
+            new_links = links[self._journaled_link_count:]
+            self._journaled_link_count = len(links)
             
-            linkograph_data = {
-                'session_id': self.session_id,
-                'timestamp': datetime.now().isoformat(),
-                'linkograph': linkograph_dict,
-                'metrics': self.current_linkograph.metrics.__dict__ if self.current_linkograph.metrics else {},
-                'move_count': len(self.moves),
-                'link_count': len(self.current_linkograph.links) if self.current_linkograph else 0
-            }
-            
-            with open(self.linkography_file, 'w') as f:
-                json.dump(linkograph_data, f, indent=2)
+            metrics = self.current_linkograph.metrics.__dict__ if self.current_linkograph.metrics else {}
+            append_records(self.journal_file, [move_record(self.current_linkograph.moves[-1], new_links, metrics)])
     
     def get_current_linkograph(self) -> Optional[Linkograph]:
         """Get current linkograph"""
@@ -295,8 +269,10 @@ class LinkographyLogger:
                 'phase_distribution': self._calculate_phase_distribution()
             }
             
+            # Compaction: materialize the journaled linkograph as one JSON file
             with open(self.linkography_file, 'w') as f:
                 json.dump(final_data, f, indent=2)
+            self._journaled_link_count = len(self.current_linkograph.links)
     
     def _extract_patterns(self) -> Dict[str, Any]:
         """Extract linkographic patterns"""